@@ -39,6 +39,10 @@ def get_icms_prod_beat_schedule():
             "task": SEND_AUTHORITY_EXPIRING_SECTION_5_TASK_NAME,
             "schedule": crontab(minute="0", hour="7"),
         },
+        "delete_expired_search_exports": {
+            "task": "web.domains.case.tasks.delete_expired_search_exports",
+            "schedule": crontab(minute="0", hour="2"),
+        },
     }
 
 
@@ -53,4 +57,8 @@ def get_imcs_dev_beat_schedule():
             "task": "web.tasks.check_celery_beat_running",
             "schedule": crontab(minute="*/15"),
         },
+        "delete_expired_search_exports": {
+            "task": "web.domains.case.tasks.delete_expired_search_exports",
+            "schedule": crontab(minute="0", hour="2"),
+        },
     }
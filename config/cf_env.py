@@ -136,6 +136,12 @@ class CloudFoundryEnvironment(BaseSettings):
     show_db_queries: bool = False
     show_debug_toolbar: bool = False
 
+    # Request instrumentation (see web.utils.instrumentation)
+    request_instrumentation_enabled: bool = False
+    request_instrumentation_sample_rate: float = 0.01
+    request_instrumentation_slow_request_ms: int = 2000
+    request_instrumentation_query_count_threshold: int = 100
+
     companies_house_domain: str = "https://api.companieshouse.gov.uk/"
     companies_house_token: str
 
@@ -149,6 +155,17 @@ class CloudFoundryEnvironment(BaseSettings):
     # S3 endpoint URL
     local_aws_s3_endpoint_url: str = "http://localstack:4566/"
 
+    # Maximum number of connections kept in the S3 client connection pool
+    aws_s3_max_pool_connections: int = 20
+
+    # Database connection pool used by the web tier (see config/gunicorn.py)
+    database_pool_enabled: bool = False
+    # Connections kept open and the most connections opened by each gunicorn worker
+    database_pool_min_size: int = 2
+    database_pool_max_size: int = 10
+    # Seconds a request waits for a connection from the pool before failing
+    database_pool_timeout: float = 30
+
     # celery settings
     celery_task_always_eager: bool = False
     celery_eager_propagates_exceptions: bool = False
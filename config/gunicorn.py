@@ -17,6 +17,10 @@ worker_class = "gevent"
 workers = 4
 worker_connections = int(os.environ.get("ICMS_WORKER_CONNECTIONS", 1000))
 
+# The greenlets of each worker share a pool of database connections.
+# The pool size is set by ICMS_DATABASE_POOL_MIN_SIZE / ICMS_DATABASE_POOL_MAX_SIZE.
+os.environ.setdefault("ICMS_DATABASE_POOL_ENABLED", "true")
+
 # '-' makes gunicorn log to stdout.
 accesslog = "-"
 
@@ -25,3 +29,11 @@ errorlog = "-"
 
 proc_name = "icms"
 gunicorn.SERVER_SOFTWARE = proc_name
+
+
+def post_worker_init(worker):
+    """Log the database connection pool statistics of each worker."""
+
+    from web.utils.db_pool import start_pool_stats_logger
+
+    start_pool_stats_logger()
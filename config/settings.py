@@ -60,6 +60,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
     # STAFF-SSO client app
     "authbroker_client",
     # GOV.OK One Login Client app
@@ -69,6 +70,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "web.middleware.common.RequestInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -90,6 +92,18 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
 DATABASES = env.get_database_config()
 
+# Each gunicorn worker shares a pool of connections between its greenlets instead of every
+# request opening a connection (see config/gunicorn.py). psycopg cooperates with gevent.
+if env.database_pool_enabled:
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.database_pool_min_size,
+        "max_size": env.database_pool_max_size,
+        "timeout": env.database_pool_timeout,
+    }
+
+# Seconds between logging the database connection pool statistics of each gunicorn worker
+DATABASE_POOL_STATS_INTERVAL = 60
+
 # Custom field renderer to handle rendering govuk-frontend-jinja macros
 FORM_RENDERER = "web.ecil.gds.forms.renderers.GDSTemplateSetting"
 
@@ -200,6 +214,8 @@ EMAIL_BACKEND = env.email_backend
 MAIL_TASK_RATE_LIMIT = env.mail_task_rate_limit
 MAIL_TASK_RETRY_JITTER = env.mail_task_retry_jitter
 MAIL_TASK_MAX_RETRIES = env.mail_task_max_retries
+# Number of send_email tasks queued in a single celery group when sending bulk emails.
+MAIL_BULK_SEND_CHUNK_SIZE = 500
 
 # Same logic here: icms/web/mail/decorators.py
 if APP_ENV in ("local", "dev", "uat", "staging", "hotfix"):
@@ -270,6 +286,17 @@ S3_ROOT_DIRECTORY = "documents"
 # Used to set the S3 endpoint in development environments only
 AWS_S3_ENDPOINT_URL: str | None = None
 
+# Connection pool settings for the shared S3 client
+AWS_S3_MAX_POOL_CONNECTIONS = env.aws_s3_max_pool_connections
+AWS_S3_TCP_KEEPALIVE = True
+
+# Size of the chunks (bytes) used when streaming file downloads from S3
+S3_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Files downloaded from S3 to be read (e.g. uploaded CFS product spreadsheets) are written to a
+# temporary file on disk, rather than kept in memory, when they are larger than this (bytes)
+AWS_S3_MAX_MEMORY_SIZE = 5 * 1024 * 1024
+
 # Order is important
 FILE_UPLOAD_HANDLERS = (
     "django_chunk_upload_handlers.clam_av.ClamAVFileUploadHandler",
@@ -404,6 +431,46 @@ HAWK_CREDENTIALS = {
 # So this constant is used in the Firearm Goods forms
 CHIEF_MAX_QUANTITY = 99_999_999_999.999
 
+# PDF generation browser settings (see web.utils.pdf.browser.BrowserPool)
+# Seconds to wait for the worker's browser before giving up
+PDF_BROWSER_ACQUIRE_TIMEOUT = 120
+# Seconds a render can take before the browser is restarted
+PDF_BROWSER_RENDER_TIMEOUT = 60
+# Renders before the page is recycled
+PDF_BROWSER_MAX_PAGE_RENDERS = 50
+# Renders before the browser is restarted
+PDF_BROWSER_MAX_RENDERS = 500
+
+# Number of threads used to upload a document pack's documents to S3
+DOCUMENT_PACK_UPLOAD_WORKERS = 4
+
+# Number of applications loaded per query when exporting search results to a spreadsheet
+SEARCH_EXPORT_BATCH_SIZE = 500
+
+# Number of days search result spreadsheet exports (and their files) are kept for
+# (see web.domains.case.tasks.delete_expired_search_exports)
+SEARCH_EXPORT_RETENTION_DAYS = 7
+
+# Number of seconds the ordered search result ids are cached for a user and search terms
+SEARCH_RESULTS_CACHE_TIMEOUT = 300
+
+# Maximum number of seconds before a worker sees reference data changed by another worker
+# (see web.utils.reference_data)
+REFERENCE_DATA_VERSION_CHECK_INTERVAL = 5
+
+# Number of seconds the rendered menu is cached for a user and site (see web.menu)
+MENU_CACHE_TIMEOUT = 3600
+
+# Request instrumentation settings (see web.utils.instrumentation)
+REQUEST_INSTRUMENTATION_ENABLED = env.request_instrumentation_enabled
+# Fraction of requests that are logged
+REQUEST_INSTRUMENTATION_SAMPLE_RATE = env.request_instrumentation_sample_rate
+# Requests at or over these thresholds are always logged
+REQUEST_INSTRUMENTATION_SLOW_REQUEST_MS = env.request_instrumentation_slow_request_ms
+REQUEST_INSTRUMENTATION_QUERY_COUNT_THRESHOLD = env.request_instrumentation_query_count_threshold
+# Number of times the same query is run in a request before it is logged as an N+1 query
+REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 10
+
 # Workbasket pagination setting
 WORKBASKET_PER_PAGE = env.workbasket_per_page
 
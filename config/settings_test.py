@@ -1,4 +1,6 @@
 # flake8: noqa: F405
+import os
+
 from .settings import *
 
 DEBUG = True
@@ -10,6 +12,11 @@ PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 CELERY_TASK_ALWAYS_EAGER = True
 
+# pytest-xdist workers share the Redis databases but each worker has its own test database,
+# so the cache keys of each worker are kept apart (e.g. keys containing a user's pk).
+for cache_config in CACHES.values():
+    cache_config["KEY_PREFIX"] = os.environ.get("PYTEST_XDIST_WORKER", "")  # type: ignore[index]
+
 # django-ratelimit
 RATELIMIT_ENABLE = False
 
@@ -10,3 +10,8 @@ class WebConfig(AppConfig):
         from web.models.lookups import ILike
 
         Field.register_lookup(ILike)
+
+        # Connect signal receivers
+        import web.permissions.signals  # noqa: F401
+        import web.utils.reference_data  # noqa: F401
+        import web.utils.search.signals  # noqa: F401
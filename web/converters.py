@@ -94,13 +94,13 @@ class ChiefStatusConverter:
 
 
 class DataWorkspaceVersionConverter:
-    regex = "v0"
+    regex = "v0|v1"
 
     def to_python(self, value):
         return value
 
     def to_url(self, value):
-        if value not in ["v0"]:
+        if value not in ["v0", "v1"]:
             raise ValueError
 
         return value
@@ -1,16 +1,74 @@
+import datetime as dt
+import functools
 import http
-from itertools import chain
-from typing import Any, ClassVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, ClassVar, get_args
 
 import pydantic
+import pydantic_core
 from django.db.models import Count, QuerySet
-from django.http import Http404, HttpRequest, HttpResponse, JsonResponse
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views.generic import ListView, View
 
 from web.data_workspace import serializers
 from web.utils.api.auth import HawkDataWorkspaceMixin
 
-VERSION = 0
+VERSION = 1
+
+# Versions from this one use keyset pagination rather than page numbers.
+KEYSET_PAGINATION_VERSION = 1
+
+
+def datetime_encoder(value: Any) -> Any:
+    """Returns a date as midnight on that day, as the serializer would for a datetime field."""
+    if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
+        return dt.datetime.combine(value, dt.time())
+
+    return value
+
+
+# Encoders for field annotations where the queryset value needs converting before it's written.
+FIELD_ENCODERS: dict[Any, Callable[[Any], Any]] = {
+    dt.datetime: datetime_encoder,
+    dt.datetime | None: datetime_encoder,
+}
+
+RecordEncoders = tuple[tuple[str, Callable[[Any], Any] | None], ...]
+
+
+@functools.cache
+def get_record_encoders(qs_serializer: type[pydantic.BaseModel]) -> RecordEncoders:
+    """Returns the fields, and their encoders, for the records in the queryset serializer results.
+
+    Records are written without being validated by the serializer, the data workspace tests
+    check the queryset values match the schema instead.
+    """
+    (record_serializer,) = get_args(qs_serializer.model_fields["results"].annotation)
+
+    return tuple(
+        (name, FIELD_ENCODERS.get(field.annotation))
+        for name, field in record_serializer.model_fields.items()
+    )
+
+
+def encode_records(
+    qs_serializer: type[pydantic.BaseModel], records: Iterable[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Returns the records restricted to the serializer fields, in schema order."""
+    encoders = get_record_encoders(qs_serializer)
+
+    return [
+        {name: encoder(record[name]) if encoder else record[name] for name, encoder in encoders}
+        for record in records
+    ]
 
 
 class MetadataView(HawkDataWorkspaceMixin, View):
@@ -31,6 +89,8 @@ class DataViewBase(HawkDataWorkspaceMixin, ListView):
     max_version: int = VERSION
     order_by: str = "pk"
     paginate_by = 1000
+    # Field used to filter records by the updated_since query parameter (from v1).
+    updated_field: str | None = None
 
     def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         version = self.kwargs["version"]
@@ -41,21 +101,122 @@ class DataViewBase(HawkDataWorkspaceMixin, ListView):
             )
         return super().dispatch(request, *args, **kwargs)
 
+    @property
+    def uses_keyset_pagination(self) -> bool:
+        return self.version_number >= KEYSET_PAGINATION_VERSION
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        if not self.uses_keyset_pagination:
+            return super().get(request, *args, **kwargs)
+
+        try:
+            self.after = self.get_after()
+            self.updated_since = self.get_updated_since()
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=http.HTTPStatus.BAD_REQUEST)
+
+        if request.GET.get("format") == "ndjson":
+            return StreamingHttpResponse(self.stream_ndjson(), content_type="application/x-ndjson")
+
+        return self.render_keyset_page()
+
+    def get_after(self) -> int:
+        """Returns the pk of the last record the client has already received."""
+        after = self.request.GET.get("after", "0")
+
+        if not after.isdigit():
+            raise ValueError("after must be a record id")
+
+        return int(after)
+
+    def get_updated_since(self) -> dt.datetime | None:
+        """Returns the datetime records must have been updated since to be returned."""
+        value = self.request.GET.get("updated_since")
+
+        if not value:
+            return None
+
+        if not self.updated_field:
+            raise ValueError("This endpoint does not support updated_since")
+
+        try:
+            updated_since = parse_datetime(value)
+        except ValueError:
+            updated_since = None
+
+        if not updated_since:
+            raise ValueError("updated_since must be an ISO 8601 datetime")
+
+        if timezone.is_naive(updated_since):
+            updated_since = timezone.make_aware(updated_since, dt.UTC)
+
+        return updated_since
+
+    def get_keyset_filters(self) -> dict[str, Any]:
+        """Returns a dict of filters to fetch the records after the cursor.
+
+        Seeking on the pk index keeps the cost of each page constant, unlike an offset.
+        """
+        filters: dict[str, Any] = {"pk__gt": self.after}
+
+        if self.updated_since:
+            filters[f"{self.updated_field}__gte"] = self.updated_since
+
+        return filters
+
+    def get_keyset_page(self) -> list[dict[str, Any]]:
+        """Returns the next paginate_by records after the cursor."""
+        return list(self.get_queryset()[: self.paginate_by])
+
+    def render_keyset_page(self) -> HttpResponse:
+        records = self.get_keyset_page()
+
+        if len(records) == self.paginate_by:
+            params = self.request.GET.copy()
+            params["after"] = str(records[-1]["id"])
+            next_url = f"{self.request.path}?{params.urlencode()}"
+        else:
+            next_url = ""
+
+        return self.render_records(records, next_url)
+
+    def stream_ndjson(self) -> Iterator[bytes]:
+        """Yields every record after the cursor as a line of JSON, a page at a time."""
+        qs_serializer = self.get_qs_serializer()
+
+        while records := self.get_keyset_page():
+            for record in encode_records(qs_serializer, records):
+                yield pydantic_core.to_json(record) + b"\n"
+
+            if len(records) < self.paginate_by:
+                break
+
+            self.after = records[-1]["id"]
+
     def render_to_response(self, context: dict[str, Any], **response_kwargs: Any) -> HttpResponse:
         queryset = context["object_list"]
-        data: dict[str, Any] = {"results": list(queryset)}
 
         paginator = context["paginator"]
         page = context["page_obj"]
         if page.number < paginator.num_pages:
-            data["next"] = f"{self.request.path}?page={page.number + 1}"
+            next_url = f"{self.request.path}?page={page.number + 1}"
         else:
-            data["next"] = ""
+            next_url = ""
 
-        qs_serializer = self.get_qs_serializer()
-        data = qs_serializer(**data).model_dump(mode="json", exclude_defaults=True)
+        return self.render_records(queryset, next_url)
 
-        return JsonResponse(data, status=http.HTTPStatus.OK)
+    def render_records(self, records: Iterable[dict[str, Any]], next_url: str) -> HttpResponse:
+        """Returns a page of records in the format of the queryset serializer."""
+        data = {
+            "next": next_url,
+            "results": encode_records(self.get_qs_serializer(), records),
+        }
+
+        return HttpResponse(
+            pydantic_core.to_json(data),
+            content_type="application/json",
+            status=http.HTTPStatus.OK,
+        )
 
     def get_qs_serializer(self) -> type[pydantic.BaseModel]:
         """Returns the queryset serilaizer. Allows override of the queryset serializer for specific versions"""
@@ -89,18 +250,25 @@ class DataViewBase(HawkDataWorkspaceMixin, ListView):
         """Returns a dict of filters to be used in get_queryset"""
         return {}
 
-    def get_queryset(self) -> QuerySet[Any] | chain:
+    def get_queryset(self) -> QuerySet[Any]:
         """Returns the queryset"""
         qs = super().get_queryset()
+        filters = self.get_queryset_filters()
+
+        if self.uses_keyset_pagination:
+            filters |= self.get_keyset_filters()
+
         return (
-            qs.filter(**self.get_queryset_filters())
+            qs.filter(**filters)
             .annotate(**self.get_queryset_annotations())
-            .order_by(self.order_by)
+            .order_by("pk" if self.uses_keyset_pagination else self.order_by)
             .values(*self.get_queryset_values(), **self.get_queryset_value_kwargs())
         )
 
 
 class ApplicationDataViewBase(DataViewBase):
+    updated_field = "last_update_datetime"
+
     def get_queryset_annotations(self) -> dict[str, Any]:
         return {"variation_number": Count("variation_requests")}
 
@@ -44,6 +44,7 @@ class ExportCertificateDocumentDataView(DataViewBase):
     model = CaseDocumentReference
     qs_serializer = serializers.ExportDocumentListSerializer
     data_serializer = serializers.ExportCertificateDocumentSerializer
+    updated_field = "export_application_certificates__updated_at"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"export_application_certificates__isnull": False}
@@ -62,6 +63,7 @@ class GMPApplicationDataView(DataViewBase):
     model = CertificateOfGoodManufacturingPracticeApplication
     qs_serializer = serializers.GMPApplicationListSerializer
     data_serializer = serializers.GMPApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_annotations(self) -> dict[str, Any]:
         return {
@@ -77,6 +79,7 @@ class COMApplicationDataView(DataViewBase):
     model = CertificateOfManufactureApplication
     qs_serializer = serializers.COMApplicationListSerializer
     data_serializer = serializers.COMApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"submit_datetime__isnull": False}
@@ -86,6 +89,7 @@ class CFSScheduleDataView(DataViewBase):
     model = CFSSchedule
     qs_serializer = serializers.CFSScheduleListSerializer
     data_serializer = serializers.CFSScheduleSerializer
+    updated_field = "application__last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"application__submit_datetime__isnull": False}
@@ -118,6 +122,7 @@ class CFSProductDataView(DataViewBase):
     model = CFSProduct
     qs_serializer = serializers.CFSProductListSerializer
     data_serializer = serializers.CFSProductSerializer
+    updated_field = "schedule__application__last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"schedule__application__submit_datetime__isnull": False}
@@ -43,6 +43,7 @@ class ImportLicenceDocumentDataView(DataViewBase):
     model = CaseDocumentReference
     qs_serializer = serializers.ImportLicenceDocumentListSerializer
     data_serializer = serializers.ImportLicenceDocumentSerializer
+    updated_field = "import_application_licences__updated_at"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {
@@ -65,6 +66,7 @@ class FaDflApplicationDataView(DataViewBase):
     model = DFLApplication
     qs_serializer = serializers.FaDflApplicationListSerializer
     data_serializer = serializers.FaDflApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"submit_datetime__isnull": False}
@@ -77,6 +79,7 @@ class FaDflGoodsDataView(DataViewBase):
     model = DFLGoodsCertificate
     qs_serializer = serializers.FaDflGoodsListSerializer
     data_serializer = serializers.FaDflGoodsSerializer
+    updated_field = "dfl_application__last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"dfl_application__submit_datetime__isnull": False}
@@ -92,6 +95,7 @@ class FaOilApplicationDataView(DataViewBase):
     model = OpenIndividualLicenceApplication
     qs_serializer = serializers.FaOilApplicationListSerializer
     data_serializer = serializers.FaOilApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"submit_datetime__isnull": False}
@@ -107,6 +111,7 @@ class FaSilApplicationDataView(DataViewBase):
     model = SILApplication
     qs_serializer = serializers.FaSilApplicationListSerializer
     data_serializer = serializers.FaSilApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"submit_datetime__isnull": False}
@@ -121,6 +126,8 @@ class FaSilApplicationDataView(DataViewBase):
 
 
 class FaSilGoodsBaseView(DataViewBase):
+    updated_field = "import_application__last_update_datetime"
+
     def get_queryset_filters(self) -> dict[str, Any]:
         return {"import_application__submit_datetime__isnull": False}
 
@@ -173,6 +180,7 @@ class SanctionsApplicationDataView(DataViewBase):
     model = SanctionsAndAdhocApplication
     qs_serializer = serializers.SanctionsApplicationListSerializer
     data_serializer = serializers.SanctionsApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_annotations(self) -> dict[str, Any]:
         return {"supporting_documents_count": Count("supporting_documents")}
@@ -182,6 +190,7 @@ class SanctionsGoodsDataView(DataViewBase):
     model = SanctionsAndAdhocApplicationGoods
     qs_serializer = serializers.SanctionsGoodsListSerializer
     data_serializer = serializers.SanctionsGoodsSerializer
+    updated_field = "import_application__last_update_datetime"
 
     def get_queryset_value_kwargs(self) -> dict[str, Any]:
         return {
@@ -194,6 +203,7 @@ class NuclearMaterialApplicationDataView(DataViewBase):
     model = NuclearMaterialApplication
     qs_serializer = serializers.NuclearMaterialApplicationListSerializer
     data_serializer = serializers.NuclearMaterialApplicationSerializer
+    updated_field = "last_update_datetime"
 
     def get_queryset_annotations(self) -> dict[str, Any]:
         return {"supporting_documents_count": Count("supporting_documents")}
@@ -203,6 +213,7 @@ class NuclearMaterialGoodsDataView(DataViewBase):
     model = NuclearMaterialApplicationGoods
     qs_serializer = serializers.NuclearMaterialGoodsListSerializer
     data_serializer = serializers.NuclearMaterialGoodsSerializer
+    updated_field = "import_application__last_update_datetime"
 
     def get_queryset_value_kwargs(self) -> dict[str, Any]:
         return {
@@ -419,7 +419,7 @@ def view_certificate_document(
 
     # Permission checks in view_application_file
     return view_application_file(
-        request.user, application, application.user_imported_certificates, certificate_pk
+        request, application, application.user_imported_certificates, certificate_pk
     )
 
 
@@ -510,7 +510,7 @@ def view_authority_document(
     )
 
     # Permission checks in view_application_file
-    return view_application_file(request.user, application, firearms_authority.files, document_pk)
+    return view_application_file(request, application, firearms_authority.files, document_pk)
 
 
 @login_required
@@ -452,7 +452,7 @@ def view_section5_document(
     get_object_or_404(application.user_section5, pk=section5_pk)
 
     # Permission checks in view_application_file
-    return view_application_file(request.user, application, application.user_section5, section5_pk)
+    return view_application_file(request, application, application.user_section5, section5_pk)
 
 
 @login_required
@@ -536,7 +536,7 @@ def view_verified_section5_document(
     )
 
     # Permission checks in view_application_file
-    return view_application_file(request.user, application, section5.files, document_pk)
+    return view_application_file(request, application, section5.files, document_pk)
 
 
 @login_required
@@ -767,7 +767,7 @@ def view_upload_document(
     )
     document = supplementary_firearm_report.document
 
-    return view_application_file(request.user, application, File.objects, document.pk)
+    return view_application_file(request, application, File.objects, document.pk)
 
 
 @login_required
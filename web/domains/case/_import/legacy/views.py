@@ -37,7 +37,7 @@ def opt_view_document(
         OutwardProcessingTradeApplication, pk=application_pk
     )
 
-    return view_application_file(request.user, application, application.documents, document_pk)
+    return view_application_file(request, application, application.documents, document_pk)
 
 
 @login_required
@@ -93,7 +93,7 @@ def tex_view_document(
     application: TextilesApplication = get_object_or_404(TextilesApplication, pk=application_pk)
 
     return view_application_file(
-        request.user, application, application.supporting_documents, document_pk
+        request, application, application.supporting_documents, document_pk
     )
 
 
@@ -159,7 +159,7 @@ def sps_view_contract_document(
         )
 
     return view_application_file(
-        request.user,
+        request,
         application,
         PriorSurveillanceContractFile.objects,
         application.contract_file_id,
@@ -176,5 +176,5 @@ def sps_view_supporting_document(
     )
 
     return view_application_file(
-        request.user, application, application.supporting_documents, document_pk
+        request, application, application.supporting_documents, document_pk
     )
@@ -8,6 +8,7 @@ from django.urls import reverse
 
 from web.domains.case.models import ApplicationBase, DocumentPackBase, DownloadLinkBase
 from web.flow.models import ProcessTypes
+from web.models.indexes import get_search_indexes
 from web.models.shared import EnumJsonEncoder, YesNoNAChoices
 from web.types import TypedTextChoices
 from web.utils import datetime_format
@@ -142,6 +143,7 @@ class ImportApplication(ApplicationBase):
                 name="IA_search_case_reference_idx",
                 opclasses=["text_pattern_ops"],
             ),
+            *get_search_indexes("reference", "IA_search_case_ref"),
             models.Index(
                 models.Q(submit_datetime__isnull=False), name="IA_submit_datetime_notnull_idx"
             ),
@@ -362,7 +362,7 @@ def view_supporting_document(
     application = get_object_or_404(NuclearMaterialApplication, pk=application_pk)
 
     return view_application_file(
-        request.user, application, application.supporting_documents, document_pk
+        request, application, application.supporting_documents, document_pk
     )
 
 
@@ -6,6 +6,7 @@ from django.urls import reverse
 
 from web.domains.case.models import ApplicationBase, DocumentPackBase
 from web.flow.models import ProcessTypes
+from web.models.indexes import get_search_indexes
 from web.types import TypedTextChoices
 
 
@@ -78,6 +79,7 @@ class ExportApplication(ExportApplicationABC, ApplicationBase):
                 name="EA_search_case_reference_idx",
                 opclasses=["text_pattern_ops"],
             ),
+            *get_search_indexes("reference", "EA_search_case_ref"),
             models.Index(fields=["-submit_datetime"], name="EA_submit_datetime_idx"),
         ]
 
@@ -1,9 +1,9 @@
-import io
-from collections import OrderedDict
+from collections import defaultdict
 from dataclasses import dataclass, field
 
 from django.core.exceptions import ValidationError
 from django.core.files.base import File
+from django.db import transaction
 from django.http import HttpResponse
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
@@ -33,7 +33,11 @@ from web.models import (
     CertificateOfManufactureApplication,
     CertificateOfManufactureApplicationTemplate,
     CFSProduct,
+    CFSProductActiveIngredient,
+    CFSProductActiveIngredientTemplate,
     CFSProductTemplate,
+    CFSProductType,
+    CFSProductTypeTemplate,
     CFSSchedule,
     CFSScheduleTemplate,
     ExportApplication,
@@ -44,6 +48,12 @@ from web.models import (
 )
 from web.utils.spreadsheet import XlsxSheetConfig, generate_xlsx_file
 
+# Number of records saved by each query when saving the products in a products file
+PRODUCTS_FILE_BATCH_SIZE = 1000
+
+# Number of errors displayed to the user when processing a products file fails
+MAX_PRODUCTS_FILE_ERRORS = 10
+
 
 class CustomError(Exception):
     pass
@@ -51,11 +61,31 @@ class CustomError(Exception):
 
 @dataclass
 class ProductData:
+    # The product name as it's first spelt in the spreadsheet
+    product_name: str
     product_type_numbers: list[int] = field(default_factory=list)
     ingredient_names: list[str] = field(default_factory=list)
     cas_numbers: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class _ProductForms:
+    """The forms used to validate the products of a schedule or schedule template."""
+
+    product: type[CFSProductForm]
+    product_type: type[CFSProductTypeForm]
+    ingredient: type[CFSActiveIngredientForm]
+
+    @classmethod
+    def for_schedule(cls, schedule: CFSSchedule | CFSScheduleTemplate) -> "_ProductForms":
+        if isinstance(schedule, CFSSchedule):
+            return cls(CFSProductForm, CFSProductTypeForm, CFSActiveIngredientForm)
+
+        return cls(
+            CFSProductTemplateForm, CFSProductTypeTemplateForm, CFSActiveIngredientTemplateForm
+        )
+
+
 def get_product_spreadsheet_response(schedule: CFSSchedule | CFSScheduleTemplate) -> HttpResponse:
     is_biocidal = schedule.is_biocidal()
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
@@ -90,22 +120,31 @@ def generate_product_template_xlsx(is_biocidal: bool = False) -> bytes:
 def process_products_file(products_file: File, schedule: CFSSchedule | CFSScheduleTemplate) -> int:
     """Processes the uploaded xlsx file and save the products to the schedule.
 
-    Raises an exception on any validation failure.
+    Every row is validated before any products are saved, raises a ValidationError containing
+    the errors of every invalid row.
     Returns the count of the products which were processed.
     """
 
     is_biocidal = schedule.is_biocidal()
 
-    products_data = _extract_product_data(products_file, is_biocidal)
-    product_count = len(products_data)
+    products_data = _extract_product_data(products_file, schedule, is_biocidal)
 
-    for product_name, product_data in products_data.items():
-        product = _process_product(schedule, product_name)
+    with transaction.atomic():
+        _save_products(schedule, products_data)
 
-        _process_product_type_numbers(product, product_data)
-        _process_ingredients(product, product_data)
+    return len(products_data)
 
-    return product_count
+
+def get_products_file_error_message(err: ValidationError) -> str:
+    """Returns the message displayed to the user when processing a products file fails."""
+
+    errors = err.messages
+    message = "; ".join(errors[:MAX_PRODUCTS_FILE_ERRORS])
+
+    if len(errors) > MAX_PRODUCTS_FILE_ERRORS:
+        message += f" (and {len(errors) - MAX_PRODUCTS_FILE_ERRORS} more errors)"
+
+    return message
 
 
 def _get_header(is_biocidal: bool = False) -> list[str]:
@@ -146,20 +185,24 @@ def _extract_sheet_header(sheet: Worksheet, is_biocidal: bool = False) -> list[s
     return header
 
 
-def _extract_product_data(products_file: File, is_biocidal: bool = False) -> dict[str, ProductData]:
+def _extract_product_data(
+    products_file: File, schedule: CFSSchedule | CFSScheduleTemplate, is_biocidal: bool = False
+) -> dict[str, ProductData]:
     """Iterates over the rows in the products xlsx and extracts the product data from each row.
 
-    Combines product type numbers and ingredients for the each product.
-    Returns the data as an OrderedDict.
+    The workbook is read from the uploaded file one row at a time (openpyxl read-only mode) and
+    every row is validated in the same pass.
+    Combines product type numbers and ingredients for each product.
+    Returns the data keyed by the lower case product name.
     """
 
-    if products_file.multiple_chunks():
-        # If there is more than one chunk, the file is too big
-        raise ValidationError("File too large to process")
+    data: dict[str, ProductData] = {}
+    errors: list[str] = []
+    forms = _ProductForms.for_schedule(schedule)
 
-    data: OrderedDict = OrderedDict()
-    chunk = next(products_file.chunks())
-    workbook = load_workbook(filename=io.BytesIO(chunk), read_only=True, data_only=True)
+    # Uploaded files are stored in S3, reading the file downloads it to a temporary file
+    products_file.seek(0)
+    workbook = load_workbook(filename=products_file.file, read_only=True, data_only=True)
 
     try:
         if "CFS Products" in workbook.sheetnames:
@@ -187,18 +230,29 @@ def _extract_product_data(products_file: File, is_biocidal: bool = False) -> dic
             if not product_name:
                 continue
 
-            product = data.get(product_name, ProductData())
+            # Product names are unique to the schedule regardless of case
+            product = data.get(product_name.lower(), ProductData(product_name))
+
+            try:
+                _validate_product_name(row_data, forms)
+            except ValidationError as err:
+                errors.extend(err.messages)
+                continue
+
+            data[product_name.lower()] = product
 
             # There will be only the product name column in the sheet for non biocidal legislation
             if not is_biocidal:
-                data[product_name] = product
-
                 continue
 
-            _add_product_type_numbers_to_product_data(row_data, product)
-            _add_ingredient_to_product_data(row_data, product)
-
-            data[product_name] = product
+            for add_to_product_data in (
+                _add_product_type_numbers_to_product_data,
+                _add_ingredient_to_product_data,
+            ):
+                try:
+                    add_to_product_data(row_data, product, forms)
+                except ValidationError as err:
+                    errors.extend(err.messages)
 
         workbook.close()
 
@@ -207,11 +261,30 @@ def _extract_product_data(products_file: File, is_biocidal: bool = False) -> dic
         workbook.close()
         raise err
 
+    if errors:
+        raise ValidationError(errors)
+
     return data
 
 
+def _validate_product_name(row_data: dict[str, str], forms: _ProductForms) -> None:
+    """Validates the product name field without checking it is unique to the schedule.
+
+    Existing products with the same name are updated rather than duplicated.
+    """
+
+    product_name = row_data["Product Name"]
+
+    try:
+        forms.product.base_fields["product_name"].clean(product_name)
+    except ValidationError as err:
+        raise ValidationError(
+            f"Product '{product_name}' has error - {err.messages[0]} - line {row_data['row']}"
+        )
+
+
 def _add_product_type_numbers_to_product_data(
-    row_data: dict[str, str], product: ProductData
+    row_data: dict[str, str], product: ProductData, forms: _ProductForms
 ) -> None:
     """Gets and validates product type numbers data from the row and adds to ProductData.
 
@@ -227,18 +300,33 @@ def _add_product_type_numbers_to_product_data(
             # Integers are stored as floats in xlsx files
             product_type = int(float(val))
 
-            if product_type not in product.product_type_numbers:
-                product.product_type_numbers.append(product_type)
-
         except ValueError:
             raise ValidationError(
                 f"Product type number '{val}' for product '{product_name}' is not a number - line {row}"
             )
 
+        if product_type in product.product_type_numbers:
+            continue
+
+        # The product isn't required to validate the product type number
+        form = forms.product_type(
+            data={"product_type_number": product_type}, product=None  # type:ignore[arg-type]
+        )
+
+        if not form.is_valid():
+            errors = form.errors
+            msg = f"product type number '{product_type}'"
+
+            if "product_type_number" in errors:
+                msg += f" - {errors['product_type_number'][0]}"
+
+            raise ValidationError(f"Product '{product_name}' has error with {msg} - line {row}")
+
+        product.product_type_numbers.append(product_type)
+
 
 def _add_ingredient_to_product_data(
-    row_data: dict[str, str],
-    product: ProductData,
+    row_data: dict[str, str], product: ProductData, forms: _ProductForms
 ) -> None:
     """Gets and validates ingredient data from the row and adds to ProductData.
 
@@ -267,105 +355,118 @@ def _add_ingredient_to_product_data(
             f"CAS number '{cas_number}' duplicated for product '{product_name}' - line {row}"
         )
 
-    product.ingredient_names.append(ingredient_name)
-    product.cas_numbers.append(cas_number)
-
-
-def _process_product(schedule: CFSSchedule | CFSScheduleTemplate, product_name: str) -> CFSProduct:
-    """Gets existing product or saves new product using CFSProductForm and returns product"""
-
-    existing_product = schedule.products.filter(product_name__iexact=product_name).first()
-
-    if existing_product:
-        return existing_product
-
-    if isinstance(schedule, CFSSchedule):
-        product_form_cls = CFSProductForm
-    else:
-        product_form_cls = CFSProductTemplateForm
-
-    form = product_form_cls(data={"product_name": product_name}, schedule=schedule)
+    # The product isn't required to validate the ingredient
+    form = forms.ingredient(
+        data={"name": ingredient_name, "cas_number": cas_number},
+        product=None,  # type:ignore[arg-type]
+    )
 
     if not form.is_valid():
         errors = form.errors
 
-        msg = f"Product '{product_name}' has error"
-
-        if "product_name" in errors:
-            msg += f" - {errors['product_name'][0]}"
+        if "name" in errors:
+            msg = f"active ingredient name '{ingredient_name}' - {errors['name'][0]}"
+        elif "cas_number" in errors:
+            msg = f"CAS number '{cas_number}' - {errors['cas_number'][0]}"
+        else:
+            msg = f"active ingredient name '{ingredient_name}' CAS number '{cas_number}'"
 
-        raise ValidationError(msg)
+        raise ValidationError(f"Product '{product_name}' has error with {msg} - line {row}")
 
-    return form.save()
+    product.ingredient_names.append(ingredient_name)
+    product.cas_numbers.append(cas_number)
 
 
-def _process_product_type_numbers(
-    product: CFSProduct | CFSProductTemplate, product_data: ProductData
+def _save_products(
+    schedule: CFSSchedule | CFSScheduleTemplate, products_data: dict[str, ProductData]
 ) -> None:
-    """Gets product type numbers from ProductData and saves using CFSProductTypeForm"""
+    """Saves the products, product type numbers and active ingredients using bulk queries.
 
-    if isinstance(product, CFSProduct):
-        product_type_form_cls = CFSProductTypeForm
-    else:
-        product_type_form_cls = CFSProductTypeTemplateForm
+    Existing products with the same name (ignoring case) are updated. Existing active
+    ingredients with the same CAS number are renamed, new ones are added.
+    """
 
-    product_type_numbers = product_data.product_type_numbers
-    existing_product_type_numbers = product.product_type_numbers.values_list(
-        "product_type_number", flat=True
+    if isinstance(schedule, CFSSchedule):
+        product_cls: type[CFSProduct | CFSProductTemplate] = CFSProduct
+        product_type_cls: type[CFSProductType | CFSProductTypeTemplate] = CFSProductType
+        ingredient_cls: type[CFSProductActiveIngredient | CFSProductActiveIngredientTemplate] = (
+            CFSProductActiveIngredient
+        )
+    else:
+        product_cls = CFSProductTemplate
+        product_type_cls = CFSProductTypeTemplate
+        ingredient_cls = CFSProductActiveIngredientTemplate
+
+    products = {p.product_name.lower(): p for p in schedule.products.all()}
+    existing_product_pks = [p.pk for p in products.values()]
+
+    new_products = product_cls.objects.bulk_create(
+        [
+            product_cls(schedule=schedule, product_name=product_data.product_name)
+            for key, product_data in products_data.items()
+            if key not in products
+        ],
+        batch_size=PRODUCTS_FILE_BATCH_SIZE,
     )
-    for product_type_number in product_type_numbers:
-        if product_type_number not in existing_product_type_numbers:
-            product_type_form = product_type_form_cls(
-                data={"product_type_number": product_type_number}, product=product
-            )
-
-            if not product_type_form.is_valid():
-                errors = product_type_form.errors
-                msg = f"product type number '{product_type_number}'"
+    products.update((p.product_name.lower(), p) for p in new_products)
 
-                if "product_type_number" in errors:
-                    msg += f" - {errors['product_type_number'][0]}"
+    # Products of non biocidal schedules only have a name
+    if not any(p.product_type_numbers or p.ingredient_names for p in products_data.values()):
+        return
 
-                raise ValidationError(f"Product '{product.product_name} has error with {msg}")
-
-            product_type_form.save()
+    existing_product_type_numbers = set(
+        product_type_cls.objects.filter(product__in=existing_product_pks).values_list(
+            "product_id", "product_type_number"
+        )
+    )
+    existing_ingredients: defaultdict[int, list] = defaultdict(list)
 
+    for ingredient in ingredient_cls.objects.filter(product__in=existing_product_pks):
+        existing_ingredients[ingredient.product_id].append(ingredient)
 
-def _process_ingredients(product: CFSProduct, product_data: ProductData) -> None:
-    """Gets ingredeient data from ProductData and saves using CFSActiveIngredientForm"""
+    new_product_types = []
+    new_ingredients = []
+    updated_ingredients = []
+    errors = []
 
-    if isinstance(product, CFSProduct):
-        ingredient_form_cls = CFSActiveIngredientForm
-    else:
-        ingredient_form_cls = CFSActiveIngredientTemplateForm
+    for key, product_data in products_data.items():
+        product = products[key]
 
-    ingredient_names = product_data.ingredient_names
-    cas_numbers = product_data.cas_numbers
+        for product_type_number in product_data.product_type_numbers:
+            if (product.pk, product_type_number) not in existing_product_type_numbers:
+                new_product_types.append(
+                    product_type_cls(product=product, product_type_number=product_type_number)
+                )
 
-    # ingredient_names and cas_numbers are both appended to for each row of data
-    # the index for each ingredient will be the same in each list
-    ingredient_data = zip(ingredient_names, cas_numbers)
+        ingredients = existing_ingredients[product.pk]
 
-    for ingredient in ingredient_data:
-        name, cas_number = ingredient
+        for name, cas_number in zip(product_data.ingredient_names, product_data.cas_numbers):
+            ingredient = next((i for i in ingredients if i.cas_number == cas_number), None)
 
-        ingredient_form = ingredient_form_cls(
-            data={"name": name, "cas_number": cas_number}, product=product
-        )
+            if any(i.name == name and i is not ingredient for i in ingredients):
+                errors.append(
+                    f"Product '{product.product_name}' has error with active ingredient name"
+                    f" '{name}' - An active ingredient with this name and a different CAS number"
+                    " already exists."
+                )
 
-        if not ingredient_form.is_valid():
-            errors = ingredient_form.errors
+            elif ingredient is None:
+                new_ingredients.append(
+                    ingredient_cls(product=product, name=name, cas_number=cas_number)
+                )
 
-            if "name" in errors:
-                msg = f"active ingredient name '{name}' - {errors['name'][0]}"
-            elif "cas_number" in errors:
-                msg = f"CAS number '{cas_number}' - {errors['cas_number'][0]}"
-            else:
-                msg = f"active ingredient name '{name}' CAS number '{cas_number}'"
+            elif ingredient.name != name:
+                ingredient.name = name
+                updated_ingredients.append(ingredient)
 
-            raise ValidationError(f"Product '{product.product_name}' has error with {msg}")
+    if errors:
+        raise ValidationError(errors)
 
-        ingredient_form.save()
+    product_type_cls.objects.bulk_create(new_product_types, batch_size=PRODUCTS_FILE_BATCH_SIZE)
+    ingredient_cls.objects.bulk_update(
+        updated_ingredients, ["name"], batch_size=PRODUCTS_FILE_BATCH_SIZE
+    )
+    ingredient_cls.objects.bulk_create(new_ingredients, batch_size=PRODUCTS_FILE_BATCH_SIZE)
 
 
 def copy_export_application_to_export_application(
@@ -51,6 +51,7 @@ from web.models import (
 from web.models.shared import AddressEntryType, YesNoChoices
 from web.permissions import AppChecker, Perms
 from web.types import AuthenticatedHttpRequest
+from web.utils.reference_data import get_export_application_type
 from web.utils.s3 import delete_file_from_s3
 from web.utils.sentry import capture_exception
 from web.utils.validation import (
@@ -74,7 +75,11 @@ from .forms import (
     SubmitCOMForm,
     SubmitGMPForm,
 )
-from .utils import get_product_spreadsheet_response, process_products_file
+from .utils import (
+    get_product_spreadsheet_response,
+    get_products_file_error_message,
+    process_products_file,
+)
 
 
 def check_can_edit_application(
@@ -133,7 +138,7 @@ def create_export_application(
     :param template_pk: Optional PK of a template to populate application
     """
     app_template: CertificateApplicationTemplate | None
-    application_type: ExportApplicationType = ExportApplicationType.objects.get(type_code=type_code)
+    application_type = get_export_application_type(type_code)
 
     if not application_type.is_active:
         raise ValueError(f"Export application of type {application_type.type_code} is not active")
@@ -669,7 +674,7 @@ def product_spreadsheet_upload(
                 messages.warning(request, f"Upload failed: {err}")
 
     except ValidationError as err:
-        messages.warning(request, f"Upload failed: {err}")
+        messages.warning(request, f"Upload failed: {get_products_file_error_message(err)}")
 
     except Exception:
         messages.warning(request, "Upload failed: An unknown error occurred")
@@ -1005,7 +1010,7 @@ def view_gmp_document(
     )
 
     return view_application_file(
-        request.user, application, application.supporting_documents, document_pk
+        request, application, application.supporting_documents, document_pk
     )
 
 
@@ -1,4 +1,5 @@
 import datetime as dt
+from typing import Literal, Union
 
 from django import forms
 from django_select2.forms import Select2MultipleWidget
@@ -17,7 +18,11 @@ from web.models import (
 )
 from web.models.shared import YesNoChoices
 from web.permissions import get_all_case_officers
-from web.utils.search import get_export_status_choices, get_import_status_choices
+from web.utils.search import (
+    SearchTerms,
+    get_export_status_choices,
+    get_import_status_choices,
+)
 
 # We are restricting what the user can enter in the regex search fields rather than having to
 # escape everything in the search code later.
@@ -314,3 +319,53 @@ class ReassignmentUserForm(forms.Form):
 
         self.fields["assign_to"].queryset = get_all_case_officers()
         self.fields["applications"].queryset = Process.objects.all()
+
+
+SearchForm = Union[
+    ExportSearchAdvancedForm, ExportSearchForm, ImportSearchAdvancedForm, ImportSearchForm
+]
+
+
+def get_search_terms_from_form(
+    case_type: Literal["import", "export"], form: SearchForm
+) -> SearchTerms:
+    """Load the SearchTerms from the form data."""
+
+    cd = form.cleaned_data
+
+    return SearchTerms(
+        case_type=case_type,
+        # ---- Common search fields (Import and Export applications) ----
+        app_type=cd.get("application_type"),
+        case_status=cd.get("status"),
+        case_ref=cd.get("case_ref"),
+        licence_ref=cd.get("licence_ref"),
+        application_contact=cd.get("application_contact"),
+        response_decision=cd.get("decision"),
+        submitted_date_start=cd.get("submitted_from"),
+        submitted_date_end=cd.get("submitted_to"),
+        pending_firs=cd.get("pending_firs"),
+        pending_update_reqs=cd.get("pending_update_reqs"),
+        reassignment_search=cd.get("reassignment"),
+        reassignment_user=cd.get("reassignment_user"),
+        # ---- Import application fields ----
+        # icms_legacy_cases = str = None
+        app_sub_type=cd.get("application_sub_type"),
+        applicant_ref=cd.get("applicant_ref"),
+        importer_agent_name=cd.get("importer_or_agent"),
+        licence_type=cd.get("licence_type"),
+        chief_usage_status=cd.get("chief_usage_status"),
+        origin_country=cd.get("origin_country"),
+        consignment_country=cd.get("consignment_country"),
+        shipping_year=cd.get("shipping_year"),
+        goods_category=cd.get("goods_category"),
+        commodity_code=cd.get("commodity_code"),
+        licence_date_start=cd.get("licence_from"),
+        licence_date_end=cd.get("licence_to"),
+        issue_date_start=cd.get("issue_from"),
+        issue_date_end=cd.get("issue_to"),
+        # ---- Export application fields ----
+        exporter_agent_name=cd.get("exporter_or_agent"),
+        certificate_country=cd.get("certificate_country"),
+        manufacture_country=cd.get("manufacture_country"),
+    )
@@ -1,15 +1,18 @@
 import uuid
 from random import randint
+from typing import Any
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.db.models import Q, QuerySet
 
 from web.flow.models import Process
 from web.mail.constants import CaseEmailCodes
+from web.models.indexes import get_search_indexes
 from web.types import TypedTextChoices
 
 from .shared import ImpExpStatus
@@ -239,6 +242,20 @@ class ApplicationBase(Process):
         max_length=4000, blank=True, null=True, verbose_name="Refusal reason"
     )
 
+    # Fields used to search applications that can change without the status changing.
+    # Cached search results are invalidated when they change, see web.utils.search.signals
+    SEARCH_STATE_FIELDS = ("status", "decision", "case_owner_id")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_search_state = instance.get_search_state()
+
+        return instance
+
+    def get_search_state(self) -> tuple[Any, ...]:
+        return tuple(self.__dict__.get(field) for field in self.SEARCH_STATE_FIELDS)
+
     def is_import_application(self) -> bool:
         raise NotImplementedError
 
@@ -398,8 +415,41 @@ class CaseDocumentReference(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["content_type", "object_id"]),
+            *get_search_indexes("reference", "CDR_search_ref"),
         ]
 
     def __str__(self):
         o_id, dt, ref = (self.object_id, self.document_type, self.reference)
         return f"CaseDocumentReference(object_id={o_id}, document_type={dt}, reference={ref})"
+
+
+class SearchExport(models.Model):
+    """A search results spreadsheet generated in the background.
+
+    The submitted search form data is stored so the search can be run by a celery task,
+    see web.domains.case.tasks.export_search_results.
+    """
+
+    class Status(TypedTextChoices):
+        SUBMITTED = ("SUBMITTED", "Submitted")
+        IN_PROGRESS = ("IN_PROGRESS", "In Progress")
+        COMPLETED = ("COMPLETED", "Completed")
+        FAILED = ("FAILED", "Failed")
+
+    case_type = models.CharField(max_length=6)
+    parameters = models.JSONField(encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=11, choices=Status.choices, default=Status.SUBMITTED)
+
+    # Progress of the export, total_rows is set once the search has been run.
+    total_rows = models.IntegerField(null=True)
+    processed_rows = models.IntegerField(default=0)
+
+    document = models.OneToOneField("web.File", on_delete=models.CASCADE, null=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="+"
+    )
+    created_datetime = models.DateTimeField(auto_now_add=True)
+    finished_datetime = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return f"SearchExport(pk={self.pk}, case_type={self.case_type}, status={self.status})"
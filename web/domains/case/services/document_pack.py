@@ -296,12 +296,15 @@ def _create_export_documents(application: ExportApplication, lock_manager: "Lock
     if application.process_type in [ProcessTypes.COM, ProcessTypes.CFS, ProcessTypes.GMP]:
         app = application.get_specific_model()
 
-        for country in app.countries.all().order_by("name"):
-            doc_ref_certificate_create(
-                certificate,
-                reference.get_export_certificate_reference(lock_manager, app),
-                country=country,
-            )
+        countries = list(app.countries.all().order_by("name"))
+
+        if not countries:
+            return
+
+        references = reference.get_export_certificate_references(lock_manager, app, len(countries))
+
+        for country, doc_reference in zip(countries, references, strict=True):
+            doc_ref_certificate_create(certificate, doc_reference, country=country)
     else:
         raise NotImplementedError(f"Unknown process_type: {application.process_type}")
 
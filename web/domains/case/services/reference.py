@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING, Literal
 
+from django.db import connection, transaction
 from django.utils import timezone
 
 from web.flow.models import ProcessTypes
-from web.models import UniqueReference
+from web.models import ReferenceCounter, UniqueReference
 
 if TYPE_CHECKING:
     from web.domains.case.types import ImpOrExp
@@ -94,6 +95,20 @@ def get_export_certificate_reference(
         - NNNNN: Next sequence value (padded to 5 digits)
     """
 
+    (certificate_reference,) = get_export_certificate_references(lock_manager, application, 1)
+
+    return certificate_reference
+
+
+def get_export_certificate_references(
+    lock_manager: "LockManager", application: "ExportApplication", count: int
+) -> list[str]:
+    """Creates `count` consecutive export application certificate references.
+
+    Used to allocate the references for every country of a certificate in one go.
+    See get_export_certificate_reference for the reference format.
+    """
+
     match application.process_type:
         case ProcessTypes.CFS:
             prefix = Prefix.EXPORT_CERTIFICATE_DOCUMENT_CFS
@@ -106,9 +121,9 @@ def get_export_certificate_reference(
                 f"Invalid process_type {application.process_type}: ExportApplication process_type is required."
             )
 
-    case_reference = _get_next_reference(lock_manager, prefix=prefix, use_year=True)
+    case_references = _get_next_references(lock_manager, prefix=prefix, use_year=True, count=count)
 
-    return _get_reference_string(case_reference, use_year=True, min_digits=5)
+    return [_get_reference_string(cr, use_year=True, min_digits=5) for cr in case_references]
 
 
 def get_mailshot_reference(lock_manager: "LockManager") -> str:
@@ -142,25 +157,64 @@ def _get_next_reference(
 ) -> UniqueReference:
     """Return the next available UniqueReference instance."""
 
-    lock_manager.ensure_tables_are_locked([UniqueReference])
+    (case_reference,) = _get_next_references(
+        lock_manager, prefix=prefix, use_year=use_year, count=1
+    )
+
+    return case_reference
+
+
+def _get_next_references(
+    lock_manager: "LockManager", *, prefix: str, use_year: bool, count: int
+) -> list[UniqueReference]:
+    """Return the next `count` available UniqueReference instances.
+
+    The ReferenceCounter row for the prefix and year is incremented and locked until the
+    transaction ends. Concurrent transactions wanting a reference with the same prefix and year
+    wait for it, and a rolled back transaction releases its references, so references are
+    allocated without gaps. Other prefixes and readers of UniqueReference are not blocked.
+
+    The counter never falls behind the UniqueReference table, which is also populated by the
+    V1 data migration.
+    """
+
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
+    if transaction.get_autocommit():
+        raise RuntimeError("References must be allocated inside a database transaction")
 
     year: int | None
 
     if use_year:
         year = timezone.now().year
+        year_filter = "year = %(year)s"
     else:
         year = None
+        year_filter = "year IS NULL"
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {ReferenceCounter._meta.db_table} (prefix, year, last_reference)
+            SELECT %(prefix)s, %(year)s, COALESCE(MAX(reference), 0) + %(count)s
+            FROM {UniqueReference._meta.db_table}
+            WHERE prefix = %(prefix)s AND {year_filter}
+            ON CONFLICT (prefix, year) DO UPDATE
+            SET last_reference = GREATEST(
+                {ReferenceCounter._meta.db_table}.last_reference + %(count)s,
+                EXCLUDED.last_reference
+            )
+            RETURNING last_reference
+            """,
+            {"prefix": prefix, "year": year, "count": count},
+        )
+        (last_reference,) = cursor.fetchone()
 
-    last_ref = UniqueReference.objects.filter(prefix=prefix, year=year).order_by("reference").last()
-
-    if last_ref:
-        new_ref = last_ref.reference + 1
-    else:
-        new_ref = 1
-
-    case_reference = UniqueReference.objects.create(prefix=prefix, year=year, reference=new_ref)
-
-    return case_reference
+    return UniqueReference.objects.bulk_create(
+        UniqueReference(prefix=prefix, year=year, reference=reference)
+        for reference in range(last_reference - count + 1, last_reference + 1)
+    )
 
 
 def _get_reference_string(case_reference: UniqueReference, use_year: bool, min_digits: int) -> str:
@@ -1,13 +1,24 @@
+import datetime as dt
 import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 
-from celery import chord
+from celery import chain
+from django.conf import settings
 from django.db import transaction
+from django.http import QueryDict
 from django.utils import timezone
 
 from config.celery import app
+from web.domains.case.forms_search import (
+    ExportSearchAdvancedForm,
+    ImportSearchAdvancedForm,
+    get_search_terms_from_form,
+)
 from web.domains.case.services import case_progress, document_pack
 from web.domains.case.shared import ImpExpStatus
-from web.domains.case.types import ImpOrExp
+from web.domains.case.types import DocumentPack, ImpOrExp
 from web.domains.case.utils import end_process_task
 from web.domains.chief import client
 from web.mail.emails import send_completed_application_process_notifications
@@ -15,117 +26,184 @@ from web.models import (
     CaseDocumentReference,
     File,
     Process,
+    SearchExport,
     Task,
     User,
     VariationRequest,
 )
 from web.types import DocumentTypes
 from web.utils.pdf import PdfGenerator, signer
-from web.utils.s3 import delete_file_from_s3, upload_file_obj_to_s3
+from web.utils.s3 import delete_file_from_s3, get_s3_client, upload_file_obj_to_s3
+from web.utils.search import write_search_results_spreadsheet
 from web.utils.sentry import capture_exception, capture_message
+from web.utils.spreadsheet import MIMETYPE
 
 
 def create_case_document_pack(application: ImpOrExp, user: User) -> None:
     # Success / Error task
-    # called after all tasks have finished
-    callback = create_document_pack_on_success.si(application.id, user.id).on_error(
-        create_document_pack_on_error.s(application_pk=application.id, user_pk=user.id)
-    )
+    # called after all the documents have been created
+    callback = create_document_pack_on_success.si(application.id, user.id)
+    errback = create_document_pack_on_error.s(application_pk=application.id, user_pk=user.id)
 
-    # Create the tasks that will generate the documents
-    if application.is_import_application():
-        create_doc_func = create_import_application_document
-    else:
-        create_doc_func = create_export_application_document
+    # Queue the documents to be generated.
+    chain(create_document_pack_documents.si(application.id, user.id), callback).on_error(
+        errback
+    ).apply_async()
 
-    doc_pack = document_pack.pack_draft_get(application)
-    documents = document_pack.doc_ref_documents_all(doc_pack)
 
-    header = [create_doc_func.si(application.id, doc_pack.pk, cdr.pk, user.id) for cdr in documents]
+class DocumentPackError(Exception):
+    pass
 
-    # Queue the documents to be generated.
-    chord(header=header, body=callback).apply_async()
 
+@dataclass
+class CaseDocument:
+    document_reference: CaseDocumentReference
+    filename: str
+    file_obj: io.BytesIO
+    key: str
+    file_size: int = 0
 
-@app.task(name="web.domains.case.tasks.create_import_application_document")
-def create_import_application_document(
-    application_pk: int, licence_pk: int, casedocumentreference_pk: int, user_pk: int
+
+@app.task(name="web.domains.case.tasks.create_document_pack_documents")
+def create_document_pack_documents(
+    application_pk: int, user_pk: int, document_reference_pks: list[int] | None = None
 ) -> None:
-    with transaction.atomic():
-        user = User.objects.get(pk=user_pk)
+    """Create every document in the application's draft document pack.
 
-        application = Process.objects.get(pk=application_pk).get_specific_model()
-        licence = application.licences.get(pk=licence_pk)
-        document_reference = licence.document_references.select_for_update().get(
-            pk=casedocumentreference_pk
-        )
+    The application, document pack and signing key are loaded once and shared by every
+    document. Documents are signed one after another and uploaded concurrently.
 
-        if document_reference.document_type == CaseDocumentReference.Type.LICENCE:
-            doc_type = DocumentTypes.LICENCE_SIGNED
-            filename = "import-licence.pdf"
+    Documents that are created successfully are saved even if others fail, the failures
+    are raised in a single DocumentPackError to trigger create_document_pack_on_error.
 
-        elif document_reference.document_type == CaseDocumentReference.Type.COVER_LETTER:
-            doc_type = DocumentTypes.COVER_LETTER_SIGNED
-            filename = "cover-letter.pdf"
+    document_reference_pks limits the documents created, see the deprecated tasks below.
+    """
+
+    user = User.objects.get(pk=user_pk)
+    application = Process.objects.get(pk=application_pk).get_specific_model()
+    doc_pack = document_pack.pack_draft_get(application)
+    document_references = document_pack.doc_ref_documents_all(doc_pack).select_related(
+        "document", "reference_data__country"
+    )
+
+    if document_reference_pks is not None:
+        document_references = document_references.filter(pk__in=document_reference_pks)
+
+    document_references = list(document_references)
+    signing_key = signer.get_signing_key() if document_references else None
+
+    errors: dict[int, Exception] = {}
+    documents: list[CaseDocument] = []
 
+    for cdr in document_references:
+        try:
+            pdf_gen, filename = _get_case_document_generator(application, doc_pack, cdr)
+
+            file_obj = io.BytesIO()
+            pdf_gen.get_pdf(target=file_obj)
+
+            # Add digital signature to the pdf
+            file_obj = signer.sign_pdf(file_obj, signing_key)
+            file_obj.seek(0)
+
+        except Exception as e:
+            errors[cdr.pk] = e
         else:
-            raise ValueError(
-                f"Unable to generate document - unsupported document type {document_reference.document_type}"
-            )
+            key = get_case_document_key(cdr, filename)
+            documents.append(CaseDocument(cdr, filename, file_obj, key))
 
-        # Delete old document if it exists.
-        # This happens if the application is sent to CHIEF but there is an error, and it is now being resent.
-        if document_reference.document:
-            delete_file_from_s3(path=document_reference.document.path)
+    with ThreadPoolExecutor(max_workers=settings.DOCUMENT_PACK_UPLOAD_WORKERS) as executor:
+        futures = {executor.submit(_upload_case_document, doc): doc for doc in documents}
+
+        for future in as_completed(futures):
+            doc = futures[future]
+
+            try:
+                future.result()
+            except Exception as e:
+                errors[doc.document_reference.pk] = e
 
-        file_obj = io.BytesIO()
-        pdf_gen = PdfGenerator(doc_type=doc_type, application=application, doc_pack=licence)
-        pdf_gen.get_pdf(target=file_obj)
+    for doc in documents:
+        if doc.document_reference.pk not in errors:
+            _save_case_document(doc, user)
 
-        # Add digital signature to the licence pdf
-        file_obj = signer.sign_pdf(file_obj)
-        file_obj.seek(0)
+    if errors:
+        error_list = ", ".join(f"{pk}: {exc!r}" for pk, exc in errors.items())
 
-        upload_case_document_file(file_obj, document_reference, filename, user)
+        raise DocumentPackError(f"Failed to create case documents (pk: error) {error_list}")
+
+
+@app.task(name="web.domains.case.tasks.create_import_application_document")
+def create_import_application_document(
+    application_pk: int, licence_pk: int, casedocumentreference_pk: int, user_pk: int
+) -> None:
+    """Deprecated: use create_document_pack_documents.
+
+    create_case_document_pack used to queue one of these tasks per document. The task is kept
+    so that tasks queued before a deploy still create their document, and can be removed once
+    none remain queued.
+    """
+
+    create_document_pack_documents(application_pk, user_pk, [casedocumentreference_pk])
 
 
 @app.task(name="web.domains.case.tasks.create_export_application_document")
 def create_export_application_document(
     application_pk: int, certificate_pk: int, casedocumentreference_pk: int, user_pk: int
 ) -> None:
-    application = Process.objects.get(pk=application_pk).get_specific_model()
-    with transaction.atomic():
-        user = User.objects.get(pk=user_pk)
+    """Deprecated: use create_document_pack_documents.
+
+    See create_import_application_document.
+    """
+
+    create_document_pack_documents(application_pk, user_pk, [casedocumentreference_pk])
 
-        certificate = application.certificates.get(pk=certificate_pk)
-        document_reference = certificate.document_references.select_for_update().get(
-            pk=casedocumentreference_pk
-        )
 
-        if document_reference.document_type == CaseDocumentReference.Type.CERTIFICATE:
+def _get_case_document_generator(
+    application: ImpOrExp, doc_pack: DocumentPack, cdr: CaseDocumentReference
+) -> tuple[PdfGenerator, str]:
+    match cdr.document_type:
+        case CaseDocumentReference.Type.LICENCE:
+            doc_type = DocumentTypes.LICENCE_SIGNED
+            filename = "import-licence.pdf"
+            country = None
+
+        case CaseDocumentReference.Type.COVER_LETTER:
+            doc_type = DocumentTypes.COVER_LETTER_SIGNED
+            filename = "cover-letter.pdf"
+            country = None
+
+        case CaseDocumentReference.Type.CERTIFICATE:
             doc_type = DocumentTypes.CERTIFICATE_SIGNED
-            at = application.application_type
-            country = document_reference.reference_data.country
-            filename = f"{at.type} ({country.name}).pdf"
-        else:
+            country = cdr.reference_data.country
+            filename = f"{application.application_type.type} ({country.name}).pdf"
+
+        case _:
             raise ValueError(
-                f"Unable to generate document - unsupported document type {document_reference.document_type}"
+                f"Unable to generate document - unsupported document type {cdr.document_type}"
             )
 
-        if document_reference.document:
-            delete_file_from_s3(path=document_reference.document.path)
+    pdf_gen = PdfGenerator(
+        doc_type=doc_type, application=application, doc_pack=doc_pack, country=country
+    )
+
+    return pdf_gen, filename
 
-        file_obj = io.BytesIO()
-        pdf_gen = PdfGenerator(
-            doc_type=doc_type, application=application, doc_pack=certificate, country=country
-        )
-        pdf_gen.get_pdf(target=file_obj)
 
-        # Add digital signature to the pdf
-        file_obj = signer.sign_pdf(file_obj)
-        file_obj.seek(0)
+def _upload_case_document(doc: CaseDocument) -> None:
+    doc.file_size = upload_file_obj_to_s3(doc.file_obj, doc.key)
 
-        upload_case_document_file(file_obj, document_reference, filename, user)
+
+def _save_case_document(doc: CaseDocument, user: User) -> None:
+    with transaction.atomic():
+        cdr = CaseDocumentReference.objects.select_for_update().get(pk=doc.document_reference.pk)
+
+        # Delete old document if it exists.
+        # This happens if the application is sent to CHIEF but there is an error, and it is now being resent.
+        if cdr.document:
+            delete_file_from_s3(path=cdr.document.path)
+
+        save_case_document_file(cdr, doc.key, doc.filename, doc.file_size, user)
 
 
 @app.task(name="web.domains.case.tasks.create_document_pack_on_success")
@@ -192,17 +270,18 @@ def update_application_on_error(application_pk: int, user_pk: int) -> None:
         )
 
 
-def upload_case_document_file(
-    file_obj: io.BytesIO, cdr: "CaseDocumentReference", filename: str, created_by: "User"
-) -> None:
-    """Upload a case document file to s3 and create related data."""
-
+def get_case_document_key(cdr: "CaseDocumentReference", filename: str) -> str:
     # application id - document type - case document reference id - timestamp - filename
     # Always store timestamp in UTC (e.g. Don't use datetime_format())
     time_stamp = timezone.now().strftime("%Y%m%d%H%M%S")
-    key = f"{cdr.object_id}_{cdr.document_type}_{cdr.id}_{time_stamp}_{filename}"
 
-    file_size = upload_file_obj_to_s3(file_obj, key)
+    return f"{cdr.object_id}_{cdr.document_type}_{cdr.id}_{time_stamp}_{filename}"
+
+
+def save_case_document_file(
+    cdr: "CaseDocumentReference", key: str, filename: str, file_size: int, created_by: "User"
+) -> None:
+    """Create the File record for a case document uploaded to s3."""
 
     cdr.document = File.objects.create(
         is_active=True,
@@ -215,6 +294,89 @@ def upload_case_document_file(
     cdr.save()
 
 
+@app.task(name="web.domains.case.tasks.export_search_results")
+def export_search_results(search_export_pk: int) -> None:
+    """Write every search result to a spreadsheet and store it as the export document.
+
+    Progress is saved after each batch of records so it can be shown while the export runs.
+    """
+
+    search_export = SearchExport.objects.select_related("created_by").get(pk=search_export_pk)
+    search_export.status = SearchExport.Status.IN_PROGRESS
+    search_export.save(update_fields=["status"])
+
+    try:
+        _write_search_export(search_export)
+    except Exception:
+        SearchExport.objects.filter(pk=search_export_pk).update(
+            status=SearchExport.Status.FAILED, finished_datetime=timezone.now()
+        )
+        raise
+
+
+def _write_search_export(search_export: SearchExport) -> None:
+    form_class = (
+        ImportSearchAdvancedForm
+        if search_export.case_type == "import"
+        else ExportSearchAdvancedForm
+    )
+    form_data = QueryDict(mutable=True)
+    for field, values in search_export.parameters.items():
+        form_data.setlist(field, values)
+
+    form = form_class(form_data)
+    if not form.is_valid():
+        raise ValueError(f"Invalid search parameters: {form.errors.as_json()}")
+
+    terms = get_search_terms_from_form(search_export.case_type, form)
+
+    def on_progress(processed_rows: int, total_rows: int) -> None:
+        SearchExport.objects.filter(pk=search_export.pk).update(
+            processed_rows=processed_rows, total_rows=total_rows
+        )
+
+    filename = f"{search_export.case_type}_application_download.xlsx"
+    key = f"SEARCH_EXPORTS/{search_export.pk}/{filename}"
+
+    with tempfile.TemporaryFile() as xlsx_file:
+        total_rows = write_search_results_spreadsheet(
+            terms, search_export.created_by, xlsx_file, on_progress
+        )
+        xlsx_file.seek(0)
+        file_size = upload_file_obj_to_s3(xlsx_file, key)
+
+    search_export.document = File.objects.create(
+        is_active=True,
+        filename=filename,
+        content_type=MIMETYPE.XLSX,
+        file_size=file_size,
+        path=key,
+        created_by=search_export.created_by,
+    )
+    search_export.status = SearchExport.Status.COMPLETED
+    search_export.total_rows = total_rows
+    search_export.processed_rows = total_rows
+    search_export.finished_datetime = timezone.now()
+    search_export.save()
+
+
+@app.task(name="web.domains.case.tasks.delete_expired_search_exports")
+def delete_expired_search_exports() -> None:
+    """Delete search exports older than SEARCH_EXPORT_RETENTION_DAYS and their spreadsheets."""
+
+    expiry = timezone.now() - dt.timedelta(days=settings.SEARCH_EXPORT_RETENTION_DAYS)
+    expired = SearchExport.objects.filter(created_datetime__lt=expiry).select_related("document")
+    s3_client = get_s3_client()
+
+    for search_export in expired:
+        if search_export.document:
+            delete_file_from_s3(search_export.document.path, s3_client)
+            # Deleting the document deletes the search export too.
+            search_export.document.delete()
+        else:
+            search_export.delete()
+
+
 # NOTE: Leaving this here for now as it's useful to easily test celery tasks.
 # def chord_testing(application_id):
 #     callback = on_chord_success.si(application_id).on_error(
@@ -34,6 +34,22 @@ public_search_urls = [
         views_search.download_spreadsheet,
         name="search-download-spreadsheet",
     ),
+    path(
+        "search-export-spreadsheet",
+        views_search.start_search_export,
+        name="search-export-spreadsheet",
+    ),
+    path(
+        "search-export/<int:search_export_pk>/",
+        include(
+            [
+                path("status/", views_search.search_export_status, name="search-export-status"),
+                path(
+                    "download/", views_search.download_search_export, name="search-export-download"
+                ),
+            ]
+        ),
+    ),
     path(
         "search-actions/<int:application_pk>/",
         include(
@@ -9,12 +9,12 @@ from guardian.shortcuts import get_objects_for_user
 from web.domains.case.services import document_pack
 from web.domains.case.types import DocumentPack
 from web.domains.case.utils import get_case_page_title
+from web.domains.file.utils import get_file_download_response
 from web.flow.models import ProcessTypes
 from web.mail.url_helpers import get_constabulary_document_download_view_url
 from web.models import CaseDocumentReference, Constabulary, ImportApplication
 from web.permissions import Perms
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 
 
 # Note: Not currently in use (replaced by DownloadDFLCaseDocumentsFormView)
@@ -110,7 +110,5 @@ class ConstabularyDocumentDownloadView(BaseConstabularyDocumentView, DetailView)
 
     def get(self, request: AuthenticatedHttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         cdr = CaseDocumentReference.objects.get(pk=kwargs["cdr_pk"])
-        file_content = get_file_from_s3(cdr.document.path)
-        response = HttpResponse(content=file_content, content_type=cdr.document.content_type)
-        response["Content-Disposition"] = f'attachment; filename="{cdr.document.filename}"'
-        return response
+
+        return get_file_download_response(request, cdr.document)
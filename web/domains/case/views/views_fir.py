@@ -18,7 +18,7 @@ from web.domains.case.forms import DocumentForm
 from web.domains.case.services import case_progress
 from web.domains.case.types import ImpOrExpOrAccess
 from web.domains.case.utils import get_case_page_title
-from web.domains.file.utils import create_file_model
+from web.domains.file.utils import create_file_model, get_file_download_response
 from web.domains.template.utils import get_fir_template_data
 from web.flow.models import ProcessTypes
 from web.mail.emails import (
@@ -29,7 +29,6 @@ from web.mail.emails import (
 from web.models import AccessRequest, FurtherInformationRequest, User
 from web.permissions import AppChecker, Perms
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 
 from .utils import (
     get_caseworker_view_readonly_status,
@@ -384,12 +383,8 @@ def view_fir_file(
     fir = get_object_or_404(application.further_information_requests, pk=fir_pk)
 
     document = fir.files.get(pk=file_pk)
-    file_content = get_file_from_s3(document.path)
 
-    response = HttpResponse(content=file_content, content_type=document.content_type)
-    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
-
-    return response
+    return get_file_download_response(request, document)
 
 
 @login_required
@@ -10,10 +10,9 @@ from web.domains.case import forms
 from web.domains.case.services import case_progress
 from web.domains.case.types import ImpOrExp
 from web.domains.case.utils import get_case_page_title
-from web.domains.file.utils import create_file_model
+from web.domains.file.utils import create_file_model, get_file_download_response
 from web.permissions import Perms
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 
 from .utils import get_caseworker_view_readonly_status, get_class_imp_or_exp
 
@@ -250,12 +249,8 @@ def view_note_document(
     application: ImpOrExp = get_object_or_404(model_class, pk=application_pk)
     note = application.case_notes.get(pk=note_pk)
     document = note.files.get(pk=file_pk)
-    file_content = get_file_from_s3(document.path)
 
-    response = HttpResponse(content=file_content, content_type=document.content_type)
-    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
-
-    return response
+    return get_file_download_response(request, document)
 
 
 @login_required
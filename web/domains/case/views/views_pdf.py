@@ -165,7 +165,7 @@ def view_case_document(
     cdr = get_object_or_404(obj.document_references, pk=casedocumentreference_pk)
 
     return view_application_file(
-        user=request.user,
+        request=request,
         application=application,
         related_file_model=File.objects,
         file_pk=cdr.document.pk,
@@ -194,7 +194,7 @@ def view_static_document(
     application: ImpOrExp = get_object_or_404(Process, pk=application_pk).get_specific_model()
 
     return view_application_file(
-        user=request.user,
+        request=request,
         application=application,
         related_file_model=File.objects,
         file_pk=file_pk,
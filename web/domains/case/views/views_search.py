@@ -1,4 +1,5 @@
-from typing import Any, Literal, Union
+from http import HTTPStatus
+from typing import Any, Literal
 from urllib import parse
 
 from django.contrib import messages
@@ -8,7 +9,7 @@ from django.core.exceptions import PermissionDenied
 from django.db import transaction
 from django.db.models import QuerySet, Window
 from django.db.models.functions import RowNumber
-from django.http import HttpResponse, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 from django.utils import timezone
@@ -34,13 +35,17 @@ from web.domains.case.forms_search import (
     ImportSearchAdvancedForm,
     ImportSearchForm,
     ReassignmentUserForm,
+    SearchForm,
+    get_search_terms_from_form,
 )
 from web.domains.case.services import case_progress, document_pack, reference
 from web.domains.case.shared import ImpExpStatus
+from web.domains.case.tasks import export_search_results
 from web.domains.cat.forms import CreateCATForm
 from web.domains.cat.models import CertificateApplicationTemplate
 from web.domains.cat.utils import create_cat
 from web.domains.chief import client
+from web.domains.file.utils import get_file_download_response
 from web.flow.models import ProcessTypes
 from web.mail.emails import (
     send_application_reopened_email,
@@ -57,6 +62,7 @@ from web.models import (
     ImportApplication,
     ImportApplicationType,
     Process,
+    SearchExport,
     Task,
     User,
     VariationRequest,
@@ -68,18 +74,12 @@ from web.permissions import (
     get_org_obj_permissions,
 )
 from web.types import AuthenticatedHttpRequest
-from web.utils.search import (
-    SearchTerms,
-    get_search_results_spreadsheet,
-    search_applications,
-)
+from web.utils.search import get_search_results_spreadsheet, search_applications
+from web.utils.search.cache import invalidate_search_results
 from web.utils.sentry import capture_exception
 
 from .mixins import ApplicationTaskMixin
 
-SearchForm = Union[
-    ExportSearchAdvancedForm, ExportSearchForm, ImportSearchAdvancedForm, ImportSearchForm
-]
 SearchFormT = type[SearchForm]
 
 
@@ -112,7 +112,7 @@ def search_cases(
 
     if form.is_valid() and get_results:
         show_search_results = True
-        terms = _get_search_terms_from_form(case_type, form)
+        terms = get_search_terms_from_form(case_type, form)
         results = search_applications(terms, request.user)
 
         total_rows = results.total_rows
@@ -168,6 +168,7 @@ def reassign_case_owner(request: AuthenticatedHttpRequest, *, case_type: str) ->
 
             now = timezone.now()
             apps.update(case_owner=new_case_owner, order_datetime=now, reassign_datetime=now)
+            invalidate_search_results()
         else:
             return HttpResponse(status=400)
 
@@ -194,7 +195,7 @@ def download_spreadsheet(
     mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     response = HttpResponse(content_type=mime_type)
 
-    terms = _get_search_terms_from_form(case_type, form)
+    terms = get_search_terms_from_form(case_type, form)
     results = search_applications(terms, request.user)
     search_spreadsheet = get_search_results_spreadsheet(case_type, results)
     response.write(search_spreadsheet)
@@ -204,6 +205,90 @@ def download_spreadsheet(
     return response
 
 
+@require_POST
+@login_required
+def start_search_export(
+    request: AuthenticatedHttpRequest, *, case_type: Literal["import", "export"]
+) -> HttpResponse:
+    """Queue a spreadsheet of every search result to be generated in the background.
+
+    Returns the URL used to check the progress of the export.
+    """
+    if not can_user_view_search_cases(request.user, case_type):
+        raise PermissionDenied
+
+    form_class: SearchFormT = (
+        ImportSearchAdvancedForm if case_type == "import" else ExportSearchAdvancedForm
+    )
+    form = form_class(request.POST)
+
+    if not form.is_valid():
+        return HttpResponse(status=400)
+
+    search_export = SearchExport.objects.create(
+        case_type=case_type,
+        parameters={field: request.POST.getlist(field) for field in form.fields},
+        created_by=request.user,
+    )
+    export_search_results.delay(search_export.pk)
+
+    status_url = reverse(
+        "case:search-export-status",
+        kwargs={"case_type": case_type, "search_export_pk": search_export.pk},
+    )
+
+    return JsonResponse(data={"status_url": status_url}, status=HTTPStatus.ACCEPTED)
+
+
+@require_GET
+@login_required
+def search_export_status(
+    request: AuthenticatedHttpRequest,
+    *,
+    case_type: Literal["import", "export"],
+    search_export_pk: int,
+) -> JsonResponse:
+    search_export = get_object_or_404(
+        SearchExport, pk=search_export_pk, case_type=case_type, created_by=request.user
+    )
+
+    if search_export.status == SearchExport.Status.COMPLETED:
+        download_url = reverse(
+            "case:search-export-download",
+            kwargs={"case_type": case_type, "search_export_pk": search_export.pk},
+        )
+    else:
+        download_url = None
+
+    return JsonResponse(
+        data={
+            "status": search_export.status,
+            "processed_rows": search_export.processed_rows,
+            "total_rows": search_export.total_rows,
+            "download_url": download_url,
+        }
+    )
+
+
+@require_GET
+@login_required
+def download_search_export(
+    request: AuthenticatedHttpRequest,
+    *,
+    case_type: Literal["import", "export"],
+    search_export_pk: int,
+) -> HttpResponse:
+    search_export = get_object_or_404(
+        SearchExport,
+        pk=search_export_pk,
+        case_type=case_type,
+        created_by=request.user,
+        status=SearchExport.Status.COMPLETED,
+    )
+
+    return get_file_download_response(request, search_export.document)
+
+
 @method_decorator(transaction.atomic, name="post")
 class ReopenApplicationView(
     LoginRequiredMixin, PermissionRequiredMixin, case_progress.ClosedApplicationTaskMixin, View
@@ -675,48 +760,3 @@ class CreateCATemplateFromExportApplicationView(
 
     def get_success_url(self) -> str:
         return reverse("cat:edit", kwargs={"cat_pk": self.new_cat.pk})
-
-
-def _get_search_terms_from_form(
-    case_type: Literal["import", "export"], form: SearchForm
-) -> SearchTerms:
-    """Load the SearchTerms from the form data."""
-
-    cd = form.cleaned_data
-
-    return SearchTerms(
-        case_type=case_type,
-        # ---- Common search fields (Import and Export applications) ----
-        app_type=cd.get("application_type"),
-        case_status=cd.get("status"),
-        case_ref=cd.get("case_ref"),
-        licence_ref=cd.get("licence_ref"),
-        application_contact=cd.get("application_contact"),
-        response_decision=cd.get("decision"),
-        submitted_date_start=cd.get("submitted_from"),
-        submitted_date_end=cd.get("submitted_to"),
-        pending_firs=cd.get("pending_firs"),
-        pending_update_reqs=cd.get("pending_update_reqs"),
-        reassignment_search=cd.get("reassignment"),
-        reassignment_user=cd.get("reassignment_user"),
-        # ---- Import application fields ----
-        # icms_legacy_cases = str = None
-        app_sub_type=cd.get("application_sub_type"),
-        applicant_ref=cd.get("applicant_ref"),
-        importer_agent_name=cd.get("importer_or_agent"),
-        licence_type=cd.get("licence_type"),
-        chief_usage_status=cd.get("chief_usage_status"),
-        origin_country=cd.get("origin_country"),
-        consignment_country=cd.get("consignment_country"),
-        shipping_year=cd.get("shipping_year"),
-        goods_category=cd.get("goods_category"),
-        commodity_code=cd.get("commodity_code"),
-        licence_date_start=cd.get("licence_from"),
-        licence_date_end=cd.get("licence_to"),
-        issue_date_start=cd.get("issue_from"),
-        issue_date_end=cd.get("issue_to"),
-        # ---- Export application fields ----
-        exporter_agent_name=cd.get("exporter_or_agent"),
-        certificate_country=cd.get("certificate_country"),
-        manufacture_country=cd.get("manufacture_country"),
-    )
@@ -24,6 +24,7 @@ from django_filters.views import FilterView
 from web.domains.case.export.forms import ProductsFileUploadForm
 from web.domains.case.export.utils import (
     get_product_spreadsheet_response,
+    get_products_file_error_message,
     process_products_file,
 )
 from web.domains.case.export.views import (
@@ -686,7 +687,7 @@ class CFSScheduleTemplateProductUploadSpreadsheetView(
             )
 
         except ValidationError as err:
-            messages.warning(self.request, f"Upload failed: {err}")
+            messages.warning(self.request, f"Upload failed: {get_products_file_error_message(err)}")
 
         except Exception:
             messages.warning(self.request, "Upload failed: An unknown error occurred")
@@ -1,10 +1,18 @@
+from collections.abc import Iterable
+
 from django.utils import timezone
 
 from web.domains.case.services import case_progress, document_pack
 from web.domains.case.shared import ImpExpStatus
 from web.domains.case.utils import end_process_task
 from web.mail.emails import send_completed_application_process_notifications
-from web.models import ICMSHMRCChiefRequest, ImportApplication, Task, VariationRequest
+from web.models import (
+    ChiefRequestResponseErrors,
+    ICMSHMRCChiefRequest,
+    ImportApplication,
+    Task,
+    VariationRequest,
+)
 
 from .types import ResponseError
 
@@ -54,17 +62,52 @@ def _finish_chief_wait_task(application: ImportApplication) -> Task:
 def complete_chief_request(chief_req: ICMSHMRCChiefRequest) -> None:
     """Mark a ICMSHMRCChiefRequest record as complete."""
 
-    chief_req.status = ICMSHMRCChiefRequest.CHIEFStatus.SUCCESS
-    chief_req.response_received_datetime = timezone.now()
-    chief_req.save()
+    complete_chief_requests([chief_req])
+
+
+def complete_chief_requests(chief_requests: Iterable[ICMSHMRCChiefRequest]) -> None:
+    """Mark ICMSHMRCChiefRequest records as complete with a single query."""
+
+    now = timezone.now()
+    chief_requests = list(chief_requests)
+
+    for chief_req in chief_requests:
+        chief_req.status = ICMSHMRCChiefRequest.CHIEFStatus.SUCCESS
+        chief_req.response_received_datetime = now
+
+    ICMSHMRCChiefRequest.objects.bulk_update(
+        chief_requests, ["status", "response_received_datetime"]
+    )
 
 
 def fail_chief_request(chief_req: ICMSHMRCChiefRequest, errors: list[ResponseError]) -> None:
     """Mark a ICMSHMRCChiefRequest record as a failure detailing the error code and message."""
 
-    chief_req.status = ICMSHMRCChiefRequest.CHIEFStatus.ERROR
-    chief_req.response_received_datetime = timezone.now()
-    chief_req.save()
+    fail_chief_requests([(chief_req, errors)])
+
+
+def fail_chief_requests(
+    failed_requests: Iterable[tuple[ICMSHMRCChiefRequest, list[ResponseError]]],
+) -> None:
+    """Mark ICMSHMRCChiefRequest records as failures detailing the error codes and messages."""
+
+    now = timezone.now()
+    chief_requests: list[ICMSHMRCChiefRequest] = []
+    response_errors: list[ChiefRequestResponseErrors] = []
+
+    for chief_req, errors in failed_requests:
+        chief_req.status = ICMSHMRCChiefRequest.CHIEFStatus.ERROR
+        chief_req.response_received_datetime = now
+        chief_requests.append(chief_req)
+
+        response_errors.extend(
+            ChiefRequestResponseErrors(
+                request=chief_req, error_code=error.error_code, error_msg=error.error_msg
+            )
+            for error in errors
+        )
 
-    for error in errors:
-        chief_req.response_errors.create(error_code=error.error_code, error_msg=error.error_msg)
+    ICMSHMRCChiefRequest.objects.bulk_update(
+        chief_requests, ["status", "response_received_datetime"]
+    )
+    ChiefRequestResponseErrors.objects.bulk_create(response_errors)
@@ -1,13 +1,15 @@
 import http
 import json
+import uuid
+from collections import Counter, defaultdict
 from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.db import transaction
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect
+from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.generic import DetailView, TemplateView, View
 
@@ -40,35 +42,62 @@ class LicenseDataCallback(HawkHMRCMixin, View):
         licence_replies = types.ChiefLicenceReplyResponseData.model_validate_json(request.body)
 
         with transaction.atomic():
+            chief_requests = self.get_chief_requests(licence_replies)
+
             for accepted in licence_replies.accepted:
-                self.accept_application(accepted)
+                utils.chief_licence_reply_approve_licence(
+                    chief_requests[accepted.id].import_application
+                )
 
             for rejected in licence_replies.rejected:
-                self.reject_application(rejected)
-
-        return JsonResponse({}, status=http.HTTPStatus.OK)
+                utils.chief_licence_reply_reject_licence(
+                    chief_requests[rejected.id].import_application
+                )
 
-    def accept_application(self, accepted_licence: types.AcceptedLicence) -> None:
-        chief_req = self.get_chief_request(accepted_licence.id)
-
-        utils.chief_licence_reply_approve_licence(chief_req.import_application)
-        utils.complete_chief_request(chief_req)
-
-    def reject_application(self, rejected_licence: types.RejectedLicence) -> None:
-        chief_req = self.get_chief_request(rejected_licence.id)
+            utils.complete_chief_requests(chief_requests[a.id] for a in licence_replies.accepted)
+            utils.fail_chief_requests(
+                (chief_requests[r.id], r.errors) for r in licence_replies.rejected
+            )
 
-        utils.chief_licence_reply_reject_licence(chief_req.import_application)
-        utils.fail_chief_request(chief_req, rejected_licence.errors)
+        return JsonResponse({}, status=http.HTTPStatus.OK)
 
     @staticmethod
-    def get_chief_request(icms_hmrc_id: str) -> ICMSHMRCChiefRequest:
-        chief_req = (
-            ICMSHMRCChiefRequest.objects.select_related("import_application")
+    def get_chief_requests(
+        licence_replies: types.ChiefLicenceReplyResponseData,
+    ) -> dict[str, ICMSHMRCChiefRequest]:
+        """Lock and return the chief request of every licence reply, keyed by icms_hmrc_id.
+
+        Raises ValueError listing every unknown or duplicate id so the whole batch is rejected.
+        """
+
+        reply_ids = [a.id for a in licence_replies.accepted] + [
+            r.id for r in licence_replies.rejected
+        ]
+        icms_hmrc_ids = {}
+        unknown = []
+
+        for reply_id in reply_ids:
+            try:
+                icms_hmrc_ids[reply_id] = uuid.UUID(reply_id)
+            except ValueError:
+                unknown.append(reply_id)
+
+        chief_requests = {
+            chief_req.icms_hmrc_id: chief_req
+            for chief_req in ICMSHMRCChiefRequest.objects.select_related("import_application")
             .select_for_update()
-            .get(icms_hmrc_id=icms_hmrc_id)
-        )
+            .filter(icms_hmrc_id__in=icms_hmrc_ids.values())
+        }
+
+        unknown.extend(rid for rid, uid in icms_hmrc_ids.items() if uid not in chief_requests)
+        duplicates = sorted(rid for rid, count in Counter(reply_ids).items() if count > 1)
+
+        if unknown or duplicates:
+            raise ValueError(
+                f"Unable to process licence replies: unknown ids {unknown}, duplicate ids {duplicates}"
+            )
 
-        return chief_req
+        return {rid: chief_requests[uid] for rid, uid in icms_hmrc_ids.items()}
 
 
 class UsageDataCallbackView(HawkHMRCMixin, View):
@@ -81,35 +110,55 @@ class UsageDataCallbackView(HawkHMRCMixin, View):
         response = types.ChiefUsageDataResponseData.model_validate_json(request.body)
 
         with transaction.atomic():
-            for rec in response.usage_data:
-                self._update_import_application_usage_status(rec)
+            self._update_import_application_usage_status(response.usage_data)
 
         return JsonResponse({}, status=http.HTTPStatus.OK)
 
-    def _update_import_application_usage_status(self, rec: types.UsageRecord) -> None:
-        try:
-            licence = ImportApplicationLicence.objects.get(
-                status__in=[
-                    ImportApplicationLicence.Status.ACTIVE,
-                    ImportApplicationLicence.Status.REVOKED,
-                ],
-                document_references__document_type=CaseDocumentReference.Type.LICENCE,
-                document_references__reference=rec.licence_ref,
-            )
-        except ObjectDoesNotExist:
-            capture_message(
-                f"licence not found: Unable to set usage status for licence number: {rec.licence_ref}."
-            )
-            return
-        except MultipleObjectsReturned:
+    def _update_import_application_usage_status(self, records: list[types.UsageRecord]) -> None:
+        """Set the usage status of the application of each licence with a single update.
+
+        Licence numbers without exactly one matching licence are skipped and reported together.
+        """
+
+        licence_refs = {rec.licence_ref for rec in records}
+        licences = ImportApplicationLicence.objects.filter(
+            status__in=[
+                ImportApplicationLicence.Status.ACTIVE,
+                ImportApplicationLicence.Status.REVOKED,
+            ],
+            document_references__document_type=CaseDocumentReference.Type.LICENCE,
+            document_references__reference__in=licence_refs,
+        ).values_list("document_references__reference", "import_application_id")
+
+        # key: licence reference, value: application id of each matching licence
+        matches = defaultdict(list)
+
+        for licence_ref, application_id in licences:
+            matches[licence_ref].append(application_id)
+
+        not_found = sorted(licence_refs - matches.keys())
+        multiple = sorted(ref for ref, app_ids in matches.items() if len(app_ids) > 1)
+
+        if not_found or multiple:
             capture_message(
-                f"multiple licences found: Unable to set usage status for licence number: {rec.licence_ref}."
+                "Unable to set usage status for licence numbers:"
+                f" licences not found: {not_found}, multiple licences found: {multiple}."
             )
-            return
 
-        application = licence.import_application
-        application.chief_usage_status = rec.licence_status
-        application.save()
+        application_ids = {ref: app_ids[0] for ref, app_ids in matches.items() if len(app_ids) == 1}
+        applications = ImportApplication.objects.in_bulk(application_ids.values())
+        now = timezone.now()
+
+        # Records are applied in order so the last status of a licence is kept.
+        for rec in records:
+            if rec.licence_ref in application_ids:
+                application = applications[application_ids[rec.licence_ref]]
+                application.chief_usage_status = rec.licence_status
+                application.last_update_datetime = now
+
+        ImportApplication.objects.bulk_update(
+            applications.values(), ["chief_usage_status", "last_update_datetime"]
+        )
 
 
 @method_decorator(transaction.atomic, name="post")
@@ -81,7 +81,7 @@ class CommodityGroupListView(ModelFilterView):
 
     def get_queryset(self):
         qs = super().get_queryset()
-        return qs.select_related("commodity_type").prefetch_related("commodities")
+        return qs.select_related("commodity_type")
 
     class Display:
         fields = [
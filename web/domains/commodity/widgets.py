@@ -6,6 +6,7 @@ from web.domains.country.types import CountryGroupName
 from web.forms.widgets import ICMSModelSelect2MultipleWidget, ICMSModelSelect2Widget
 from web.models import Country, ImportApplicationType
 from web.types import AuthenticatedHttpRequest
+from web.utils.reference_data import get_import_application_type
 
 
 class CommodityWidget(ICMSModelSelect2MultipleWidget):
@@ -55,19 +56,19 @@ class UsageCountryWidget(ICMSModelSelect2Widget):
 
         application_type_pk: str = dependent_fields.get("application_type", "")
 
-        if (
-            not application_type_pk.isdigit()
-            or not ImportApplicationType.objects.filter(pk=application_type_pk).exists()
-        ):
+        if not application_type_pk.isdigit():
             return queryset.none()
 
-        group_name = self._get_country_of_origin_group_name(application_type_pk)
+        try:
+            application_type = get_import_application_type(int(application_type_pk))
+        except ImportApplicationType.DoesNotExist:
+            return queryset.none()
 
-        return queryset.filter(country_groups__name=group_name)
+        group_name = self._get_country_of_origin_group_name(application_type)
 
-    def _get_country_of_origin_group_name(self, app_type_pk: str) -> str:
-        application_type = ImportApplicationType.objects.get(pk=int(app_type_pk))
+        return queryset.filter(country_groups__name=group_name)
 
+    def _get_country_of_origin_group_name(self, application_type: ImportApplicationType) -> str:
         types = ImportApplicationType.Types
         subtypes = ImportApplicationType.SubTypes
 
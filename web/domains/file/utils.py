@@ -1,16 +1,23 @@
 import os.path
-from collections.abc import Callable, Iterable
-from typing import Any
+import re
+from collections.abc import Callable, Iterable, Iterator
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
 
+from botocore.exceptions import ClientError
 from django import forms
 from django.conf import settings
 from django.db import models
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.template.loader import render_to_string
 from django_chunk_upload_handlers.clam_av import validate_virus_check_result
 from storages.backends.s3boto3 import S3Boto3StorageFile
 
-from web.models import User
-from web.utils.s3 import delete_file_from_s3
+from web.models import File, User
+from web.utils.s3 import delete_file_from_s3, get_file_stream_from_s3
+
+if TYPE_CHECKING:
+    from botocore.response import StreamingBody
 
 FILE_EXTENSION_ALLOW_LIST = [
     "bmp",
@@ -185,3 +192,66 @@ def create_file_model(
         clam_av_results=clam_av_results or None,
         **extra_args,
     )
+
+
+# A single byte range, e.g. "bytes=0-499", "bytes=500-" or "bytes=-500"
+BYTE_RANGE_RE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+
+
+def get_file_download_response(request: HttpRequest, document: File) -> HttpResponse:
+    """Return a response that streams the document from S3 as an attachment.
+
+    The file is sent in chunks of S3_DOWNLOAD_CHUNK_SIZE bytes rather than being read into
+    memory. A single byte range can be requested using the Range header, any other Range
+    header (or a conditional If-Range request) is ignored and the whole file is returned.
+    """
+
+    byte_range = _get_byte_range(request)
+
+    try:
+        s3_file = get_file_stream_from_s3(document.path, byte_range)
+    except ClientError as e:
+        if byte_range and e.response["Error"]["Code"] == "InvalidRange":
+            response = HttpResponse(status=HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            response["Content-Range"] = f"bytes */{document.file_size}"
+
+            return response
+
+        raise
+
+    response = StreamingHttpResponse(
+        _iter_s3_file(s3_file["Body"]), content_type=document.content_type
+    )
+    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
+    response["Content-Length"] = s3_file["ContentLength"]
+    response["Accept-Ranges"] = "bytes"
+
+    if "ContentRange" in s3_file:
+        response.status_code = HTTPStatus.PARTIAL_CONTENT
+        response["Content-Range"] = s3_file["ContentRange"]
+
+    return response
+
+
+def _get_byte_range(request: HttpRequest) -> str | None:
+    byte_range = request.headers.get("Range", "").replace(" ", "")
+
+    if not byte_range or "If-Range" in request.headers:
+        return None
+
+    if not BYTE_RANGE_RE.match(byte_range):
+        return None
+
+    start, _, end = byte_range.removeprefix("bytes=").partition("-")
+
+    if start and end and int(start) > int(end):
+        return None
+
+    return byte_range
+
+
+def _iter_s3_file(body: "StreamingBody") -> Iterator[bytes]:
+    try:
+        yield from body.iter_chunks(settings.S3_DOWNLOAD_CHUNK_SIZE)
+    finally:
+        body.close()
@@ -13,12 +13,11 @@ from django.urls import reverse
 from django.views.decorators.http import require_POST
 
 from web.domains.case.forms import DocumentForm
-from web.domains.file.utils import create_file_model
+from web.domains.file.utils import create_file_model, get_file_download_response
 from web.mail.emails import send_authority_archived_email
 from web.models import Importer, User
 from web.permissions import Perms, can_user_edit_firearm_authorities
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 from web.views import ModelFilterView
 from web.views.actions import Archive, Edit, Unarchive
 
@@ -466,12 +465,8 @@ def view_document_firearms(
     firearms: FirearmsAuthority = get_object_or_404(FirearmsAuthority, pk=firearms_pk)
 
     document = firearms.files.get(pk=document_pk)
-    file_content = get_file_from_s3(document.path)
 
-    response = HttpResponse(content=file_content, content_type=document.content_type)
-    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
-
-    return response
+    return get_file_download_response(request, document)
 
 
 @login_required
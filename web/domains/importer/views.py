@@ -17,7 +17,7 @@ from guardian.shortcuts import get_objects_for_user
 
 from web.domains.case.forms import DocumentForm
 from web.domains.contacts.forms import ContactForm
-from web.domains.file.utils import create_file_model
+from web.domains.file.utils import create_file_model, get_file_download_response
 from web.domains.importer.forms import (
     AgentIndividualForm,
     AgentIndividualNonILBForm,
@@ -48,7 +48,6 @@ from web.permissions import (
     organisation_get_contacts,
 )
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 from web.views import ModelFilterView
 from web.views.actions import (
     Archive,
@@ -93,6 +92,8 @@ def get_importer_list_fields_config() -> dict[str, Any]:
             "header": "Agents",
             "show_all": True,
             "query_filter": {"is_active": True},
+            # Individual agents are displayed with the user's name.
+            "select_related": ["user"],
         },
     }
 
@@ -525,12 +526,8 @@ def view_document_section5(
     section5: Section5Authority = get_object_or_404(Section5Authority, pk=section5_pk)
 
     document = section5.files.get(pk=document_pk)
-    file_content = get_file_from_s3(document.path)
 
-    response = HttpResponse(content=file_content, content_type=document.content_type)
-    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
-
-    return response
+    return get_file_download_response(request, document)
 
 
 @login_required
@@ -16,12 +16,11 @@ from django.views.generic.detail import DetailView, SingleObjectMixin
 
 from web.domains.case.forms import DocumentForm
 from web.domains.case.services import reference
-from web.domains.file.utils import create_file_model
+from web.domains.file.utils import create_file_model, get_file_download_response
 from web.models import Template, User
 from web.permissions import Perms
 from web.tasks import send_mailshot_email_task, send_retract_mailshot_email_task
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 from web.views import ModelFilterView, ModelUpdateView
 from web.views.mixins import PostActionMixin
 
@@ -415,12 +414,7 @@ def view_document(
     mailshot = get_object_or_404(Mailshot, pk=mailshot_pk)
     document = get_object_or_404(mailshot.documents, pk=document_pk)
 
-    file_content = get_file_from_s3(document.path)
-
-    response = HttpResponse(content=file_content, content_type=document.content_type)
-    response["Content-Disposition"] = f'attachment; filename="{document.filename}"'
-
-    return response
+    return get_file_download_response(request, document)
 
 
 @require_POST
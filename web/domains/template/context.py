@@ -1,3 +1,4 @@
+import functools
 from typing import Any, Protocol
 
 from django.conf import settings
@@ -14,6 +15,7 @@ from web.models import (
     CountryTranslationSet,
     ExportApplication,
     ImportApplication,
+    ImportApplicationLicence,
     NuclearMaterialApplication,
     NuclearMaterialApplicationGoods,
     Process,
@@ -195,14 +197,16 @@ class CoverLetterTemplateContext:
                 return self._placeholder(item)
         return self._context(item)
 
-    def _full_context(self, item: str) -> str:
-        licence = document_pack.pack_draft_get(self.application)
+    @functools.cached_property
+    def _licence(self) -> ImportApplicationLicence:
+        return document_pack.pack_draft_get(self.application)
 
+    def _full_context(self, item: str) -> str:
         match item:
             case "LICENCE_NUMBER":
-                return document_pack.doc_ref_licence_get(licence).reference
+                return document_pack.doc_ref_licence_get(self._licence).reference
             case "LICENCE_END_DATE":
-                return licence.licence_end_date.strftime(self.date_fmt)
+                return self._licence.licence_end_date.strftime(self.date_fmt)
         return self._context(item)
 
     def __getitem__(self, item: str) -> str:
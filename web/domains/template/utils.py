@@ -1,6 +1,8 @@
 import dataclasses
+import functools
+import itertools
 import re
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING
 
 from web.domains.case.types import ImpOrExp
@@ -18,6 +20,7 @@ from web.models import (
     SILApplication,
     User,
 )
+from web.utils.reference_data import get_template_title_and_content
 
 from .constants import TemplateCodes
 from .context import (
@@ -35,7 +38,6 @@ if TYPE_CHECKING:
 
 
 # e.g. [[CONTACT_NAME]]
-TEMPLATE_CONTENT_REGEX = r"\[\[{}]]"
 CONTEXT_VARIABLE_REGEX = re.compile(
     r"""
         \[\[        # Opening braces
@@ -66,8 +68,52 @@ def add_endorsements_from_application_type(application: "ImportApplication") ->
     )
 
 
+@dataclasses.dataclass(frozen=True)
+class CompiledTemplate:
+    """Template content split into literal text and placeholder names.
+
+    Each placeholder is preceded by the literal text at the same index, there is always one
+    more literal than there are placeholders.
+    """
+
+    literals: tuple[str, ...]
+    placeholders: tuple[str, ...]
+
+    def render(self, values: Mapping[str, str]) -> str:
+        parts = [self.literals[0]]
+
+        for placeholder, literal in zip(self.placeholders, self.literals[1:]):
+            parts.append(values[placeholder])
+            parts.append(literal)
+
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_template(content: str) -> CompiledTemplate:
+    """Parse the template content into a CompiledTemplate.
+
+    Template versions are never edited (a new version is created instead), so caching on
+    the content caches each template version. The same applies to mailshot bodies that are
+    rendered once per recipient.
+    """
+
+    # split returns the literal text with the captured placeholder names in between.
+    parts = CONTEXT_VARIABLE_REGEX.split(content)
+
+    return CompiledTemplate(literals=tuple(parts[::2]), placeholders=tuple(parts[1::2]))
+
+
 def get_context_dict(content: str, context: "TemplateContextProcessor") -> dict[str, str]:
-    return {hit: context[hit] for hit in set(re.findall(CONTEXT_VARIABLE_REGEX, content))}
+    return get_context_values(compile_template(content).placeholders, context)
+
+
+def get_context_values(
+    placeholders: Iterable[str], context: "TemplateContextProcessor"
+) -> dict[str, str]:
+    """Resolve each distinct placeholder from the context once."""
+
+    return {placeholder: context[placeholder] for placeholder in set(placeholders)}
 
 
 def find_invalid_placeholders(content: str, valid_placeholders: list[str]) -> list[str]:
@@ -75,7 +121,7 @@ def find_invalid_placeholders(content: str, valid_placeholders: list[str]) -> li
 
     return [
         f"[[{placeholder}]]"
-        for placeholder in set(re.findall(CONTEXT_VARIABLE_REGEX, content))
+        for placeholder in set(compile_template(content).placeholders)
         if placeholder not in valid_placeholders
     ]
 
@@ -86,15 +132,28 @@ def replace_template_values(content: str | None, context: "TemplateContextProces
     Calling this function with replacements={'foo': 'bar'} will return the template content
     with all occurrences of [[foo]] replaced with bar"""
 
-    if content is None:
-        return ""
-
-    for replacement, value in get_context_dict(content, context).items():
-        content = re.sub(TEMPLATE_CONTENT_REGEX.format(replacement), value, content)
+    (content,) = render_templates([content], context)
 
     return content
 
 
+def render_templates(
+    contents: Sequence[str | None], context: "TemplateContextProcessor"
+) -> list[str]:
+    """Render several templates (e.g. an email subject and body) sharing the same context.
+
+    Placeholders used by more than one of the templates are only resolved once.
+    """
+
+    compiled = [compile_template(content) for content in contents if content is not None]
+    values = get_context_values(
+        itertools.chain.from_iterable(c.placeholders for c in compiled), context
+    )
+    rendered = iter([c.render(values) for c in compiled])
+
+    return ["" if content is None else next(rendered) for content in contents]
+
+
 def get_template_title(template: Template, context: "TemplateContextProcessor") -> str:
     """Gets the title of a template with replacements for placeholder values"""
     return replace_template_values(template.template_title, context)
@@ -124,13 +183,9 @@ def get_email_template_subject_body(
     context_cls: type[EmailTemplateContext] = EmailTemplateContext,
     current_user_name: str = "",
 ) -> tuple[str, str]:
-    template = Template.objects.get(
-        template_code=template_code,
-        template_type="EMAIL_TEMPLATE",
-    )
+    title, content = get_template_title_and_content(template_code, Template.EMAIL_TEMPLATE)
     context = context_cls(process, current_user_name=current_user_name)
-    subject = get_template_title(template, context)
-    body = get_template_content(template, context)
+    subject, body = render_templates([title, content], context)
 
     return subject, body
 
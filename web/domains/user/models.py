@@ -8,6 +8,8 @@ from govuk_onelogin_django.constants import ONE_LOGIN_UNSET_NAME
 from guardian.core import ObjectPermissionChecker
 from guardian.mixins import GuardianUserMixin
 
+from web.models.indexes import get_search_indexes
+
 
 class User(GuardianUserMixin, AbstractUser):
     def __init__(self, *args, **kwargs):
@@ -21,7 +23,9 @@ class User(GuardianUserMixin, AbstractUser):
         See: icms/web/auth/backends.py
         """
 
-        self.guardian_checker = ObjectPermissionChecker(self)
+        from web.permissions.service import ObjectPermissionSnapshot
+
+        self.guardian_checker = ObjectPermissionSnapshot(self)
 
     REQUIRED_FIELDS = [
         "email",
@@ -71,6 +75,10 @@ class User(GuardianUserMixin, AbstractUser):
 
     class Meta:
         ordering = ("-is_active", "first_name")
+        indexes = [
+            *get_search_indexes("first_name", "user_first_name"),
+            *get_search_indexes("last_name", "user_last_name"),
+        ]
 
 
 class PhoneNumber(models.Model):
@@ -30,7 +30,7 @@ from django_ratelimit import UNSAFE
 from django_ratelimit.decorators import ratelimit
 
 from web.domains.template.context import UserManagementContext
-from web.domains.template.utils import replace_template_values
+from web.domains.template.utils import render_templates
 from web.domains.user.utils import send_and_create_email_verification
 from web.mail.constants import CaseEmailCodes
 from web.mail.emails import send_case_email
@@ -406,10 +406,10 @@ class UserReactivateFormView(PermissionRequiredMixin, FormView):
         user = self.get_platform_user()
         ctx = UserManagementContext(user)
         email_template = Template.objects.get(template_code=self.email_template_code.value)
-        return initial | {
-            "subject": replace_template_values(email_template.template_title, ctx),
-            "body": replace_template_values(email_template.template_content, ctx),
-        }
+        subject, body = render_templates(
+            [email_template.template_title, email_template.template_content], ctx
+        )
+        return initial | {"subject": subject, "body": body}
 
     def form_valid(self, form: Form) -> HttpResponseRedirect:
         response = super().form_valid(form)
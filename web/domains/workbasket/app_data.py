@@ -1,9 +1,8 @@
-from itertools import chain
-from typing import Literal
+from typing import Any, Literal
 
 from django.contrib.postgres.aggregates import ArrayAgg, JSONBAgg
 from django.contrib.postgres.expressions import ArraySubquery
-from django.db.models import Exists, F, Func, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models import Exists, F, Func, OuterRef, Q, Subquery, Value
 from guardian.shortcuts import get_objects_for_user
 
 from web.domains.case.shared import ImpExpStatus
@@ -30,6 +29,8 @@ from web.models import (
 )
 from web.permissions import Perms
 
+from .query import WorkbasketSource
+
 # Used to get a list of active tasks for the application
 # Prevents a call to get_active_task_list for every application record.
 ACTIVE_TASK_ANNOTATION = ArrayAgg(
@@ -112,72 +113,74 @@ APP_STATUS_TO_SHOW = [
 ]
 
 
-def get_ilb_admin_qs(user: User) -> chain[QuerySet]:
+def get_ilb_admin_qs(user: User) -> list[WorkbasketSource]:
     submitted = AccessRequest.Statuses.SUBMITTED
 
     # Annotations used on every row to improve performance
     open_fir_pks_annotation = _get_open_firs_pk_annotation("further_information_requests")
 
-    exporter_access_requests = (
-        ExporterAccessRequest.objects.filter(is_active=True, status=submitted)
-        .annotate(
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            annotation_has_open_approval_request=_get_approval_request_annotation(
+    exporter_access_requests = WorkbasketSource(
+        queryset=ExporterAccessRequest.objects.filter(
+            is_active=True, status=submitted
+        ).select_related("submitted_by"),
+        annotations={
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "annotation_has_open_approval_request": _get_approval_request_annotation(
                 ExporterApprovalRequest, ApprovalRequest.Statuses.OPEN
             ),
-            annotation_has_complete_approval_request=_get_approval_request_annotation(
+            "annotation_has_complete_approval_request": _get_approval_request_annotation(
                 ExporterApprovalRequest, ApprovalRequest.Statuses.COMPLETED
             ),
-        )
-        .select_related("submitted_by")
+        },
     )
 
-    importer_access_requests = (
-        ImporterAccessRequest.objects.filter(is_active=True, status=submitted)
-        .annotate(
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            annotation_has_open_approval_request=_get_approval_request_annotation(
+    importer_access_requests = WorkbasketSource(
+        queryset=ImporterAccessRequest.objects.filter(
+            is_active=True, status=submitted
+        ).select_related("submitted_by"),
+        annotations={
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "annotation_has_open_approval_request": _get_approval_request_annotation(
                 ImporterApprovalRequest, ApprovalRequest.Statuses.OPEN
             ),
-            annotation_has_complete_approval_request=_get_approval_request_annotation(
+            "annotation_has_complete_approval_request": _get_approval_request_annotation(
                 ImporterApprovalRequest, ApprovalRequest.Statuses.COMPLETED
             ),
-        )
-        .select_related("submitted_by")
+        },
     )
 
     app_filters = get_caseworker_app_filters(user=user)
 
-    export_applications = (
-        ExportApplication.objects.filter(*app_filters)
+    export_applications = WorkbasketSource(
+        queryset=ExportApplication.objects.filter(*app_filters)
         .exclude(decision=ExportApplication.REFUSE)
-        .select_related("exporter", "contact", "application_type", "submitted_by", "case_owner")
-        .annotate(
-            annotation_has_withdrawal=EXPORT_HAS_WITHDRAWAL_ANNOTATION,
-            active_tasks=ACTIVE_TASK_ANNOTATION,
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            open_case_emails=_get_open_case_emails_annotation("export_applications"),
-        )
+        .select_related("exporter", "contact", "application_type", "submitted_by", "case_owner"),
+        annotations={
+            "annotation_has_withdrawal": EXPORT_HAS_WITHDRAWAL_ANNOTATION,
+            "active_tasks": ACTIVE_TASK_ANNOTATION,
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "open_case_emails": _get_open_case_emails_annotation("export_applications"),
+        },
     )
 
-    import_applications = (
-        ImportApplication.objects.filter(*app_filters)
+    import_applications = WorkbasketSource(
+        queryset=ImportApplication.objects.filter(*app_filters)
         .exclude(decision=ImportApplication.REFUSE)
-        .select_related("importer", "contact", "application_type", "submitted_by", "case_owner")
-        .annotate(
-            active_tasks=ACTIVE_TASK_ANNOTATION,
-            annotation_has_withdrawal=IMPORT_HAS_WITHDRAWAL_ANNOTATION,
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            open_case_emails=_get_open_case_emails_annotation("import_applications"),
-        )
+        .select_related("importer", "contact", "application_type", "submitted_by", "case_owner"),
+        annotations={
+            "active_tasks": ACTIVE_TASK_ANNOTATION,
+            "annotation_has_withdrawal": IMPORT_HAS_WITHDRAWAL_ANNOTATION,
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "open_case_emails": _get_open_case_emails_annotation("import_applications"),
+        },
     )
 
-    return chain(
+    return [
         exporter_access_requests,
         importer_access_requests,
         export_applications,
         import_applications,
-    )
+    ]
 
 
 def _get_open_case_emails_annotation(
@@ -209,68 +212,68 @@ def _get_approval_request_annotation(
     return Exists(approval_cls.objects.filter(access_request=OuterRef("pk"), status=status))
 
 
-def get_sanctions_case_officer_qs(user: User) -> chain[QuerySet]:
+def get_sanctions_case_officer_qs(user: User) -> list[WorkbasketSource]:
     submitted = AccessRequest.Statuses.SUBMITTED
     # Annotations used on every row to improve performance
     open_fir_pks_annotation = _get_open_firs_pk_annotation("further_information_requests")
-    importer_access_requests = (
-        ImporterAccessRequest.objects.filter(is_active=True, status=submitted)
-        .annotate(
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            annotation_has_open_approval_request=_get_approval_request_annotation(
+    importer_access_requests = WorkbasketSource(
+        queryset=ImporterAccessRequest.objects.filter(
+            is_active=True, status=submitted
+        ).select_related("submitted_by"),
+        annotations={
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "annotation_has_open_approval_request": _get_approval_request_annotation(
                 ImporterApprovalRequest, ApprovalRequest.Statuses.OPEN
             ),
-            annotation_has_complete_approval_request=_get_approval_request_annotation(
+            "annotation_has_complete_approval_request": _get_approval_request_annotation(
                 ImporterApprovalRequest, ApprovalRequest.Statuses.COMPLETED
             ),
-        )
-        .select_related("submitted_by")
+        },
     )
 
     app_filters = get_caseworker_app_filters(user)
-    import_applications = (
-        ImportApplication.objects.filter(*app_filters, process_type=ProcessTypes.SANCTIONS)
+    import_applications = WorkbasketSource(
+        queryset=ImportApplication.objects.filter(*app_filters, process_type=ProcessTypes.SANCTIONS)
         .exclude(decision=ImportApplication.REFUSE)
-        .select_related("importer", "contact", "application_type", "submitted_by", "case_owner")
-        .annotate(
-            active_tasks=ACTIVE_TASK_ANNOTATION,
-            annotation_has_withdrawal=IMPORT_HAS_WITHDRAWAL_ANNOTATION,
-            annotation_open_fir_pks=open_fir_pks_annotation,
-            open_case_emails=_get_open_case_emails_annotation("import_applications"),
-        )
+        .select_related("importer", "contact", "application_type", "submitted_by", "case_owner"),
+        annotations={
+            "active_tasks": ACTIVE_TASK_ANNOTATION,
+            "annotation_has_withdrawal": IMPORT_HAS_WITHDRAWAL_ANNOTATION,
+            "annotation_open_fir_pks": open_fir_pks_annotation,
+            "open_case_emails": _get_open_case_emails_annotation("import_applications"),
+        },
     )
 
-    return chain(importer_access_requests, import_applications)
+    return [importer_access_requests, import_applications]
 
 
-def get_applicant_qs(user: User) -> chain[QuerySet]:
+def get_applicant_qs(user: User) -> list[WorkbasketSource]:
     # user/admin access requests and firs
     open_fir_pks_annotation = _get_open_firs_pk_annotation("further_information_requests")
 
-    access_requests = (
-        AccessRequest.objects.filter(
+    access_requests = WorkbasketSource(
+        queryset=AccessRequest.objects.filter(
             submitted_by_id=user.pk,
             status__in=[AccessRequest.Statuses.SUBMITTED, AccessRequest.Statuses.FIR_REQUESTED],
-        )
-        .select_related("submitted_by")
-        .annotate(annotation_open_fir_pks=open_fir_pks_annotation)
+        ).select_related("submitted_by"),
+        annotations={"annotation_open_fir_pks": open_fir_pks_annotation},
     )
 
     # User access requests
-    chain_items = [access_requests]
+    sources = [access_requests]
 
     # Importer applications and approval requests
     if user.has_perm(Perms.sys.importer_access):
-        chain_items.extend(_get_importer_queryset(user))
+        sources.extend(_get_importer_queryset(user))
 
     # Exporter applications and approval requests.
     if user.has_perm(Perms.sys.exporter_access):
-        chain_items.extend(_get_exporter_queryset(user))
+        sources.extend(_get_exporter_queryset(user))
 
-    return chain(*chain_items)
+    return sources
 
 
-def _get_importer_queryset(user: User) -> list[QuerySet]:
+def _get_importer_queryset(user: User) -> list[WorkbasketSource]:
     open_fir_pks_annotation = _get_open_firs_pk_annotation(
         "access_request__further_information_requests"
     )
@@ -293,15 +296,13 @@ def _get_importer_queryset(user: User) -> list[QuerySet]:
         any_perm=True,
     )
 
-    importer_approval_requests = (
-        ImporterApprovalRequest.objects.select_related(
+    importer_approval_requests = WorkbasketSource(
+        queryset=ImporterApprovalRequest.objects.select_related(
             # get the importer associated with the approval request
             # join access_request and join importer from access_request
             "access_request__importeraccessrequest__link",
             "access_request__submitted_by",
-        )
-        .annotate(annotation_open_fir_pks=open_fir_pks_annotation)
-        .filter(
+        ).filter(
             is_active=True,
             status=ApprovalRequest.Statuses.OPEN,
             # Only show approval requests for orgs the user can manage
@@ -310,16 +311,14 @@ def _get_importer_queryset(user: User) -> list[QuerySet]:
                 Perms.obj.importer.manage_contacts_and_agents,
                 main_importers,
             ),
-        )
+        ),
+        annotations={"annotation_open_fir_pks": open_fir_pks_annotation},
     )
 
     # Import Applications
     import_applications = ImportApplication.objects.select_related(
         "importer", "contact", "application_type", "submitted_by"
     )
-    # Add annotations
-    import_applications = _add_user_import_annotations(import_applications)
-
     import_applications = (
         import_applications.filter(is_active=True, status__in=APP_STATUS_TO_SHOW)
         .filter(
@@ -351,10 +350,14 @@ def _get_importer_queryset(user: User) -> list[QuerySet]:
         .exclude(cleared_by=user)
     )
 
-    return [importer_approval_requests, import_applications, mailshots]
+    return [
+        importer_approval_requests,
+        WorkbasketSource(queryset=import_applications, annotations=_get_user_import_annotations()),
+        WorkbasketSource(queryset=mailshots),
+    ]
 
 
-def _get_exporter_queryset(user: User) -> list[QuerySet]:
+def _get_exporter_queryset(user: User) -> list[WorkbasketSource]:
     open_fir_pks_annotation = _get_open_firs_pk_annotation(
         "access_request__further_information_requests"
     )
@@ -376,15 +379,13 @@ def _get_exporter_queryset(user: User) -> list[QuerySet]:
         any_perm=True,
     )
 
-    exporter_approval_requests = (
-        ExporterApprovalRequest.objects.select_related(
+    exporter_approval_requests = WorkbasketSource(
+        queryset=ExporterApprovalRequest.objects.select_related(
             # get the exporter associated with the approval request
             # join access_request and join exporter from access_request
             "access_request__exporteraccessrequest__link",
             "access_request__submitted_by",
-        )
-        .annotate(annotation_open_fir_pks=open_fir_pks_annotation)
-        .filter(
+        ).filter(
             is_active=True,
             status=ApprovalRequest.Statuses.OPEN,
             # Only show approval requests for orgs the user can manage
@@ -393,17 +394,14 @@ def _get_exporter_queryset(user: User) -> list[QuerySet]:
                 Perms.obj.exporter.manage_contacts_and_agents,
                 main_exporters,
             ),
-        )
+        ),
+        annotations={"annotation_open_fir_pks": open_fir_pks_annotation},
     )
 
     # Export Applications
     export_applications = ExportApplication.objects.select_related(
         "exporter", "contact", "application_type", "submitted_by"
     )
-    # Add annotations
-    export_applications = _add_user_export_annotations(export_applications)
-
-    # Apply filters
     export_applications = (
         export_applications.filter(is_active=True, status__in=APP_STATUS_TO_SHOW)
         .filter(
@@ -435,13 +433,15 @@ def _get_exporter_queryset(user: User) -> list[QuerySet]:
         .exclude(cleared_by=user)
     )
 
-    return [exporter_approval_requests, export_applications, mailshots]
+    return [
+        exporter_approval_requests,
+        WorkbasketSource(queryset=export_applications, annotations=_get_user_export_annotations()),
+        WorkbasketSource(queryset=mailshots),
+    ]
 
 
-def _add_user_import_annotations(
-    applications: QuerySet[ImportApplication],
-) -> "QuerySet[ImportApplication]":
-    """Add user workbasket annotations for import applications."""
+def _get_user_import_annotations() -> dict[str, Any]:
+    """User workbasket annotations for import applications."""
 
     open_fir_subquery = (
         FurtherInformationRequest.objects.filter(
@@ -479,19 +479,19 @@ def _add_user_import_annotations(
         )
     )
 
-    return applications.annotate(
-        active_tasks=ACTIVE_TASK_ANNOTATION,
-        annotation_has_withdrawal=IMPORT_HAS_WITHDRAWAL_ANNOTATION,
-        annotation_open_fir_pairs=Subquery(open_fir_subquery.values("open_fir_pairs_annotation")),
-        annotation_open_ur_pks=open_ur_pks_annotation,
-        annotation_has_in_progress_ur=has_in_progress_ur,
-    )
+    return {
+        "active_tasks": ACTIVE_TASK_ANNOTATION,
+        "annotation_has_withdrawal": IMPORT_HAS_WITHDRAWAL_ANNOTATION,
+        "annotation_open_fir_pairs": Subquery(
+            open_fir_subquery.values("open_fir_pairs_annotation")
+        ),
+        "annotation_open_ur_pks": open_ur_pks_annotation,
+        "annotation_has_in_progress_ur": has_in_progress_ur,
+    }
 
 
-def _add_user_export_annotations(
-    applications: QuerySet[ExportApplication],
-) -> "QuerySet[ExportApplication]":
-    """Add user workbasket annotations for export applications."""
+def _get_user_export_annotations() -> dict[str, Any]:
+    """User workbasket annotations for export applications."""
 
     open_fir_subquery = (
         FurtherInformationRequest.objects.filter(
@@ -529,13 +529,15 @@ def _add_user_export_annotations(
         )
     )
 
-    return applications.annotate(
-        active_tasks=ACTIVE_TASK_ANNOTATION,
-        annotation_has_withdrawal=EXPORT_HAS_WITHDRAWAL_ANNOTATION,
-        annotation_open_fir_pairs=Subquery(open_fir_subquery.values("open_fir_pairs_annotation")),
-        annotation_open_ur_pks=open_ur_pks_annotation,
-        annotation_has_in_progress_ur=has_in_progress_ur,
-    )
+    return {
+        "active_tasks": ACTIVE_TASK_ANNOTATION,
+        "annotation_has_withdrawal": EXPORT_HAS_WITHDRAWAL_ANNOTATION,
+        "annotation_open_fir_pairs": Subquery(
+            open_fir_subquery.values("open_fir_pairs_annotation")
+        ),
+        "annotation_open_ur_pks": open_ur_pks_annotation,
+        "annotation_has_in_progress_ur": has_in_progress_ur,
+    }
 
 
 def _get_open_firs_pk_annotation(relationship: str) -> ArrayAgg:
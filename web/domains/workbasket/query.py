@@ -0,0 +1,87 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, overload
+
+from django.db.models import F, Model, QuerySet, Value
+
+
+@dataclass
+class WorkbasketSource:
+    """A filtered queryset of workbasket records.
+
+    The annotations are only applied when fetching the records being rendered, they are
+    not needed to order or count the workbasket.
+    """
+
+    queryset: QuerySet
+    annotations: dict[str, Any] = field(default_factory=dict)
+
+    def get_keys_queryset(self, source_id: int) -> QuerySet:
+        """Return the minimal (source_id, pk, order_datetime) rows used to order the workbasket."""
+
+        return (
+            self.queryset.order_by()
+            .annotate(
+                wb_source=Value(source_id),
+                wb_pk=F("pk"),
+                wb_order_datetime=F("order_datetime"),
+            )
+            .values_list("wb_source", "wb_pk", "wb_order_datetime")
+        )
+
+    def get_records(self, pks: Iterable[int]) -> QuerySet:
+        return self.queryset.filter(pk__in=pks).annotate(**self.annotations)
+
+
+class WorkbasketQuery:
+    """Lazy sequence of workbasket records spanning several querysets.
+
+    All sources are combined into a single UNION query that is ordered and sliced by the
+    database. Full model instances (with the workbasket annotations) are only loaded for
+    the slice being rendered.
+
+    Intended to be passed to django.core.paginator.Paginator.
+    """
+
+    def __init__(self, sources: list[WorkbasketSource]) -> None:
+        self.sources = sources
+
+    @property
+    def keys(self) -> QuerySet:
+        first, *rest = [source.get_keys_queryset(i) for i, source in enumerate(self.sources)]
+
+        # UNION removes duplicate rows caused by joining multi-valued relationships.
+        keys = first.union(*rest) if rest else first.distinct()
+
+        return keys.order_by("-wb_order_datetime", "wb_source", "-wb_pk")
+
+    def count(self) -> int:
+        return self.keys.count()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    @overload
+    def __getitem__(self, key: int) -> Model: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[Model]: ...
+
+    def __getitem__(self, key: int | slice) -> Model | list[Model]:
+        if isinstance(key, int):
+            return self[key : key + 1][0]
+
+        keys = [(source_id, pk) for source_id, pk, _ in self.keys[key]]
+
+        pks_by_source: dict[int, list[int]] = defaultdict(list)
+        for source_id, pk in keys:
+            pks_by_source[source_id].append(pk)
+
+        records = {}
+        for source_id, pks in pks_by_source.items():
+            for record in self.sources[source_id].get_records(pks):
+                records[source_id, record.pk] = record
+
+        # A record may have changed between fetching the keys and the records.
+        return [records[k] for k in keys if k in records]
@@ -1,11 +1,11 @@
-from operator import attrgetter
-
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import Paginator
 from django.http.response import HttpResponse
 from django.shortcuts import render
 
+from web.flow.models import get_specific_models
+from web.models import ExportApplication, ImportApplication
 from web.permissions import Perms
 from web.sites import is_exporter_site, is_importer_site
 from web.types import AuthenticatedHttpRequest
@@ -13,6 +13,7 @@ from web.types import AuthenticatedHttpRequest
 from .actions.applicant_actions import ShowWelcomeMessageAction
 from .app_data import get_applicant_qs, get_ilb_admin_qs, get_sanctions_case_officer_qs
 from .base import WorkbasketRow, WorkbasketSection
+from .query import WorkbasketQuery
 from .row import get_workbasket_row_func
 
 
@@ -23,22 +24,24 @@ def show_workbasket(request: AuthenticatedHttpRequest) -> HttpResponse:
     # Users with sanctions_case_officer are also ilb_admin's so check this first.
     # The goal is to restrict the records shown to sanctions case officers.
     if request.user.has_perm(Perms.sys.sanctions_case_officer):
-        qs = get_sanctions_case_officer_qs(request.user)
+        sources = get_sanctions_case_officer_qs(request.user)
     elif is_ilb_admin:
-        qs = get_ilb_admin_qs(request.user)
+        sources = get_ilb_admin_qs(request.user)
     else:
-        qs = get_applicant_qs(request.user)
-
-    qs_list = list(qs)
+        sources = get_applicant_qs(request.user)
 
-    # Order all records before pagination
-    qs_list.sort(key=attrgetter("order_datetime"), reverse=True)
-
-    paginator = Paginator(qs_list, settings.WORKBASKET_PER_PAGE)
+    # Records are ordered and paginated in the database.
+    paginator = Paginator(WorkbasketQuery(sources), settings.WORKBASKET_PER_PAGE)
     page_number = request.GET.get("page", default=1)
 
     page_obj = paginator.get_page(page_number)
 
+    # Applicant actions use the specific application model, downcast them in bulk.
+    if not is_ilb_admin:
+        get_specific_models(
+            r for r in page_obj if isinstance(r, ImportApplication | ExportApplication)
+        )
+
     # Only call get_workbasket_row on the row's being rendered
     rows = []
 
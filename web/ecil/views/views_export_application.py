@@ -32,6 +32,7 @@ from web.models import (
 from web.models.shared import YesNoChoices
 from web.permissions import AppChecker, Perms, can_user_edit_org, is_user_agent_of_org
 from web.types import AuthenticatedHttpRequest
+from web.utils.reference_data import get_export_application_type
 
 
 #
@@ -275,21 +276,19 @@ class CreateExportApplicationSummaryUpdateView(CreateExportApplicationBase, Summ
         match self.object.app_type:
             case self.object.ExportApplicationsChoices.CFS:
                 model_class = CertificateOfFreeSaleApplication
-                application_type = ExportApplicationType.objects.get(
-                    type_code=ExportApplicationType.Types.FREE_SALE
+                application_type = get_export_application_type(
+                    ExportApplicationType.Types.FREE_SALE
                 )
 
             case self.object.ExportApplicationsChoices.COM:
                 model_class = CertificateOfManufactureApplication
-                application_type = ExportApplicationType.objects.get(
-                    type_code=ExportApplicationType.Types.MANUFACTURE
+                application_type = get_export_application_type(
+                    ExportApplicationType.Types.MANUFACTURE
                 )
 
             case self.object.ExportApplicationsChoices.GMP:
                 model_class = CertificateOfGoodManufacturingPracticeApplication
-                application_type = ExportApplicationType.objects.get(
-                    type_code=ExportApplicationType.Types.GMP
-                )
+                application_type = get_export_application_type(ExportApplicationType.Types.GMP)
 
             case _:
                 raise ValueError(
@@ -1,3 +1,8 @@
+import functools
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.apps import apps
 from django.conf import settings
 from django.db import models
 from django.utils import timezone
@@ -42,9 +47,20 @@ class ProcessTypes(TypedTextChoices):
     ImpApprovalReq = ("ImporterApprovalRequest", "Importer Approval Request")
 
 
+class ProcessQuerySet(models.QuerySet):
+    def as_specific(self, *select_related: str) -> list["Process"]:
+        """Return the processes downcast to their specific model class, in order.
+
+        See get_specific_models.
+        """
+        return get_specific_models(self, *select_related)
+
+
 class Process(models.Model):
     """Base class for all processes."""
 
+    objects = ProcessQuerySet.as_manager()
+
     # each final subclass needs to set this for downcasting to work; see
     # get_specific_model. they should also mark themselves with typing.final.
     IS_FINAL = False
@@ -102,6 +118,10 @@ class Process(models.Model):
         if self.IS_FINAL:
             return self
 
+        # set when downcast in bulk; see get_specific_models
+        if specific_model := self.__dict__.get("_specific_model"):
+            return specific_model
+
         pt = self.process_type
 
         # importer/exporter access requests
@@ -156,6 +176,59 @@ class Process(models.Model):
         self.order_datetime = timezone.now()
 
 
+@functools.cache
+def get_process_type_models() -> dict[str, type[Process]]:
+    """Return the specific model class for each process_type."""
+
+    return {
+        model.PROCESS_TYPE: model
+        for model in apps.get_models()
+        if issubclass(model, Process) and model.IS_FINAL
+    }
+
+
+def get_specific_models(processes: Iterable[Process], *select_related: str) -> list[Process]:
+    """Downcast processes to their specific model class, in the original order.
+
+    Rather than a query per process (see Process.get_specific_model) the processes are
+    grouped by process_type and each specific model is fetched with one query. The specific
+    model is cached on the original process, so calling get_specific_model on it later doesn't
+    query the database again.
+
+    :param processes: Processes to downcast
+    :param select_related: Related fields to select with every specific model
+    """
+
+    processes = list(processes)
+    pks_by_process_type: defaultdict[str, list[int]] = defaultdict(list)
+
+    for process in processes:
+        if not process.IS_FINAL:
+            pks_by_process_type[process.process_type].append(process.pk)
+
+    process_type_models = get_process_type_models()
+    specific_models: dict[int, Process] = {}
+
+    for process_type, pks in pks_by_process_type.items():
+        try:
+            model = process_type_models[process_type]
+        except KeyError:
+            raise NotImplementedError(f"Unknown process_type {process_type}")
+
+        specific_models |= model.objects.select_related(*select_related).in_bulk(pks)
+
+    downcast = []
+
+    for process in processes:
+        if not process.IS_FINAL:
+            process._specific_model = specific_models[process.pk]
+            process = process._specific_model
+
+        downcast.append(process)
+
+    return downcast
+
+
 class Task(models.Model):
     """A task. A process can have as many tasks as it wants attached to it, and
     tasks maintain a "previous" link to track the task ordering.
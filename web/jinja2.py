@@ -24,6 +24,7 @@ from web.permissions import Perms
 from web.permissions.context_processors import UserObjectPerms
 from web.types import AuthenticatedHttpRequest
 from web.utils import datetime_format
+from web.utils.instrumentation import InstrumentedTemplate
 from web.utils.messages import get_messages
 
 if TYPE_CHECKING:
@@ -172,6 +173,9 @@ def environment(**options):
     env.filters["localdate"] = timezone.localdate
     env.filters["datetime_format"] = datetime_format
 
+    if settings.REQUEST_INSTRUMENTATION_ENABLED:
+        env.template_class = InstrumentedTemplate
+
     return env
 
 
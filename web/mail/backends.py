@@ -1,13 +1,16 @@
 import logging
+from collections.abc import Iterable
 from urllib.parse import ParseResult, urlparse
-from uuid import UUID
 
+from celery import group
+from celery.canvas import Signature
+from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.mail.backends.base import BaseEmailBackend
+from django.db.models.functions import Lower
 
 from web.domains.user.utils import send_and_create_email_verification
 from web.mail.constants import EmailTypes
-from web.mail.models import EmailTemplate
 from web.models import Email
 
 from .api import send_email
@@ -18,29 +21,50 @@ logger = logging.getLogger(__name__)
 
 class GovNotifyEmailBackend(BaseEmailBackend):
     def send_messages(self, email_messages: list[GOVNotifyEmailMessage]) -> None:
+        """Queue a send_email task for every recipient of the supplied messages.
+
+        Recipient verification state is loaded for every message in a single query and the
+        tasks are queued in groups of MAIL_BULK_SEND_CHUNK_SIZE, so sending a message to
+        thousands of recipients (e.g. a mailshot) doesn't run a query per recipient.
+        """
+
+        recipients = {r.lower() for message in email_messages for r in message.recipients()}
+        emails = self._get_emails(recipients)
+        signatures = []
+
         for message in email_messages:
+            personalisation = message.get_personalisation()
+
             for recipient in message.recipients():
                 logger.info("Sending %s email to %s", message.name.label, recipient)
-                self._send_message(message.template_id, message.get_personalisation(), recipient)
 
-    def _send_message(self, template_id: UUID, personalisation: dict, recipient: str) -> None:
-        self._verify_recipient(template_id, personalisation, recipient)
+                # Do not perform logic if email being sent is an email verify email
+                if message.name != EmailTypes.EMAIL_VERIFICATION:
+                    self._verify_recipient(emails.get(recipient.lower()), personalisation)
 
-        send_email.apply_async(args=[template_id, personalisation, recipient])
+                signatures.append(send_email.si(message.template_id, personalisation, recipient))
 
-    def _verify_recipient(self, template_id: UUID, personalisation: dict, recipient: str) -> None:
-        """Checks if the supplied email address has been verified."""
+        for chunk in _chunked(signatures, settings.MAIL_BULK_SEND_CHUNK_SIZE):
+            group(chunk).apply_async()
+
+    def _get_emails(self, recipients: Iterable[str]) -> dict[str, Email]:
+        """Return the first Email record for each (lower case) recipient address."""
 
-        template = EmailTemplate.objects.get(gov_notify_template_id=template_id)
+        emails: dict[str, Email] = {}
+        records = (
+            Email.objects.annotate(email_lower=Lower("email"))
+            .filter(email_lower__in=recipients)
+            .order_by("pk")
+        )
 
-        # Do not perform logic if email being sent is an email verify email
-        if template.name == EmailTypes.EMAIL_VERIFICATION:
-            logger.debug(
-                "GovNotifyEmailBackend._verify_recipient: Not verifying EMAIL_VERIFICATION email."
-            )
-            return
+        for email in records:
+            emails.setdefault(email.email_lower, email)
+
+        return emails
+
+    def _verify_recipient(self, email: Email | None, personalisation: dict) -> None:
+        """Checks if the supplied email address has been verified."""
 
-        email = Email.objects.filter(email__iexact=recipient).first()
         if email and not email.is_verified:
             if icms_url := personalisation.get("icms_url"):
                 result: ParseResult = urlparse(icms_url)
@@ -55,3 +79,8 @@ class GovNotifyEmailBackend(BaseEmailBackend):
                 logger.error(
                     f"GovNotifyEmailBackend._verify_recipient: Unable to send very email for email_pk: {email.pk}"
                 )
+
+
+def _chunked(signatures: list[Signature], size: int) -> Iterable[list[Signature]]:
+    for i in range(0, len(signatures), size):
+        yield signatures[i : i + size]
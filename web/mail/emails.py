@@ -1,6 +1,7 @@
 import datetime as dt
 
 from django.contrib.sites.models import Site
+from django.core.mail import get_connection
 from django.db.models import QuerySet
 from django.utils import timezone
 
@@ -39,6 +40,7 @@ from web.models import (
 )
 from web.permissions import get_ilb_case_officers
 from web.sites import get_exporter_site_domain, get_importer_site_domain
+from web.utils.reference_data import get_email_template_id
 
 from .constants import EmailTypes
 from .messages import (
@@ -86,6 +88,7 @@ from .messages import (
     WithdrawalCancelledEmail,
     WithdrawalOpenedEmail,
     WithdrawalRejectedEmail,
+    get_service_name,
 )
 from .recipients import (
     get_application_contact_email_addresses,
@@ -478,9 +481,7 @@ def send_mailshot_email(mailshot: Mailshot) -> None:
 def send_mailshot_email_to_organisations(
     mailshot: Mailshot, organisation_class: type[Organisation], site_domain: str
 ) -> None:
-    recipients = get_email_addresses_for_mailshot(organisation_class)
-    for recipient in recipients:
-        MailshotEmail(mailshot=mailshot, site_domain=site_domain, recipient=recipient).send()
+    send_bulk_mailshot_email(MailshotEmail, mailshot, organisation_class, site_domain)
 
 
 def send_retract_mailshot_email(mailshot: Mailshot) -> None:
@@ -493,9 +494,36 @@ def send_retract_mailshot_email(mailshot: Mailshot) -> None:
 def send_retract_mailshot_email_to_organisations(
     mailshot: Mailshot, organisation_class: type[Organisation], site_domain: str
 ) -> None:
-    recipients = get_email_addresses_for_mailshot(organisation_class)
-    for recipient in recipients:
-        RetractMailshotEmail(mailshot=mailshot, site_domain=site_domain, recipient=recipient).send()
+    send_bulk_mailshot_email(RetractMailshotEmail, mailshot, organisation_class, site_domain)
+
+
+def send_bulk_mailshot_email(
+    email_class: type[MailshotEmail | RetractMailshotEmail],
+    mailshot: Mailshot,
+    organisation_class: type[Organisation],
+    site_domain: str,
+) -> None:
+    """Send a mailshot email to every organisation contact using a single email connection.
+
+    The template and service name are loaded once and the messages are passed to the email backend together
+    so recipients are verified and queued in bulk.
+    """
+
+    template_id = get_email_template_id(email_class.name)
+    service_name = get_service_name(site_domain)
+    messages = [
+        email_class(
+            mailshot=mailshot,
+            site_domain=site_domain,
+            recipient=recipient,
+            template_id=template_id,
+            service_name=service_name,
+        )
+        for recipient in get_email_addresses_for_mailshot(organisation_class)
+    ]
+
+    if messages:
+        get_connection().send_messages(messages)
 
 
 def send_case_email(case_email: CaseEmailModel, sent_by: User) -> None:
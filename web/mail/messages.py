@@ -49,9 +49,9 @@ from web.sites import (
     is_importer_site,
 )
 from web.utils import datetime_format
+from web.utils.reference_data import get_email_template_id
 
 from .constants import DATE_FORMAT, CaseEmailCodes, EmailTypes
-from .models import EmailTemplate
 from .types import ImporterDetails
 from .url_helpers import (
     get_accept_org_invite_url,
@@ -76,18 +76,38 @@ from .url_helpers import (
 )
 
 
+def get_service_name(site_domain: str) -> str:
+    if site_domain == get_importer_site_domain():
+        return SiteName.IMPORTER.label
+    if site_domain == get_exporter_site_domain():
+        return SiteName.EXPORTER.label
+    if site_domain == get_caseworker_site_domain():
+        return SiteName.CASEWORKER.label
+    raise ValueError(f"Unknown site domain: {site_domain}")
+
+
 class GOVNotifyEmailMessage(EmailMessage):
     name: ClassVar[EmailTypes]
 
-    def __init__(self, *args: Any, recipient: RecipientDetails, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        recipient: RecipientDetails,
+        template_id: UUID | None = None,
+        service_name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
         self.recipient = recipient
         kwargs["to"] = [recipient.email_address]
         super().__init__(*args, **kwargs)
-        self.template_id = self.get_template_id()
+        # template_id and service_name can be supplied when sending the same email to many
+        # recipients to avoid loading them for each recipient.
+        self.template_id = template_id or self.get_template_id()
+        self.service_name = service_name
         self.first_name = recipient.first_name
 
     def get_template_id(self) -> UUID:
-        return EmailTemplate.objects.get(name=self.name).gov_notify_template_id
+        return get_email_template_id(self.name)
 
     def message(self) -> SafeMIMEMultipart:
         """Adds the personalisation data to the message header, so it is visible when using the console backend."""
@@ -102,7 +122,7 @@ class GOVNotifyEmailMessage(EmailMessage):
             "icms_contact_phone": settings.ILB_CONTACT_PHONE,
             "subject": self.subject,
             "body": self.body,
-            "service_name": self.get_service_name(),
+            "service_name": self.service_name or self.get_service_name(),
             "first_name": self.first_name,
         } | self.get_context()
 
@@ -113,14 +133,7 @@ class GOVNotifyEmailMessage(EmailMessage):
         raise NotImplementedError
 
     def get_service_name(self) -> str:
-        site_domain = self.get_site_domain()
-        if site_domain == get_importer_site_domain():
-            return SiteName.IMPORTER.label
-        if site_domain == get_exporter_site_domain():
-            return SiteName.EXPORTER.label
-        if site_domain == get_caseworker_site_domain():
-            return SiteName.CASEWORKER.label
-        raise ValueError(f"Unknown site domain: {site_domain}")
+        return get_service_name(self.get_site_domain())
 
 
 @final
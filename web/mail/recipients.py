@@ -5,7 +5,7 @@ from django.db.models import QuerySet
 from web.domains.case.types import ImpOrExp, Organisation
 from web.flow.models import ProcessTypes
 from web.mail.types import RecipientDetails
-from web.models import CaseEmail, Constabulary, Email, User
+from web.models import CaseEmail, Constabulary, Email, Importer, User
 from web.permissions import (
     Perms,
     SysPerms,
@@ -14,6 +14,7 @@ from web.permissions import (
     get_ilb_case_officers,
     get_org_obj_permissions,
     organisation_get_contacts,
+    organisations_get_contacts,
 )
 
 from .constants import (
@@ -92,10 +93,28 @@ def get_organisation_contact_email_addresses(org: Organisation) -> list[Recipien
 def get_email_addresses_for_mailshot(
     organisation_class: type[Organisation],
 ) -> list[RecipientDetails]:
-    emails = []
-    for org in organisation_class.objects.filter(is_active=True):
-        emails.extend(get_organisation_contact_email_addresses(org))
-    return emails
+    """Return the email addresses of the contacts of every active organisation.
+
+    Contacts of several organisations are only emailed once.
+    """
+
+    edit_perm = (
+        Perms.obj.importer.edit if organisation_class is Importer else Perms.obj.exporter.edit
+    )
+    users = organisations_get_contacts(organisation_class, perms=[edit_perm.codename])
+    emails = (
+        Email.objects.filter(user__in=users, portal_notifications=True)
+        .order_by("email")
+        .values_list("email", "user__first_name")
+    )
+
+    # dict.fromkeys de-duplicates by email address and keeps the order.
+    return list(
+        dict.fromkeys(
+            RecipientDetails(first_name=first_name, email_address=email)
+            for email, first_name in emails
+        )
+    )
 
 
 def get_email_addresses_for_section_5_expiring_authorities() -> list[RecipientDetails]:
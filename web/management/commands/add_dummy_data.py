@@ -38,6 +38,7 @@ from web.models import (
 from web.models.shared import YesNoChoices
 from web.permissions import constabulary_add_contact, organisation_add_contact
 from web.utils import datetime_format
+from web.utils.reference_data import invalidate_reference_data
 from web.utils.s3 import upload_file_obj_to_s3
 
 IMPORT_USERS = [
@@ -459,6 +460,7 @@ class Command(BaseCommand):
         if settings.SET_INACTIVE_APP_TYPES_ACTIVE:
             ImportApplicationType.objects.update(is_active=True)
             ExportApplicationType.objects.update(is_active=True)
+            invalidate_reference_data()
 
         self.add_ilb_admin_users(options["password"])
         self.add_importers_and_users(options["password"])
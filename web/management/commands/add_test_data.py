@@ -39,6 +39,7 @@ from web.tests.types import (
     TestExporter,
     TestImporter,
 )
+from web.utils.reference_data import invalidate_reference_data
 
 
 class Command(BaseCommand):
@@ -104,6 +105,7 @@ class Command(BaseCommand):
             ]
         ).update(is_active=True)
         ExportApplicationType.objects.update(is_active=True)
+        invalidate_reference_data()
 
         # Add a dummy biocidal_claim legislation (defaults to GB and NI legislation)
         ProductLegislation.objects.create(
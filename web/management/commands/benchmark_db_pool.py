@@ -0,0 +1,83 @@
+import statistics
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Any
+
+import psycopg
+from django.core.management.base import BaseCommand
+from django.db import connection
+from psycopg_pool import ConnectionPool
+
+
+class Command(BaseCommand):
+    help = """Benchmark database connections with and without a connection pool.
+
+    Concurrent clients make requests that each get a connection, run a few queries and release
+    it, as a gunicorn worker's greenlets do. Without a pool every request opens and closes its own
+    connection, with a pool the connections are shared. Reports the throughput, request latency
+    and pool wait time of both.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=50, help="Number of concurrent clients")
+        parser.add_argument(
+            "--requests", type=int, default=20, help="Number of requests per client"
+        )
+        parser.add_argument("--queries", type=int, default=5, help="Number of queries per request")
+        parser.add_argument("--pool-size", type=int, default=10, help="Maximum pool size")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connect_kwargs = connection.get_connection_params()
+        connect_kwargs["autocommit"] = True
+
+        self.stdout.write(
+            f"{'Mode':<10} {'Requests/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'Wait ms':>8}"
+        )
+
+        self.run("no pool", lambda: psycopg.connect(**connect_kwargs), options)
+
+        with ConnectionPool(
+            kwargs=connect_kwargs, min_size=options["pool_size"], max_size=options["pool_size"]
+        ) as pool:
+            pool.wait()
+            self.run("pool", pool.connection, options, pool=pool)
+
+    def run(
+        self,
+        mode: str,
+        get_connection: Callable[[], AbstractContextManager[psycopg.Connection]],
+        options: dict[str, Any],
+        pool: ConnectionPool | None = None,
+    ) -> None:
+        def client() -> list[float]:
+            timings = []
+
+            for _ in range(options["requests"]):
+                start = time.perf_counter()
+
+                with get_connection() as conn:
+                    for _ in range(options["queries"]):
+                        conn.execute("SELECT 1").fetchall()
+
+                timings.append((time.perf_counter() - start) * 1000)
+
+            return timings
+
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=options["clients"]) as executor:
+            futures = [executor.submit(client) for _ in range(options["clients"])]
+            timings = [t for f in futures for t in f.result()]
+
+        elapsed = time.perf_counter() - start
+
+        p50 = statistics.median(timings)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        # Time spent waiting for a free connection in the pool
+        wait = str(pool.get_stats().get("requests_wait_ms", 0)) if pool else "-"
+
+        self.stdout.write(
+            f"{mode:<10} {len(timings) / elapsed:>10.1f} {p50:>8.2f} {p95:>8.2f} {wait:>8}"
+        )
@@ -0,0 +1,118 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from web.domains.case.services import reference
+from web.models import ReferenceCounter, UniqueReference
+from web.utils.lock_manager import LockManager
+
+# Prefixes that aren't used by ICMS so the benchmark doesn't allocate real references.
+BENCHMARK_PREFIX = "BENCH"
+
+
+class Command(BaseCommand):
+    help = """Benchmark allocating references from concurrent transactions.
+
+    Each worker allocates references in its own transaction, like an application being submitted.
+    The references use benchmark prefixes which are checked to be unique and gap free and then
+    deleted when the command finishes. Use --lock-table to lock the UniqueReference table before
+    allocating, as references used to be allocated, to compare the throughput.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8, help="Number of concurrent workers")
+        parser.add_argument(
+            "--allocations", type=int, default=50, help="Number of transactions per worker"
+        )
+        parser.add_argument(
+            "--prefixes", type=int, default=4, help="Number of prefixes the workers allocate from"
+        )
+        parser.add_argument(
+            "--count", type=int, default=1, help="Number of references per transaction"
+        )
+        parser.add_argument(
+            "--hold-ms",
+            type=float,
+            default=5,
+            help="Time each transaction stays open after allocating, e.g. to save the application",
+        )
+        parser.add_argument(
+            "--lock-table", action="store_true", help="Lock the UniqueReference table first"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        workers = options["workers"]
+        prefixes = [f"{BENCHMARK_PREFIX}{i}" for i in range(options["prefixes"])]
+
+        if UniqueReference.objects.filter(prefix__in=prefixes).exists():
+            raise CommandError("Benchmark references already exist")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                start = time.perf_counter()
+                futures = [
+                    executor.submit(self.run_worker, prefixes[i % len(prefixes)], options)
+                    for i in range(workers)
+                ]
+                allocated = sum(f.result() for f in futures)
+                elapsed = time.perf_counter() - start
+
+                gap_free = executor.submit(self.check_gap_free, prefixes).result()
+            finally:
+                # Cleaned up from a worker connection so it's committed in every case.
+                executor.submit(self.clean_up, prefixes).result()
+
+        mode = "lock table" if options["lock_table"] else "reference counter"
+        self.stdout.write(f"Mode: {mode}")
+        self.stdout.write(f"Workers: {workers}, prefixes: {len(prefixes)}")
+        self.stdout.write(f"Allocated {allocated} references in {elapsed:.2f}s")
+        self.stdout.write(f"Throughput: {allocated / elapsed:.1f} references/s")
+        self.stdout.write(f"Unique and gap free: {'yes' if gap_free else 'no'}")
+
+    def run_worker(self, prefix: str, options: dict[str, Any]) -> int:
+        allocated = 0
+
+        try:
+            for _ in range(options["allocations"]):
+                with transaction.atomic():
+                    lock_manager = LockManager()
+
+                    if options["lock_table"]:
+                        lock_manager.lock_tables([UniqueReference])
+
+                    references = reference._get_next_references(
+                        lock_manager, prefix=prefix, use_year=True, count=options["count"]
+                    )
+                    time.sleep(options["hold_ms"] / 1000)
+
+                allocated += len(references)
+        finally:
+            connection.close()
+
+        return allocated
+
+    def check_gap_free(self, prefixes: list[str]) -> bool:
+        try:
+            for prefix in prefixes:
+                references = list(
+                    UniqueReference.objects.filter(prefix=prefix)
+                    .order_by("reference")
+                    .values_list("reference", flat=True)
+                )
+
+                if references != list(range(1, len(references) + 1)):
+                    return False
+
+            return True
+        finally:
+            connection.close()
+
+    def clean_up(self, prefixes: list[str]) -> None:
+        try:
+            UniqueReference.objects.filter(prefix__in=prefixes).delete()
+            ReferenceCounter.objects.filter(prefix__in=prefixes).delete()
+        finally:
+            connection.close()
@@ -0,0 +1,120 @@
+import statistics
+import time
+from typing import Any
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection, models, transaction
+
+from web.models import CaseDocumentReference, ExportApplication, ImportApplication, User
+from web.utils.search import get_wildcard_filter
+
+# The fields searched by web.utils.search.api._apply_search
+SEARCH_FIELDS: list[tuple[type[models.Model], str]] = [
+    (ImportApplication, "reference"),
+    (ExportApplication, "reference"),
+    (CaseDocumentReference, "reference"),
+    (User, "first_name"),
+    (User, "last_name"),
+]
+
+DEFAULT_PATTERNS = ["IMA/2024/%", "%/0001", "GBSIL%", "%SIL%1", "smi%", "%son"]
+
+SEED_NAMES = ["Smith", "Jones", "Williams", "Taylor", "Davies", "Robinson", "Thompson"]
+
+
+class Command(BaseCommand):
+    help = """Benchmark the application search wildcard filters.
+
+    Reports the median query time and the query plan scan for each search field and pattern.
+    Run against a database with production row counts or use --seed-rows to add temporary
+    document reference and user rows. Everything is rolled back when the command finishes.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pattern",
+            action="append",
+            dest="patterns",
+            help="Search pattern to benchmark, can be repeated",
+        )
+        parser.add_argument("--runs", type=int, default=5, help="Number of runs per query")
+        parser.add_argument(
+            "--seed-rows",
+            type=int,
+            default=0,
+            help="Number of temporary document reference and user rows to add",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        patterns = options["patterns"] or DEFAULT_PATTERNS
+
+        with transaction.atomic():
+            if options["seed_rows"]:
+                self.seed(options["seed_rows"])
+
+            self.stdout.write(f"{'Field':<40} {'Pattern':<15} {'Median ms':>10}  Plan")
+
+            for model, field in SEARCH_FIELDS:
+                name = f"{model._meta.db_table}.{field}"
+
+                for pattern in patterns:
+                    queryset = model.objects.filter(get_wildcard_filter(field, pattern))
+                    median = self.time_query(queryset.values_list("pk", flat=True), options["runs"])
+                    scan = get_plan_scan(queryset.explain())
+
+                    self.stdout.write(f"{name:<40} {pattern:<15} {median:>10.2f}  {scan}")
+
+            transaction.set_rollback(True)
+
+    def seed(self, rows: int) -> None:
+        self.stdout.write(f"Adding {rows} temporary rows")
+
+        content_type = ContentType.objects.get_for_model(ImportApplication)
+        CaseDocumentReference.objects.bulk_create(
+            (
+                CaseDocumentReference(
+                    content_type=content_type,
+                    object_id=i,
+                    document_type=CaseDocumentReference.Type.LICENCE,
+                    reference=f"GBSIL{i:07}",
+                )
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+        User.objects.bulk_create(
+            (
+                User(
+                    username=f"benchmark-search-{i}",
+                    first_name=f"{SEED_NAMES[i % len(SEED_NAMES)]}{i}",
+                    last_name=f"{SEED_NAMES[-i % len(SEED_NAMES)]}son{i}",
+                )
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+
+        with connection.cursor() as cursor:
+            for model in (CaseDocumentReference, User):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def time_query(self, queryset: models.QuerySet, runs: int) -> float:
+        timings = []
+
+        for _ in range(runs):
+            start = time.perf_counter()
+            list(queryset)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(timings)
+
+
+def get_plan_scan(plan: str) -> str:
+    """Return the first scan node of the query plan, e.g. "Bitmap Index Scan on ..."."""
+
+    for line in plan.splitlines():
+        if "Scan" in line:
+            return line.strip().lstrip("-> ").split("  (")[0]
+
+    return plan.splitlines()[0]
@@ -1,58 +1,86 @@
+import dataclasses
+import functools
+import hashlib
+import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from django.conf import settings
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.core.cache import cache
 from django.urls import NoReverseMatch, resolve, reverse
 
-from web.permissions import Perms, can_user_view_search_cases
+from web.permissions import Perms, can_user_view_search_cases, get_permissions_version
 from web.sites import SiteName, is_caseworker_site
 from web.types import AuthenticatedHttpRequest
 
 logger = logging.getLogger(__name__)
 
+PermissionCheck = Callable[[AuthenticatedHttpRequest], bool]
 
-def url(view_name, kwargs):
-    """
-    Reverse view name and return resolved url
-    """
-    if view_name:
-        return reverse(view_name, kwargs=kwargs)
 
-    return ""
+@dataclasses.dataclass(frozen=True)
+class CompiledLink:
+    url: str
+    has_permission: PermissionCheck
 
 
-def has_view_access(
-    request: AuthenticatedHttpRequest, view_name: str | None, view_kwargs: dict[str, Any] | None
-) -> bool:
-    """Check if current user has access to given view."""
+def compile_link(view_name: str | None, view_kwargs: dict[str, Any] | None) -> CompiledLink | None:
+    """Reverse the view url and return it with the permission check of the view.
+
+    Returns None if the view isn't available (some urls are only available on the private app).
+    """
 
     if not view_name:
-        return True
+        return CompiledLink(url="", has_permission=lambda request: True)
+
+    try:
+        view_url = reverse(view_name, kwargs=view_kwargs)
+    except NoReverseMatch:
+        return None
+
+    return CompiledLink(
+        url=view_url, has_permission=get_view_permission_check(view_name, view_kwargs, view_url)
+    )
+
+
+def get_view_permission_check(
+    view_name: str, view_kwargs: dict[str, Any] | None, view_url: str
+) -> PermissionCheck:
+    """Return a function checking if the current user has access to given view."""
 
     match view_name:
         # Specific checks for function based view menu items
         case "workbasket":
-            has_perm = True
+            return lambda request: True
 
         case "case:search":
             # view_kwargs will be a dict for this case.
             assert view_kwargs
-            has_perm = can_user_view_search_cases(request.user, view_kwargs["case_type"])
+            case_type = view_kwargs["case_type"]
 
-        # All class based views checked here.
-        case _:
-            try:
-                view_url = reverse(view_name, kwargs=view_kwargs)
-                view = resolve(view_url).func.view_class()
-                view.request = request
+            return lambda request: can_user_view_search_cases(request.user, case_type)
+
+    # All class based views checked here.
+    view_class = resolve(view_url).func.view_class
+
+    if (
+        view_class.has_permission is PermissionRequiredMixin.has_permission
+        and view_class.get_permission_required is PermissionRequiredMixin.get_permission_required
+    ):
+        # The view only checks the permissions in permission_required.
+        perms = view_class().get_permission_required()
 
-                has_perm = view.has_permission()
+        return lambda request: request.user.has_perms(perms)
 
-            # Now some urls are only available on private app this code can throw exceptions.
-            except NoReverseMatch:
-                has_perm = False
+    def has_permission(request: AuthenticatedHttpRequest) -> bool:
+        view = view_class()
+        view.request = request
 
-    return has_perm
+        return view.has_permission()
+
+    return has_permission
 
 
 class MenuItem:
@@ -96,11 +124,16 @@ class MenuLink(MenuItem):
         self.kwargs = kwargs
         self.target = target
 
+    @functools.cached_property
+    def compiled(self) -> CompiledLink | None:
+        """The link url and permission check, compiled once per process."""
+        return compile_link(self.view, self.kwargs)
+
     def has_access(self, request):
-        return has_view_access(request, self.view, self.kwargs)
+        return self.compiled is not None and self.compiled.has_permission(request)
 
     def get_link(self):
-        return url(self.view, self.kwargs)
+        return self.compiled.url if self.compiled else ""
 
     def as_html(self, request):
         return f"""
@@ -335,8 +368,42 @@ class Menu:
         MenuButton(label="New Certificate Application", view="export:choose"),
     ] + extra_menu_items
 
-    def as_html(self, request):
-        html = ""
-        for item in self.items:
-            html += item.html(request)
+    def as_html(self, request: AuthenticatedHttpRequest) -> str:
+        """Return the menu html, cached per user, user permissions version and site."""
+
+        key = ":".join(
+            [
+                "menu",
+                get_menu_digest(),
+                str(request.site.pk),
+                str(request.user.pk),
+                get_permissions_version(request.user),
+            ]
+        )
+        html = cache.get(key)
+
+        if html is None:
+            html = "".join(item.html(request) for item in self.items)
+            cache.set(key, html, timeout=settings.MENU_CACHE_TIMEOUT)
+
         return html
+
+
+@functools.cache
+def get_menu_digest() -> str:
+    """Return a digest of the menu items, so a changed menu doesn't use the cached menus."""
+
+    def describe(item: MenuItem) -> list[Any]:
+        children = getattr(item, "links", None) or getattr(item, "sub_menu_list", None) or []
+
+        return [
+            type(item).__name__,
+            item.label,
+            getattr(item, "view", None),
+            getattr(item, "kwargs", None),
+            [describe(child) for child in children],
+        ]
+
+    data = json.dumps([describe(item) for item in Menu.items])
+
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
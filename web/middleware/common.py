@@ -1,6 +1,11 @@
+import time
+
+from django.conf import settings
 from django.contrib.sites.middleware import CurrentSiteMiddleware
+from django.core.exceptions import MiddlewareNotUsed
 from django.urls import resolve
 
+from web.utils import instrumentation
 from web.utils.lock_manager import LockManager
 
 
@@ -43,6 +48,54 @@ class DBQueriesMiddleware:
         return response
 
 
+class RequestInstrumentationMiddleware:
+    """Records query, template and S3 / HTTP call metrics for each request.
+
+    Only used when REQUEST_INSTRUMENTATION_ENABLED is set, see web.utils.instrumentation.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+
+        with instrumentation.collect_metrics() as metrics:
+            response = self.get_response(request)
+
+        if response.streaming and not response.is_async:
+            # The body of a streaming response (e.g. a file download) is generated after the
+            # middleware has returned, so the metrics are reported once it has been sent.
+            response.streaming_content = self.stream_content(
+                response.streaming_content, request, response, metrics, start
+            )
+        else:
+            self.report_metrics(request, response, metrics, start)
+
+        return response
+
+    def stream_content(self, content, request, response, metrics, start):
+        try:
+            with instrumentation.collect_metrics(metrics):
+                yield from content
+        finally:
+            self.report_metrics(request, response, metrics, start)
+
+    def report_metrics(self, request, response, metrics, start):
+        resolver_match = request.resolver_match
+
+        instrumentation.report_metrics(
+            metrics,
+            view_name=resolver_match.view_name if resolver_match else "",
+            method=request.method,
+            status_code=response.status_code,
+            duration=time.perf_counter() - start,
+        )
+
+
 class SetPermittedCrossDomainPolicyHeaderMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
@@ -0,0 +1,94 @@
+# Generated by Django 5.1.9 on 2026-10-18 07:47
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("web", "0071_cfsproduct_is_raw_material_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="casedocumentreference",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["reference"], name="CDR_search_ref_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="casedocumentreference",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("reference"), name="text_pattern_ops"
+                ),
+                name="CDR_search_ref_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exportapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["reference"], name="EA_search_case_ref_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exportapplication",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("reference"), name="text_pattern_ops"
+                ),
+                name="EA_search_case_ref_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="importapplication",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["reference"], name="IA_search_case_ref_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="importapplication",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("reference"), name="text_pattern_ops"
+                ),
+                name="IA_search_case_ref_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["first_name"], name="user_first_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("first_name"), name="text_pattern_ops"
+                ),
+                name="user_first_name_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["last_name"], name="user_last_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("last_name"), name="text_pattern_ops"
+                ),
+                name="user_last_name_upper_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.9 on 2026-10-18 08:05
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0072_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchExport",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("case_type", models.CharField(max_length=6)),
+                (
+                    "parameters",
+                    models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("SUBMITTED", "Submitted"),
+                            ("IN_PROGRESS", "In Progress"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="SUBMITTED",
+                        max_length=11,
+                    ),
+                ),
+                ("total_rows", models.IntegerField(null=True)),
+                ("processed_rows", models.IntegerField(default=0)),
+                ("created_datetime", models.DateTimeField(auto_now_add=True)),
+                ("finished_datetime", models.DateTimeField(null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "document",
+                    models.OneToOneField(
+                        null=True, on_delete=django.db.models.deletion.CASCADE, to="web.file"
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.9 on 2026-10-18 09:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0073_search_export"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "prefix",
+                    models.CharField(
+                        choices=[
+                            ("IMA", "Import App"),
+                            ("ILD", "Import Licence Document"),
+                            ("CFS", "Export Certificate Document Cfs"),
+                            ("COM", "Export Certificate Document Com"),
+                            ("GMP", "Export Certificate Document Gmp"),
+                            ("GA", "Export App Ga"),
+                            ("CA", "Export App Ca"),
+                            ("MAIL", "Mailshot"),
+                            ("IAR", "Imp Access Req"),
+                            ("EAR", "Exp Access Req"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                ("year", models.IntegerField(null=True)),
+                ("last_reference", models.IntegerField()),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("prefix", "year"),
+                        name="reference_counter_unique",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.9 on 2026-10-18 14:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("web", "0074_reference_counter"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="generatedreport",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("COMPLETED", "Completed"),
+                    ("DELETED", "Deleted"),
+                    ("FAILED", "Failed"),
+                    ("IN_PROGRESS", "In Progress"),
+                    ("PROCESSING", "Processing"),
+                    ("SUBMITTED", "Submitted"),
+                ],
+                default="SUBMITTED",
+                max_length=255,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="schedulereport",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("COMPLETED", "Completed"),
+                    ("DELETED", "Deleted"),
+                    ("FAILED", "Failed"),
+                    ("IN_PROGRESS", "In Progress"),
+                    ("PROCESSING", "Processing"),
+                    ("SUBMITTED", "Submitted"),
+                ],
+                default="SUBMITTED",
+                max_length=255,
+            ),
+        ),
+    ]
@@ -99,6 +99,7 @@ from web.domains.case.models import (
     CaseEmail,
     CaseEmailDownloadLink,
     CaseNote,
+    SearchExport,
     UpdateRequest,
     VariationRequest,
     WithdrawApplication,
@@ -165,7 +166,7 @@ from web.domains.user.models import Email, EmailVerification, PhoneNumber, User
 from web.ecil.models import ECILExample, ECILMultiStepExample, ECILUserExportApplication
 from web.flow.models import Process, Task
 from web.mail.models import EmailTemplate
-from web.models.models import GlobalPermission, UniqueReference
+from web.models.models import GlobalPermission, ReferenceCounter, UniqueReference
 from web.reports.models import GeneratedReport, Report, ScheduleReport
 
 __all__ = [
@@ -265,6 +266,7 @@ __all__ = [
     "PriorSurveillanceContractFile",
     "Process",
     "ProductLegislation",
+    "ReferenceCounter",
     "Report",
     "ScheduleReport",
     "SIGLTransmission",
@@ -288,6 +290,7 @@ __all__ = [
     "SanctionEmail",
     "SanctionsAndAdhocApplication",
     "SanctionsAndAdhocApplicationGoods",
+    "SearchExport",
     "Section5Authority",
     "Section5Clause",
     "Signature",
@@ -0,0 +1,22 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models
+from django.db.models.functions import Upper
+
+
+def get_search_indexes(field: str, name_prefix: str) -> list[models.Index]:
+    """Indexes for fields searched using web.utils.search.get_wildcard_filter.
+
+    The trigram index is used for patterns containing wildcards (e.g. "IMA/%/0001") and the
+    UPPER text_pattern_ops index for prefix patterns (e.g. "IMA/2024/%"), which are filtered
+    using istartswith.
+
+    :param field: The name of the field to index
+    :param name_prefix: Index name prefix, index names are limited to 30 characters.
+    """
+
+    return [
+        GinIndex(fields=[field], name=f"{name_prefix}_trgm_idx", opclasses=["gin_trgm_ops"]),
+        models.Index(
+            OpClass(Upper(field), name="text_pattern_ops"), name=f"{name_prefix}_upper_idx"
+        ),
+    ]
@@ -47,6 +47,31 @@ class UniqueReference(models.Model):
     reference = models.IntegerField()
 
 
+class ReferenceCounter(models.Model):
+    """The last UniqueReference number allocated for each prefix/year combination.
+
+    The row is updated (and locked) when references are allocated so concurrent transactions
+    only wait for each other when they need a reference with the same prefix and year.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["prefix", "year"], name="reference_counter_unique", nulls_distinct=False
+            )
+        ]
+
+    def __str__(self):
+        return f"ReferenceCounter(prefix={self.prefix!r}, year={self.year!r}, last_reference={self.last_reference!r})"
+
+    prefix = models.CharField(max_length=8, choices=UniqueReference.Prefix.choices)
+
+    # this is null for importer/exporter access requests and mailshots
+    year = models.IntegerField(null=True)
+
+    last_reference = models.IntegerField()
+
+
 class GlobalPermission(models.Model):
     """Contains global permissions.
 
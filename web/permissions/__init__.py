@@ -22,7 +22,9 @@ from .service import (
     get_all_case_officers,
     get_case_officers_for_process_type,
     get_ilb_case_officers,
+    get_object_permission_snapshot,
     get_org_obj_permissions,
+    get_permissions_version,
     get_report_type_for_permission,
     get_sanctions_case_officers,
     get_user_exporter_permissions,
@@ -33,6 +35,7 @@ from .service import (
     organisation_add_contact,
     organisation_get_contacts,
     organisation_remove_contact,
+    organisations_get_contacts,
 )
 from .types import PermissionTextChoice
 
@@ -53,6 +56,8 @@ __all__ = [
     "AppChecker",
     "is_user_agent_of_org",
     "is_user_org_admin",
+    "get_object_permission_snapshot",
+    "get_permissions_version",
     "get_org_obj_permissions",
     "can_user_manage_org_contacts",
     "can_user_edit_firearm_authorities",
@@ -73,6 +78,7 @@ __all__ = [
     "organisation_add_contact",
     "organisation_get_contacts",
     "organisation_remove_contact",
+    "organisations_get_contacts",
     "PermissionTextChoice",
     "importer_object_permissions",
     "exporter_object_permissions",
@@ -1,9 +1,15 @@
 import dataclasses
-from typing import TYPE_CHECKING, Literal, NamedTuple, TypeAlias
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeAlias
 
 from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.aggregates import ArrayAgg
-from django.db.models import QuerySet, Value
+from django.db.models import CharField, F, Model, Q, QuerySet, Value
+from django.db.models.functions import Cast
+from guardian.core import ObjectPermissionChecker
+from guardian.models import GroupObjectPermission, UserObjectPermission
 from guardian.shortcuts import assign_perm, get_objects_for_user, get_user_perms
 from guardian.shortcuts import get_users_with_perms as get_users_with_obj_perm
 from guardian.shortcuts import remove_perm
@@ -13,8 +19,10 @@ from web.flow.models import ProcessTypes
 from web.models import (
     Constabulary,
     Exporter,
+    ExporterGroupObjectPermission,
     ExporterUserObjectPermission,
     Importer,
+    ImporterGroupObjectPermission,
     ImporterUserObjectPermission,
     User,
 )
@@ -26,6 +34,7 @@ from web.permissions import (
     SysPerms,
 )
 from web.reports.constants import ReportType
+from web.utils.cache import bump_version, get_version
 
 if TYPE_CHECKING:
     from web.models import Report
@@ -130,6 +139,128 @@ class AppChecker:
         )
 
 
+class ObjectPermissionSnapshot(ObjectPermissionChecker):
+    """Object permission checker with every importer, exporter and constabulary object
+    permission of the user loaded up front.
+
+    The guardian checker loads the permissions of each object when it is first checked, which
+    is two queries per organisation when building a list of applications (e.g. the workbasket).
+    The snapshot is loaded with one query and answers for any organisation from memory.
+
+    A snapshot is set on the user instance when the first object permission is checked
+    (see User.set_guardian_checker) and lasts as long as the user instance, i.e. the request.
+    """
+
+    def __init__(self, user: User) -> None:
+        super().__init__(user)
+
+        # key: content type id, value: permission codenames of each object of that type
+        self._snapshot: dict[int, defaultdict[str, set[str]]] = {}
+
+        if user.is_active and not user.is_superuser:
+            self._load_snapshot()
+
+    def _load_snapshot(self) -> None:
+        content_types = ContentType.objects.get_for_models(Importer, Exporter, Constabulary)
+        importer_ct = content_types[Importer].pk
+        exporter_ct = content_types[Exporter].pk
+        constabulary_ct = content_types[Constabulary].pk
+
+        def _org_perms(model: type[Model], content_type_id: int, **filters: Any) -> QuerySet:
+            return _values(
+                model.objects.filter(**filters),
+                Value(content_type_id),
+                Cast("content_object_id", output_field=CharField()),
+            )
+
+        def _generic_perms(model: type[Model], **filters: Any) -> QuerySet:
+            return _values(
+                model.objects.filter(content_type_id=constabulary_ct, **filters),
+                F("content_type_id"),
+                F("object_pk"),
+            )
+
+        def _values(qs: QuerySet, content_type_id: Any, object_pk: Any) -> QuerySet:
+            # Annotate every column so they are selected in the same order for the union.
+            return qs.annotate(
+                ct_id=content_type_id, obj_pk=object_pk, codename=F("permission__codename")
+            ).values_list("ct_id", "obj_pk", "codename")
+
+        user_perms = {"user": self.user}
+        group_perms = {"group__user": self.user}
+
+        object_permissions = _org_perms(
+            ImporterUserObjectPermission, importer_ct, **user_perms
+        ).union(
+            _org_perms(ImporterGroupObjectPermission, importer_ct, **group_perms),
+            _org_perms(ExporterUserObjectPermission, exporter_ct, **user_perms),
+            _org_perms(ExporterGroupObjectPermission, exporter_ct, **group_perms),
+            _generic_perms(UserObjectPermission, **user_perms),
+            _generic_perms(GroupObjectPermission, **group_perms),
+            all=True,
+        )
+
+        self._snapshot = {ct.pk: defaultdict(set) for ct in content_types.values()}
+
+        for content_type_id, object_pk, codename in object_permissions:
+            self._snapshot[content_type_id][object_pk].add(codename)
+
+    def get_perms(self, obj: Model) -> list[str]:
+        content_type_id, object_pk = self.get_local_cache_key(obj)
+
+        if content_type_id in self._snapshot:
+            return list(self._snapshot[content_type_id].get(object_pk, []))
+
+        return super().get_perms(obj)
+
+    def get_org_perms(self, org_class: type[ORGANISATION]) -> dict[int, set[str]]:
+        """Return the permission codenames of each organisation the user has permissions for."""
+
+        content_type_id = ContentType.objects.get_for_model(org_class).pk
+
+        return {
+            int(pk): perms.copy() for pk, perms in self._snapshot.get(content_type_id, {}).items()
+        }
+
+
+def get_object_permission_snapshot(user: User) -> ObjectPermissionSnapshot:
+    """Return the object permission snapshot set on the user instance."""
+
+    if not isinstance(user.guardian_checker, ObjectPermissionSnapshot):
+        user.set_guardian_checker()
+
+    return user.guardian_checker  # type:ignore[return-value]
+
+
+def clear_object_permission_snapshot(user: User) -> None:
+    """Discard the object permissions loaded for the user after they have changed."""
+
+    user.guardian_checker = None
+
+
+# Changing a version makes values cached for a user's permissions (e.g. the menu) stale.
+PERMISSIONS_VERSION_KEY = "permissions:version"
+
+
+def get_permissions_version(user: User) -> str:
+    """Return the version of the user's permissions.
+
+    The version changes when the permissions of the user, or of any group, change.
+    See web.permissions.signals.
+    """
+
+    return get_version(PERMISSIONS_VERSION_KEY, f"{PERMISSIONS_VERSION_KEY}:{user.pk}")
+
+
+def invalidate_permissions_version(user_pks: Iterable[int] | None = None) -> None:
+    """Change the permissions version of the supplied users, or of every user if None."""
+
+    if user_pks is None:
+        bump_version(PERMISSIONS_VERSION_KEY)
+    else:
+        bump_version(*(f"{PERMISSIONS_VERSION_KEY}:{pk}" for pk in user_pks))
+
+
 class UserOrgPerms(NamedTuple):
     user_id: int
     content_object_id: int
@@ -202,6 +333,38 @@ def organisation_get_contacts(
     return org_contacts.filter(is_active=True)
 
 
+def organisations_get_contacts(
+    organisation_class: type[ORGANISATION], *, perms: list[str]
+) -> QuerySet[User]:
+    """Current active contacts of every active importer or exporter.
+
+    Equivalent to calling organisation_get_contacts for each active organisation but
+    resolved in a single query.
+    """
+
+    if organisation_class is Importer:
+        user_obj_perms: QuerySet = ImporterUserObjectPermission.objects.all()
+        group_obj_perms: QuerySet = ImporterGroupObjectPermission.objects.all()
+        org_access = Perms.sys.importer_access.codename
+    elif organisation_class is Exporter:
+        user_obj_perms = ExporterUserObjectPermission.objects.all()
+        group_obj_perms = ExporterGroupObjectPermission.objects.all()
+        org_access = Perms.sys.exporter_access.codename
+    else:
+        raise ValueError(f"Unknown org class {organisation_class}")
+
+    obj_perm_filter = {"permission__codename__in": perms, "content_object__is_active": True}
+    user_ids = user_obj_perms.filter(**obj_perm_filter).values("user_id")
+    group_ids = group_obj_perms.filter(**obj_perm_filter).values("group_id")
+
+    org_contacts = User.objects.filter(Q(pk__in=user_ids) | Q(groups__in=group_ids))
+
+    # Ensure they have org access (ignoring user permissions by design)
+    org_contacts = org_contacts.filter(groups__permissions__codename=org_access)
+
+    return org_contacts.filter(is_active=True).distinct()
+
+
 def organisation_add_contact(org: ORGANISATION, user: User, assign_manage: bool = False) -> None:
     """Add a user to an organisation.
 
@@ -226,6 +389,7 @@ def organisation_add_contact(org: ORGANISATION, user: User, assign_manage: bool
         assign_perm(obj_perms.is_agent, user, org.get_main_org())
 
     add_group(user, obj_perms.get_group_name())
+    clear_object_permission_snapshot(user)
 
 
 def organisation_remove_contact(org: ORGANISATION, user: User) -> None:
@@ -245,6 +409,8 @@ def organisation_remove_contact(org: ORGANISATION, user: User) -> None:
     if not other_orgs.exists():
         remove_group(user, obj_perms.get_group_name())
 
+    clear_object_permission_snapshot(user)
+
 
 def can_user_view_org(user: User, org: ORGANISATION) -> bool:
     """Check if the supplied user can view an organisation."""
@@ -355,6 +521,7 @@ def constabulary_add_contact(constabulary: Constabulary, user: User) -> None:
         assign_perm(perm, user, constabulary)
 
     add_group(user, Perms.obj.constabulary.get_group_name())
+    clear_object_permission_snapshot(user)
 
 
 def constabulary_remove_contact(constabulary: Constabulary, user: User) -> None:
@@ -367,6 +534,8 @@ def constabulary_remove_contact(constabulary: Constabulary, user: User) -> None:
     if not other_orgs.exists():
         remove_group(user, Perms.obj.constabulary.get_group_name())
 
+    clear_object_permission_snapshot(user)
+
 
 def can_user_edit_firearm_authorities(user: User) -> bool:
     return user.has_perm(Perms.sys.edit_firearm_authorities)
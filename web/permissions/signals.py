@@ -0,0 +1,87 @@
+from typing import Any
+
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from guardian.models import GroupObjectPermission, UserObjectPermission
+
+from web.models import (
+    ExporterGroupObjectPermission,
+    ExporterUserObjectPermission,
+    ImporterGroupObjectPermission,
+    ImporterUserObjectPermission,
+    User,
+)
+
+from .service import invalidate_permissions_version
+
+USER_OBJECT_PERMISSION_MODELS = (
+    ExporterUserObjectPermission,
+    ImporterUserObjectPermission,
+    UserObjectPermission,
+)
+GROUP_OBJECT_PERMISSION_MODELS = (
+    ExporterGroupObjectPermission,
+    GroupObjectPermission,
+    ImporterGroupObjectPermission,
+)
+
+
+def user_saved(sender: Any, instance: User, **kwargs: Any) -> None:
+    """A user's permissions depend on is_active and is_superuser."""
+
+    invalidate_permissions_version([instance.pk])
+
+
+def user_groups_or_permissions_changed(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: set[int] | None, **kwargs: Any
+) -> None:
+    """User.groups or User.user_permissions changed, from either side of the relationship."""
+
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        invalidate_permissions_version([instance.pk])
+    elif pk_set is None:
+        # Every user was removed from the group / permission.
+        invalidate_permissions_version()
+    else:
+        invalidate_permissions_version(pk_set)
+
+
+def group_permissions_changed(sender: Any, action: str, **kwargs: Any) -> None:
+    if action.startswith("post_"):
+        invalidate_permissions_version()
+
+
+def object_permission_changed(sender: Any, instance: Any, **kwargs: Any) -> None:
+    if isinstance(instance, USER_OBJECT_PERMISSION_MODELS):
+        invalidate_permissions_version([instance.user_id])
+    elif isinstance(instance, GROUP_OBJECT_PERMISSION_MODELS):
+        invalidate_permissions_version()
+
+
+post_save.connect(user_saved, sender=User, dispatch_uid="permissions_user_saved")
+
+for through in [User.groups.through, User.user_permissions.through]:
+    m2m_changed.connect(
+        user_groups_or_permissions_changed,
+        sender=through,
+        dispatch_uid=f"permissions_{through.__name__}_changed",
+    )
+
+m2m_changed.connect(
+    group_permissions_changed,
+    sender=Group.permissions.through,
+    dispatch_uid="permissions_group_permissions_changed",
+)
+
+for model in USER_OBJECT_PERMISSION_MODELS + GROUP_OBJECT_PERMISSION_MODELS:
+    post_save.connect(
+        object_permission_changed, sender=model, dispatch_uid=f"permissions_{model.__name__}_saved"
+    )
+    post_delete.connect(
+        object_permission_changed,
+        sender=model,
+        dispatch_uid=f"permissions_{model.__name__}_deleted",
+    )
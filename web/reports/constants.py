@@ -6,11 +6,15 @@ NO = "No"
 CELERY_REPORTS_QUEUE_NAME = "reports"
 
 GENERATE_REPORT_TASK_NAME = "web.reports.generate_report"
+GENERATE_REPORT_SHEET_TASK_NAME = "web.reports.generate_report_sheet"
+MERGE_REPORT_SHEETS_TASK_NAME = "web.reports.merge_report_sheets"
+MULTI_SHEET_REPORT_ERROR_TASK_NAME = "web.reports.multi_sheet_report_error"
 
 
 class ReportStatus(TypedTextChoices):
     COMPLETED = ("COMPLETED", "Completed")
     DELETED = ("DELETED", "Deleted")
+    FAILED = ("FAILED", "Failed")
     IN_PROGRESS = ("IN_PROGRESS", "In Progress")
     PROCESSING = ("PROCESSING", "Processing")
     SUBMITTED = ("SUBMITTED", "Submitted")
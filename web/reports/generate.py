@@ -1,13 +1,23 @@
 import csv
-from io import StringIO
+import io
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
 
+import xlsxwriter
 from django.utils import timezone
+from openpyxl import load_workbook
 
 from web.models import File, GeneratedReport, ScheduleReport
-from web.utils.s3 import put_object_in_s3
-from web.utils.spreadsheet import MIMETYPE, XlsxSheetConfig, generate_xlsx_file
+from web.utils.s3 import (
+    delete_file_from_s3,
+    download_file_obj_from_s3,
+    get_s3_client,
+    upload_file_obj_to_s3,
+)
+from web.utils.spreadsheet import MIMETYPE, XlsxSheetConfig, add_worksheet
 
-from .constants import ReportStatus
+from .constants import ReportStatus, ReportType
 from .interfaces import (
     AccessRequestTotalsInterface,
     ActiveStaffUserInterface,
@@ -25,6 +35,9 @@ from .interfaces import (
 )
 from .utils import get_error_serializer_header
 
+# constant_memory flushes each row to a temporary file once the next row is written.
+XLSX_OPTIONS = {"remove_timezone": True, "constant_memory": True}
+
 
 def get_report_file_name(scheduled_report: ScheduleReport) -> str:
     return f"{scheduled_report.pk}-{scheduled_report.title}"
@@ -59,17 +72,6 @@ def generate_supplementary_firearms_report(scheduled_report: ScheduleReport) ->
     _end_processing_report(scheduled_report, has_errors)
 
 
-def generate_access_request_report(scheduled_report: ScheduleReport) -> None:
-    scheduled_report = _start_processing_report(scheduled_report)
-    import_report_interface = ImporterAccessRequestInterface(scheduled_report)
-    export_report_interface = ExporterAccessRequestInterface(scheduled_report)
-    totals = AccessRequestTotalsInterface(scheduled_report)
-    has_errors = write_files(
-        scheduled_report, [import_report_interface, export_report_interface, totals]
-    )
-    _end_processing_report(scheduled_report, has_errors)
-
-
 def generate_import_licence_report(scheduled_report: ScheduleReport) -> None:
     scheduled_report = _start_processing_report(scheduled_report)
     report_interface = ImportLicenceInterface(scheduled_report)
@@ -77,94 +79,259 @@ def generate_import_licence_report(scheduled_report: ScheduleReport) -> None:
     _end_processing_report(scheduled_report, has_errors)
 
 
-def generate_firearms_licences_report(scheduled_report: ScheduleReport) -> None:
-    scheduled_report = _start_processing_report(scheduled_report)
-    dfl_interface = DFLFirearmsLicenceInterface(scheduled_report)
-    sil_interface = SILFirearmsLicenceInterface(scheduled_report)
-    oil_interface = OILFirearmsLicenceInterface(scheduled_report)
-    has_errors = write_files(scheduled_report, [dfl_interface, sil_interface, oil_interface])
-    _end_processing_report(scheduled_report, has_errors)
+# Reports with several sheets, each sheet is generated by a separate task.
+# See web.reports.tasks.generate_report_task
+MULTI_SHEET_REPORT_INTERFACES: dict[str, list[type[ReportInterface]]] = {
+    ReportType.ACCESS_REQUESTS: [
+        ImporterAccessRequestInterface,
+        ExporterAccessRequestInterface,
+        AccessRequestTotalsInterface,
+    ],
+    ReportType.FIREARMS_LICENCES: [
+        DFLFirearmsLicenceInterface,
+        SILFirearmsLicenceInterface,
+        OILFirearmsLicenceInterface,
+    ],
+    ReportType.ACTIVE_USERS: [
+        ActiveUserInterface,
+        ActiveStaffUserInterface,
+        RegisteredUserInterface,
+    ],
+}
 
 
-def generate_active_users_report(scheduled_report: ScheduleReport) -> None:
-    scheduled_report = _start_processing_report(scheduled_report)
-    active_users_interface = ActiveUserInterface(scheduled_report)
-    active_staff_interface = ActiveStaffUserInterface(scheduled_report)
-    registered_users_interface = RegisteredUserInterface(scheduled_report)
-    has_errors = write_files(
-        scheduled_report,
-        [active_users_interface, active_staff_interface, registered_users_interface],
-    )
+def start_multi_sheet_report(scheduled_report: ScheduleReport) -> int:
+    """Mark the report as in progress and return the number of sheets to generate."""
+
+    _start_processing_report(scheduled_report)
+
+    return len(MULTI_SHEET_REPORT_INTERFACES[scheduled_report.report.report_type])
+
+
+def generate_report_sheet(scheduled_report: ScheduleReport, sheet_index: int) -> str:
+    """Write the CSV file and a partial workbook for one sheet of a multi-sheet report.
+
+    :return: The S3 path of the partial workbook
+    """
+
+    interfaces = MULTI_SHEET_REPORT_INTERFACES[scheduled_report.report.report_type]
+    report_interface = interfaces[sheet_index](scheduled_report)
+    path = _get_report_sheet_path(scheduled_report, sheet_index)
+
+    write_report_sheet(scheduled_report, report_interface, path)
+
+    return path
+
+
+def end_multi_sheet_report(scheduled_report: ScheduleReport, sheet_paths: list[str]) -> None:
+    has_errors = merge_report_sheets(scheduled_report, sheet_paths)
     _end_processing_report(scheduled_report, has_errors)
 
 
+def fail_multi_sheet_report(scheduled_report: ScheduleReport) -> None:
+    """Mark the report as failed and delete the partial workbooks written by its sheets."""
+
+    scheduled_report.errors = True
+    scheduled_report.status = ReportStatus.FAILED
+    scheduled_report.finished_at = timezone.now()
+    scheduled_report.save(update_fields=["status", "finished_at", "errors"])
+
+    sheet_count = len(MULTI_SHEET_REPORT_INTERFACES[scheduled_report.report.report_type])
+    s3_client = get_s3_client()
+
+    # Deleting the partial workbook of a sheet that wasn't written is a no-op.
+    for sheet_index in range(sheet_count):
+        delete_file_from_s3(_get_report_sheet_path(scheduled_report, sheet_index), s3_client)
+
+
+def _get_report_sheet_path(scheduled_report: ScheduleReport, sheet_index: int) -> str:
+    return f"REPORTS/{scheduled_report.report.pk}/sheets/{scheduled_report.pk}-{sheet_index}.xlsx"
+
+
 def write_files(scheduled_report: ScheduleReport, report_interfaces: list[ReportInterface]) -> bool:
-    workbook_sheets = []
+    """Write a CSV file per report interface and an XLSX file containing every report.
+
+    Rows are written to the CSV file and the XLSX sheet as they are serialized. Both files
+    are written to temporary files on disk (the XLSX file using xlsxwriter's constant_memory
+    mode) and uploaded to S3 in parts, so memory use doesn't grow with the size of the report.
+    """
+
     errors = []
     has_errors = False
-    for report_interface in report_interfaces:
-        data = report_interface.get_data()
-        csv_file_name = f"{scheduled_report.pk}_{report_interface.name}--{scheduled_report.title}"
-        _write_csv_file(scheduled_report, csv_file_name, data["results"], data["header"])
-        workbook_sheets.append(
-            _prepare_workbook_sheet(report_interface.name, data["results"], data["header"])
-        )
-        errors.extend(data["errors"])
 
     file_name_prefixes = [str(scheduled_report.pk), scheduled_report.report.report_type.title()]
     file_name_suffix = f"--{scheduled_report.title}"
-
-    if errors:
-        error_file_name = "_".join(file_name_prefixes + ["Errors"]) + file_name_suffix
-        has_errors = True
-        error_header = get_error_serializer_header()
-        workbook_sheets.append(_prepare_workbook_sheet("Errors", errors, error_header))
-        _write_csv_file(
-            scheduled_report,
-            error_file_name,
-            errors,
-            error_header,
-        )
     xlsx_file_name = "_".join(file_name_prefixes) + file_name_suffix
-    _write_xlsx_file(scheduled_report, xlsx_file_name, workbook_sheets)
+
+    with tempfile.TemporaryFile() as xlsx_file:
+        with xlsxwriter.Workbook(xlsx_file, XLSX_OPTIONS) as workbook:
+            for report_interface in report_interfaces:
+                csv_file_name = (
+                    f"{scheduled_report.pk}_{report_interface.name}--{scheduled_report.title}"
+                )
+                _write_report_files(
+                    scheduled_report,
+                    workbook,
+                    report_interface.name,
+                    csv_file_name,
+                    report_interface.iter_rows(),
+                    report_interface.get_header(),
+                )
+                errors.extend(report_interface.errors)
+
+            if errors:
+                error_file_name = "_".join(file_name_prefixes + ["Errors"]) + file_name_suffix
+                has_errors = True
+                _write_report_files(
+                    scheduled_report,
+                    workbook,
+                    "Errors",
+                    error_file_name,
+                    (e.model_dump(by_alias=True) for e in errors),
+                    get_error_serializer_header(),
+                )
+
+        xlsx_file.seek(0)
+        write_file_data(scheduled_report, xlsx_file, f"{xlsx_file_name}.xlsx", MIMETYPE.XLSX)
+
     return has_errors
 
 
-def _prepare_workbook_sheet(sheet_name: str, data: list, header: list) -> XlsxSheetConfig:
+def write_report_sheet(
+    scheduled_report: ScheduleReport, report_interface: ReportInterface, path: str
+) -> None:
+    """Write the report interface CSV file and upload a partial workbook to S3.
+
+    The partial workbook contains the report sheet and an Errors sheet if any rows failed
+    to serialize. The partial workbooks are combined by merge_report_sheets.
+    """
+
+    csv_file_name = f"{scheduled_report.pk}_{report_interface.name}--{scheduled_report.title}"
+
+    with tempfile.TemporaryFile() as xlsx_file:
+        with xlsxwriter.Workbook(xlsx_file, XLSX_OPTIONS) as workbook:
+            _write_report_files(
+                scheduled_report,
+                workbook,
+                report_interface.name,
+                csv_file_name,
+                report_interface.iter_rows(),
+                report_interface.get_header(),
+            )
+
+            if report_interface.errors:
+                error_rows = (e.model_dump(by_alias=True).values() for e in report_interface.errors)
+                add_worksheet(
+                    workbook,
+                    _prepare_workbook_sheet("Errors", error_rows, get_error_serializer_header()),
+                )
+
+        xlsx_file.seek(0)
+        upload_file_obj_to_s3(xlsx_file, path)
+
+
+def merge_report_sheets(scheduled_report: ScheduleReport, sheet_paths: list[str]) -> bool:
+    """Combine the partial workbooks written by write_report_sheet into the report XLSX file.
+
+    Sheets are copied row by row so memory use doesn't grow with the size of the report.
+    The partial workbooks are deleted from S3 once the report file has been written.
+
+    :return: True if any sheet had errors
+    """
+
+    errors: list[dict[str, Any]] = []
+    error_header = get_error_serializer_header()
+
+    file_name_prefixes = [str(scheduled_report.pk), scheduled_report.report.report_type.title()]
+    file_name_suffix = f"--{scheduled_report.title}"
+    xlsx_file_name = "_".join(file_name_prefixes) + file_name_suffix
+
+    with tempfile.TemporaryFile() as xlsx_file:
+        with xlsxwriter.Workbook(xlsx_file, XLSX_OPTIONS) as workbook:
+            for path in sheet_paths:
+                with tempfile.TemporaryFile() as sheet_file:
+                    download_file_obj_from_s3(path, sheet_file)
+                    sheet_file.seek(0)
+
+                    partial_workbook = load_workbook(sheet_file, read_only=True)
+                    sheet, *error_sheets = partial_workbook.worksheets
+
+                    rows = sheet.iter_rows(values_only=True)
+                    header = list(next(rows))
+                    add_worksheet(workbook, _prepare_workbook_sheet(sheet.title, rows, header))
+
+                    for error_sheet in error_sheets:
+                        error_rows = error_sheet.iter_rows(min_row=2, values_only=True)
+                        errors.extend(dict(zip(error_header, row)) for row in error_rows)
+
+                    partial_workbook.close()
+
+            if errors:
+                error_file_name = "_".join(file_name_prefixes + ["Errors"]) + file_name_suffix
+                _write_report_files(
+                    scheduled_report, workbook, "Errors", error_file_name, errors, error_header
+                )
+
+        xlsx_file.seek(0)
+        write_file_data(scheduled_report, xlsx_file, f"{xlsx_file_name}.xlsx", MIMETYPE.XLSX)
+
+    s3_client = get_s3_client()
+    for path in sheet_paths:
+        delete_file_from_s3(path, s3_client)
+
+    return bool(errors)
+
+
+def _write_report_files(
+    scheduled_report: ScheduleReport,
+    workbook: xlsxwriter.Workbook,
+    sheet_name: str,
+    csv_file_name: str,
+    rows: Iterable[dict[str, Any]],
+    header: list[str],
+) -> None:
+    """Write the rows to a CSV file and to a sheet of the workbook in a single pass."""
+
+    with tempfile.TemporaryFile() as csv_file:
+        with io.TextIOWrapper(csv_file, encoding="utf-8", newline="") as csv_text:
+            writer = csv.DictWriter(csv_text, header)
+            writer.writeheader()
+
+            add_worksheet(
+                workbook, _prepare_workbook_sheet(sheet_name, _tee_csv(rows, writer), header)
+            )
+
+            csv_text.flush()
+            csv_file.seek(0)
+            write_file_data(scheduled_report, csv_file, f"{csv_file_name}.csv", MIMETYPE.CSV)
+
+
+def _tee_csv(rows: Iterable[dict[str, Any]], writer: csv.DictWriter) -> Iterator[Iterable[Any]]:
+    """Write each row to the CSV file as the workbook sheet consumes it."""
+
+    for row in rows:
+        writer.writerow(row)
+        yield row.values()
+
+
+def _prepare_workbook_sheet(
+    sheet_name: str, rows: Iterable[Iterable[Any]], header: list
+) -> XlsxSheetConfig:
     config = XlsxSheetConfig()
     config.header.data = header
     config.header.styles = {"bold": True}
-    config.rows = [d.values() for d in data]
+    config.rows = rows
     config.column_width = 25
     config.sheet_name = sheet_name
     return config
 
 
-def _write_xlsx_file(
-    scheduled_report: ScheduleReport, file_name: str, sheets: list[XlsxSheetConfig]
-) -> None:
-    file_name = f"{file_name}.xlsx"
-    file_data = generate_xlsx_file(sheets, {"remove_timezone": True})
-    write_file_data(scheduled_report, file_data, file_name, MIMETYPE.XLSX)
-
-
-def _write_csv_file(
-    scheduled_report: ScheduleReport, file_name: str, data: list, header: list
-) -> None:
-    file_name = f"{file_name}.csv"
-    dest = StringIO()
-    writer = csv.DictWriter(dest, header)
-    writer.writeheader()
-    writer.writerows(data)
-    write_file_data(scheduled_report, dest.getvalue(), file_name, MIMETYPE.CSV)
-    dest.close()
-
-
 def write_file_data(
-    scheduled_report: ScheduleReport, data: str | bytes, file_name: str, content_type: MIMETYPE
+    scheduled_report: ScheduleReport, file_obj: IO[bytes], file_name: str, content_type: MIMETYPE
 ) -> GeneratedReport:
     path = f"REPORTS/{scheduled_report.report.pk}/{file_name}"
-    file_size = put_object_in_s3(data, path)
+    # upload_file_obj_to_s3 uses a multipart upload for large files.
+    file_size = upload_file_obj_to_s3(file_obj, path)
     document = File.objects.create(
         is_active=True,
         filename=file_name,
@@ -1,6 +1,6 @@
 import datetime as dt
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from functools import wraps
 from itertools import chain
 from typing import Any, ClassVar, final
@@ -182,10 +182,20 @@ class ReportInterface:
         ).model_dump(by_alias=True)
 
     def process_results(self) -> list[BaseModel]:
-        results = []
+        return list(self.iter_results())
+
+    def iter_results(self) -> Iterator[BaseModel]:
+        """Serialize the report rows lazily, so the whole report is never held in memory.
+
+        Rows that fail to serialize are skipped and recorded in self.errors.
+        """
+
         for r in self.get_queryset().iterator(500):
-            results += self.serialize_rows(r)
-        return list(filter(None, results))
+            yield from filter(None, self.serialize_rows(r))
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        for result in self.iter_results():
+            yield result.model_dump(by_alias=True)
 
     def get_header(self) -> list[str]:
         schema = self.ReportSerializer.model_json_schema(by_alias=True, mode="serialization")
@@ -716,6 +726,9 @@ class AccessRequestTotalsInterface(ReportInterface):
             )
         ]
 
+    def iter_results(self) -> Iterator[BaseModel]:
+        yield from self.process_results()
+
     def get_row_identifier(self, **kwargs: Any) -> str:
         return "Totals"
 
@@ -1,32 +1,88 @@
+from typing import Any
+
+from celery import chord
+from celery.app.task import Context
+
 from config.celery import app
 from web.models import ScheduleReport
+from web.utils.sentry import capture_exception, capture_message
 
-from .constants import CELERY_REPORTS_QUEUE_NAME, GENERATE_REPORT_TASK_NAME, ReportType
+from .constants import (
+    CELERY_REPORTS_QUEUE_NAME,
+    GENERATE_REPORT_SHEET_TASK_NAME,
+    GENERATE_REPORT_TASK_NAME,
+    MERGE_REPORT_SHEETS_TASK_NAME,
+    MULTI_SHEET_REPORT_ERROR_TASK_NAME,
+    ReportType,
+)
 from .generate import (
-    generate_access_request_report,
-    generate_active_users_report,
-    generate_firearms_licences_report,
+    MULTI_SHEET_REPORT_INTERFACES,
+    end_multi_sheet_report,
+    fail_multi_sheet_report,
     generate_import_licence_report,
     generate_issued_certificate_report,
+    generate_report_sheet,
     generate_supplementary_firearms_report,
+    start_multi_sheet_report,
 )
 
 
 @app.task(name=GENERATE_REPORT_TASK_NAME, queue=CELERY_REPORTS_QUEUE_NAME)
 def generate_report_task(scheduled_report_pk: int) -> None:
     scheduled_report = ScheduleReport.objects.get(pk=scheduled_report_pk)
-    match scheduled_report.report.report_type:
+    report_type = scheduled_report.report.report_type
+
+    # Each sheet is generated by a separate task so the sheets are written in parallel
+    # by the report workers, the workbook is assembled once every sheet has finished.
+    if report_type in MULTI_SHEET_REPORT_INTERFACES:
+        sheet_count = start_multi_sheet_report(scheduled_report)
+        sheet_tasks = [
+            generate_report_sheet_task.si(scheduled_report_pk, i) for i in range(sheet_count)
+        ]
+        callback = merge_report_sheets_task.s(scheduled_report_pk).on_error(
+            multi_sheet_report_error_task.s(scheduled_report_pk=scheduled_report_pk)
+        )
+        chord(sheet_tasks)(callback)
+
+        return
+
+    match report_type:
         case ReportType.ISSUED_CERTIFICATES:
             generate_issued_certificate_report(scheduled_report)
-        case ReportType.ACCESS_REQUESTS:
-            generate_access_request_report(scheduled_report)
         case ReportType.IMPORT_LICENCES:
             generate_import_licence_report(scheduled_report)
         case ReportType.SUPPLEMENTARY_FIREARMS:
             generate_supplementary_firearms_report(scheduled_report)
-        case ReportType.FIREARMS_LICENCES:
-            generate_firearms_licences_report(scheduled_report)
-        case ReportType.ACTIVE_USERS:
-            generate_active_users_report(scheduled_report)
         case _:
             raise ValueError("Unsupported Report Type")
+
+
+@app.task(name=GENERATE_REPORT_SHEET_TASK_NAME, queue=CELERY_REPORTS_QUEUE_NAME)
+def generate_report_sheet_task(scheduled_report_pk: int, sheet_index: int) -> str:
+    scheduled_report = ScheduleReport.objects.get(pk=scheduled_report_pk)
+
+    return generate_report_sheet(scheduled_report, sheet_index)
+
+
+@app.task(name=MERGE_REPORT_SHEETS_TASK_NAME, queue=CELERY_REPORTS_QUEUE_NAME)
+def merge_report_sheets_task(sheet_paths: list[str], scheduled_report_pk: int) -> None:
+    scheduled_report = ScheduleReport.objects.get(pk=scheduled_report_pk)
+    end_multi_sheet_report(scheduled_report, sheet_paths)
+
+
+@app.task(name=MULTI_SHEET_REPORT_ERROR_TASK_NAME, queue=CELERY_REPORTS_QUEUE_NAME)
+def multi_sheet_report_error_task(
+    request: Context,
+    exc: Exception,
+    traceback: Any,
+    *args: Any,
+    scheduled_report_pk: int,
+    **kwargs: Any,
+) -> None:
+    """Called when a sheet task, or merging the sheets, fails."""
+
+    capture_message(f"Multi-sheet report Task {request.id!r} raised error: {exc!r}")
+    capture_exception()
+
+    scheduled_report = ScheduleReport.objects.get(pk=scheduled_report_pk)
+    fail_multi_sheet_report(scheduled_report)
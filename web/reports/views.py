@@ -10,10 +10,10 @@ from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.generic import CreateView, DetailView, ListView, RedirectView
 
+from web.domains.file.utils import get_file_download_response
 from web.models import GeneratedReport, Report, ScheduleReport
 from web.permissions import Perms, can_user_view_report
 from web.types import AuthenticatedHttpRequest
-from web.utils.s3 import get_file_from_s3
 from web.utils.spreadsheet import MIMETYPE
 
 from .constants import ReportStatus, ReportType
@@ -142,14 +142,8 @@ class DownloadReportView(BaseReportView, DetailView):
         generated_report = GeneratedReport.objects.get(
             schedule__report=self.get_report(), pk=kwargs["pk"]
         )
-        file_content = get_file_from_s3(generated_report.document.path)
-        response = HttpResponse(
-            content=file_content, content_type=generated_report.document.content_type
-        )
-        response["Content-Disposition"] = (
-            f'attachment; filename="{generated_report.document.filename}"'
-        )
-        return response
+
+        return get_file_download_response(self.request, generated_report.document)
 
 
 @method_decorator(transaction.atomic, name="post")
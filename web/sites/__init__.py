@@ -8,6 +8,7 @@ from django.http import HttpResponse
 
 from web.permissions import Perms
 from web.types import AuthenticatedHttpRequest, TypedTextChoices
+from web.utils.reference_data import get_site_domain
 
 PLATFORM_NAME = "Apply for an import licence or export certificate"
 
@@ -100,6 +101,6 @@ def get_importer_site_domain() -> str:
 def _get_site_domain(name: SiteName) -> str:
     """Return a site domain with the scheme included."""
     scheme = "https" if settings.APP_ENV not in ["local", "test"] else "http"
-    domain = Site.objects.get(name=name).domain
+    domain = get_site_domain(name)
 
     return f"{scheme}://{domain}"
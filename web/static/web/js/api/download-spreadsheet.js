@@ -45,6 +45,90 @@ async function handleResultsSpreadsheetDownload(downloadForm, searchFormId) {
 }
 
 
+function setupExportSpreadsheetEventHandler({ exportId, searchFormId, statusId, warningId }) {
+  const exportForm = document.querySelector(exportId)
+
+  if (exportForm !== null) {
+    exportForm.addEventListener("submit", (e) => {
+      e.preventDefault();
+      const warning = document.querySelector(warningId);
+      const status = document.querySelector(statusId);
+
+      warning.style.display = "none";
+
+      handleResultsSpreadsheetExport(exportForm, searchFormId, status)
+        .catch(reason => {
+          status.style.display = "none";
+          warning.style.display = "block";
+          console.warn(reason);
+        });
+    });
+  }
+}
+
+
+// The export status is checked every 2 seconds for at most 30 minutes.
+const EXPORT_STATUS_CHECK_INTERVAL = 2000;
+const EXPORT_STATUS_MAX_CHECKS = 900;
+
+
+/**
+ * Export every application search result to a spreadsheet generated in the background.
+ * The export status is checked until the spreadsheet is ready to download, or until
+ * EXPORT_STATUS_MAX_CHECKS checks have been made.
+ * @param {HTMLFormElement} exportForm
+ * @param {string} searchFormId
+ * @param {HTMLElement} status
+ */
+async function handleResultsSpreadsheetExport(exportForm, searchFormId, status) {
+  const searchForm = document.querySelector(searchFormId);
+  let formData = new FormData(searchForm)
+  formData.append("csrfmiddlewaretoken", exportForm.csrfmiddlewaretoken.value)
+
+  const response = await fetch(exportForm.action, {mode: 'same-origin', method: "POST", body: formData})
+
+  if (!response.ok) {
+    return Promise.reject("Unable to export spreadsheet");
+  }
+
+  const { status_url } = await response.json();
+  const message = status.querySelector("p");
+  status.style.display = "block";
+  message.textContent = "Exporting applications...";
+
+  for (let check = 0; check < EXPORT_STATUS_MAX_CHECKS; check++) {
+    await new Promise(resolve => setTimeout(resolve, EXPORT_STATUS_CHECK_INTERVAL));
+
+    const statusResponse = await fetch(status_url, {mode: 'same-origin'});
+
+    if (!statusResponse.ok) {
+      return Promise.reject("Unable to check export status");
+    }
+
+    const exportStatus = await statusResponse.json();
+
+    if (exportStatus.status === "FAILED") {
+      return Promise.reject("Spreadsheet export failed");
+    }
+
+    if (exportStatus.download_url !== null) {
+      const link = document.createElement("a");
+      link.href = exportStatus.download_url;
+      link.textContent = "Download spreadsheet";
+      message.replaceChildren(`Exported ${exportStatus.total_rows} applications. `, link);
+
+      return;
+    }
+
+    if (exportStatus.total_rows !== null) {
+      message.textContent = `Exporting applications: ${exportStatus.processed_rows} of ${exportStatus.total_rows}`;
+    }
+  }
+
+  message.textContent = "The export is taking longer than expected, please try again later.";
+}
+
+
 /**
  * Create a link and simulate a click event to download the supplied file object.
  */
@@ -17,6 +17,13 @@ window.addEventListener('load', function (event) {
     warningId: "#spreadsheet-download-warning"
   });
 
+  setupExportSpreadsheetEventHandler({
+    exportId: "#export-search-spreadsheet",
+    searchFormId: "#search-application-form",
+    statusId: "#spreadsheet-export-status",
+    warningId: "#spreadsheet-export-warning"
+  });
+
   /* strips empty search values */
   setupSearchFormEventHandler();
 
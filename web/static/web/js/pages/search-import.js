@@ -30,6 +30,13 @@ window.addEventListener('load', function(event) {
     warningId: "#spreadsheet-download-warning"
   });
 
+  setupExportSpreadsheetEventHandler({
+    exportId: "#export-search-spreadsheet",
+    searchFormId: "#search-application-form",
+    statusId: "#spreadsheet-export-status",
+    warningId: "#spreadsheet-export-warning"
+  });
+
   /* Reassignment handlers */
   setupReassignFormEventHandler();
   const selectAllBtn = document.querySelector("#select-all-records");
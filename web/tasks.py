@@ -4,10 +4,10 @@ from config.celery import app
 
 # Celery tasks
 from web.domains.case.tasks import (  # NOQA
+    create_document_pack_documents,
     create_document_pack_on_error,
     create_document_pack_on_success,
-    create_export_application_document,
-    create_import_application_document,
+    export_search_results,
 )
 from web.mail.tasks import (  # NOQA
     send_authority_expiring_firearms_email_task,
@@ -9,6 +9,7 @@ import pytest
 from django.conf import settings
 from django.contrib.auth.hashers import make_password
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
 from django.test import override_settings, signals
@@ -72,10 +73,14 @@ from web.models import (
     WoodQuotaChecklist,
 )
 from web.models.shared import YesNoNAChoices
+from web.permissions.service import PERMISSIONS_VERSION_KEY
 from web.reports.constants import DateFilterType, ReportType
 from web.sites import SiteName
 from web.tests.helpers import CaseURLS, get_test_client
 from web.tests.utils.search.conftest import Build, importer_one_fixture_data  # NOQA
+from web.utils.pdf import signer
+from web.utils.reference_data import clear_reference_data_cache
+from web.utils.search.cache import SEARCH_RESULTS_VERSION_KEY
 
 from .application_fixtures import (
     FirearmsDFLAppFixture,
@@ -1702,7 +1707,7 @@ def _add_valid_checklist(app):
 
 
 def _add_files_to_active_document_pack(app, ilb_admin_user) -> None:
-    """Simulates what happens when upload_case_document_file is called without uploading a file to s3"""
+    """Simulates what happens when save_case_document_file is called without uploading a file to s3"""
     active_pack = document_pack.pack_active_get(app)
 
     for cdr in active_pack.document_references.all():
@@ -1744,6 +1749,33 @@ def mock_signature_file(monkeypatch):
     monkeypatch.setattr(signature_utils, "get_signature_file_base64", mock_file)
 
 
+@pytest.fixture(autouse=True)
+def clear_signing_key_cache():
+    yield
+    signer.clear_signing_key_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_search_results_cache():
+    # Cached search results would outlive the test database transaction.
+    yield
+    cache.delete(SEARCH_RESULTS_VERSION_KEY)
+
+
+@pytest.fixture(autouse=True)
+def clear_reference_data():
+    # Reference data loaded in a test would outlive the test database transaction.
+    yield
+    clear_reference_data_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_menu_cache():
+    # Menus cached for a user would outlive the test database transaction.
+    yield
+    cache.delete(PERMISSIONS_VERSION_KEY)
+
+
 @pytest.fixture
 def report_schedule(ilb_admin_user):
     issued_cert_report = Report.objects.get(report_type=ReportType.ISSUED_CERTIFICATES)
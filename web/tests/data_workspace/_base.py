@@ -1,6 +1,8 @@
 from http import HTTPStatus
 from typing import Any
 
+from django.urls import resolve
+
 from web.tests.api_auth import make_testing_hawk_sender
 
 DATE_STR_FORMAT = "%Y-%m-%dT%H:%M:%S"
@@ -28,6 +30,12 @@ class BaseTestDataView:
         assert response.status_code == HTTPStatus.OK
         result = response.json()
         self.check_result(result)
+        self.check_schema(result)
 
     def check_result(self, result: list[dict[str, Any]]) -> None:
         assert True
+
+    def check_schema(self, result: dict[str, Any]) -> None:
+        # Records aren't validated when the response is written, check they match the schema.
+        qs_serializer = resolve(self.url).func.view_class.qs_serializer
+        assert qs_serializer(**result).model_dump(mode="json", exclude_defaults=True) == result
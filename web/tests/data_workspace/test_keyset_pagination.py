@@ -0,0 +1,103 @@
+import datetime as dt
+import json
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from web.data_workspace.views.base import DataViewBase
+from web.models import ImportApplication, Importer
+from web.tests.api_auth import make_testing_hawk_sender
+from web.utils.api.auth import HAWK_RESPONSE_HEADER
+
+
+class TestKeysetPagination:
+    @pytest.fixture(autouse=True)
+    def _setup(self, cw_client):
+        self.client = cw_client
+        self.importer_url = reverse("data-workspace:importer-data", kwargs={"version": "v1"})
+        self.application_url = reverse(
+            "data-workspace:import-application-data", kwargs={"version": "v1"}
+        )
+
+    def get(self, url):
+        sender = make_testing_hawk_sender(
+            "GET", url, api_type="data_workspace", content="", content_type=""
+        )
+        return self.client.get(url, HTTP_AUTHORIZATION=sender.request_header)
+
+    def test_pages_are_fetched_after_the_cursor(self):
+        importer_ids = list(Importer.objects.order_by("pk").values_list("pk", flat=True))
+
+        with mock.patch.object(DataViewBase, "paginate_by", 2):
+            response = self.get(self.importer_url)
+            assert response.status_code == HTTPStatus.OK
+            result = response.json()
+            assert [r["id"] for r in result["results"]] == importer_ids[:2]
+            assert result["next"] == f"{self.importer_url}?after={importer_ids[1]}"
+
+            ids = []
+            url = self.importer_url
+
+            while url:
+                result = self.get(url).json()
+                ids.extend(r["id"] for r in result["results"])
+                url = result["next"]
+
+        assert ids == importer_ids
+
+    def test_invalid_cursor(self):
+        response = self.get(f"{self.importer_url}?after=abc")
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {"error": "after must be a record id"}
+
+    def test_updated_since(self, fa_dfl_app_pre_sign, fa_sil_app_submitted):
+        ImportApplication.objects.filter(pk=fa_dfl_app_pre_sign.pk).update(
+            last_update_datetime=timezone.now() - dt.timedelta(days=2)
+        )
+        ImportApplication.objects.filter(pk=fa_sil_app_submitted.pk).update(
+            last_update_datetime=timezone.now()
+        )
+        updated_since = (timezone.now() - dt.timedelta(days=1)).strftime("%Y-%m-%dT%H:%M:%S")
+
+        result = self.get(f"{self.application_url}?updated_since={updated_since}").json()
+        ids = [r["id"] for r in result["results"]]
+
+        assert fa_sil_app_submitted.pk in ids
+        assert fa_dfl_app_pre_sign.pk not in ids
+
+    def test_updated_since_invalid(self):
+        response = self.get(f"{self.application_url}?updated_since=yesterday")
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {"error": "updated_since must be an ISO 8601 datetime"}
+
+    def test_updated_since_not_supported(self):
+        response = self.get(f"{self.importer_url}?updated_since=2024-01-01T00:00:00")
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {"error": "This endpoint does not support updated_since"}
+
+    def test_ndjson(self):
+        with mock.patch.object(DataViewBase, "paginate_by", 2):
+            response = self.get(f"{self.importer_url}?format=ndjson")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert response[HAWK_RESPONSE_HEADER]
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+
+        assert [r["id"] for r in records] == list(
+            Importer.objects.order_by("pk").values_list("pk", flat=True)
+        )
+        assert records[0]["name"] == "Test Importer 1"
+
+    def test_v0_uses_page_numbers(self):
+        url = reverse("data-workspace:importer-data", kwargs={"version": "v0"})
+
+        with mock.patch.object(DataViewBase, "paginate_by", 2):
+            result = self.get(url).json()
+
+        assert result["next"] == f"{url}?page=2"
@@ -12,6 +12,10 @@ class TestMetaDataView(BaseTestDataView):
         self.client = cw_client
         self.url = reverse("data-workspace:metadata")
 
+    def check_schema(self, result: dict[str, Any]) -> None:
+        # The metadata is validated by its serializer when the response is written.
+        pass
+
     def check_result(self, result: list[dict[str, Any]]) -> None:
         assert result == {
             "tables": [
@@ -31,7 +31,12 @@ from web.tests.application_utils import (
     submit_app,
 )
 from web.tests.auth import AuthTestCase
-from web.tests.helpers import CaseURLS, check_page_errors, get_test_client
+from web.tests.helpers import (
+    CaseURLS,
+    check_page_errors,
+    get_s3_object_response,
+    get_test_client,
+)
 
 
 def test_create_in_progress_fa_dfl_application(
@@ -604,9 +609,11 @@ def test_edit_goods_certificate_description(fa_dfl_app_submitted, ilb_admin_clie
     assert document.goods_description == "New Description"
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
-def test_view_goods_certificate_get(mock_get_file_from_s3, fa_dfl_app_submitted, importer_client):
-    mock_get_file_from_s3.return_value = b"test_file"
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
+def test_view_goods_certificate_get(
+    mock_get_file_stream_from_s3, fa_dfl_app_submitted, importer_client
+):
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     app = fa_dfl_app_submitted
     document = app.goods_certificates.first()
 
@@ -724,11 +731,11 @@ def test_report_firearms_manual_report(
     assert new_report.proofing == "yes"
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_add_report_firearm_upload(
-    mock_get_file_from_s3, completed_dfl_app_with_supplementary_report, importer_client
+    mock_get_file_stream_from_s3, completed_dfl_app_with_supplementary_report, importer_client
 ):
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     app = completed_dfl_app_with_supplementary_report
     report = app.supplementary_info.reports.first()
     assert report.firearms.count() == 1
@@ -758,12 +765,12 @@ def test_add_report_firearm_upload(
     assert new_report.is_upload is True
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_view_uploaded_document(
-    mock_get_file_from_s3, completed_dfl_app_with_supplementary_report, importer_client
+    mock_get_file_stream_from_s3, completed_dfl_app_with_supplementary_report, importer_client
 ):
     app = completed_dfl_app_with_supplementary_report
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     report = app.supplementary_info.reports.first()
     goods_certificate = report.get_goods_certificates().first()
 
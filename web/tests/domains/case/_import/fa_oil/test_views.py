@@ -32,7 +32,11 @@ from web.tests.application_utils import (
 from web.tests.auth import AuthTestCase
 from web.tests.conftest import LOGIN_URL
 from web.tests.domains.case._import.factory import OILApplicationFactory
-from web.tests.helpers import CaseURLS, check_gov_notify_email_was_sent
+from web.tests.helpers import (
+    CaseURLS,
+    check_gov_notify_email_was_sent,
+    get_s3_object_response,
+)
 
 
 def test_create_in_progress_fa_oil_application(
@@ -375,11 +379,11 @@ def test_fa_oil_delete_report(completed_oil_app_with_supplementary_report, impor
     assert OILSupplementaryReportFirearm.objects.filter(pk=report_firearm.pk).exists() is False
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_fa_oil_view_upload_document(
-    mock_get_file_from_s3, completed_oil_app_with_supplementary_report, importer_client
+    mock_get_file_stream_from_s3, completed_oil_app_with_supplementary_report, importer_client
 ):
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     app = completed_oil_app_with_supplementary_report
     report: OILSupplementaryReport = app.supplementary_info.reports.first()
     report_firearm: OILSupplementaryReportFirearm = report.firearms.first()
@@ -387,7 +391,7 @@ def test_fa_oil_view_upload_document(
     url = CaseURLS.fa_oil_report_upload_view(app.pk, report.pk, report_firearm.pk)
     resp = importer_client.get(url)
     assert resp.status_code == HTTPStatus.OK
-    assert mock_get_file_from_s3.called is True
+    assert mock_get_file_stream_from_s3.called is True
 
 
 def test_fa_oil_report_firearm_manual_add(
@@ -22,7 +22,7 @@ from web.models import (
 )
 from web.tests.application_utils import create_import_app, save_app_data
 from web.tests.auth import AuthTestCase
-from web.tests.helpers import CaseURLS, check_page_errors
+from web.tests.helpers import CaseURLS, check_page_errors, get_s3_object_response
 from web.utils.validation import ApplicationErrors, PageErrors
 
 
@@ -245,16 +245,18 @@ def test_validate_query_param_shows_errors(importer_client, fa_sil_app_in_progre
     assert message == "You must enter this item"
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
-def test_view_section5_document(mock_get_file_from_s3, fa_sil_app_in_progress, importer_client):
-    mock_get_file_from_s3.return_value = b"test_file"
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
+def test_view_section5_document(
+    mock_get_file_stream_from_s3, fa_sil_app_in_progress, importer_client
+):
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     app = fa_sil_app_in_progress
     section_5 = app.user_section5.first()
     url = CaseURLS.fa_sil_view_section_5_document(app.pk, section_5.pk)
 
     response = importer_client.get(url)
     assert response.status_code == HTTPStatus.OK
-    assert mock_get_file_from_s3.called is True
+    assert mock_get_file_stream_from_s3.called is True
 
 
 def test_archive_section5_document(importer_client, fa_sil_app_in_progress):
@@ -334,11 +336,11 @@ def test_view_verified_section5(fa_sil_app_in_progress, importer_client, importe
     assert response.status_code == HTTPStatus.FORBIDDEN
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_view_verified_section5_document(
-    mock_get_file_from_s3, fa_sil_app_in_progress, importer_one_contact, importer_client
+    mock_get_file_stream_from_s3, fa_sil_app_in_progress, importer_one_contact, importer_client
 ):
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     app = fa_sil_app_in_progress
     start_date = dt.date(2020, 2, 16)
     end_date = dt.date(2030, 2, 16)
@@ -360,7 +362,7 @@ def test_view_verified_section5_document(
     url = CaseURLS.fa_sil_verified_section_5_document(app.pk, document_pk)
     response = importer_client.get(url)
     assert response.status_code == HTTPStatus.OK
-    assert mock_get_file_from_s3.called is True
+    assert mock_get_file_stream_from_s3.called is True
 
 
 def test_view_set_cover_letter(fa_sil_app_submitted, ilb_admin_client):
@@ -478,12 +480,14 @@ def test_report_firearms_manual_report(
     assert new_report.proofing == "yes"
 
 
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_view_uploaded_document(
-    mock_get_file_from_s3, completed_sil_app_with_uploaded_supplementary_report, importer_client
+    mock_get_file_stream_from_s3,
+    completed_sil_app_with_uploaded_supplementary_report,
+    importer_client,
 ):
     app = completed_sil_app_with_uploaded_supplementary_report
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
     report = app.supplementary_info.reports.first()
     section5_firearms = report.section5_firearms.first()
 
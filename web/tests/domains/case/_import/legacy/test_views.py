@@ -6,14 +6,18 @@ from pytest_django.asserts import assertRedirects
 
 from web.models import OutwardProcessingTradeFile, PriorSurveillanceContractFile
 from web.tests.application_fixtures import add_dummy_file
-from web.tests.helpers import CaseURLS, get_messages_from_response
+from web.tests.helpers import (
+    CaseURLS,
+    get_messages_from_response,
+    get_s3_object_response,
+)
 
 
 class TestOPTView:
 
-    @mock.patch("web.domains.case.utils.get_file_from_s3")
-    def test_view_document(self, mock_get_file_from_s3, opt_app_submitted, ilb_admin_client):
-        mock_get_file_from_s3.return_value = b"test_file"
+    @mock.patch("web.domains.file.utils.get_file_stream_from_s3")
+    def test_view_document(self, mock_get_file_stream_from_s3, opt_app_submitted, ilb_admin_client):
+        mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
         app = opt_app_submitted
         app.documents.add(
             add_dummy_file(
@@ -38,9 +42,11 @@ class TestOPTView:
 
 class TestTextilesView:
 
-    @mock.patch("web.domains.case.utils.get_file_from_s3")
-    def test_view_document(self, mock_get_file_from_s3, textiles_app_submitted, ilb_admin_client):
-        mock_get_file_from_s3.return_value = b"test_file"
+    @mock.patch("web.domains.file.utils.get_file_stream_from_s3")
+    def test_view_document(
+        self, mock_get_file_stream_from_s3, textiles_app_submitted, ilb_admin_client
+    ):
+        mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
         app = textiles_app_submitted
         document_pk = app.supporting_documents.first().pk
         manage_checklist = CaseURLS.textiles_view_document(app.pk, document_pk)
@@ -59,9 +65,11 @@ class TestTextilesView:
 
 class TestSPSView:
 
-    @mock.patch("web.domains.case.utils.get_file_from_s3")
-    def test_sps_view_document(self, mock_get_file_from_s3, sps_app_submitted, ilb_admin_client):
-        mock_get_file_from_s3.return_value = b"test_file"
+    @mock.patch("web.domains.file.utils.get_file_stream_from_s3")
+    def test_sps_view_document(
+        self, mock_get_file_stream_from_s3, sps_app_submitted, ilb_admin_client
+    ):
+        mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
         app = sps_app_submitted
         document_pk = app.supporting_documents.first().pk
         url = CaseURLS.sps_view_document(app.pk, document_pk)
@@ -69,13 +77,13 @@ class TestSPSView:
 
         assert resp.status_code == HTTPStatus.OK
         assert resp.headers["Content-Disposition"] == 'attachment; filename="dummy-filename"'
-        assert mock_get_file_from_s3.called is True
+        assert mock_get_file_stream_from_s3.called is True
 
-    @mock.patch("web.domains.case.utils.get_file_from_s3")
+    @mock.patch("web.domains.file.utils.get_file_stream_from_s3")
     def test_sps_view_contract_document_without_contract(
-        self, mock_get_file_from_s3, sps_app_submitted, ilb_admin_client
+        self, mock_get_file_stream_from_s3, sps_app_submitted, ilb_admin_client
     ):
-        mock_get_file_from_s3.return_value = b"test_file"
+        mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
         app = sps_app_submitted
         url = CaseURLS.sps_view_contract_document(app.pk)
         resp = ilb_admin_client.get(url)
@@ -87,13 +95,13 @@ class TestSPSView:
         messages = get_messages_from_response(resp)
         assert len(messages) == 1
         assert messages[0] == "The application does not have contract/invoice attached."
-        assert mock_get_file_from_s3.called is False
+        assert mock_get_file_stream_from_s3.called is False
 
-    @mock.patch("web.domains.case.utils.get_file_from_s3")
+    @mock.patch("web.domains.file.utils.get_file_stream_from_s3")
     def test_sps_view_contract_document(
-        self, mock_get_file_from_s3, sps_app_submitted, ilb_admin_client
+        self, mock_get_file_stream_from_s3, sps_app_submitted, ilb_admin_client
     ):
-        mock_get_file_from_s3.return_value = b"test_file"
+        mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
         app = sps_app_submitted
 
         contract_file = PriorSurveillanceContractFile.objects.create(
@@ -111,4 +119,4 @@ class TestSPSView:
         resp = ilb_admin_client.get(url)
         assert resp.status_code == HTTPStatus.OK
         assert resp.headers["Content-Disposition"] == 'attachment; filename="dummy-filename"'
-        assert mock_get_file_from_s3.called is True
+        assert mock_get_file_stream_from_s3.called is True
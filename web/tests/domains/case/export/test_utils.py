@@ -8,6 +8,7 @@ from web.domains.case.export.utils import (
     copy_export_application_to_export_application,
     copy_export_application_to_template,
     copy_template_to_export_application,
+    get_products_file_error_message,
     process_products_file,
 )
 from web.domains.case.shared import ImpExpStatus
@@ -109,16 +110,124 @@ def test_process_products_file_cfs_template(cfs_cat, is_biocidal):
 
 
 @pytest.mark.django_db
-def test_multiple_chunks_invalid(cfs_app_submitted):
+def test_multiple_chunks(cfs_app_submitted):
     schedule = create_schedule(cfs_app_submitted)
     config = create_dummy_config()
     xlsx_file = create_dummy_xlsx_file(config)
     xlsx_file.DEFAULT_CHUNK_SIZE = 5000
 
+    assert xlsx_file.multiple_chunks()
+
+    count = process_products_file(xlsx_file, schedule)
+
+    assert count == 3
+    assert schedule.products.count() == 3
+
+
+@pytest.mark.django_db
+def test_process_products_file_query_count(cfs_app_submitted, django_assert_max_num_queries):
+    schedule = create_schedule(cfs_app_submitted, is_biocidal=True)
+    config = create_dummy_config(is_biocidal=True)
+    config.rows = [[f"Product {i}", "1,2", f"Ingredient {i}", "107-07-3"] for i in range(200)] + [
+        [f"Product {i}", "3", f"Ingredient {i}b", "506-64-9"] for i in range(200)
+    ]
+    xlsx_file = create_dummy_xlsx_file(config)
+
+    # The number of queries doesn't depend on the number of products.
+    with django_assert_max_num_queries(12):
+        count = process_products_file(xlsx_file, schedule)
+
+    assert count == 200
+    assert schedule.products.count() == 200
+    product = schedule.products.get(product_name="Product 10")
+    assert sorted(product.product_type_numbers.values_list("product_type_number", flat=True)) == [
+        1,
+        2,
+        3,
+    ]
+    assert product.active_ingredients.count() == 2
+
+
+@pytest.mark.django_db
+def test_process_products_file_existing_products(cfs_app_submitted):
+    schedule = create_schedule(cfs_app_submitted, is_biocidal=True)
+    product = schedule.products.create(product_name="product 1")
+    product.product_type_numbers.create(product_type_number=1)
+    product.active_ingredients.create(name="Old name", cas_number="107-07-3")
+
+    config = create_dummy_config(is_biocidal=True)
+    xlsx_file = create_dummy_xlsx_file(config)
+    count = process_products_file(xlsx_file, schedule)
+
+    assert count == 3
+    assert schedule.products.count() == 3
+    assert schedule.products.get(product_name="product 1") == product
+    assert sorted(product.product_type_numbers.values_list("product_type_number", flat=True)) == [
+        1,
+        2,
+        3,
+    ]
+    # Existing ingredients are matched by CAS number.
+    assert sorted(product.active_ingredients.values_list("name", "cas_number")) == [
+        ("Ingredient 1", "107-07-3"),
+        ("Ingredient 2", "506-64-9"),
+    ]
+
+
+@pytest.mark.django_db
+def test_process_products_file_existing_ingredient_name(cfs_app_submitted):
+    schedule = create_schedule(cfs_app_submitted, is_biocidal=True)
+    product = schedule.products.create(product_name="Product 1")
+    product.active_ingredients.create(name="Ingredient 1", cas_number="58-08-2")
+
+    config = create_dummy_config(is_biocidal=True)
+    xlsx_file = create_dummy_xlsx_file(config)
+
     with pytest.raises(ValidationError) as e:
         process_products_file(xlsx_file, schedule)
 
-    assert "File too large to process" in str(e.value)
+    assert e.value.messages == [
+        "Product 'Product 1' has error with active ingredient name 'Ingredient 1' - An active"
+        " ingredient with this name and a different CAS number already exists."
+    ]
+
+    # Nothing is saved
+    assert schedule.products.count() == 1
+
+
+@pytest.mark.django_db
+def test_all_row_errors_are_reported(cfs_app_submitted):
+    schedule = create_schedule(cfs_app_submitted, is_biocidal=True)
+    config = create_dummy_config(is_biocidal=True)
+    config.rows[0][1] = "23"
+    config.rows[1][3] = "506-64-8"
+    config.rows[2][2] = None
+    config.rows[3][0] = "a" * 1001
+    xlsx_file = create_dummy_xlsx_file(config)
+
+    with pytest.raises(ValidationError) as e:
+        process_products_file(xlsx_file, schedule)
+
+    assert e.value.messages == [
+        "Product 'Product 1' has error with product type number '23' - Select a valid choice."
+        " 23 is not one of the available choices. - line 2",
+        "Product 'Product 1' has error with CAS number '506-64-8' - This is not a valid CAS"
+        " number (check digit validation has failed). - line 3",
+        "Ingredient name missing - line 4",
+        f"Product '{'a' * 1001}' has error - Ensure this value has at most 1000 characters"
+        " (it has 1001). - line 5",
+    ]
+    assert schedule.products.count() == 0
+
+
+def test_get_products_file_error_message():
+    err = ValidationError([f"Error {i}" for i in range(12)])
+
+    assert get_products_file_error_message(err) == (
+        "Error 0; Error 1; Error 2; Error 3; Error 4; Error 5; Error 6; Error 7; Error 8; Error 9"
+        " (and 2 more errors)"
+    )
+    assert get_products_file_error_message(ValidationError("Error")) == "Error"
 
 
 @pytest.mark.django_db
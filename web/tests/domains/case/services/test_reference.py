@@ -1,5 +1,6 @@
 import datetime as dt
 import re
+from unittest import mock
 
 import pytest
 from django.utils import timezone
@@ -17,6 +18,7 @@ from web.models import (
     OpenIndividualLicenceApplication,
     OutwardProcessingTradeApplication,
     PriorSurveillanceApplication,
+    ReferenceCounter,
     SanctionsAndAdhocApplication,
     SILApplication,
     TextilesApplication,
@@ -71,6 +73,45 @@ def test_year(lock_manager):
     assert reference._get_reference_string(ref2, True, min_digits=4) == f"blii/{year}/0002"
 
 
+@pytest.mark.django_db
+def test_get_next_references(lock_manager):
+    year = timezone.now().year
+
+    refs = reference._get_next_references(lock_manager, prefix="bloo", use_year=True, count=3)
+    assert [reference._get_reference_string(r, True, min_digits=1) for r in refs] == [
+        f"bloo/{year}/1",
+        f"bloo/{year}/2",
+        f"bloo/{year}/3",
+    ]
+
+    ref = reference._get_next_reference(lock_manager, prefix="bloo", use_year=True)
+    assert ref.reference == 4
+    assert ReferenceCounter.objects.get(prefix="bloo", year=year).last_reference == 4
+
+    with pytest.raises(ValueError, match="count must be at least 1"):
+        reference._get_next_references(lock_manager, prefix="bloo", use_year=True, count=0)
+
+
+@pytest.mark.django_db
+def test_counter_is_kept_ahead_of_existing_references(lock_manager):
+    ref = reference._get_next_reference(lock_manager, prefix="blee", use_year=False)
+    assert ref.reference == 1
+
+    # e.g. references added by the V1 data migration
+    UniqueReference.objects.create(prefix="blee", year=None, reference=10)
+
+    ref = reference._get_next_reference(lock_manager, prefix="blee", use_year=False)
+    assert ref.reference == 11
+    assert ReferenceCounter.objects.get(prefix="blee", year=None).last_reference == 11
+
+
+@pytest.mark.django_db
+def test_references_are_allocated_in_a_transaction(lock_manager):
+    with mock.patch.object(reference.transaction, "get_autocommit", return_value=True):
+        with pytest.raises(RuntimeError, match="inside a database transaction"):
+            reference._get_next_reference(lock_manager, prefix="bly", use_year=False)
+
+
 def test_get_application_case_and_licence_references(
     db, importer_one_contact, importer, office, exporter, exporter_office, lock_manager
 ):
@@ -1,13 +1,30 @@
+import datetime as dt
+import io
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+import pytest
+from django.utils import timezone
+from openpyxl import load_workbook
+
 from web.domains.case.services import case_progress, document_pack
 from web.domains.case.shared import ImpExpStatus
 from web.domains.case.tasks import (
+    DocumentPackError,
     create_case_document_pack,
+    create_import_application_document,
+    delete_expired_search_exports,
+    export_search_results,
     update_application_on_error,
 )
 from web.domains.case.utils import end_process_task
-from web.models import ICMSHMRCChiefRequest, Task, VariationRequest
+from web.models import (
+    File,
+    ICMSHMRCChiefRequest,
+    SearchExport,
+    Task,
+    VariationRequest,
+)
 from web.tests.helpers import add_variation_request_to_app
 
 
@@ -62,6 +79,38 @@ def test_fa_dfl_create_case_document_pack(
     ).exists()
 
 
+@mock.patch("web.utils.pdf.signer.get_active_signature_image")
+@mock.patch("web.domains.case.tasks.delete_file_from_s3")
+@mock.patch("web.domains.case.tasks.upload_file_obj_to_s3")
+def test_create_import_application_document(
+    mock_upload_file_obj_to_s3,
+    mock_delete_file_from_s3,
+    mock_get_active_signature_image,
+    dummy_signature_image,
+    fa_dfl_app_pre_sign,
+    ilb_admin_user,
+):
+    application = fa_dfl_app_pre_sign
+
+    sign_pre_signed_application(application, ilb_admin_user)
+
+    mock_get_active_signature_image.return_value = dummy_signature_image
+    mock_upload_file_obj_to_s3.return_value = 100
+
+    pack = document_pack.pack_draft_get(application)
+    licence = document_pack.doc_ref_licence_get(pack)
+
+    create_import_application_document(application.pk, pack.pk, licence.pk, ilb_admin_user.pk)
+
+    # Only the queued document is created.
+    assert mock_upload_file_obj_to_s3.call_count == 1
+
+    licence.refresh_from_db()
+    cover_letter = document_pack.doc_ref_cover_letter_get(pack)
+    assert licence.document.filename == "import-licence.pdf"
+    assert cover_letter.document is None
+
+
 def test_fa_dfl_update_application_on_error(fa_dfl_app_pre_sign, ilb_admin_user):
     application = fa_dfl_app_pre_sign
 
@@ -183,3 +232,143 @@ def test_cfs_update_application_on_error(cfs_app_pre_sign, ilb_admin_user):
 
     case_progress.check_expected_status(application, [ImpExpStatus.PROCESSING])
     case_progress.check_expected_task(application, Task.TaskType.DOCUMENT_ERROR)
+
+
+@mock.patch("web.domains.case.tasks.capture_message")
+@mock.patch("web.domains.case.tasks.send_completed_application_process_notifications")
+@mock.patch("web.utils.pdf.signer.get_active_signature_image")
+@mock.patch("web.domains.case.tasks.delete_file_from_s3")
+@mock.patch("web.domains.case.tasks.upload_file_obj_to_s3")
+def test_cfs_create_case_document_pack_document_error(
+    mock_upload_file_obj_to_s3,
+    mock_delete_file_from_s3,
+    mock_get_active_signature_image,
+    mock_send_completed_application_process_notifications,
+    mock_capture_message,
+    dummy_signature_image,
+    cfs_app_pre_sign,
+    ilb_admin_user,
+):
+    application = cfs_app_pre_sign
+    sign_pre_signed_application(application, ilb_admin_user)
+
+    mock_get_active_signature_image.return_value = dummy_signature_image
+    # The second certificate fails to upload
+    mock_upload_file_obj_to_s3.side_effect = [100, ValueError("Upload failed")]
+
+    # Eager tasks raise the error after calling create_document_pack_on_error
+    with (
+        mock.patch(
+            "web.domains.case.tasks.ThreadPoolExecutor",
+            return_value=ThreadPoolExecutor(max_workers=1),
+        ),
+        pytest.raises(DocumentPackError),
+    ):
+        create_case_document_pack(application, ilb_admin_user)
+
+    mock_send_completed_application_process_notifications.assert_not_called()
+
+    # Check the error has been reported
+    mock_capture_message.assert_called_once()
+    assert "Failed to create case documents" in mock_capture_message.call_args.args[0]
+    assert "ValueError('Upload failed')" in mock_capture_message.call_args.args[0]
+
+    application.refresh_from_db()
+    case_progress.check_expected_status(application, [ImpExpStatus.PROCESSING])
+    case_progress.check_expected_task(application, Task.TaskType.DOCUMENT_ERROR)
+
+    # The first certificate has still been saved.
+    pack = document_pack.pack_draft_get(application)
+    cert_one, cert_two = document_pack.doc_ref_certificates_all(pack)
+    assert cert_one.document.filename == "Certificate of Free Sale (Afghanistan).pdf"
+    assert cert_two.document is None
+
+
+@mock.patch("web.domains.case.tasks.upload_file_obj_to_s3")
+def test_export_search_results(mock_upload_file_obj_to_s3, completed_sil_app, ilb_admin_user):
+    uploaded = {}
+
+    def upload(file_obj, key):
+        uploaded[key] = file_obj.read()
+        return len(uploaded[key])
+
+    mock_upload_file_obj_to_s3.side_effect = upload
+
+    search_export = SearchExport.objects.create(
+        case_type="import",
+        parameters={"case_ref": [completed_sil_app.reference], "shipping_year": []},
+        created_by=ilb_admin_user,
+    )
+
+    export_search_results(search_export.pk)
+
+    search_export.refresh_from_db()
+    assert search_export.status == SearchExport.Status.COMPLETED
+    assert search_export.total_rows == 1
+    assert search_export.processed_rows == 1
+    assert search_export.finished_datetime is not None
+
+    document = search_export.document
+    assert document.filename == "import_application_download.xlsx"
+    assert document.path == f"SEARCH_EXPORTS/{search_export.pk}/import_application_download.xlsx"
+    assert document.file_size == len(uploaded[document.path])
+    assert document.created_by == ilb_admin_user
+
+    workbook = load_workbook(filename=io.BytesIO(uploaded[document.path]), read_only=True)
+    rows = list(workbook["Sheet 1"].values)
+    assert [row[0] for row in rows[1:]] == [completed_sil_app.reference]
+
+
+def test_export_search_results_error(ilb_admin_user):
+    search_export = SearchExport.objects.create(
+        case_type="import",
+        parameters={"submitted_from": ["not-a-date"]},
+        created_by=ilb_admin_user,
+    )
+
+    with pytest.raises(ValueError, match="Invalid search parameters"):
+        export_search_results(search_export.pk)
+
+    search_export.refresh_from_db()
+    assert search_export.status == SearchExport.Status.FAILED
+    assert search_export.finished_datetime is not None
+    assert search_export.document is None
+
+
+@mock.patch("web.domains.case.tasks.get_s3_client")
+@mock.patch("web.domains.case.tasks.delete_file_from_s3")
+def test_delete_expired_search_exports(
+    mock_delete_file_from_s3, mock_get_s3_client, ilb_admin_user
+):
+    def create_search_export(days_old, has_document):
+        document = None
+        if has_document:
+            document = File.objects.create(
+                filename="import_application_download.xlsx",
+                content_type="application/vnd.ms-excel",
+                file_size=1,
+                path=f"SEARCH_EXPORTS/{days_old}/import_application_download.xlsx",
+                created_by=ilb_admin_user,
+            )
+
+        search_export = SearchExport.objects.create(
+            case_type="import", parameters={}, created_by=ilb_admin_user, document=document
+        )
+        SearchExport.objects.filter(pk=search_export.pk).update(
+            created_datetime=timezone.now() - dt.timedelta(days=days_old)
+        )
+
+        return search_export
+
+    expired = create_search_export(8, has_document=True)
+    expired_failed = create_search_export(8, has_document=False)
+    current = create_search_export(6, has_document=True)
+
+    delete_expired_search_exports()
+
+    mock_delete_file_from_s3.assert_called_once_with(
+        expired.document.path, mock_get_s3_client.return_value
+    )
+    assert not SearchExport.objects.filter(pk__in=[expired.pk, expired_failed.pk]).exists()
+    assert not File.objects.filter(pk=expired.document.pk).exists()
+    assert SearchExport.objects.get(pk=current.pk).document == current.document
@@ -2,7 +2,7 @@ from unittest import mock
 
 from web.domains.case.services import document_pack
 from web.models import Constabulary
-from web.tests.helpers import CaseURLS
+from web.tests.helpers import CaseURLS, get_s3_object_response
 
 
 def test_constabulary_documents_view(constabulary_client, completed_dfl_app):
@@ -13,31 +13,31 @@ def test_constabulary_documents_view(constabulary_client, completed_dfl_app):
     assert response.status_code == 200
 
 
-@mock.patch("web.domains.case.views.views_constabulary.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_constabulary_documents_download_view(
-    mock_get_file_from_s3, constabulary_client, completed_dfl_app
+    mock_get_file_stream_from_s3, constabulary_client, completed_dfl_app
 ):
-    mock_get_file_from_s3.return_value = ""
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"")
     active_pack = document_pack.pack_active_get(completed_dfl_app)
     cdr = active_pack.document_references.first()
     response = constabulary_client.get(
         CaseURLS.constabulary_documents_download(completed_dfl_app.pk, active_pack.pk, cdr.pk)
     )
     assert response.status_code == 200
-    assert mock_get_file_from_s3.called is True
+    assert mock_get_file_stream_from_s3.called is True
 
 
-@mock.patch("web.domains.case.views.views_constabulary.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_constabulary_documents_download_view_cdr_not_found(
-    mock_get_file_from_s3, constabulary_client, completed_dfl_app
+    mock_get_file_stream_from_s3, constabulary_client, completed_dfl_app
 ):
     active_pack = document_pack.pack_active_get(completed_dfl_app)
-    mock_get_file_from_s3.return_value = ""
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"")
     response = constabulary_client.get(
         CaseURLS.constabulary_documents_download(completed_dfl_app.pk, active_pack.pk, 0)
     )
     assert response.status_code == 403
-    assert mock_get_file_from_s3.called is False
+    assert mock_get_file_stream_from_s3.called is False
 
 
 def test_constabulary_documents_view_as_ilb_admin(ilb_admin_client, completed_dfl_app):
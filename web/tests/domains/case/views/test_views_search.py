@@ -1,9 +1,11 @@
 import datetime as dt
 import io
 from http import HTTPStatus
+from unittest import mock
 
 import pytest
 from django.core import mail
+from django.http import HttpResponse
 from django.test.client import Client
 from django.urls import resolve
 from django.utils import timezone
@@ -21,6 +23,7 @@ from web.models import (
     CertificateOfGoodManufacturingPracticeApplication,
     CertificateOfManufactureApplication,
     ImportApplicationLicence,
+    SearchExport,
     SILApplication,
     Task,
     WoodQuotaApplication,
@@ -197,6 +200,86 @@ class TestDownloadSpreadsheetView:
         assert case_refs == [completed_cfs_app.reference]
 
 
+class TestSearchExportViews:
+    @pytest.fixture(autouse=True)
+    def _setup(self, importer_client, exporter_client, ilb_admin_client):
+        self.importer_user_client = importer_client
+        self.exporter_user_client = exporter_client
+        self.ilb_admin_user_client = ilb_admin_client
+
+        with mock.patch("web.domains.case.tasks.upload_file_obj_to_s3") as mock_upload:
+            mock_upload.return_value = 100
+            yield
+
+    def test_permission(self):
+        response = self.importer_user_client.post(SearchURLS.export_spreadsheet("import"))
+        assert response.status_code == HTTPStatus.ACCEPTED
+
+        response = self.exporter_user_client.post(SearchURLS.export_spreadsheet("import"))
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        response = self.exporter_user_client.post(SearchURLS.export_spreadsheet("export"))
+        assert response.status_code == HTTPStatus.ACCEPTED
+
+        response = self.importer_user_client.post(SearchURLS.export_spreadsheet("export"))
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_invalid_search(self):
+        response = self.importer_user_client.post(
+            SearchURLS.export_spreadsheet("import"), {"submitted_from": "not-a-date"}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert not SearchExport.objects.exists()
+
+    def test_export_spreadsheet(self, completed_sil_app, importer_one_contact):
+        response = self.importer_user_client.post(
+            SearchURLS.export_spreadsheet("import"), {"case_ref": completed_sil_app.reference}
+        )
+        assert response.status_code == HTTPStatus.ACCEPTED
+
+        search_export = SearchExport.objects.get()
+        assert search_export.created_by == importer_one_contact
+        assert search_export.parameters["case_ref"] == [completed_sil_app.reference]
+        assert response.json() == {"status_url": SearchURLS.export_status(search_export.pk)}
+
+        response = self.importer_user_client.get(SearchURLS.export_status(search_export.pk))
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "status": "COMPLETED",
+            "processed_rows": 1,
+            "total_rows": 1,
+            "download_url": SearchURLS.export_download(search_export.pk),
+        }
+
+        with mock.patch(
+            "web.domains.case.views.views_search.get_file_download_response"
+        ) as mock_download:
+            mock_download.return_value = HttpResponse()
+            response = self.importer_user_client.get(SearchURLS.export_download(search_export.pk))
+
+        assert response.status_code == HTTPStatus.OK
+        mock_download.assert_called_once_with(mock.ANY, search_export.document)
+
+    def test_export_only_visible_to_creator(self, importer_one_contact):
+        search_export = SearchExport.objects.create(
+            case_type="import", parameters={}, created_by=importer_one_contact
+        )
+        status_url = SearchURLS.export_status(search_export.pk)
+        download_url = SearchURLS.export_download(search_export.pk)
+
+        response = self.importer_user_client.get(status_url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["download_url"] is None
+
+        # The export hasn't completed
+        response = self.importer_user_client.get(download_url)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+        for url in [status_url, download_url]:
+            response = self.ilb_admin_user_client.get(url)
+            assert response.status_code == HTTPStatus.NOT_FOUND
+
+
 class TestReassignCaseOwnerView:
     def test_permission(self, importer_client, exporter_client, ilb_admin_client):
         importer_user_client = importer_client
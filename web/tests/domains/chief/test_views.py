@@ -18,7 +18,7 @@ from web.models import ImportApplicationLicence, Task
 from web.tests.api_auth import JSON_TYPE, make_testing_hawk_sender
 from web.tests.helpers import CaseURLS
 from web.utils.api import auth as api_auth
-from web.utils.sentry import capture_exception
+from web.utils.sentry import capture_exception, capture_message
 
 from .conftest import (
     check_complete_chief_request_correct,
@@ -253,6 +253,44 @@ class TestLicenseDataCallbackView:
         assert response.status_code == HTTPStatus.BAD_REQUEST
         assert response.headers.get("Content-Type") == "application/json"
 
+    def test_unknown_and_duplicate_ids_are_reported_together(self):
+        mock_sentry = create_autospec(capture_exception)
+        self.monkeypatch.setattr(api_auth, "capture_exception", mock_sentry)
+        chief_req_id = str(self.chief_req.icms_hmrc_id)
+        unknown_id = "00000000-0000-0000-0000-000000000000"
+
+        payload = types.ChiefLicenceReplyResponseData(
+            run_number=1,
+            accepted=[
+                types.AcceptedLicence(id=chief_req_id),
+                types.AcceptedLicence(id="unknown-key"),
+                types.AcceptedLicence(id=unknown_id),
+            ],
+            rejected=[types.RejectedLicence(id=chief_req_id, errors=[])],
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            chief_views.LicenseDataCallback.get_chief_requests(payload)
+
+        assert str(exc_info.value) == (
+            "Unable to process licence replies:"
+            f" unknown ids ['unknown-key', '{unknown_id}'], duplicate ids ['{chief_req_id}']"
+        )
+
+        response = self.client.post(
+            self.url,
+            data=payload.model_dump(),
+            content_type=JSON_TYPE,
+            HTTP_HAWK_AUTHENTICATION="foo",
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        mock_sentry.assert_called_once()
+
+        # Nothing in the batch is processed
+        self.chief_req.refresh_from_db()
+        assert self.chief_req.status == self.chief_req.CHIEFStatus.PROCESSING
+
 
 @pytest.mark.django_db
 class TestPendingLicences:
@@ -562,3 +600,61 @@ class TestUsageDataCallbackView:
 
         assert self.complete_app.chief_usage_status == "O"
         assert self.revoked_app.chief_usage_status == "D"
+
+    def test_post_reports_unknown_licences_together(self):
+        mock_capture_message = create_autospec(capture_message)
+        self.monkeypatch.setattr(chief_views, "capture_message", mock_capture_message)
+
+        active_licence = document_pack.doc_ref_licence_get(
+            document_pack.pack_active_get(self.complete_app)
+        )
+
+        payload = types.ChiefUsageDataResponseData(
+            usage_data=[
+                types.UsageRecord(licence_ref="GBSIL0000001A", licence_status="O"),
+                types.UsageRecord(licence_ref=active_licence.reference, licence_status="O"),
+                types.UsageRecord(licence_ref="GBSIL0000002B", licence_status="O"),
+                types.UsageRecord(licence_ref=active_licence.reference, licence_status="E"),
+            ]
+        )
+
+        response = self.client.post(
+            self.url,
+            data=payload.model_dump(),
+            content_type=JSON_TYPE,
+            HTTP_HAWK_AUTHENTICATION="foo",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+
+        mock_capture_message.assert_called_once_with(
+            "Unable to set usage status for licence numbers:"
+            " licences not found: ['GBSIL0000001A', 'GBSIL0000002B'], multiple licences found: []."
+        )
+
+        # The last status of a licence is kept
+        self.complete_app.refresh_from_db()
+        assert self.complete_app.chief_usage_status == "E"
+
+    def test_post_query_count(self, django_assert_num_queries):
+        licence_refs = [
+            document_pack.doc_ref_licence_get(document_pack.pack_active_get(self.complete_app)),
+            document_pack.doc_ref_licence_get(document_pack.pack_revoked_get(self.revoked_app)),
+        ]
+        payload = types.ChiefUsageDataResponseData(
+            usage_data=[
+                types.UsageRecord(licence_ref=licence.reference, licence_status="C")
+                for licence in licence_refs
+            ]
+        )
+
+        # Savepoint, licences, applications, update and release savepoint
+        with django_assert_num_queries(5):
+            response = self.client.post(
+                self.url,
+                data=payload.model_dump(),
+                content_type=JSON_TYPE,
+                HTTP_HAWK_AUTHENTICATION="foo",
+            )
+
+        assert response.status_code == HTTPStatus.OK
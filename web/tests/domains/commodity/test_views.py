@@ -15,6 +15,7 @@ from web.models import (
 )
 from web.tests.auth import AuthTestCase
 from web.tests.conftest import LOGIN_URL
+from web.tests.helpers import get_page_query_count
 
 from .factory import CommodityFactory, CommodityGroupFactory
 
@@ -128,6 +129,34 @@ class TestCommodityDetailView(AuthTestCase):
         assert response.context["page_title"] == f"Viewing {self.commodity}"
 
 
+class TestCommodityGroupListView(AuthTestCase):
+    url = reverse("commodity-group-list")
+
+    def test_forbidden_access(self):
+        response = self.importer_client.get(self.url)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_query_count(self):
+        commodity_type = CommodityType.objects.first()
+
+        def add_commodity_group():
+            group = CommodityGroupFactory(is_active=True, group_name="Query count group")
+            group.commodities.add(
+                CommodityFactory(commodity_type=commodity_type),
+                CommodityFactory(commodity_type=commodity_type),
+            )
+
+        url = f"{self.url}?group_name=Query+count+group"
+        add_commodity_group()
+        query_count = get_page_query_count(self.ilb_admin_client, url)
+
+        # The commodities of each group are prefetched.
+        for i in range(3):
+            add_commodity_group()
+
+        assert get_page_query_count(self.ilb_admin_client, url) == query_count
+
+
 class TestCommodityGroupCreateView(AuthTestCase):
     url = "/commodity/group/new/"
     redirect_url = f"{LOGIN_URL}?next={url}"
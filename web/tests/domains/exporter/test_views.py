@@ -7,11 +7,12 @@ from guardian.shortcuts import remove_perm
 from pytest_django.asserts import assertRedirects
 
 from web.domains.exporter.views import _get_user_context
-from web.models import Exporter
+from web.models import Exporter, Office
 from web.permissions import Perms
 from web.tests.auth import AuthTestCase
 from web.tests.conftest import LOGIN_URL
-from web.tests.helpers import get_messages_from_response
+from web.tests.domains.exporter.factory import ExporterFactory
+from web.tests.helpers import get_messages_from_response, get_page_query_count
 
 
 @pytest.fixture
@@ -63,6 +64,18 @@ class TestExporterListView(AuthTestCase):
         decoded_response = response.content.decode("utf-8")
         assert '<a href="/exporter/create/">Exporter</a>' in decoded_response
 
+    def test_query_count(self):
+        url = f"{self.url}?status=True"
+        query_count = get_page_query_count(self.ilb_admin_client, url)
+
+        # The offices and agents of each exporter are prefetched.
+        for i in range(3):
+            office = Office.objects.create(address_1=f"{i} Example Street", postcode="S12SS")
+            exporter = ExporterFactory(is_active=True, offices=[office])
+            ExporterFactory(is_active=True, main_exporter=exporter)
+
+        assert get_page_query_count(self.ilb_admin_client, url) == query_count
+
 
 class TestExporterListUserView(AuthTestCase):
     url = reverse("user-exporter-list")
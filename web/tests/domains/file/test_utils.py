@@ -1,16 +1,22 @@
+from http import HTTPStatus
 from random import choice
 from unittest import mock
 
 import pytest
+from botocore.exceptions import ClientError
 from django.forms import forms
+from django.test import RequestFactory
 from storages.backends.s3boto3 import S3Boto3StorageFile
 
 from web.domains.file.utils import (
     FILE_EXTENSION_ALLOW_LIST,
     IMAGE_EXTENSION_ALLOW_LIST,
     ImageFileFieldValidator,
+    get_file_download_response,
     validate_file_extension,
 )
+from web.models import File
+from web.tests.helpers import get_s3_object_response
 
 
 @pytest.mark.parametrize(
@@ -137,3 +143,75 @@ def test_validate_image_file_extension_invalid_with_custom_allowed_extensions():
             match="Invalid file extension. Only these extensions are allowed: ",
         ):
             ImageFileFieldValidator(allowed_extensions=["jpg"])(mock_file)
+
+
+class TestGetFileDownloadResponse:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.document = File(
+            filename="test.csv", content_type="text/csv", file_size=10, path="documents/test.csv"
+        )
+
+        with mock.patch(
+            "web.domains.file.utils.get_file_stream_from_s3"
+        ) as self.mock_get_file_stream_from_s3:
+            yield
+
+    def test_file_is_streamed(self):
+        self.mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"0123456789")
+        request = RequestFactory().get("/")
+
+        response = get_file_download_response(request, self.document)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming is True
+        assert response.getvalue() == b"0123456789"
+        assert response.headers["Content-Type"] == "text/csv"
+        assert response.headers["Content-Length"] == "10"
+        assert response.headers["Accept-Ranges"] == "bytes"
+        assert response.headers["Content-Disposition"] == 'attachment; filename="test.csv"'
+        self.mock_get_file_stream_from_s3.assert_called_once_with("documents/test.csv", None)
+
+    def test_byte_range(self):
+        self.mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"23456") | {
+            "ContentRange": "bytes 2-6/10"
+        }
+        request = RequestFactory().get("/", headers={"Range": "bytes=2-6"})
+
+        response = get_file_download_response(request, self.document)
+
+        assert response.status_code == HTTPStatus.PARTIAL_CONTENT
+        assert response.getvalue() == b"23456"
+        assert response.headers["Content-Length"] == "5"
+        assert response.headers["Content-Range"] == "bytes 2-6/10"
+        self.mock_get_file_stream_from_s3.assert_called_once_with("documents/test.csv", "bytes=2-6")
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Range": "bytes=0-1,4-5"},
+            {"Range": "bytes=6-2"},
+            {"Range": "items=0-1"},
+            {"Range": "bytes=0-1", "If-Range": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        ],
+    )
+    def test_unsupported_range_returns_whole_file(self, headers):
+        self.mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"0123456789")
+        request = RequestFactory().get("/", headers=headers)
+
+        response = get_file_download_response(request, self.document)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.getvalue() == b"0123456789"
+        self.mock_get_file_stream_from_s3.assert_called_once_with("documents/test.csv", None)
+
+    def test_range_not_satisfiable(self):
+        self.mock_get_file_stream_from_s3.side_effect = ClientError(
+            {"Error": {"Code": "InvalidRange"}}, "GetObject"
+        )
+        request = RequestFactory().get("/", headers={"Range": "bytes=20-"})
+
+        response = get_file_download_response(request, self.document)
+
+        assert response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response.headers["Content-Range"] == "bytes */10"
@@ -10,10 +10,10 @@ from django.utils import timezone
 from guardian.shortcuts import remove_perm
 from pytest_django.asserts import assertInHTML, assertRedirects
 
-from web.domains.importer import views
+from web.domains.file import utils as file_utils
 from web.domains.importer.views import _get_user_context
 from web.mail.constants import EmailTypes
-from web.models import Importer, Section5Authority
+from web.models import Importer, Office, Section5Authority
 from web.permissions import Perms
 from web.sites import SiteName, get_caseworker_site_domain
 from web.tests.auth import AuthTestCase
@@ -22,8 +22,18 @@ from web.tests.domains.importer.factory import ImporterFactory
 from web.tests.helpers import (
     check_gov_notify_email_was_sent,
     get_messages_from_response,
+    get_page_query_count,
+    get_s3_object_response,
 )
-from web.utils.s3 import get_file_from_s3
+from web.utils.s3 import get_file_stream_from_s3
+
+
+def add_importers_with_offices_and_agents(count: int, agent_user) -> None:
+    for i in range(count):
+        office = Office.objects.create(address_1=f"{i} Example Street", postcode="S12SS")
+        importer = ImporterFactory(offices=[office])
+        ImporterFactory(main_importer=importer, type=Importer.INDIVIDUAL, user=agent_user)
+        ImporterFactory(main_importer=importer)
 
 
 @pytest.fixture
@@ -103,6 +113,15 @@ class TestImporterListAdminView(AuthTestCase):
         assert "Main Individual Importer" in decoded_response
         assert "Main Organisation Importer" in decoded_response
 
+    def test_query_count(self):
+        url = f"{self.url}?status=True"
+        query_count = get_page_query_count(self.ilb_admin_client, url)
+
+        # The offices and agents of each importer are prefetched.
+        add_importers_with_offices_and_agents(3, self.importer_agent_user)
+
+        assert get_page_query_count(self.ilb_admin_client, url) == query_count
+
 
 class TestImporterListUserView(AuthTestCase):
     url = reverse("user-importer-list")
@@ -163,6 +182,13 @@ class TestImporterListRegulatorView(AuthTestCase):
         importers = response.context["object_list"]
         assert importers.count() == 5
 
+    def test_query_count(self):
+        url = f"{self.url}?status=True"
+        query_count = get_page_query_count(self.ho_admin_client, url)
+        add_importers_with_offices_and_agents(3, self.importer_agent_user)
+
+        assert get_page_query_count(self.ho_admin_client, url) == query_count
+
 
 class TestImporterDetailRegulatorView(AuthTestCase):
     @pytest.fixture(autouse=True)
@@ -703,9 +729,9 @@ class TestViewDocumentSection5View(AuthTestCase):
             kwargs={"section5_pk": self.section5.id, "document_pk": self.document.pk},
         )
 
-        get_file_from_s3_mock = create_autospec(get_file_from_s3)
-        get_file_from_s3_mock.return_value = b"file_content"
-        monkeypatch.setattr(views, "get_file_from_s3", get_file_from_s3_mock)
+        get_file_stream_from_s3_mock = create_autospec(get_file_stream_from_s3)
+        get_file_stream_from_s3_mock.return_value = get_s3_object_response(b"file_content")
+        monkeypatch.setattr(file_utils, "get_file_stream_from_s3", get_file_stream_from_s3_mock)
 
     def test_permission(self):
         response = self.ilb_admin_client.get(self.url)
@@ -721,7 +747,7 @@ class TestViewDocumentSection5View(AuthTestCase):
         response = self.ilb_admin_client.get(self.url)
         assert response.status_code == HTTPStatus.OK
 
-        assert response.content == b"file_content"
+        assert response.getvalue() == b"file_content"
         assert response.headers["Content-Type"] == "text/plain"
         assert (
             response.headers["Content-Disposition"]
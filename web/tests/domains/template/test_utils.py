@@ -14,6 +14,7 @@ from web.domains.template.utils import (
     add_application_default_cover_letter,
     add_endorsements_from_application_type,
     add_template_data_on_submit,
+    compile_template,
     fetch_schedule_text,
     find_invalid_placeholders,
     get_application_update_template_data,
@@ -22,6 +23,7 @@ from web.domains.template.utils import (
     get_email_template_subject_body,
     get_fir_template_data,
     get_letter_fragment,
+    render_templates,
 )
 from web.mail.messages import MailshotEmail
 from web.mail.types import RecipientDetails
@@ -402,6 +404,31 @@ def test_find_invalid_placeholders(content, placeholders, expected):
     assert find_invalid_placeholders(content, placeholders) == expected
 
 
+def test_compile_template():
+    compiled = compile_template("Dear [[FIRST_NAME]], [[FIRST_NAME]] [[email_address]].")
+
+    assert compiled.literals == ("Dear ", ", ", " ", ".")
+    assert compiled.placeholders == ("FIRST_NAME", "FIRST_NAME", "email_address")
+    assert compile_template("Dear [[FIRST_NAME]], [[FIRST_NAME]] [[email_address]].") is compiled
+
+    values = {"FIRST_NAME": r"\1 Test", "email_address": "test@example.com"}  # /PS-IGNORE
+    # Values are inserted as is, they are not treated as regex replacement strings.
+    assert compiled.render(values) == r"Dear \1 Test, \1 Test test@example.com."  # /PS-IGNORE
+    assert compile_template("No placeholders").render({}) == "No placeholders"
+
+
+def test_render_templates_resolves_placeholders_once():
+    context = Mock()
+    context.__getitem__ = Mock(side_effect=lambda item: item.lower())
+
+    assert render_templates(["[[ONE]] [[TWO]]", None, "[[TWO]] [[ONE]] [[TWO]]"], context) == [
+        "one two",
+        "",
+        "two one two",
+    ]
+    assert sorted(c.args[0] for c in context.__getitem__.call_args_list) == ["ONE", "TWO"]
+
+
 def test_get_import_application_update_request_contents(wood_app_submitted, ilb_admin_two):
     _check_get_export_application_update_request_contents(wood_app_submitted, ilb_admin_two)
 
@@ -0,0 +1,82 @@
+import datetime as dt
+
+import pytest
+from django.core.paginator import Paginator
+from django.utils import timezone
+
+from web.domains.workbasket.app_data import get_applicant_qs
+from web.domains.workbasket.query import WorkbasketQuery
+from web.models import AccessRequest, Mailshot, Template
+from web.tests.auth.auth import AuthTestCase
+
+
+class TestWorkbasketQuery(AuthTestCase):
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, _setup, fa_dfl_app_in_progress, fa_sil_app_in_progress, sanctions_app_in_progress
+    ):
+        AccessRequest.objects.all().delete()
+
+        now = timezone.now()
+        self.mailshot = self._create_mailshot(now - dt.timedelta(days=2))
+        self.dfl_app = self._set_order_datetime(fa_dfl_app_in_progress, now - dt.timedelta(days=1))
+        self.sil_app = self._set_order_datetime(fa_sil_app_in_progress, now - dt.timedelta(days=3))
+        self.sanctions_app = self._set_order_datetime(
+            sanctions_app_in_progress, now - dt.timedelta(days=4)
+        )
+
+    def test_records_are_ordered_across_sources(self):
+        wb_query = WorkbasketQuery(get_applicant_qs(self.importer_user))
+
+        assert wb_query.count() == 4
+        assert [r.pk for r in wb_query[0:4]] == [
+            self.dfl_app.pk,
+            self.mailshot.pk,
+            self.sil_app.pk,
+            self.sanctions_app.pk,
+        ]
+
+    def test_records_have_workbasket_annotations(self):
+        wb_query = WorkbasketQuery(get_applicant_qs(self.importer_user))
+
+        dfl_app, mailshot, *_ = wb_query[0:2]
+
+        assert dfl_app.active_tasks == ["prepare"]
+        assert dfl_app.annotation_open_fir_pairs is None
+        assert mailshot.process_type == "MAILSHOT"
+
+    def test_paginator(self, django_assert_num_queries):
+        paginator = Paginator(WorkbasketQuery(get_applicant_qs(self.importer_user)), 3)
+
+        assert paginator.count == 4
+        assert paginator.num_pages == 2
+
+        # One query for the page keys and one for the import applications on this page.
+        with django_assert_num_queries(2):
+            page = paginator.get_page(2)
+            records = list(page)
+
+        assert [r.pk for r in records] == [self.sanctions_app.pk]
+
+    def _set_order_datetime(self, app, order_datetime):
+        app.order_datetime = order_datetime
+        app.save()
+
+        return app
+
+    def _create_mailshot(self, published_datetime):
+        template = Template.objects.get(template_code=Template.Codes.PUBLISH_MAILSHOT)
+
+        return Mailshot.objects.create(
+            title="Test Mailshot",
+            description="Test Desc",
+            status=Mailshot.Statuses.PUBLISHED,
+            is_email=True,
+            email_subject=template.template_title,
+            email_body=template.template_content,
+            created_by=self.ilb_admin_user,
+            is_to_importers=True,
+            reference="MAIL/1",
+            version=1,
+            published_datetime=published_datetime,
+        )
@@ -5,9 +5,9 @@ from django.utils import timezone
 from web.domains.case.services import case_progress
 from web.domains.case.shared import ImpExpStatus
 from web.domains.workbasket.app_data import (
-    _add_user_import_annotations,
     _get_open_case_emails_annotation,
     _get_open_firs_pk_annotation,
+    _get_user_import_annotations,
 )
 from web.domains.workbasket.base import WorkbasketSection
 from web.domains.workbasket.row import get_workbasket_row_func
@@ -355,7 +355,7 @@ def _test_view_endpoint_is_case_management(application, sections, view_label="Vi
 
 def _get_wood_app_with_annotations(app):
     """Return a WoodQuotaApplication instance with the correct workbasket annotations"""
-    app = _add_user_import_annotations(WoodQuotaApplication.objects.filter(pk=app.pk))
+    app = WoodQuotaApplication.objects.filter(pk=app.pk).annotate(**_get_user_import_annotations())
 
     open_fir_pks_annotation = _get_open_firs_pk_annotation("further_information_requests")
     app = app.annotate(
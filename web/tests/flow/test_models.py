@@ -1,7 +1,13 @@
 import pytest
 
-from web.flow.models import ProcessTypes
-from web.models import Process
+from web.flow.models import ProcessTypes, get_specific_models
+from web.models import (
+    CertificateOfFreeSaleApplication,
+    ImporterAccessRequest,
+    Process,
+    SILApplication,
+    WoodQuotaApplication,
+)
 
 
 @pytest.mark.django_db
@@ -12,6 +18,56 @@ def test_downcast_unknown():
         p.get_specific_model()
 
 
+def test_as_specific(
+    wood_app_submitted,
+    fa_sil_app_submitted,
+    cfs_app_submitted,
+    importer_access_request,
+    django_assert_num_queries,
+):
+    pks = [
+        fa_sil_app_submitted.pk,
+        importer_access_request.pk,
+        wood_app_submitted.pk,
+        cfs_app_submitted.pk,
+    ]
+    processes = list(Process.objects.filter(pk__in=pks).order_by("-pk"))
+
+    # One query per process_type
+    with django_assert_num_queries(4):
+        specific = get_specific_models(processes)
+
+    assert [p.pk for p in specific] == [p.pk for p in processes]
+    assert {type(p) for p in specific} == {
+        WoodQuotaApplication,
+        SILApplication,
+        CertificateOfFreeSaleApplication,
+        ImporterAccessRequest,
+    }
+
+    # The specific model is cached on the original process
+    with django_assert_num_queries(0):
+        assert [p.get_specific_model() for p in processes] == specific
+
+    # Processes that are already the specific model are returned as they are
+    with django_assert_num_queries(0):
+        assert get_specific_models(specific) == specific
+
+
+def test_as_specific_queryset(wood_app_submitted, fa_sil_app_submitted):
+    specific = Process.objects.filter(
+        pk__in=[wood_app_submitted.pk, fa_sil_app_submitted.pk]
+    ).order_by("pk")
+
+    assert specific.as_specific("importer") == [wood_app_submitted, fa_sil_app_submitted]
+
+
+@pytest.mark.django_db
+def test_as_specific_unknown():
+    with pytest.raises(NotImplementedError, match="Unknown process_type blaa"):
+        get_specific_models([Process(pk=1, process_type="blaa")])
+
+
 @pytest.mark.parametrize(
     "process_type,expected_label",
     [
@@ -1,8 +1,15 @@
+import io
+from http import HTTPStatus
+from typing import Any
+
+from botocore.response import StreamingBody
 from django.conf import settings
 from django.contrib.messages import get_messages
 from django.core import mail
+from django.db import connection
 from django.http import HttpResponse, HttpResponseRedirect
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -148,6 +155,22 @@ def get_messages_from_response(response: HttpResponseRedirect | HttpResponse) ->
     return [msg.message for msg in get_messages(response.wsgi_request)]
 
 
+def get_page_query_count(client: Client, url: str) -> int:
+    """Return the number of queries run to load a page.
+
+    The page is loaded once beforehand so per-process caches (e.g. the menu) are populated.
+    """
+
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+
+    assert response.status_code == HTTPStatus.OK
+
+    return len(ctx.captured_queries)
+
+
 class CaseURLS:
     """Collection of Case Urls for convenience when testing."""
 
@@ -1023,6 +1046,24 @@ class SearchURLS:
 
         return reverse("case:search-download-spreadsheet", kwargs=kwargs)
 
+    @staticmethod
+    def export_spreadsheet(case_type: str = "import") -> str:
+        kwargs = {"case_type": case_type}
+
+        return reverse("case:search-export-spreadsheet", kwargs=kwargs)
+
+    @staticmethod
+    def export_status(search_export_pk: int, case_type: str = "import") -> str:
+        kwargs = {"search_export_pk": search_export_pk, "case_type": case_type}
+
+        return reverse("case:search-export-status", kwargs=kwargs)
+
+    @staticmethod
+    def export_download(search_export_pk: int, case_type: str = "import") -> str:
+        kwargs = {"search_export_pk": search_export_pk, "case_type": case_type}
+
+        return reverse("case:search-export-download", kwargs=kwargs)
+
     @staticmethod
     def reopen_case(application_pk: int, case_type: str = "import") -> str:
         kwargs = {"application_pk": application_pk, "case_type": case_type}
@@ -1069,3 +1110,9 @@ class SearchURLS:
             "case:search-copy-export-app-to-cat",
             kwargs={"application_pk": application_pk, "case_type": "export"},
         )
+
+
+def get_s3_object_response(data: bytes) -> dict[str, Any]:
+    """Fake S3 get_object response, used to mock web.utils.s3.get_file_stream_from_s3."""
+
+    return {"Body": StreamingBody(io.BytesIO(data), len(data)), "ContentLength": len(data)}
@@ -3,15 +3,19 @@ from unittest import mock
 from django.contrib.sites.models import Site
 from django.test import override_settings
 
+from web.mail.backends import GovNotifyEmailBackend
 from web.mail.constants import EmailTypes
 from web.mail.emails import send_new_user_welcome_email
+from web.mail.messages import MailshotEmail
+from web.mail.types import RecipientDetails
 from web.models import Email, EmailTemplate
-from web.sites import SiteName
+from web.sites import SiteName, get_importer_site_domain
 
 
 @override_settings(EMAIL_BACKEND="web.mail.backends.GovNotifyEmailBackend")
+@mock.patch("web.mail.backends.group")
 @mock.patch("web.mail.backends.send_email", autospec=True)
-def test_verify_email_is_sent(mock_send_email, importer_one_contact, db):
+def test_verify_email_is_sent(mock_send_email, mock_group, importer_one_contact, db):
     # setup
     email = Email.objects.create(
         email="test-unverified-email@example.com",  # /PS-IGNORE
@@ -35,27 +39,50 @@ def test_verify_email_is_sent(mock_send_email, importer_one_contact, db):
     email.refresh_from_db()
     assert email.verified_reminder_count == 1
 
-    assert mock_send_email.apply_async.call_count == 2
+    assert mock_send_email.si.call_count == 2
+    assert mock_group.return_value.apply_async.call_count == 2
 
     expected_calls = [
         mock.call(
-            args=[
-                EmailTemplate.objects.get(
-                    name=EmailTypes.EMAIL_VERIFICATION
-                ).gov_notify_template_id,
-                # The personalisation of this email is tested elsewhere
-                mock.ANY,
-                importer_one_contact.email,
-            ]
+            EmailTemplate.objects.get(name=EmailTypes.EMAIL_VERIFICATION).gov_notify_template_id,
+            # The personalisation of this email is tested elsewhere
+            mock.ANY,
+            importer_one_contact.email,
         ),
         mock.call(
-            args=[
-                EmailTemplate.objects.get(name=EmailTypes.NEW_USER_WELCOME).gov_notify_template_id,
-                # The personalisation of this email is tested elsewhere
-                mock.ANY,
-                importer_one_contact.email,
-            ]
+            EmailTemplate.objects.get(name=EmailTypes.NEW_USER_WELCOME).gov_notify_template_id,
+            # The personalisation of this email is tested elsewhere
+            mock.ANY,
+            importer_one_contact.email,
         ),
     ]
 
-    mock_send_email.apply_async.assert_has_calls(expected_calls)
+    mock_send_email.si.assert_has_calls(expected_calls)
+
+
+@override_settings(
+    EMAIL_BACKEND="web.mail.backends.GovNotifyEmailBackend", MAIL_BULK_SEND_CHUNK_SIZE=2
+)
+@mock.patch("web.mail.backends.group")
+@mock.patch("web.mail.backends.send_email", autospec=True)
+def test_send_messages_in_chunks(
+    mock_send_email, mock_group, django_assert_num_queries, draft_mailshot
+):
+    template_id = EmailTemplate.objects.get(name=EmailTypes.MAILSHOT).gov_notify_template_id
+    messages = [
+        MailshotEmail(
+            mailshot=draft_mailshot,
+            site_domain=get_importer_site_domain(),
+            recipient=RecipientDetails(first_name="Test", email_address=f"user{i}@example.com"),
+            template_id=template_id,
+            service_name=SiteName.IMPORTER.label,
+        )
+        for i in range(5)
+    ]
+
+    # One query to load the verification state of every recipient.
+    with django_assert_num_queries(1):
+        GovNotifyEmailBackend().send_messages(messages)
+
+    assert mock_send_email.si.call_count == 5
+    assert [len(c.args[0]) for c in mock_group.call_args_list] == [2, 2, 1]
@@ -2,9 +2,12 @@ import pytest
 from django.test import override_settings
 
 from web.mail.recipients import (
+    get_email_addresses_for_mailshot,
     get_ilb_case_officers_email_addresses,
     get_organisation_contact_email_addresses,
 )
+from web.models import Importer
+from web.permissions import organisation_add_contact
 
 
 @pytest.mark.django_db
@@ -34,3 +37,30 @@ def test_get_ilb_case_officers_email_addresses_override_recipients():
 def test_get_importer_organisation_contact_email_addresses(importer, importer_one_contact):
     recipients = get_organisation_contact_email_addresses(importer)
     assert [recipient.email_address for recipient in recipients] == [importer_one_contact.email]
+
+
+@pytest.mark.django_db
+def test_get_email_addresses_for_mailshot(
+    django_assert_num_queries,
+    importer,
+    importer_two,
+    importer_one_contact,
+    importer_one_agent_one_contact,
+    importer_two_contact,
+):
+    # Contacts of several importers are only emailed once.
+    organisation_add_contact(importer_two, importer_one_contact)
+    importer.is_active = False
+    importer.save()
+
+    with django_assert_num_queries(1):
+        recipients = get_email_addresses_for_mailshot(Importer)
+
+    assert [recipient.email_address for recipient in recipients] == sorted(
+        [
+            importer_one_contact.email,
+            importer_one_agent_one_contact.email,
+            importer_two_contact.email,
+            "individual_importer_user@example.com",  # /PS-IGNORE
+        ]
+    )
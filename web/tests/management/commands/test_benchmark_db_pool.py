@@ -0,0 +1,22 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def test_benchmark_db_pool(db):
+    out = StringIO()
+
+    call_command(
+        "benchmark_db_pool",
+        "--clients=4",
+        "--requests=3",
+        "--queries=2",
+        "--pool-size=2",
+        stdout=out,
+    )
+
+    header, no_pool, pool = out.getvalue().splitlines()
+    assert header.split() == ["Mode", "Requests/s", "p50", "ms", "p95", "ms", "Wait", "ms"]
+    assert no_pool.startswith("no pool ")
+    assert no_pool.endswith(" -")
+    assert pool.startswith("pool ")
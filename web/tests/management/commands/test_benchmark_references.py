@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from web.models import ReferenceCounter, UniqueReference
+
+
+def test_benchmark_references(db):
+    out = StringIO()
+
+    call_command(
+        "benchmark_references",
+        "--workers=4",
+        "--allocations=3",
+        "--prefixes=2",
+        "--count=2",
+        "--hold-ms=0",
+        stdout=out,
+    )
+
+    output = out.getvalue().splitlines()
+    assert output[0] == "Mode: reference counter"
+    assert output[1] == "Workers: 4, prefixes: 2"
+    assert output[2].startswith("Allocated 24 references in ")
+    assert output[4] == "Unique and gap free: yes"
+
+    # The benchmark references are removed.
+    assert not UniqueReference.objects.filter(prefix__startswith="BENCH").exists()
+    assert not ReferenceCounter.objects.filter(prefix__startswith="BENCH").exists()
@@ -0,0 +1,26 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from web.models import CaseDocumentReference, User
+
+
+def test_benchmark_search(db):
+    user_count = User.objects.count()
+    out = StringIO()
+
+    call_command("benchmark_search", "--seed-rows=20", "--runs=1", "--pattern=GBSIL%", stdout=out)
+
+    output = out.getvalue().splitlines()
+    assert output[0] == "Adding 20 temporary rows"
+    assert [line.split()[:2] for line in output[2:]] == [
+        ["web_importapplication.reference", "GBSIL%"],
+        ["web_exportapplication.reference", "GBSIL%"],
+        ["web_casedocumentreference.reference", "GBSIL%"],
+        ["web_user.first_name", "GBSIL%"],
+        ["web_user.last_name", "GBSIL%"],
+    ]
+
+    # The temporary rows are removed.
+    assert User.objects.count() == user_count
+    assert not CaseDocumentReference.objects.filter(reference__startswith="GBSIL").exists()
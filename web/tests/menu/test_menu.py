@@ -0,0 +1,83 @@
+import pytest
+from django.test import RequestFactory
+from django.urls import reverse
+
+from web.menu import Menu
+from web.menu.menu import get_view_permission_check
+from web.permissions import organisation_add_contact
+
+
+@pytest.fixture
+def get_request():
+    def get_request(user, site):
+        request = RequestFactory().get("/")
+        request.user = user
+        request.site = site
+
+        return request
+
+    return get_request
+
+
+def test_menu_is_cached(ilb_admin_user, caseworker_site, get_request, django_assert_num_queries):
+    html = Menu().as_html(get_request(ilb_admin_user, caseworker_site))
+    assert "Workbasket" in html
+    assert "CHIEF Dashboard" in html
+
+    # A new request has a new user instance, without any cached permissions.
+    user = type(ilb_admin_user).objects.get(pk=ilb_admin_user.pk)
+
+    with django_assert_num_queries(0):
+        assert Menu().as_html(get_request(user, caseworker_site)) == html
+
+
+def test_menu_is_cached_per_user_and_site(
+    ilb_admin_user, importer_one_contact, caseworker_site, importer_site, get_request
+):
+    ilb_admin_html = Menu().as_html(get_request(ilb_admin_user, caseworker_site))
+    importer_html = Menu().as_html(get_request(importer_one_contact, importer_site))
+
+    assert "CHIEF Dashboard" in ilb_admin_html
+    assert "CHIEF Dashboard" not in importer_html
+    assert "New Import Application" in importer_html
+
+    # The ICMS admin link is only shown on the caseworker site.
+    ilb_admin_user.is_superuser = True
+    ilb_admin_user.save()
+
+    assert "Site Admin" in Menu().as_html(get_request(ilb_admin_user, caseworker_site))
+    assert "Site Admin" not in Menu().as_html(get_request(ilb_admin_user, importer_site))
+
+
+def test_menu_changes_with_the_user_permissions(
+    django_user_model, importer, importer_site, get_request
+):
+    user = django_user_model.objects.create_user(username="new-user")
+    assert "New Import Application" not in Menu().as_html(get_request(user, importer_site))
+
+    organisation_add_contact(importer, user)
+
+    # Reload the user to discard the permissions cached on the instance.
+    user = django_user_model.objects.get(pk=user.pk)
+    assert "New Import Application" in Menu().as_html(get_request(user, importer_site))
+
+
+def test_view_permission_check(ilb_admin_user, importer_one_contact, get_request, caseworker_site):
+    def get_check(view_name, view_kwargs=None):
+        view_url = reverse(view_name, kwargs=view_kwargs)
+
+        return get_view_permission_check(view_name, view_kwargs, view_url)
+
+    # View with permission_required
+    check = get_check("chief:pending-licences")
+    assert check(get_request(ilb_admin_user, caseworker_site))
+    assert not check(get_request(importer_one_contact, caseworker_site))
+
+    # View with a has_permission method
+    check = get_check("mailshot-received")
+    assert not check(get_request(ilb_admin_user, caseworker_site))
+    assert check(get_request(importer_one_contact, caseworker_site))
+
+    check = get_check("case:search", {"case_type": "export", "mode": "standard"})
+    assert check(get_request(ilb_admin_user, caseworker_site))
+    assert not check(get_request(importer_one_contact, caseworker_site))
@@ -1,8 +1,10 @@
 import pytest
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
 from guardian.shortcuts import remove_perm
 
 from web.flow.models import ProcessTypes
-from web.models import Constabulary, Report, User
+from web.models import Constabulary, Exporter, Importer, Report, User
 from web.permissions.perms import Perms
 from web.permissions.service import (
     AppChecker,
@@ -20,7 +22,9 @@ from web.permissions.service import (
     get_all_case_officers,
     get_case_officers_for_process_type,
     get_ilb_case_officers,
+    get_object_permission_snapshot,
     get_org_obj_permissions,
+    get_permissions_version,
     get_report_permission,
     get_report_type_for_permission,
     get_sanctions_case_officers,
@@ -420,6 +424,51 @@ class TestPermissionsService:
             ]
         )
 
+    def test_object_permission_snapshot(self, django_assert_num_queries):
+        user = User.objects.get(pk=self.importer_contact.pk)
+        ContentType.objects.get_for_models(Importer, Exporter, Constabulary)
+        # System permissions are cached by ModelBackend
+        assert user.has_perm(Perms.sys.importer_access)
+
+        # Every object permission is loaded with one query
+        with django_assert_num_queries(1):
+            snapshot = get_object_permission_snapshot(user)
+
+        # And checked without querying the database
+        with django_assert_num_queries(0):
+            assert user.has_perm(Perms.obj.importer.edit, self.importer)
+            assert not user.has_perm(Perms.obj.importer.edit, self.agent_importer)
+            assert not user.has_perm(Perms.obj.exporter.view, self.exporter)
+            assert AppChecker(user, self.fa_sil_app).can_edit()
+
+        assert get_object_permission_snapshot(user) is snapshot
+        assert snapshot.get_org_perms(Importer) == {
+            self.importer.pk: {
+                Perms.obj.importer.manage_contacts_and_agents.codename,
+                Perms.obj.importer.edit.codename,
+                Perms.obj.importer.view.codename,
+            }
+        }
+        assert snapshot.get_org_perms(Exporter) == {}
+
+    def test_object_permission_snapshot_cleared(self):
+        user = User.objects.get(pk=self.importer_contact.pk)
+        assert not user.has_perm(Perms.obj.exporter.view, self.exporter)
+
+        organisation_add_contact(self.exporter, user)
+        assert user.has_perm(Perms.obj.exporter.view, self.exporter)
+
+        organisation_remove_contact(self.exporter, user)
+        assert not user.has_perm(Perms.obj.exporter.view, self.exporter)
+
+    def test_object_permission_snapshot_constabulary(self):
+        user = User.objects.get(pk=self.importer_contact.pk)
+        constabulary = Constabulary.objects.first()
+        assert not user.has_perm(Perms.obj.constabulary.verified_fa_authority_editor, constabulary)
+
+        constabulary_add_contact(constabulary, user)
+        assert user.has_perm(Perms.obj.constabulary.verified_fa_authority_editor, constabulary)
+
     def test_get_user_importer_permissions(self):
         uop = get_user_importer_permissions(self.importer_contact)
 
@@ -683,3 +732,31 @@ def test__is_org_admin_raises(db):
     # Added for 100% test coverage
     with pytest.raises(ValueError, match=r"Unknown org "):
         is_user_org_admin(User.objects.first(), object())
+
+
+def test_get_permissions_version(ilb_admin_user, importer_one_contact, importer):
+    admin_version = get_permissions_version(ilb_admin_user)
+    contact_version = get_permissions_version(importer_one_contact)
+
+    assert get_permissions_version(ilb_admin_user) == admin_version
+    assert admin_version != contact_version
+
+    # Object permissions of one user
+    organisation_add_contact(importer, ilb_admin_user)
+
+    assert get_permissions_version(ilb_admin_user) != admin_version
+    assert get_permissions_version(importer_one_contact) == contact_version
+
+    # Groups of one user, from the group side
+    admin_version = get_permissions_version(ilb_admin_user)
+    Group.objects.get(name="Importer User").user_set.remove(ilb_admin_user)
+
+    assert get_permissions_version(ilb_admin_user) != admin_version
+    assert get_permissions_version(importer_one_contact) == contact_version
+
+    # Group permissions apply to every user
+    admin_version = get_permissions_version(ilb_admin_user)
+    Group.objects.get(name="Importer User").permissions.remove(Permission.objects.first())
+
+    assert get_permissions_version(ilb_admin_user) != admin_version
+    assert get_permissions_version(importer_one_contact) != contact_version
@@ -1,12 +1,17 @@
 import datetime as dt
+import io
 from unittest import mock
 
+import pytest
+import xlsxwriter
 from django.utils import timezone
 from freezegun import freeze_time
+from openpyxl import load_workbook
 
-from web.models import GeneratedReport
+from web.models import GeneratedReport, Report
 from web.reports import generate, interfaces
-from web.reports.constants import ReportStatus, UserDateFilterType
+from web.reports.constants import ReportStatus, ReportType
+from web.reports.serializers import ErrorSerializer
 
 
 @freeze_time("2024-01-01 12:00:00")
@@ -25,16 +30,11 @@ def test_generate_issued_certificate_report(mock_write_files, report_schedule):
 
 @freeze_time("2024-01-01 12:00:00")
 @mock.patch("web.reports.generate.write_files")
-def test_access_request_report(mock_write_files, report_schedule):
+def test_import_licence_report(mock_write_files, report_schedule):
     mock_write_files.return_value = None
-    generate.generate_access_request_report(report_schedule)
+    generate.generate_import_licence_report(report_schedule)
     mock_write_files.called_once_with(
-        [report_schedule],
-        [
-            interfaces.ImporterAccessRequestInterface(report_schedule),
-            interfaces.ExporterAccessRequestInterface(report_schedule),
-            interfaces.AccessRequestTotalsInterface(report_schedule),
-        ],
+        [report_schedule], [interfaces.ImportLicenceInterface(report_schedule)]
     )
     report_schedule.refresh_from_db()
     assert report_schedule.status == ReportStatus.COMPLETED
@@ -42,108 +42,192 @@ def test_access_request_report(mock_write_files, report_schedule):
     assert report_schedule.finished_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
 
 
-@freeze_time("2024-01-01 12:00:00")
-@mock.patch("web.reports.generate.write_files")
-def test_generate_firearms_licences_report(mock_write_files, report_schedule):
-    mock_write_files.return_value = None
-    generate.generate_firearms_licences_report(report_schedule)
-    mock_write_files.called_once_with(
-        [report_schedule],
-        [
-            interfaces.DFLFirearmsLicenceInterface(report_schedule),
-            interfaces.SILFirearmsLicenceInterface(report_schedule),
-            interfaces.OILFirearmsLicenceInterface(report_schedule),
-        ],
+@pytest.fixture
+def mock_write_file_data():
+    """Mock write_file_data and capture the contents of the uploaded files."""
+
+    files = {}
+
+    def write_file_data(scheduled_report, file_obj, file_name, content_type):
+        files[file_name] = file_obj.read()
+
+    with mock.patch(
+        "web.reports.generate.write_file_data", side_effect=write_file_data
+    ) as mock_write_file_data:
+        mock_write_file_data.files = files
+        yield mock_write_file_data
+
+
+def test_write_files(mock_write_file_data, report_schedule):
+    importer_report_interface = interfaces.ImporterAccessRequestInterface(report_schedule)
+    exporter_report_interface = interfaces.ExporterAccessRequestInterface(report_schedule)
+    has_errors = generate.write_files(
+        report_schedule, [importer_report_interface, exporter_report_interface]
     )
-    report_schedule.refresh_from_db()
-    assert report_schedule.status == ReportStatus.COMPLETED
-    assert report_schedule.started_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
-    assert report_schedule.finished_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
+    assert has_errors is False
+    assert mock_write_file_data.call_count == 3
+    assert [c.args[3] for c in mock_write_file_data.call_args_list] == [
+        "application/csv",
+        "application/csv",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ]
 
 
 @freeze_time("2024-01-01 12:00:00")
-@mock.patch("web.reports.generate.write_files")
-def test_generate_active_users_report(mock_write_files, report_schedule):
-    mock_write_files.return_value = None
-    report_schedule.parameters["date_filter_type"] = UserDateFilterType.DATE_JOINED
-    generate.generate_active_users_report(report_schedule)
-    mock_write_files.called_once_with(
-        [report_schedule],
-        [
-            interfaces.ActiveUserInterface(report_schedule),
-            interfaces.ActiveStaffUserInterface(report_schedule),
-            interfaces.RegisteredUserInterface(report_schedule),
-        ],
+def test_write_report_files(mock_write_file_data, report_schedule):
+    rows = [{"int": 1, "str": "test", "date": timezone.now()}, {"int": 2, "str": "£", "date": None}]
+    xlsx_file = io.BytesIO()
+
+    with xlsxwriter.Workbook(xlsx_file, generate.XLSX_OPTIONS) as workbook:
+        generate._write_report_files(
+            report_schedule, workbook, "Sheet 1", "test-file", iter(rows), ["int", "str", "date"]
+        )
+
+    assert mock_write_file_data.files == {
+        "test-file.csv": "int,str,date\r\n1,test,2024-01-01 12:00:00+00:00\r\n2,£,\r\n".encode()
+    }
+
+    xlsx_file.seek(0)
+    worksheet = load_workbook(xlsx_file).active
+    assert worksheet.title == "Sheet 1"
+    assert [[c.value for c in row] for row in worksheet.rows] == [
+        ["int", "str", "date"],
+        # Dates are written as Excel serial numbers, without a date format.
+        [1, "test", 45292.5],
+        [2, "£", None],
+    ]
+
+
+def test_write_files_with_errors(mock_write_file_data, report_schedule):
+    interface = interfaces.ImporterAccessRequestInterface(report_schedule)
+    interface.errors.append(
+        ErrorSerializer(
+            report_name=interface.name,
+            identifier="IAR/1",
+            error_type="Validation Error",
+            error_message="Error",
+            column="column",
+            value="value",
+        )
     )
-    report_schedule.refresh_from_db()
-    assert report_schedule.status == ReportStatus.COMPLETED
-    assert report_schedule.started_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
-    assert report_schedule.finished_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
 
+    assert generate.write_files(report_schedule, [interface]) is True
+    assert mock_write_file_data.call_count == 3
 
-@freeze_time("2024-01-01 12:00:00")
-@mock.patch("web.reports.generate.write_files")
-def test_import_licence_report(mock_write_files, report_schedule):
-    mock_write_files.return_value = None
-    generate.generate_import_licence_report(report_schedule)
-    mock_write_files.called_once_with(
-        [report_schedule], [interfaces.ImportLicenceInterface(report_schedule)]
+    error_file_name = f"{report_schedule.pk}_Issued_Certificates_Errors--test report.csv"
+    assert mock_write_file_data.files[error_file_name].decode().splitlines()[1] == (
+        "Importer Access Requests,IAR/1,Validation Error,Error,column,value"
     )
+
+
+@pytest.fixture
+def mock_s3_sheets():
+    """Store the partial workbooks written by write_report_sheet in memory."""
+
+    s3_files = {}
+
+    def upload_file_obj_to_s3(file_obj, path):
+        s3_files[path] = file_obj.read()
+        return len(s3_files[path])
+
+    def download_file_obj_from_s3(path, file_obj):
+        file_obj.write(s3_files[path])
+
+    def delete_file_from_s3(path, client):
+        del s3_files[path]
+
+    with (
+        mock.patch.object(generate, "upload_file_obj_to_s3", side_effect=upload_file_obj_to_s3),
+        mock.patch.object(
+            generate, "download_file_obj_from_s3", side_effect=download_file_obj_from_s3
+        ),
+        mock.patch.object(generate, "delete_file_from_s3", side_effect=delete_file_from_s3),
+        mock.patch.object(generate, "get_s3_client"),
+    ):
+        yield s3_files
+
+
+@freeze_time("2024-01-01 12:00:00")
+def test_start_multi_sheet_report(report_schedule):
+    report_schedule.report = Report.objects.get(report_type=ReportType.FIREARMS_LICENCES)
+    report_schedule.save()
+
+    assert generate.start_multi_sheet_report(report_schedule) == 3
+
     report_schedule.refresh_from_db()
-    assert report_schedule.status == ReportStatus.COMPLETED
+    assert report_schedule.status == ReportStatus.IN_PROGRESS
     assert report_schedule.started_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
-    assert report_schedule.finished_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
 
 
-@mock.patch("web.reports.generate._write_xlsx_file")
-@mock.patch("web.reports.generate._write_csv_file")
-def test_write_files(mock_write_csv, mock_write_xlsx, report_schedule):
-    mock_write_csv.return_value = None
-    mock_write_xlsx.return_value = None
-    importer_report_interface = interfaces.ImporterAccessRequestInterface(report_schedule)
-    exporter_report_interface = interfaces.ExporterAccessRequestInterface(report_schedule)
-    generate.write_files(report_schedule, [importer_report_interface, exporter_report_interface])
-    assert mock_write_csv.call_count == 2
-    assert mock_write_xlsx.call_count == 1
+def test_generate_report_sheet(mock_s3_sheets, mock_write_file_data, report_schedule):
+    report_schedule.report = Report.objects.get(report_type=ReportType.ACCESS_REQUESTS)
+    report_schedule.save()
 
+    path = generate.generate_report_sheet(report_schedule, 1)
 
-@freeze_time("2024-01-01 12:00:00")
-@mock.patch("web.reports.generate.write_file_data")
-def test_write_csv_file(mock_write_file_data, report_schedule):
-    mock_write_file_data.return_value = None
-    file_data = [{"int": 1, "str": "test", "date": timezone.now()}]
-    generate._write_csv_file(report_schedule, "test-file", file_data, ["int", "str", "date"])
-    assert mock_write_file_data.called is True
-    assert mock_write_file_data.call_args == mock.call(
-        report_schedule,
-        "int,str,date\r\n1,test,2024-01-01 12:00:00+00:00\r\n",
-        "test-file.csv",
-        "application/csv",
-    )
+    assert path == f"REPORTS/{report_schedule.report.pk}/sheets/{report_schedule.pk}-1.xlsx"
+    assert list(mock_s3_sheets) == [path]
+    assert list(mock_write_file_data.files) == [
+        f"{report_schedule.pk}_Exporter Access Requests--test report.csv"
+    ]
+
+    workbook = load_workbook(io.BytesIO(mock_s3_sheets[path]))
+    assert workbook.sheetnames == ["Exporter Access Requests"]
 
 
 @freeze_time("2024-01-01 12:00:00")
-@mock.patch("web.reports.generate.write_file_data")
-def test_write_xlsx_file(mock_write_file_data, report_schedule):
-    mock_write_file_data.return_value = None
-    file_data = [{"int": 1, "str": "test", "date": timezone.now()}]
-    sheet = generate._prepare_workbook_sheet("Sheet 1", file_data, ["int", "str", "date"])
-    sheet_2 = generate._prepare_workbook_sheet("Sheet 2", file_data, ["int", "str", "date"])
-    generate._write_xlsx_file(report_schedule, "test-file", [sheet, sheet_2])
-    assert mock_write_file_data.called is True
-    assert mock_write_file_data.call_args == mock.call(
-        report_schedule,
-        mock.ANY,
-        "test-file.xlsx",
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+def test_merge_report_sheets(mock_s3_sheets, mock_write_file_data, report_schedule):
+    report_schedule.report = Report.objects.get(report_type=ReportType.ACCESS_REQUESTS)
+    report_schedule.save()
+
+    importer_interface = interfaces.ImporterAccessRequestInterface(report_schedule)
+    importer_interface.errors.append(
+        ErrorSerializer(
+            report_name=importer_interface.name,
+            identifier="IAR/1",
+            error_type="Validation Error",
+            error_message="Error",
+            column="column",
+            value="value",
+        )
     )
+    generate.write_report_sheet(report_schedule, importer_interface, "sheets/0.xlsx")
+    sheet_paths = ["sheets/0.xlsx", generate.generate_report_sheet(report_schedule, 1)]
+
+    generate.end_multi_sheet_report(report_schedule, sheet_paths)
+
+    # The partial workbooks are removed once merged.
+    assert mock_s3_sheets == {}
+
+    xlsx_file_name = f"{report_schedule.pk}_Access_Requests--test report.xlsx"
+    error_file_name = f"{report_schedule.pk}_Access_Requests_Errors--test report.csv"
+    assert list(mock_write_file_data.files) == [
+        f"{report_schedule.pk}_Importer Access Requests--test report.csv",
+        f"{report_schedule.pk}_Exporter Access Requests--test report.csv",
+        error_file_name,
+        xlsx_file_name,
+    ]
+    assert mock_write_file_data.files[error_file_name].decode().splitlines()[1] == (
+        "Importer Access Requests,IAR/1,Validation Error,Error,column,value"
+    )
+
+    workbook = load_workbook(io.BytesIO(mock_write_file_data.files[xlsx_file_name]))
+    assert workbook.sheetnames == ["Importer Access Requests", "Exporter Access Requests", "Errors"]
+    assert [c.value for c in workbook["Importer Access Requests"][1]] == (
+        importer_interface.get_header()
+    )
+
+    report_schedule.refresh_from_db()
+    assert report_schedule.status == ReportStatus.COMPLETED
+    assert report_schedule.errors is True
+    assert report_schedule.finished_at == dt.datetime(2024, 1, 1, 12, 0, 0, tzinfo=dt.UTC)
 
 
-@mock.patch("web.reports.generate.put_object_in_s3")
-def test_write_file_data(mock_put_object, report_schedule):
-    mock_put_object.return_value = 1234
+@mock.patch("web.reports.generate.upload_file_obj_to_s3")
+def test_write_file_data(mock_upload_file_obj, report_schedule):
+    mock_upload_file_obj.return_value = 1234
     generated_report: GeneratedReport = generate.write_file_data(
-        report_schedule, "hello", "test-file.txt", "text/html"
+        report_schedule, io.BytesIO(b"hello"), "test-file.txt", "text/html"
     )
     report_schedule.refresh_from_db()
     assert generated_report.status == ReportStatus.COMPLETED
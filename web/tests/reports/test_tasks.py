@@ -3,15 +3,17 @@ from unittest import mock
 import pytest
 
 from web.models import Report
-from web.reports.constants import ReportType, UserDateFilterType
-from web.reports.tasks import generate_report_task
+from web.reports.constants import ReportStatus, ReportType, UserDateFilterType
+from web.reports.generate import MULTI_SHEET_REPORT_INTERFACES
+from web.reports.tasks import generate_report_task, multi_sheet_report_error_task
 
 
 def test_report_task(report_schedule):
     for report_type in ReportType:
+        if report_type in MULTI_SHEET_REPORT_INTERFACES:
+            continue
+
         report_schedule.report = Report.objects.get(report_type=report_type)
-        if report_type == ReportType.ACTIVE_USERS:
-            report_schedule.parameters["date_filter_type"] = UserDateFilterType.DATE_JOINED
         report_schedule.save()
         with mock.patch("web.reports.generate.write_files") as mock_write_files:
             mock_write_files.return_value = None
@@ -19,8 +21,79 @@ def test_report_task(report_schedule):
             mock_write_files.assert_called_once()
 
 
+@pytest.mark.parametrize("report_type", list(MULTI_SHEET_REPORT_INTERFACES))
+def test_multi_sheet_report_task(report_type, report_schedule):
+    report_schedule.report = Report.objects.get(report_type=report_type)
+    if report_type == ReportType.ACTIVE_USERS:
+        report_schedule.parameters["date_filter_type"] = UserDateFilterType.DATE_JOINED
+    report_schedule.save()
+
+    with (
+        mock.patch("web.reports.generate.write_report_sheet") as mock_write_report_sheet,
+        mock.patch("web.reports.generate.merge_report_sheets") as mock_merge_report_sheets,
+    ):
+        mock_merge_report_sheets.return_value = False
+        generate_report_task(report_schedule.pk)
+
+    interfaces = MULTI_SHEET_REPORT_INTERFACES[report_type]
+    assert [type(c.args[1]) for c in mock_write_report_sheet.call_args_list] == interfaces
+
+    # Every sheet is merged into a single workbook once generated.
+    mock_merge_report_sheets.assert_called_once()
+    sheet_paths = mock_merge_report_sheets.call_args.args[1]
+    assert sheet_paths == [c.args[2] for c in mock_write_report_sheet.call_args_list]
+
+    report_schedule.refresh_from_db()
+    assert report_schedule.status == ReportStatus.COMPLETED
+
+
 def test_report_task_unsupported(report_schedule):
     report_schedule.report.report_type = "REPORT1"
     report_schedule.report.save()
     with pytest.raises(ValueError, match="Unsupported Report Type"):
         generate_report_task(report_schedule.pk)
+
+
+def test_multi_sheet_report_task_error_callback(report_schedule):
+    report_schedule.report = Report.objects.get(report_type=ReportType.ACCESS_REQUESTS)
+    report_schedule.save()
+
+    with mock.patch("web.reports.tasks.chord") as mock_chord:
+        generate_report_task(report_schedule.pk)
+
+    # A failed sheet (or merge) fails the report rather than leaving it in progress.
+    callback = mock_chord.return_value.call_args.args[0]
+    assert callback.options["link_error"] == [
+        multi_sheet_report_error_task.s(scheduled_report_pk=report_schedule.pk)
+    ]
+
+
+def test_multi_sheet_report_error_task(report_schedule):
+    report_type = ReportType.ACCESS_REQUESTS
+    report_schedule.report = Report.objects.get(report_type=report_type)
+    report_schedule.status = ReportStatus.IN_PROGRESS
+    report_schedule.save()
+
+    with (
+        mock.patch("web.reports.generate.get_s3_client"),
+        mock.patch("web.reports.generate.delete_file_from_s3") as mock_delete_file_from_s3,
+        mock.patch("web.reports.tasks.capture_exception"),
+        mock.patch("web.reports.tasks.capture_message"),
+    ):
+        multi_sheet_report_error_task(
+            mock.Mock(id="task-id"),
+            Exception("Sheet failed"),
+            None,
+            scheduled_report_pk=report_schedule.pk,
+        )
+
+    # The partial workbook of every sheet is deleted.
+    sheet_count = len(MULTI_SHEET_REPORT_INTERFACES[report_type])
+    assert [c.args[0] for c in mock_delete_file_from_s3.call_args_list] == [
+        f"REPORTS/{report_schedule.report.pk}/sheets/{report_schedule.pk}-{i}.xlsx"
+        for i in range(sheet_count)
+    ]
+
+    report_schedule.refresh_from_db()
+    assert report_schedule.status == ReportStatus.FAILED
+    assert report_schedule.finished_at
@@ -11,7 +11,7 @@ from web.reports.constants import (
     UserDateFilterType,
 )
 from web.reports.models import Report, ScheduleReport
-from web.tests.helpers import CaseURLS
+from web.tests.helpers import CaseURLS, get_s3_object_response
 
 
 @pytest.fixture
@@ -297,12 +297,12 @@ def test_report_delete_view(ilb_admin_client, report_schedule):
     assert report_schedule.status == ReportStatus.DELETED
 
 
-@mock.patch("web.reports.views.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_download_report_view(
-    mock_get_file_from_s3, ilb_admin_client, report_schedule, ilb_admin_user
+    mock_get_file_stream_from_s3, ilb_admin_client, report_schedule, ilb_admin_user
 ):
     file_data = b"testdata"
-    mock_get_file_from_s3.return_value = file_data
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(file_data)
     document = File.objects.create(
         is_active=True,
         filename="test.csv",
@@ -319,6 +319,6 @@ def test_download_report_view(
         CaseURLS.download_report_view(report_schedule.report.pk, generated_report.pk)
     )
     assert response.status_code == 200
-    assert mock_get_file_from_s3.called is True
-    assert response.content == file_data
+    assert mock_get_file_stream_from_s3.called is True
+    assert response.getvalue() == file_data
     assert response.headers["Content-Disposition"] == 'attachment; filename="test.csv"'
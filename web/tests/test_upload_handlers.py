@@ -9,7 +9,7 @@ from freezegun import freeze_time
 from storages.backends.s3boto3 import S3Boto3StorageFile
 
 from web.models import File
-from web.tests.helpers import CaseURLS
+from web.tests.helpers import CaseURLS, get_s3_object_response
 
 
 class FakeClamAVResponse:
@@ -58,9 +58,9 @@ class FakeFile:
 @mock.patch("django_chunk_upload_handlers.s3.S3Boto3StorageFile")
 @mock.patch("django_chunk_upload_handlers.s3.boto3_client")
 @mock.patch("django_chunk_upload_handlers.clam_av.HTTPSConnection")
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_upload_virus_free_file(
-    mock_get_file_from_s3,
+    mock_get_file_stream_from_s3,
     mock_clam_av_connection,
     mock_boto_client,
     mock_boto_storage_file,
@@ -75,14 +75,14 @@ def test_upload_virus_free_file(
         HTTPStatus.OK, False
     )
     mock_clam_av_connection.return_value.connect.return_value = None
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
 
     app = completed_dfl_app_with_supplementary_report
     _upload_file(app, importer_client)
 
     assert mock_boto_client.call_count == 1
     assert mock_boto_storage_file.call_count == 1
-    assert mock_get_file_from_s3.call_count == 1
+    assert mock_get_file_stream_from_s3.call_count == 1
     assert mock_clam_av_connection.call_count == 1
     assert mock_delete_file_from_s3_from_s3.call_count == 0
 
@@ -109,9 +109,9 @@ def test_upload_virus_free_file(
 @mock.patch("django_chunk_upload_handlers.s3.S3Boto3StorageFile")
 @mock.patch("django_chunk_upload_handlers.s3.boto3_client")
 @mock.patch("django_chunk_upload_handlers.clam_av.HTTPSConnection")
-@mock.patch("web.domains.case.utils.get_file_from_s3")
+@mock.patch("web.domains.file.utils.get_file_stream_from_s3")
 def test_upload_file_with_virus(
-    mock_get_file_from_s3,
+    mock_get_file_stream_from_s3,
     mock_clam_av_connection,
     mock_boto_client,
     mock_boto_storage_file,
@@ -126,14 +126,14 @@ def test_upload_file_with_virus(
         HTTPStatus.OK, True
     )
     mock_clam_av_connection.return_value.connect.return_value = None
-    mock_get_file_from_s3.return_value = b"test_file"
+    mock_get_file_stream_from_s3.return_value = get_s3_object_response(b"test_file")
 
     app = completed_dfl_app_with_supplementary_report
     _upload_file_error(app, importer_client)
 
     assert mock_boto_client.call_count == 1
     assert mock_boto_storage_file.call_count == 0
-    assert mock_get_file_from_s3.call_count == 0
+    assert mock_get_file_stream_from_s3.call_count == 0
     assert mock_clam_av_connection.call_count == 1
     assert mock_delete_file_from_s3_from_s3.call_count == 1
 
@@ -0,0 +1,168 @@
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.test import override_settings
+from playwright.sync_api import Error
+
+from web.utils.pdf import browser_worker
+from web.utils.pdf.browser import BrowserPool
+from web.utils.pdf.exceptions import BrowserPoolTimeout
+
+# Runs the browser worker with a fake Chromium that renders every document as b"%PDF-".
+FAKE_WORKER = textwrap.dedent(
+    """
+    import runpy
+    import sys
+    import time
+    from unittest.mock import MagicMock, patch
+
+    from playwright.sync_api import Error
+
+    def set_content(html):
+        if "hang" in html:
+            time.sleep(60)
+
+        if "error" in html:
+            raise Error("Render failed")
+
+    browser = MagicMock()
+    page = browser.new_context.return_value.new_page.return_value
+    page.set_content.side_effect = set_content
+    page.pdf.return_value = b"%PDF-"
+
+    with patch("playwright.sync_api._generated.BrowserType.launch", return_value=browser):
+        runpy.run_path(sys.argv.pop(1), run_name="__main__")
+    """
+)
+
+
+def _get_fake_worker_args():
+    return [sys.executable, "-c", FAKE_WORKER, browser_worker.__file__, "500", "50"]
+
+
+@pytest.fixture(autouse=True)
+def fake_worker():
+    with patch("web.utils.pdf.browser._get_worker_args", _get_fake_worker_args):
+        yield
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool()
+
+    yield pool
+
+    pool.close()
+
+
+def test_browser_is_reused(pool):
+    assert pool.html_to_pdf("<html>one</html>") == b"%PDF-"
+    process = pool._process
+
+    assert pool.html_to_pdf("<html>two</html>") == b"%PDF-"
+    assert pool._process is process
+
+
+def test_render_error_is_raised(pool):
+    with pytest.raises(Error, match="Render failed"):
+        pool.html_to_pdf("<html>error</html>")
+
+    process = pool._process
+
+    assert pool.html_to_pdf("<html>test</html>") == b"%PDF-"
+    assert pool._process is process
+
+
+def test_exited_browser_is_restarted(pool):
+    pool.html_to_pdf("<html>one</html>")
+    process = pool._process
+    process.kill()
+    process.wait()
+
+    assert pool.html_to_pdf("<html>two</html>") == b"%PDF-"
+    assert pool._process is not process
+
+
+def test_browser_is_restarted_after_render_timeout(pool):
+    pool.html_to_pdf("<html>one</html>")
+    process = pool._process
+
+    with override_settings(PDF_BROWSER_RENDER_TIMEOUT=0.5):
+        with pytest.raises(BrowserPoolTimeout, match="Timed out rendering a PDF document."):
+            pool.html_to_pdf("<html>hang</html>")
+
+    assert process.poll() is not None
+    assert not pool._lock.locked()
+
+    assert pool.html_to_pdf("<html>two</html>") == b"%PDF-"
+    assert pool._process is not process
+
+
+@override_settings(PDF_BROWSER_ACQUIRE_TIMEOUT=0.01)
+def test_timeout_waiting_for_browser(pool):
+    pool._lock = MagicMock()
+    pool._lock.acquire.return_value = False
+
+    with pytest.raises(BrowserPoolTimeout, match="Timed out waiting for a PDF browser."):
+        pool.html_to_pdf("<html>test</html>")
+
+
+def test_browser_is_discarded_after_fork(pool):
+    pool.html_to_pdf("<html>test</html>")
+    process = pool._process
+
+    pool._after_fork()
+    pool.html_to_pdf("<html>test</html>")
+
+    assert pool._process is not process
+
+    process.kill()
+    process.wait()
+
+
+GEVENT_RENDER_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    from gevent import monkey
+
+    monkey.patch_all()
+
+    from unittest.mock import patch
+
+    import django
+    from django.conf import settings
+
+    settings.DATABASES["default"]["NAME"] = sys.argv[1]
+    django.setup()
+
+    from django.db import connection
+
+    from web.tests.utils.pdf.test_browser import _get_fake_worker_args
+    from web.utils.pdf.browser import browser_pool
+
+    with patch("web.utils.pdf.browser._get_worker_args", _get_fake_worker_args):
+        assert browser_pool.html_to_pdf("<html>test</html>") == b"%PDF-"
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    """
+)
+
+
+def test_database_can_be_used_after_render_in_gevent_worker(db):
+    """Gunicorn runs the web workers with gevent, rendering mustn't break the ORM."""
+
+    from django.db import connection
+
+    result = subprocess.run(
+        [sys.executable, "-c", GEVENT_RENDER_SCRIPT, connection.settings_dict["NAME"]],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
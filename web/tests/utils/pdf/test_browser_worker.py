@@ -0,0 +1,111 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from playwright.sync_api import Error
+
+from web.utils.pdf.browser_worker import (
+    REQUEST_HEADER,
+    RESPONSE_HEADER,
+    BrowserRenderer,
+    serve,
+)
+
+
+@pytest.fixture
+def mock_sync_playwright():
+    with patch("web.utils.pdf.browser_worker.sync_playwright") as mock_sync_playwright:
+        playwright = mock_sync_playwright.return_value.start.return_value
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+
+        page = browser.new_context.return_value.new_page.return_value
+        page.is_closed.return_value = False
+        page.pdf.return_value = b"%PDF-"
+
+        yield mock_sync_playwright
+
+
+def _get_browser(mock_sync_playwright):
+    return mock_sync_playwright.return_value.start.return_value.chromium.launch.return_value
+
+
+def test_browser_is_reused(mock_sync_playwright):
+    renderer = BrowserRenderer(max_renders=500, max_page_renders=50)
+
+    assert renderer.html_to_pdf("<html>one</html>") == b"%PDF-"
+    assert renderer.html_to_pdf("<html>two</html>") == b"%PDF-"
+
+    mock_sync_playwright.return_value.start.assert_called_once()
+    browser = _get_browser(mock_sync_playwright)
+    browser.new_context.assert_called_once()
+
+    page = browser.new_context.return_value.new_page.return_value
+    assert page.set_content.call_count == 2
+
+
+def test_disconnected_browser_is_restarted(mock_sync_playwright):
+    renderer = BrowserRenderer(max_renders=500, max_page_renders=50)
+    renderer.html_to_pdf("<html>one</html>")
+
+    browser = _get_browser(mock_sync_playwright)
+    browser.is_connected.return_value = False
+    renderer.html_to_pdf("<html>two</html>")
+
+    assert mock_sync_playwright.return_value.start.call_count == 2
+
+
+def test_render_is_retried_after_browser_crash(mock_sync_playwright):
+    browser = _get_browser(mock_sync_playwright)
+    page = browser.new_context.return_value.new_page.return_value
+    page.pdf.side_effect = [Error("Target page, context or browser has been closed"), b"%PDF-"]
+
+    renderer = BrowserRenderer(max_renders=500, max_page_renders=50)
+
+    assert renderer.html_to_pdf("<html>test</html>") == b"%PDF-"
+    assert mock_sync_playwright.return_value.start.call_count == 2
+    browser.close.assert_called_once()
+
+
+def test_render_error_is_raised_after_retry(mock_sync_playwright):
+    browser = _get_browser(mock_sync_playwright)
+    page = browser.new_context.return_value.new_page.return_value
+    page.pdf.side_effect = Error("Failed")
+
+    renderer = BrowserRenderer(max_renders=500, max_page_renders=50)
+
+    with pytest.raises(Error, match="Failed"):
+        renderer.html_to_pdf("<html>test</html>")
+
+    assert mock_sync_playwright.return_value.start.call_count == 2
+
+
+def test_page_and_browser_are_recycled(mock_sync_playwright):
+    renderer = BrowserRenderer(max_renders=3, max_page_renders=2)
+
+    for _ in range(3):
+        renderer.html_to_pdf("<html>test</html>")
+
+    browser = _get_browser(mock_sync_playwright)
+    assert browser.new_context.call_count == 2
+    assert mock_sync_playwright.return_value.start.call_count == 1
+
+    renderer.html_to_pdf("<html>test</html>")
+    assert mock_sync_playwright.return_value.start.call_count == 2
+
+
+def test_serve(mock_sync_playwright):
+    browser = _get_browser(mock_sync_playwright)
+    page = browser.new_context.return_value.new_page.return_value
+    page.pdf.side_effect = [b"%PDF-", Error("Failed"), Error("Failed")]
+
+    documents = [b"<html>one</html>", b"<html>two</html>"]
+    stdin = io.BytesIO(b"".join(REQUEST_HEADER.pack(len(d)) + d for d in documents))
+    stdout = io.BytesIO()
+
+    serve(stdin, stdout, BrowserRenderer(max_renders=500, max_page_renders=50))
+
+    assert stdout.getvalue() == (
+        RESPONSE_HEADER.pack(True, 5) + b"%PDF-" + RESPONSE_HEADER.pack(False, 6) + b"Failed"
+    )
+    page.set_content.assert_called_with("<html>two</html>")
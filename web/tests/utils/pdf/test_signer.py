@@ -12,10 +12,11 @@ from django.conf import settings
 from django.test import override_settings
 from endesive.pdf import verify
 
+from web.models import Signature
 from web.types import DocumentTypes
 from web.utils.pdf.exceptions import SignatureTextNotFound
 from web.utils.pdf.generator import PdfGenBase
-from web.utils.pdf.signer import sign_pdf
+from web.utils.pdf.signer import load_signing_key, sign_pdf, sign_pdfs
 
 
 def test_dummy_certificate_details():
@@ -104,3 +105,67 @@ def test_no_signature_placeholder(mock_get_document_html):
     PdfGenBase(doc_type=DocumentTypes.LICENCE_PREVIEW).get_pdf(target=target)
     with pytest.raises(SignatureTextNotFound):
         sign_pdf(target)
+
+
+@pytest.fixture()
+def mock_get_signature_file_bytes(dummy_signature_image):
+    image_file = io.BytesIO()
+    dummy_signature_image.save(image_file, "PNG")
+
+    with patch("web.utils.pdf.signer.get_signature_file_bytes") as mock_get_signature_file_bytes:
+        mock_get_signature_file_bytes.return_value = image_file.getvalue()
+        yield mock_get_signature_file_bytes
+
+
+@pytest.mark.django_db
+@patch(
+    "web.utils.pdf.signer.pkcs12.load_key_and_certificates", wraps=pkcs12.load_key_and_certificates
+)
+def test_signing_key_is_cached(mock_load_key_and_certificates, mock_get_signature_file_bytes):
+    signing_key = load_signing_key()
+
+    assert load_signing_key() == signing_key
+    mock_load_key_and_certificates.assert_called_once()
+    mock_get_signature_file_bytes.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_signature_image_reloaded_when_active_signature_changes(
+    active_signature, mock_get_signature_file_bytes
+):
+    signature_image = load_signing_key().signature_image
+
+    active_signature.is_active = False
+    active_signature.save()
+    new_signature = Signature.objects.create(
+        is_active=True,
+        filename="new_signature.png",
+        content_type="image/png",
+        file_size=100,
+        path="new_signature.png",
+        created_by=active_signature.created_by,
+        name="New Signature",
+        signatory="Test Signatory",
+        history="",
+    )
+
+    assert load_signing_key().signature_image is not signature_image
+    assert mock_get_signature_file_bytes.call_count == 2
+    mock_get_signature_file_bytes.assert_called_with(new_signature)
+
+
+@patch("web.utils.pdf.signer.load_signing_key", wraps=load_signing_key)
+@patch("web.utils.pdf.signer.get_active_signature_image")
+def test_sign_pdfs(
+    mock_get_active_signature_image, mock_load_signing_key, dummy_signature_image, dummy_pdf
+):
+    mock_get_active_signature_image.return_value = dummy_signature_image
+    targets = [io.BytesIO(dummy_pdf.getvalue()) for _ in range(3)]
+
+    signed_pdfs = list(sign_pdfs(targets))
+
+    assert len(signed_pdfs) == 3
+    mock_load_signing_key.assert_called_once()
+
+    for signed_pdf in signed_pdfs:
+        assert verify(signed_pdf.getvalue()) == [(True, True, False)]
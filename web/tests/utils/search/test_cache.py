@@ -0,0 +1,93 @@
+from unittest import mock
+
+import pytest
+
+from web.domains.case.shared import ImpExpStatus
+from web.models import Country, ImportApplication
+from web.permissions.service import organisation_remove_contact
+from web.utils.search import SearchTerms
+from web.utils.search.cache import get_search_ids_and_types, invalidate_search_results
+from web.utils.search.types import ProcessTypeAndPK
+
+
+@pytest.fixture
+def query():
+    return mock.Mock(return_value=[ProcessTypeAndPK(process_type="WoodQuotaApplication", pk=1)])
+
+
+def test_search_ids_are_cached(query, importer_one_contact):
+    terms = SearchTerms(case_type="import", case_ref="IMA/2024/%")
+
+    assert get_search_ids_and_types(terms, importer_one_contact, query) == query.return_value
+    assert get_search_ids_and_types(terms, importer_one_contact, query) == query.return_value
+
+    query.assert_called_once()
+
+
+def test_search_terms_are_normalised(query, importer_one_contact):
+    countries = Country.objects.order_by("pk")[:3]
+
+    get_search_ids_and_types(
+        SearchTerms(case_type="import", case_ref="ref", origin_country=countries),
+        importer_one_contact,
+        query,
+    )
+    get_search_ids_and_types(
+        SearchTerms(
+            case_type="import",
+            case_ref=" ref ",
+            origin_country=Country.objects.filter(pk__in=countries).order_by("-pk"),
+        ),
+        importer_one_contact,
+        query,
+    )
+
+    query.assert_called_once()
+
+
+def test_search_ids_are_cached_per_user_and_terms(query, importer_one_contact, ilb_admin_user):
+    terms = SearchTerms(case_type="import")
+
+    get_search_ids_and_types(terms, importer_one_contact, query)
+    get_search_ids_and_types(terms, ilb_admin_user, query)
+    get_search_ids_and_types(SearchTerms(case_type="export"), ilb_admin_user, query)
+
+    assert query.call_count == 3
+
+
+def test_permissions_change_invalidates_search_results(query, importer_one_contact, importer):
+    terms = SearchTerms(case_type="import")
+    get_search_ids_and_types(terms, importer_one_contact, query)
+
+    organisation_remove_contact(importer, importer_one_contact)
+    get_search_ids_and_types(terms, importer_one_contact, query)
+
+    assert query.call_count == 2
+
+
+def test_invalidate_search_results(query, importer_one_contact):
+    terms = SearchTerms(case_type="import")
+
+    get_search_ids_and_types(terms, importer_one_contact, query)
+    invalidate_search_results()
+    get_search_ids_and_types(terms, importer_one_contact, query)
+
+    assert query.call_count == 2
+
+
+def test_application_status_change_invalidates_search_results(
+    query, wood_app_submitted, importer_one_contact
+):
+    terms = SearchTerms(case_type="import")
+    get_search_ids_and_types(terms, importer_one_contact, query)
+
+    # Saving an application without changing the status keeps the cached results.
+    app = ImportApplication.objects.get(pk=wood_app_submitted.pk).get_specific_model()
+    app.save()
+    get_search_ids_and_types(terms, importer_one_contact, query)
+    assert query.call_count == 1
+
+    app.status = ImpExpStatus.PROCESSING
+    app.save()
+    get_search_ids_and_types(terms, importer_one_contact, query)
+    assert query.call_count == 2
@@ -2,6 +2,8 @@ import datetime as dt
 import io
 
 import pytest
+from django.db.models import Q
+from django.test import override_settings
 from django.urls import reverse
 from django.utils.timezone import make_aware
 from openpyxl import load_workbook
@@ -29,8 +31,10 @@ from web.tests.helpers import CaseURLS
 from web.utils.search import (
     SearchTerms,
     get_search_results_spreadsheet,
+    get_wildcard_filter,
     search_applications,
     types,
+    write_search_results_spreadsheet,
 )
 
 from .conftest import (
@@ -766,6 +770,44 @@ def test_get_export_search_results_spreadsheet(exporter_one_fixture_data: Export
     assert case_refs == [com.reference, cfs.reference, gmp.reference]
 
 
+@override_settings(SEARCH_EXPORT_BATCH_SIZE=2)
+def test_write_search_results_spreadsheet(importer_one_fixture_data):
+    Build.wood_application("Wood ref 1", importer_one_fixture_data)
+    Build.wood_application("Wood ref 2", importer_one_fixture_data)
+    Build.textiles_application("Textiles ref 1", importer_one_fixture_data)
+    Build.opt_application("Opt ref 1", importer_one_fixture_data)
+    Build.fa_dfl_application("fa-dfl ref 1", importer_one_fixture_data)
+
+    search_terms = SearchTerms(case_type="import")
+    progress = []
+    xlsx_file = io.BytesIO()
+
+    total_rows = write_search_results_spreadsheet(
+        search_terms,
+        importer_one_fixture_data.ilb_admin_user,
+        xlsx_file,
+        lambda processed, total: progress.append((processed, total)),
+    )
+
+    assert total_rows == 5
+    assert progress == [(0, 5), (2, 5), (4, 5), (5, 5)]
+
+    workbook = load_workbook(filename=io.BytesIO(xlsx_file.getvalue()))
+    sheet = workbook["Sheet 1"]
+
+    assert sheet.max_column == 19
+
+    # Rows are in the same order as the search results, across every batch.
+    applicant_refs = [row_data[1] for row_data in sheet.iter_rows(min_row=2, values_only=True)]
+    assert applicant_refs == [
+        "fa-dfl ref 1",
+        "Opt ref 1",
+        "Textiles ref 1",
+        "Wood ref 2",
+        "Wood ref 1",
+    ]
+
+
 def test_case_statuses(importer_one_fixture_data):
     st = ImpExpStatus
     Build.wood_application("completed", importer_one_fixture_data, override_status=st.COMPLETED)
@@ -1045,6 +1087,22 @@ def test_wildcard_search(importer_one_fixture_data, case_ref_pattern, should_mat
         assert results.total_rows == 0
 
 
+@pytest.mark.parametrize(
+    ["search_pattern", "expected"],
+    [
+        ("%", Q()),
+        ("IMA/2024", Q(reference__istartswith="IMA/2024")),
+        ("ima/2024/%", Q(reference__istartswith="ima/2024/")),
+        ("IMA%0001", Q(reference__ilike="IMA%0001%")),
+        ("%0001", Q(reference__ilike="%0001%")),
+        ("IMA_2024%", Q(reference__ilike="IMA_2024%")),
+        ("IMA%%", Q(reference__ilike="IMA%%")),
+    ],
+)
+def test_get_wildcard_filter(search_pattern, expected):
+    assert get_wildcard_filter("reference", search_pattern) == expected
+
+
 def test_case_reference_wildcard_any(
     importer_one_fixture_data: FixtureData,
     exporter_one_fixture_data: ExportFixtureData,
@@ -0,0 +1,27 @@
+from web.utils.cache import bump_version, get_version
+
+
+def test_get_version(db):
+    version = get_version("test:version")
+
+    assert get_version("test:version") == version
+    assert (
+        get_version("test:version", "test:version:1")
+        == f"{version}:{get_version('test:version:1')}"
+    )
+
+
+def test_bump_version(db, django_capture_on_commit_callbacks):
+    version_1 = get_version("test:version:1")
+    version_2 = get_version("test:version:2")
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        bump_version("test:version:1")
+
+        bumped_version = get_version("test:version:1")
+        assert bumped_version != version_1
+
+    # The version is changed again once the transaction commits.
+    assert len(callbacks) == 1
+    assert get_version("test:version:1") != bumped_version
+    assert get_version("test:version:2") == version_2
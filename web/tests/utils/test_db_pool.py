@@ -0,0 +1,63 @@
+import json
+import logging
+from unittest import mock
+
+import pytest
+from django.db import connection
+
+from web.utils import db_pool
+
+
+@pytest.fixture
+def pool():
+    with mock.patch.object(db_pool, "connection") as mock_connection:
+        yield mock_connection.pool
+
+
+def test_get_pool_stats_without_pool():
+    assert db_pool.get_pool_stats() is None
+
+
+def test_get_pool_stats(pool):
+    pool.pop_stats.return_value = {"pool_size": 4, "requests_num": 4, "requests_wait_ms": 10}
+
+    assert db_pool.get_pool_stats() == {
+        "pool_size": 4,
+        "requests_num": 4,
+        "requests_wait_ms": 10,
+        "requests_wait_ms_avg": 2,
+    }
+
+
+def test_log_pool_stats(pool, caplog):
+    caplog.set_level(logging.INFO, logger=db_pool.__name__)
+    pool.pop_stats.return_value = {"pool_size": 4}
+
+    db_pool.log_pool_stats()
+
+    (record,) = caplog.records
+    message = record.getMessage()
+    assert message.startswith("Database pool stats: ")
+    assert json.loads(message.removeprefix("Database pool stats: ")) == {"pool_size": 4}
+
+
+def test_start_pool_stats_logger_without_pool():
+    with mock.patch.object(db_pool.threading, "Thread") as thread:
+        db_pool.start_pool_stats_logger()
+
+    thread.assert_not_called()
+
+
+def test_start_pool_stats_logger():
+    settings_dict = connection.settings_dict | {"OPTIONS": {"pool": {"max_size": 4}}}
+
+    with (
+        mock.patch.object(connection, "settings_dict", settings_dict),
+        mock.patch.object(db_pool.threading, "Thread") as thread,
+    ):
+        db_pool.start_pool_stats_logger()
+
+    thread.assert_called_once_with(
+        target=db_pool._log_pool_stats_forever, name="db-pool-stats", daemon=True
+    )
+    thread.return_value.start.assert_called_once()
@@ -0,0 +1,179 @@
+import json
+import logging
+from unittest import mock
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+
+from web.middleware.common import RequestInstrumentationMiddleware
+from web.models import Country
+from web.utils import instrumentation
+
+
+@pytest.fixture
+def instrumentation_settings(settings):
+    settings.REQUEST_INSTRUMENTATION_ENABLED = True
+    settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE = 0
+    settings.REQUEST_INSTRUMENTATION_SLOW_REQUEST_MS = 60_000
+    settings.REQUEST_INSTRUMENTATION_QUERY_COUNT_THRESHOLD = 100
+    settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 3
+
+    return settings
+
+
+def test_collect_metrics(db):
+    with instrumentation.collect_metrics() as metrics:
+        for country in Country.objects.order_by("pk")[:3]:
+            Country.objects.get(pk=country.pk)
+
+        with instrumentation.track_external_call("http"):
+            pass
+
+        instrumentation.record_external_call("s3", 0.5)
+
+    assert metrics.query_count == 4
+    assert metrics.query_time > 0
+    assert list(metrics.get_duplicate_queries(3).values()) == [3]
+    assert metrics.get_duplicate_queries(4) == {}
+    assert metrics.external_call_count == {"http": 1, "s3": 1}
+    assert metrics.external_call_time["s3"] == 0.5
+
+    # Nothing is recorded outside of collect_metrics
+    Country.objects.first()
+    instrumentation.record_external_call("s3", 0.5)
+
+    assert metrics.query_count == 4
+    assert metrics.external_call_count["s3"] == 1
+
+
+def test_template_render_time():
+    with mock.patch.object(instrumentation.time, "perf_counter", side_effect=[1.0, 1.25]):
+        with instrumentation.collect_metrics() as metrics:
+            with instrumentation.track_template_render():
+                # Nested renders are included in the outer render time.
+                with instrumentation.track_template_render():
+                    pass
+
+    assert metrics.template_time == 0.25
+    assert not metrics.rendering_template
+
+
+def test_instrumented_template():
+    template = instrumentation.InstrumentedTemplate("{{ value }}")
+
+    with instrumentation.collect_metrics() as metrics:
+        assert template.render(value="a") == "a"
+
+    assert metrics.template_time > 0
+
+
+class TestRequestInstrumentationMiddleware:
+    @pytest.fixture(autouse=True)
+    def _setup(self, db, instrumentation_settings, caplog):
+        self.settings = instrumentation_settings
+        self.caplog = caplog
+        self.caplog.set_level(logging.INFO, logger=instrumentation.__name__)
+
+        self.request = RequestFactory().get("/workbasket/")
+        self.request.resolver_match = resolve("/workbasket/")
+
+    def get_response(self, request):
+        for country in Country.objects.order_by("pk")[:3]:
+            Country.objects.get(pk=country.pk)
+
+        return HttpResponse("OK")
+
+    def get_events(self):
+        return [
+            json.loads(r.getMessage().removeprefix("Request metrics: "))
+            for r in self.caplog.records
+            if r.name == instrumentation.__name__
+        ]
+
+    def test_disabled(self):
+        self.settings.REQUEST_INSTRUMENTATION_ENABLED = False
+
+        with pytest.raises(MiddlewareNotUsed):
+            RequestInstrumentationMiddleware(self.get_response)
+
+    def test_duplicate_queries_are_logged(self):
+        response = RequestInstrumentationMiddleware(self.get_response)(self.request)
+        assert response.status_code == 200
+
+        (event,) = self.get_events()
+
+        assert event["view"] == "workbasket"
+        assert event["method"] == "GET"
+        assert event["status_code"] == 200
+        assert event["reasons"] == ["duplicate_queries"]
+        assert event["query_count"] == 4
+        assert len(event["duplicate_queries"]) == 1
+        assert event["duplicate_queries"][0]["count"] == 3
+        assert event["duplicate_queries"][0]["sql"].startswith("SELECT")
+        assert event["s3_calls"] == 0
+        assert event["http_calls"] == 0
+
+    def test_requests_under_the_thresholds_are_sampled(self):
+        self.settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 10
+
+        RequestInstrumentationMiddleware(self.get_response)(self.request)
+        assert self.get_events() == []
+
+        self.settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE = 1
+
+        RequestInstrumentationMiddleware(self.get_response)(self.request)
+        (event,) = self.get_events()
+        assert event["reasons"] == ["sampled"]
+
+    def test_slow_requests_are_logged(self):
+        self.settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 10
+        self.settings.REQUEST_INSTRUMENTATION_SLOW_REQUEST_MS = 0
+        self.settings.REQUEST_INSTRUMENTATION_QUERY_COUNT_THRESHOLD = 4
+
+        RequestInstrumentationMiddleware(self.get_response)(self.request)
+
+        (event,) = self.get_events()
+        assert event["reasons"] == ["slow", "query_count"]
+
+    def test_streaming_response_body_is_included(self):
+        self.settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 10
+        self.settings.REQUEST_INSTRUMENTATION_QUERY_COUNT_THRESHOLD = 4
+
+        def stream():
+            for country in Country.objects.order_by("pk")[:3]:
+                yield Country.objects.get(pk=country.pk).name
+
+        response = RequestInstrumentationMiddleware(lambda r: StreamingHttpResponse(stream()))(
+            self.request
+        )
+
+        # The metrics are reported once the body has been sent.
+        assert self.get_events() == []
+        assert len(list(response.streaming_content)) == 3
+
+        (event,) = self.get_events()
+        assert event["reasons"] == ["query_count"]
+        assert event["query_count"] == 4
+
+    def test_metrics_are_recorded(self):
+        self.settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD = 10
+
+        with (
+            mock.patch.object(instrumentation, "request_duration") as request_duration,
+            mock.patch.object(instrumentation, "request_query_count") as request_query_count,
+            mock.patch.object(
+                instrumentation, "duplicate_query_requests"
+            ) as duplicate_query_requests,
+        ):
+            RequestInstrumentationMiddleware(self.get_response)(self.request)
+
+        # Every request is recorded, whether or not it is logged.
+        assert self.get_events() == []
+
+        attributes = {"view": "workbasket", "method": "GET", "status_code": 200}
+        request_duration.record.assert_called_once_with(mock.ANY, attributes)
+        request_query_count.record.assert_called_once_with(4, attributes)
+        duplicate_query_requests.add.assert_not_called()
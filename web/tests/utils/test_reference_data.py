@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pytest
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+
+from web.domains.country.types import CountryGroupName
+from web.mail.constants import EmailTypes
+from web.models import Country, CountryGroup, EmailTemplate, ExportApplicationType
+from web.sites import SiteName, get_exporter_site_domain
+from web.utils import reference_data
+from web.utils.reference_data import (
+    REFERENCE_DATA_VERSION_KEY,
+    get_country_group_country_pks,
+    get_email_template_id,
+    get_export_application_type,
+)
+
+
+def test_reference_data_is_cached(db, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        template_id = get_email_template_id(EmailTypes.ACCESS_REQUEST_CLOSED)
+        assert get_email_template_id(EmailTypes.ACCESS_REQUEST_CLOSED) == template_id
+        assert get_email_template_id(EmailTypes.APPLICATION_COMPLETE) != template_id
+
+    assert (
+        template_id
+        == EmailTemplate.objects.get(name=EmailTypes.ACCESS_REQUEST_CLOSED).gov_notify_template_id
+    )
+
+    with pytest.raises(EmailTemplate.DoesNotExist):
+        get_email_template_id("unknown")
+
+
+def test_saving_reference_data_invalidates_the_cache(db, django_assert_num_queries):
+    version = cache.get_or_set(REFERENCE_DATA_VERSION_KEY, "initial", timeout=None)
+    assert get_exporter_site_domain() == "http://export-a-certificate"
+
+    site = Site.objects.get(name=SiteName.EXPORTER)
+    site.domain = "export.example.com"  # /PS-IGNORE
+    site.save()
+
+    assert cache.get(REFERENCE_DATA_VERSION_KEY) != version
+    assert get_exporter_site_domain() == "http://export.example.com"  # /PS-IGNORE
+
+    # The change hasn't been committed so the reference data isn't cached.
+    with django_assert_num_queries(2):
+        get_exporter_site_domain()
+        get_exporter_site_domain()
+
+    # Reference data is cached again once the transaction has finished.
+    with mock.patch.object(connection, "in_atomic_block", False):
+        with django_assert_num_queries(1):
+            get_exporter_site_domain()
+            get_exporter_site_domain()
+
+
+def test_changing_many_to_many_invalidates_the_cache(db):
+    group = CountryGroup.objects.get(name=CountryGroupName.EU)
+    country = Country.objects.filter(is_active=True).exclude(country_groups=group).first()
+
+    assert country.pk not in get_country_group_country_pks(CountryGroupName.EU)
+
+    version = cache.get(REFERENCE_DATA_VERSION_KEY)
+    group.countries.add(country)
+
+    assert cache.get(REFERENCE_DATA_VERSION_KEY) != version
+    assert country.pk in get_country_group_country_pks(CountryGroupName.EU)
+
+
+def test_other_worker_invalidates_the_cache(db, settings, django_assert_num_queries):
+    settings.REFERENCE_DATA_VERSION_CHECK_INTERVAL = 60
+    get_exporter_site_domain()
+
+    # Another worker saves a Site.
+    cache.set(REFERENCE_DATA_VERSION_KEY, "other", timeout=None)
+
+    # The version isn't checked again until the check interval has passed.
+    with django_assert_num_queries(0):
+        get_exporter_site_domain()
+
+    after_interval = reference_data.time.monotonic() + 61
+
+    with (
+        mock.patch.object(reference_data.time, "monotonic", return_value=after_interval),
+        django_assert_num_queries(1),
+    ):
+        get_exporter_site_domain()
+        get_exporter_site_domain()
+
+
+def test_value_loaded_during_version_change_is_not_cached(db):
+    data_cache = reference_data.reference_data
+    data_cache.get("other", lambda: "other")
+
+    def load():
+        # Another greenlet sees a new version while this value is being loaded.
+        cache.set(REFERENCE_DATA_VERSION_KEY, "new", timeout=None)
+        data_cache._expire_version_check()
+        data_cache.get("other", lambda: "other")
+
+        return "stale"
+
+    assert data_cache.get("value", load) == "stale"
+    assert data_cache.get("value", lambda: "current") == "current"
+
+
+def test_get_export_application_type_returns_a_copy(db):
+    application_type = get_export_application_type(ExportApplicationType.Types.GMP)
+    application_type.type = "Changed"
+
+    assert get_export_application_type(ExportApplicationType.Types.GMP).type != "Changed"
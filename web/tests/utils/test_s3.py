@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 
@@ -9,12 +10,83 @@ from web.utils import s3 as s3_web
 @override_settings(AWS_STORAGE_BUCKET_NAME="Fake-Bucket")
 def test_upload_file_obj():
     fake_file = SimpleUploadedFile("test_file.txt", b"file_content")
+    fake_client = MagicMock()
+    actual_content_length = s3_web.upload_file_obj_to_s3(fake_file, "test_file.txt", fake_client)
+    assert actual_content_length == 12
+    fake_client.upload_fileobj.assert_called_with(
+        fake_file, Bucket="Fake-Bucket", Key="test_file.txt"
+    )
+    fake_client.head_object.assert_not_called()
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="Fake-Bucket")
+def test_upload_file_obj_not_seekable():
+    fake_file = MagicMock(seekable=MagicMock(return_value=False))
     fake_client = MagicMock(
         head_object=MagicMock(return_value={"ContentLength": 44444}),
     )
     actual_content_length = s3_web.upload_file_obj_to_s3(fake_file, "test_file.txt", fake_client)
     assert actual_content_length == 44444
-    fake_client.upload_fileobj.assert_called_with(
-        fake_file, Bucket="Fake-Bucket", Key="test_file.txt"
-    )
     fake_client.head_object.assert_called_with(Bucket="Fake-Bucket", Key="test_file.txt")
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="Fake-Bucket")
+def test_put_object_in_s3():
+    fake_client = MagicMock()
+    actual_content_length = s3_web.put_object_in_s3("£10", "test_file.txt", fake_client)
+    assert actual_content_length == 4
+    fake_client.put_object.assert_called_with(
+        Body="£10".encode(), Bucket="Fake-Bucket", Key="test_file.txt"
+    )
+    fake_client.head_object.assert_not_called()
+
+
+class TestS3ClientRegistry:
+    @pytest.fixture(autouse=True)
+    def setup(self, settings):
+        settings.AWS_REGION = "eu-west-2"
+        self.registry = s3_web.S3ClientRegistry()
+
+    def test_client_is_reused(self):
+        client = self.registry.get_client()
+
+        assert self.registry.get_client() is client
+        assert client.meta.config.max_pool_connections == 20
+        assert client.meta.config.tcp_keepalive is True
+
+    def test_client_per_settings(self):
+        client = self.registry.get_client()
+
+        with override_settings(AWS_S3_ENDPOINT_URL="http://localhost:4566/"):
+            other_client = self.registry.get_client()
+            assert other_client is not client
+            assert other_client.meta.endpoint_url == "http://localhost:4566/"
+
+        assert self.registry.get_client() is client
+
+    def test_client_is_discarded_after_fork(self):
+        client = self.registry.get_client()
+
+        self.registry._after_fork()
+
+        assert self.registry.get_client() is not client
+
+    def test_clear(self):
+        client = self.registry.get_client()
+
+        self.registry.clear()
+
+        assert self.registry.get_client() is not client
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="Fake-Bucket")
+def test_get_file_stream_from_s3():
+    fake_client = MagicMock()
+
+    s3_web.get_file_stream_from_s3("test_file.txt", client=fake_client)
+    fake_client.get_object.assert_called_with(Bucket="Fake-Bucket", Key="test_file.txt")
+
+    s3_web.get_file_stream_from_s3("test_file.txt", "bytes=0-9", client=fake_client)
+    fake_client.get_object.assert_called_with(
+        Bucket="Fake-Bucket", Key="test_file.txt", Range="bytes=0-9"
+    )
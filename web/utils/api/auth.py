@@ -8,13 +8,14 @@ import requests
 from django.conf import settings
 from django.core import exceptions
 from django.core.cache import cache
-from django.http import HttpRequest, JsonResponse
+from django.http import HttpRequest, HttpResponseBase, JsonResponse
 from django.utils import timezone
 from django.utils.crypto import constant_time_compare
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from mohawk.util import parse_authorization_header, prepare_header_val
 
+from web.utils.instrumentation import track_external_call
 from web.utils.sentry import capture_exception
 
 HTTPMethod = Literal["GET", "OPTIONS", "HEAD", "POST", "PUT", "PATCH", "DELETE"]
@@ -141,7 +142,8 @@ def make_hawk_request(
     prepped.headers["Hawk-Authentication"] = hawk_sender.request_header
 
     session = requests.Session()
-    response = session.send(prepped)
+    with track_external_call("http"):
+        response = session.send(prepped)
 
     return hawk_sender, response
 
@@ -177,13 +179,19 @@ class HawkAuthMixin:
         return response
 
     def _get_hawk_response_header(
-        self, hawk_receiver: mohawk.Receiver, response: JsonResponse
+        self, hawk_receiver: mohawk.Receiver, response: HttpResponseBase
     ) -> str:
         sender_nonce = hawk_receiver.parsed_header.get("nonce")
 
-        hawk_response_header = hawk_receiver.respond(
-            content=response.content, content_type=response.headers["Content-type"]
-        )
+        if response.streaming:
+            # The content of a streamed response isn't known until it has been sent.
+            hawk_response_header = hawk_receiver.respond(
+                content_type=response.headers["Content-type"], always_hash_content=False
+            )
+        else:
+            hawk_response_header = hawk_receiver.respond(
+                content=response.content, content_type=response.headers["Content-type"]
+            )
 
         # Add the original sender nonce and ts to get around this bug
         # https://github.com/kumar303/mohawk/issues/50
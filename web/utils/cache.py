@@ -0,0 +1,40 @@
+"""Version keys used to invalidate cached values.
+
+Values are cached with the version of the data they depend on, so changing the version makes
+every value cached with the previous version stale without having to find and delete them.
+"""
+
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_version(*keys: str) -> str:
+    """Return the combined version stored in the supplied keys, setting any that are missing."""
+
+    versions = cache.get_many(keys)
+
+    if missing := {key: _new_version() for key in keys if key not in versions}:
+        cache.set_many(missing, timeout=None)
+        versions |= missing
+
+    return ":".join(versions[key] for key in keys)
+
+
+def bump_version(*keys: str) -> None:
+    """Change the version stored in the supplied keys.
+
+    The version is changed again once the current transaction commits, in case a value was
+    cached by another request before the change was visible to it.
+    """
+
+    def set_versions() -> None:
+        cache.set_many({key: _new_version() for key in keys}, timeout=None)
+
+    set_versions()
+    transaction.on_commit(set_versions)
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex
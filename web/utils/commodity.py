@@ -7,6 +7,7 @@ from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from web.models import Commodity, CommodityGroup, Country, Unit, Usage
+from web.utils.reference_data import reference_data
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -18,12 +19,20 @@ class CommodityGroupData(TypedDict):
 
 
 def get_usage_records(app_type: str, app_sub_type: str | None = None) -> "QuerySet[Usage]":
-    """Gets all Usage records for the supplied application type / subtype"""
+    """Gets all Usage records for the supplied application type / subtype.
 
-    usage_records = Usage.objects.all()
-    usage_records = add_usage_filter(usage_records, app_type, app_sub_type)
+    The pks of the records valid today are cached as reference data.
+    """
+
+    def load() -> list[int]:
+        usage_records = add_usage_filter(Usage.objects.all(), app_type, app_sub_type)
+
+        return list(usage_records.values_list("pk", flat=True).distinct())
+
+    today = timezone.now().date()
+    usage_pks = reference_data.get(f"usage_record_pks:{app_type}:{app_sub_type}:{today}", load)
 
-    return usage_records.distinct()
+    return Usage.objects.filter(pk__in=usage_pks)
 
 
 def add_usage_filter(
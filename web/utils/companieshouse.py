@@ -7,6 +7,7 @@ import requests
 from django.conf import settings
 
 from web.errors import APIError, CompanyNotFound
+from web.utils.instrumentation import track_external_call
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,8 @@ logger = logging.getLogger(__name__)
 def api_get_companies(query_string: str) -> dict[str, Any]:
     query_string = urllib.parse.quote_plus(query_string)
     url = _get_companies_url(query_string)
-    response = requests.get(url, headers=_get_auth_header())
+    with track_external_call("http"):
+        response = requests.get(url, headers=_get_auth_header())
 
     if response.status_code != 200:
         error_msg = "Unable to lookup company"
@@ -27,7 +29,8 @@ def api_get_companies(query_string: str) -> dict[str, Any]:
 
 def api_get_company(company_number: str) -> dict[str, Any] | None:
     url = _get_company_profile_url(company_number)
-    response = requests.get(url, headers=_get_auth_header())
+    with track_external_call("http"):
+        response = requests.get(url, headers=_get_auth_header())
 
     if response.status_code != 200:
         if response.status_code == 404:
@@ -0,0 +1,59 @@
+"""Database connection pool statistics (see DATABASES in config/settings.py)."""
+
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+def get_pool_stats() -> dict[str, int] | None:
+    """Return the connection pool statistics since they were last returned.
+
+    Returns None if the database connections aren't pooled.
+    See https://www.psycopg.org/psycopg3/docs/advanced/pool.html#pool-stats
+    """
+
+    pool = connection.pool
+
+    if pool is None:
+        return None
+
+    stats = pool.pop_stats()
+
+    if requests := stats.get("requests_num"):
+        stats["requests_wait_ms_avg"] = round(stats.get("requests_wait_ms", 0) / requests)
+
+    return stats
+
+
+def log_pool_stats() -> None:
+    if stats := get_pool_stats():
+        logger.info("Database pool stats: %s", json.dumps(stats))
+
+
+def start_pool_stats_logger() -> None:
+    """Log the pool statistics every DATABASE_POOL_STATS_INTERVAL seconds.
+
+    The thread is a greenlet in a gevent worker, so it doesn't block requests.
+    """
+
+    if not connection.settings_dict["OPTIONS"].get("pool"):
+        return
+
+    thread = threading.Thread(target=_log_pool_stats_forever, name="db-pool-stats", daemon=True)
+    thread.start()
+
+
+def _log_pool_stats_forever() -> None:
+    while True:
+        time.sleep(settings.DATABASE_POOL_STATS_INTERVAL)
+
+        try:
+            log_pool_stats()
+        except Exception:
+            logger.exception("Unable to log the database pool stats")
@@ -0,0 +1,253 @@
+"""Low overhead per-request instrumentation that is safe to run in production.
+
+RequestInstrumentationMiddleware collects the metrics of each request in a RequestMetrics
+instance: the database queries (count, time and duplicate query signatures), template
+rendering time and S3 / HTTP call time.
+
+The metrics of every request are recorded as OpenTelemetry metrics (per view, method and status
+code), exported by the OpenTelemetry SDK configured for the deployed environments. The metrics
+of a sample of requests, and of every request over one of the REQUEST_INSTRUMENTATION_*
+thresholds, are also logged as a JSON event with the duplicate query signatures.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import json
+import logging
+import random
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterator
+from typing import Any, Literal
+
+import jinja2
+from django.conf import settings
+from django.db import connection
+from opentelemetry import metrics as otel_metrics
+
+logger = logging.getLogger(__name__)
+
+# The instruments don't record anything unless a MeterProvider has been configured.
+meter = otel_metrics.get_meter(__name__)
+request_duration = meter.create_histogram(
+    "icms.request.duration", unit="ms", description="Duration of a request"
+)
+request_query_count = meter.create_histogram(
+    "icms.request.db.queries", unit="{query}", description="Database queries run by a request"
+)
+request_query_duration = meter.create_histogram(
+    "icms.request.db.duration", unit="ms", description="Time spent running database queries"
+)
+request_template_duration = meter.create_histogram(
+    "icms.request.template.duration", unit="ms", description="Time spent rendering templates"
+)
+request_external_call_duration = meter.create_histogram(
+    "icms.request.external_call.duration",
+    unit="ms",
+    description="Time spent calling an external service (S3 or HTTP)",
+)
+duplicate_query_requests = meter.create_counter(
+    "icms.request.duplicate_queries",
+    unit="{request}",
+    description="Requests that repeated the same query, i.e. likely N+1 queries",
+)
+
+ExternalCall = Literal["s3", "http"]
+
+# Longest SQL logged for a duplicate query signature
+MAX_SIGNATURE_LENGTH = 300
+
+_current_metrics: contextvars.ContextVar["RequestMetrics | None"] = contextvars.ContextVar(
+    "request_metrics", default=None
+)
+
+
+@dataclasses.dataclass
+class RequestMetrics:
+    query_count: int = 0
+    query_time: float = 0.0
+    # key: SQL with placeholders for the parameters, value: number of times it was run
+    query_signatures: Counter[str] = dataclasses.field(default_factory=Counter)
+    template_time: float = 0.0
+    external_call_count: Counter[str] = dataclasses.field(default_factory=Counter)
+    external_call_time: defaultdict[str, float] = dataclasses.field(
+        default_factory=lambda: defaultdict(float)
+    )
+    rendering_template: bool = False
+
+    def get_duplicate_queries(self, threshold: int) -> dict[str, int]:
+        """Return the query signatures run at least `threshold` times, i.e. likely N+1 queries."""
+
+        return {
+            sql: count for sql, count in self.query_signatures.most_common() if count >= threshold
+        }
+
+
+@contextlib.contextmanager
+def collect_metrics(metrics: RequestMetrics | None = None) -> Iterator[RequestMetrics]:
+    """Collect the metrics of everything run inside the with statement block.
+
+    Pass metrics to add to the metrics already collected, e.g. for a streaming response.
+    """
+
+    if metrics is None:
+        metrics = RequestMetrics()
+
+    token = _current_metrics.set(metrics)
+
+    try:
+        with connection.execute_wrapper(_record_query):
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+def _record_query(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: dict[str, Any]
+) -> Any:
+    metrics = _current_metrics.get()
+
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.query_time += time.perf_counter() - start
+        metrics.query_count += 1
+        metrics.query_signatures[sql] += 1
+
+
+@contextlib.contextmanager
+def track_template_render() -> Iterator[None]:
+    """Add the time spent rendering a template to the current metrics.
+
+    Templates rendered while another template is being rendered are already included.
+    """
+
+    metrics = _current_metrics.get()
+
+    if metrics is None or metrics.rendering_template:
+        yield
+        return
+
+    metrics.rendering_template = True
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        metrics.template_time += time.perf_counter() - start
+        metrics.rendering_template = False
+
+
+@contextlib.contextmanager
+def track_external_call(call_type: ExternalCall) -> Iterator[None]:
+    """Add the time spent calling an external service to the current metrics."""
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        record_external_call(call_type, time.perf_counter() - start)
+
+
+def record_external_call(call_type: ExternalCall, seconds: float) -> None:
+    metrics = _current_metrics.get()
+
+    if metrics is not None:
+        metrics.external_call_count[call_type] += 1
+        metrics.external_call_time[call_type] += seconds
+
+
+class InstrumentedTemplate(jinja2.Template):
+    """Jinja template that records its rendering time in the current metrics."""
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        with track_template_render():
+            return super().render(*args, **kwargs)
+
+
+def s3_before_call(context: dict[str, Any], **kwargs: Any) -> None:
+    """botocore before-call event handler (see web.utils.s3.S3ClientRegistry)."""
+
+    context["instrumentation_start"] = time.perf_counter()
+
+
+def s3_after_call(context: dict[str, Any], **kwargs: Any) -> None:
+    """botocore after-call event handler (see web.utils.s3.S3ClientRegistry)."""
+
+    if start := context.get("instrumentation_start"):
+        record_external_call("s3", time.perf_counter() - start)
+
+
+def report_metrics(
+    metrics: RequestMetrics, *, view_name: str, method: str, status_code: int, duration: float
+) -> None:
+    """Record the request metrics and log them if the request was sampled or is over a threshold."""
+
+    duplicate_queries = metrics.get_duplicate_queries(
+        settings.REQUEST_INSTRUMENTATION_DUPLICATE_QUERY_THRESHOLD
+    )
+    attributes: dict[str, str | int] = {
+        "view": view_name,
+        "method": method,
+        "status_code": status_code,
+    }
+
+    request_duration.record(_ms(duration), attributes)
+    request_query_count.record(metrics.query_count, attributes)
+    request_query_duration.record(_ms(metrics.query_time), attributes)
+    request_template_duration.record(_ms(metrics.template_time), attributes)
+
+    for call_type, seconds in metrics.external_call_time.items():
+        request_external_call_duration.record(_ms(seconds), attributes | {"call_type": call_type})
+
+    if duplicate_queries:
+        duplicate_query_requests.add(1, attributes)
+
+    reasons = []
+
+    if duration * 1000 >= settings.REQUEST_INSTRUMENTATION_SLOW_REQUEST_MS:
+        reasons.append("slow")
+
+    if metrics.query_count >= settings.REQUEST_INSTRUMENTATION_QUERY_COUNT_THRESHOLD:
+        reasons.append("query_count")
+
+    if duplicate_queries:
+        reasons.append("duplicate_queries")
+
+    if not reasons and random.random() < settings.REQUEST_INSTRUMENTATION_SAMPLE_RATE:
+        reasons.append("sampled")
+
+    if not reasons:
+        return
+
+    event = {
+        "view": view_name,
+        "method": method,
+        "status_code": status_code,
+        "reasons": reasons,
+        "duration_ms": _ms(duration),
+        "query_count": metrics.query_count,
+        "query_ms": _ms(metrics.query_time),
+        "duplicate_queries": [
+            {"sql": sql[:MAX_SIGNATURE_LENGTH], "count": count}
+            for sql, count in duplicate_queries.items()
+        ],
+        "template_ms": _ms(metrics.template_time),
+        "s3_calls": metrics.external_call_count["s3"],
+        "s3_ms": _ms(metrics.external_call_time["s3"]),
+        "http_calls": metrics.external_call_count["http"],
+        "http_ms": _ms(metrics.external_call_time["http"]),
+    }
+
+    logger.info("Request metrics: %s", json.dumps(event))
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
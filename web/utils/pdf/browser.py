@@ -0,0 +1,171 @@
+import logging
+import os
+import selectors
+import subprocess
+import sys
+import threading
+import time
+
+from django.conf import settings
+from playwright.sync_api import Error
+
+from . import browser_worker
+from .exceptions import BrowserPoolTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Long-lived headless Chromium used to render PDF documents.
+
+    Launching Chromium takes far longer than rendering a document so the browser (and a page)
+    is kept open between renders for the lifetime of the worker process.
+
+    The browser is driven by a child process (see browser_worker). A started Playwright
+    instance leaves an asyncio event loop running in its thread, which makes Django refuse to
+    run database queries in that thread (SynchronousOnlyOperation), and under the gevent
+    workers used by gunicorn every greenlet shares that thread. Playwright can't be started
+    from a native thread of a gevent monkey patched process either.
+
+    The child process renders one document at a time, therefore renders are serialised by a
+    lock. Callers wait at most PDF_BROWSER_ACQUIRE_TIMEOUT seconds for the browser before
+    BrowserPoolTimeout is raised. A render that takes longer than PDF_BROWSER_RENDER_TIMEOUT
+    seconds raises BrowserPoolTimeout and the child process is killed, so a hung Chromium
+    can't block every later render.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def html_to_pdf(self, html: str) -> bytes:
+        """Render the supplied html as an A4 PDF."""
+
+        if not self._lock.acquire(timeout=settings.PDF_BROWSER_ACQUIRE_TIMEOUT):
+            raise BrowserPoolTimeout("Timed out waiting for a PDF browser.")
+
+        try:
+            return self._render(html)
+        finally:
+            self._lock.release()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _render(self, html: str) -> bytes:
+        if self._process is None or self._process.poll() is not None:
+            self._start()
+
+        stdin = self._process.stdin.fileno()  # type: ignore[union-attr]
+        stdout = self._process.stdout.fileno()  # type: ignore[union-attr]
+        deadline = time.monotonic() + settings.PDF_BROWSER_RENDER_TIMEOUT
+        document = html.encode()
+
+        try:
+            _write(stdin, browser_worker.REQUEST_HEADER.pack(len(document)) + document, deadline)
+
+            header = _read(stdout, browser_worker.RESPONSE_HEADER.size, deadline)
+            success, length = browser_worker.RESPONSE_HEADER.unpack(header)
+            body = _read(stdout, length, deadline)
+
+        except TimeoutError:
+            logger.error("PDF browser timed out rendering document, restarting browser.")
+            self._stop()
+
+            raise BrowserPoolTimeout("Timed out rendering a PDF document.")
+
+        except (EOFError, OSError):
+            self._stop()
+
+            raise Error("PDF browser process exited unexpectedly.")
+
+        if not success:
+            raise Error(body.decode())
+
+        return body
+
+    def _start(self) -> None:
+        self._stop()
+
+        self._process = subprocess.Popen(
+            _get_worker_args(), stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+
+        # Reads and writes wait for the pipes with a timeout, see _wait.
+        os.set_blocking(self._process.stdin.fileno(), False)  # type: ignore[union-attr]
+        os.set_blocking(self._process.stdout.fileno(), False)  # type: ignore[union-attr]
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+
+        if process is not None:
+            process.kill()
+            process.wait()
+            process.stdin.close()  # type: ignore[union-attr]
+            process.stdout.close()  # type: ignore[union-attr]
+
+    def _after_fork(self) -> None:
+        """Discard a browser inherited from the parent process.
+
+        The browser process and the pipes used to communicate with it belong to the parent
+        process.
+        """
+
+        self._lock = threading.Lock()
+        self._process = None
+
+
+def _get_worker_args() -> list[str]:
+    # Run as a script so the browser process doesn't import Django.
+    return [
+        sys.executable,
+        browser_worker.__file__,
+        str(settings.PDF_BROWSER_MAX_RENDERS),
+        str(settings.PDF_BROWSER_MAX_PAGE_RENDERS),
+    ]
+
+
+def _wait(fd: int, event: int, deadline: float) -> None:
+    timeout = deadline - time.monotonic()
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, event)
+
+        if timeout <= 0 or not selector.select(timeout):
+            raise TimeoutError()
+
+
+def _write(fd: int, data: bytes, deadline: float) -> None:
+    view = memoryview(data)
+
+    while view:
+        _wait(fd, selectors.EVENT_WRITE, deadline)
+
+        try:
+            view = view[os.write(fd, view) :]
+        except BlockingIOError:
+            pass
+
+
+def _read(fd: int, size: int, deadline: float) -> bytes:
+    data = bytearray()
+
+    while len(data) < size:
+        _wait(fd, selectors.EVENT_READ, deadline)
+
+        try:
+            chunk = os.read(fd, size - len(data))
+        except BlockingIOError:
+            continue
+
+        if not chunk:
+            raise EOFError()
+
+        data += chunk
+
+    return bytes(data)
+
+
+browser_pool = BrowserPool()
+os.register_at_fork(after_in_child=browser_pool._after_fork)
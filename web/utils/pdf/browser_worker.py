@@ -0,0 +1,137 @@
+"""Renders PDF documents with a long-lived headless Chromium.
+
+Run as a child process of web.utils.pdf.browser.BrowserPool, which sends html documents to
+stdin and reads the rendered PDF documents from stdout. Only depends on Playwright so it can
+be run as a script without setting up Django.
+
+Each request is a header holding the length of the html document followed by the document.
+Each response is a header holding whether the render succeeded and the length of the body,
+followed by the body (the PDF document or the error message).
+"""
+
+import logging
+import struct
+import sys
+from typing import BinaryIO
+
+from playwright.sync_api import Browser, Error, Page, Playwright, sync_playwright
+
+logger = logging.getLogger(__name__)
+
+REQUEST_HEADER = struct.Struct("!I")
+RESPONSE_HEADER = struct.Struct("!?I")
+
+
+class BrowserRenderer:
+    """Renders html as A4 PDF documents, keeping the browser (and a page) open between renders.
+
+    The page is recycled after max_page_renders renders and the browser is restarted after
+    max_renders renders to keep Chromium memory usage bounded. A browser that has crashed or
+    disconnected is restarted and the render retried once.
+    """
+
+    def __init__(self, max_renders: int, max_page_renders: int) -> None:
+        self.max_renders = max_renders
+        self.max_page_renders = max_page_renders
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._page: Page | None = None
+        self._browser_renders = 0
+        self._page_renders = 0
+
+    def html_to_pdf(self, html: str) -> bytes:
+        try:
+            return self._render(html)
+        except Error:
+            logger.warning("PDF browser failed to render document, restarting browser.")
+            self.close()
+
+            return self._render(html)
+
+    def close(self) -> None:
+        browser, playwright = self._browser, self._playwright
+        self._playwright = self._browser = self._page = None
+
+        # The browser may have crashed, so errors closing it are expected.
+        try:
+            if browser is not None:
+                browser.close()
+        except Error:
+            pass
+
+        try:
+            if playwright is not None:
+                playwright.stop()
+        except Error:
+            pass
+
+    def _render(self, html: str) -> bytes:
+        page = self._get_page()
+        page.set_content(html)
+        pdf_data = page.pdf(format="A4")
+
+        self._page_renders += 1
+        self._browser_renders += 1
+
+        return pdf_data
+
+    def _get_page(self) -> Page:
+        if self._browser_renders >= self.max_renders:
+            self.close()
+
+        if self._browser is None or not self._browser.is_connected():
+            self._start()
+
+        if self._page is None or self._page.is_closed():
+            self._new_page()
+
+        elif self._page_renders >= self.max_page_renders:
+            self._page.context.close()
+            self._new_page()
+
+        return self._page  # type: ignore[return-value]
+
+    def _new_page(self) -> None:
+        context = self._browser.new_context()  # type: ignore[union-attr]
+        self._page = context.new_page()
+        self._page_renders = 0
+
+    def _start(self) -> None:
+        self.close()
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=True)
+        self._browser_renders = 0
+
+
+def serve(stdin: BinaryIO, stdout: BinaryIO, renderer: BrowserRenderer) -> None:
+    """Render the documents read from stdin until it is closed."""
+
+    while header := stdin.read(REQUEST_HEADER.size):
+        (length,) = REQUEST_HEADER.unpack(header)
+        html = stdin.read(length).decode()
+
+        try:
+            body = renderer.html_to_pdf(html)
+            success = True
+        except Error as e:
+            body = e.message.encode()
+            success = False
+
+        stdout.write(RESPONSE_HEADER.pack(success, len(body)))
+        stdout.write(body)
+        stdout.flush()
+
+
+def main() -> None:
+    max_renders, max_page_renders = (int(arg) for arg in sys.argv[1:3])
+    renderer = BrowserRenderer(max_renders, max_page_renders)
+
+    try:
+        serve(sys.stdin.buffer, sys.stdout.buffer, renderer)
+    finally:
+        renderer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,6 @@
 class SignatureTextNotFound(Exception):
     pass
+
+
+class BrowserPoolTimeout(Exception):
+    pass
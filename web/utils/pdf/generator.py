@@ -1,10 +1,9 @@
 import io
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from django.conf import settings
 from django.template.loader import render_to_string
-from playwright.sync_api import sync_playwright
 
 from web.domains.case.types import DocumentPack, ImpOrExp
 from web.flow.models import ProcessTypes
@@ -12,6 +11,7 @@ from web.models import Country
 from web.types import DocumentTypes
 
 from . import pages, utils
+from .browser import browser_pool
 
 
 @dataclass
@@ -25,14 +25,7 @@ class PdfGenBase:
         :return: None if target is supplied else bytes
         """
         document_html = self.get_document_html()
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=True)
-            context = browser.new_context()
-            page = context.new_page()
-            page.set_content(document_html)
-
-            pdf_data = page.pdf(format="A4")
-
+        pdf_data = browser_pool.html_to_pdf(document_html)
         pdf_data = self.format_pages(pdf_data)
 
         if target:
@@ -64,6 +57,7 @@ class PdfGenerator(PdfGenBase):
     application: ImpOrExp
     doc_pack: DocumentPack
     country: Country | None = None
+    _context: dict[str, Any] | None = field(default=None, init=False, repr=False)
 
     @property
     def is_cover_letter(self) -> bool:
@@ -103,7 +97,16 @@ class PdfGenerator(PdfGenBase):
                     raise ValueError(f"Unsupported process type: {self.application.process_type}")
 
     def get_document_context(self) -> dict[str, Any]:
-        """Return the document context"""
+        """Return the document context.
+
+        The context is used when rendering and formatting the document so is only built once.
+        """
+        if self._context is None:
+            self._context = self._get_document_context()
+
+        return self._context
+
+    def _get_document_context(self) -> dict[str, Any]:
         if self.is_cover_letter:
             return utils.get_cover_letter_context(self.application, self.doc_type)
 
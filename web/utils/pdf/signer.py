@@ -1,29 +1,75 @@
 import base64
 import datetime as dt
+import functools
 import io
 import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 
 import fitz
+from cryptography import x509
 from cryptography.hazmat import backends
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from cryptography.hazmat.primitives.serialization import pkcs12
 from django.conf import settings
 from endesive.pdf import cms
 from PIL import Image
 
 from web.domains.signature.utils import get_active_signature, get_signature_file_bytes
+from web.models import Signature
 from web.utils.pdf.exceptions import SignatureTextNotFound
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SigningKey:
+    """Everything required to digitally sign a document."""
+
+    key: PrivateKeyTypes
+    certificate: x509.Certificate
+    additional_certificates: list[x509.Certificate]
+    signature_image: Image.Image
+
+
 def get_active_signature_image() -> Image.Image:
-    """Fetch the active signature image from s3 and return as a PIL Image object
+    """Return the active signature image as a PIL Image object
+
+    The decoded image is cached for the active signature, a different signature being set
+    active is picked up by the next call.
 
     :return: PIL Image object
     """
     active_signature = get_active_signature()
-    active_signature_bytes = get_signature_file_bytes(active_signature)
-    return Image.open(io.BytesIO(active_signature_bytes))
+    return _load_signature_image(active_signature)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_signature_image(signature: Signature) -> Image.Image:
+    """Fetch the signature image from s3 and decode it."""
+
+    signature_bytes = get_signature_file_bytes(signature)
+    image = Image.open(io.BytesIO(signature_bytes))
+
+    # Decode the image data now rather than on first use.
+    image.load()  # type: ignore[no-untyped-call]
+
+    return image
+
+
+@functools.lru_cache(maxsize=1)
+def _load_p12(
+    p12_base64: str, password: str
+) -> tuple[PrivateKeyTypes, x509.Certificate, list[x509.Certificate]]:
+    """Decode and parse the base64 encoded p12 certificate."""
+
+    key, certificate, additional_certificates = pkcs12.load_key_and_certificates(
+        base64.b64decode(p12_base64),  # /PS-IGNORE
+        password=password.encode(),
+        backend=backends.default_backend(),
+    )
+
+    return key, certificate, additional_certificates  # type: ignore[return-value]
 
 
 def get_signature_coordinates(
@@ -70,31 +116,71 @@ def get_signature_coordinates(
     raise SignatureTextNotFound("Unable to find signature text in pdf")
 
 
-def sign_pdf(target: io.BytesIO) -> io.BytesIO:
-    """Takes a pdf written to a BytesIO stream and adds a digital signature."""
-
-    pdf_bytes = target.getvalue()
-
+def is_signing_enabled() -> bool:
     if not settings.P12_SIGNATURE_BASE_64:
         logger.info("P12_SIGNATURE_BASE_64 environment variable not set for this environment.")
-        return target
+        return False
 
     if not settings.P12_SIGNATURE_PASSWORD:
         logger.info("P12_SIGNATURE_PASSWORD environment variable not set for this environment.")
-        return target
+        return False
+
+    return True
+
+
+def get_signing_key() -> SigningKey | None:
+    """Return the SigningKey or None if signing isn't enabled for this environment."""
+
+    if not is_signing_enabled():
+        return None
+
+    return load_signing_key()
+
+
+def load_signing_key() -> SigningKey:
+    """Load the p12 certificate and the active signature image used to sign documents.
+
+    Both are cached in process memory so only the active signature is queried per call.
+    """
 
     # load the base64 encoded p12 certificate into memory
-    loaded_p12_certificate = pkcs12.load_key_and_certificates(
-        base64.b64decode(settings.P12_SIGNATURE_BASE_64),  # /PS-IGNORE
-        password=settings.P12_SIGNATURE_PASSWORD.encode(),
-        backend=backends.default_backend(),
+    key, certificate, additional_certificates = _load_p12(
+        settings.P12_SIGNATURE_BASE_64, settings.P12_SIGNATURE_PASSWORD
+    )
+
+    # Now we need to load the active signature image from s3, and convert it to a PIL image object
+    return SigningKey(
+        key=key,
+        certificate=certificate,
+        additional_certificates=additional_certificates,
+        signature_image=get_active_signature_image(),
     )
 
+
+def clear_signing_key_cache() -> None:
+    """Discard the cached p12 certificate and signature image."""
+
+    _load_p12.cache_clear()
+    _load_signature_image.cache_clear()
+
+
+def sign_pdf(target: io.BytesIO, signing_key: SigningKey | None = None) -> io.BytesIO:
+    """Takes a pdf written to a BytesIO stream and adds a digital signature.
+
+    :param target: The pdf to sign
+    :param signing_key: Optional SigningKey, loaded when not supplied.
+    """
+
+    pdf_bytes = target.getvalue()
+
+    if not signing_key and not is_signing_enabled():
+        return target
+
     pdf_file = fitz.open("pdf", pdf_bytes)
     signature_image_coordinates, page_number = get_signature_coordinates(pdf_file)
 
-    # Now we need to load the active signature image from s3, and convert it to a PIL image object
-    active_signature_image = get_active_signature_image()
+    if not signing_key:
+        signing_key = load_signing_key()
 
     # Setting up signature metadata
     dct = {
@@ -104,7 +190,7 @@ def sign_pdf(target: io.BytesIO) -> io.BytesIO:
         "sigpage": page_number,
         "auto_sigfield": True,
         "signaturebox": signature_image_coordinates,
-        "signature_img": active_signature_image,
+        "signature_img": signing_key.signature_image,
         "contact": "contact:enquiries.ilb@trade.gov.uk",  # /PS-IGNORE
         "location": "Department for Business and Trade",
         "signingdate": dt.datetime.now(dt.UTC).strftime("D:%Y%m%d%H%M%S+00'00'"),
@@ -115,9 +201,9 @@ def sign_pdf(target: io.BytesIO) -> io.BytesIO:
     pdf_signature = cms.sign(
         pdf_bytes,
         dct,
-        loaded_p12_certificate[0],
-        loaded_p12_certificate[1],
-        loaded_p12_certificate[2],
+        signing_key.key,
+        signing_key.certificate,
+        signing_key.additional_certificates,
         "sha256",
     )
 
@@ -126,3 +212,16 @@ def sign_pdf(target: io.BytesIO) -> io.BytesIO:
     signed_pdf.write(pdf_bytes)
     signed_pdf.write(pdf_signature)
     return signed_pdf
+
+
+def sign_pdfs(targets: Iterable[io.BytesIO]) -> Iterator[io.BytesIO]:
+    """Sign several pdfs using a signing key loaded once for the whole batch.
+
+    :param targets: The pdfs to sign
+    :return: The signed pdfs, in the order supplied
+    """
+
+    signing_key = get_signing_key()
+
+    for target in targets:
+        yield sign_pdf(target, signing_key)
@@ -13,6 +13,7 @@ from qrcode import QRCode
 
 from web.domains.case._import.fa.types import FaImportApplication
 from web.domains.case.services import document_pack
+from web.domains.country.types import CountryGroupName
 from web.domains.signature.utils import get_active_signature_file
 from web.domains.template.utils import (
     fetch_cfs_declaration_translations,
@@ -53,6 +54,7 @@ from web.utils import (
     newlines_to_commas,
 )
 from web.utils.commodity import annotate_commodity_unit
+from web.utils.reference_data import get_country_group_country_pks
 
 if TYPE_CHECKING:
     from web.reports.serializers import GoodsSectionSerializer
@@ -426,9 +428,11 @@ def _get_importer_eori_numbers(application: ImportApplication) -> list[str]:
             eori_numbers.append(f"XI{main_eori_num[2:]}")
 
         # FA-SIL / FA-DFL check the consignment country as well
-        elif (
-            application.process_type in [ProcessTypes.FA_SIL, ProcessTypes.FA_DFL]
-            and application.consignment_country in Country.util.get_eu_countries()
+        elif application.process_type in [
+            ProcessTypes.FA_SIL,
+            ProcessTypes.FA_DFL,
+        ] and application.consignment_country_id in get_country_group_country_pks(
+            CountryGroupName.EU
         ):
             eori_numbers.append(f"XI{main_eori_num[2:]}")
 
@@ -4,6 +4,7 @@ import requests
 from django.conf import settings
 
 from web.errors import APIError
+from web.utils.instrumentation import track_external_call
 
 
 def api_postcode_to_address_lookup(post_code: str) -> list[dict[str, Any]]:
@@ -14,7 +15,8 @@ def api_postcode_to_address_lookup(post_code: str) -> list[dict[str, Any]]:
     api_url = f"https://api.getAddress.io/find/{post_code}"
 
     payload = {"api-key": settings.ADDRESS_API_KEY, "expand": True, "sort": True}
-    response = requests.get(api_url, params=payload)
+    with track_external_call("http"):
+        response = requests.get(api_url, params=payload)
 
     if response.status_code == 200:
         content = response.json()
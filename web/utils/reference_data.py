@@ -0,0 +1,254 @@
+"""Process local cache of reference data that rarely changes, e.g. sites and email templates.
+
+Each worker keeps the reference data it has loaded in memory. Saving or deleting a reference
+data record changes the version stored in the cache (Redis) and every worker discards its
+reference data when it sees the version has changed. Workers check the version at most every
+REFERENCE_DATA_VERSION_CHECK_INTERVAL seconds, the worker that saved the record discards its
+reference data straight away.
+
+Records changed with QuerySet.update() or bulk_create() don't send signals, call
+invalidate_reference_data() after changing them.
+"""
+
+import copy
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import connection, transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from web.models import (
+    Commodity,
+    CommodityGroup,
+    Country,
+    CountryGroup,
+    EmailTemplate,
+    ExportApplicationType,
+    ImportApplicationType,
+    Template,
+    TemplateVersion,
+    Usage,
+)
+from web.utils.cache import bump_version, get_version
+
+T = TypeVar("T")
+
+# Changing the version makes every worker discard its reference data.
+REFERENCE_DATA_VERSION_KEY = "reference-data:version"
+
+REFERENCE_DATA_MODELS: tuple[type[Model], ...] = (
+    Commodity,
+    CommodityGroup,
+    Country,
+    CountryGroup,
+    EmailTemplate,
+    ExportApplicationType,
+    ImportApplicationType,
+    Site,
+    Template,
+    TemplateVersion,
+    Usage,
+)
+
+# The many-to-many relationships between reference data records.
+REFERENCE_DATA_M2M_MODELS: tuple[type[Model], ...] = (
+    CommodityGroup.commodities.through,
+    CountryGroup.countries.through,
+)
+
+
+class ReferenceDataCache:
+    def __init__(self) -> None:
+        self._data: dict[str, Any] = {}
+        self._version: str | None = None
+        self._version_checked_at = 0.0
+        # Set when reference data is changed in the current transaction (per thread / greenlet).
+        self._local = threading.local()
+
+    def get(self, key: str, load: Callable[[], T]) -> T:
+        """Return the reference data stored for key, calling load() to load it if it isn't."""
+
+        if self._changed_in_transaction():
+            # Uncommitted changes must not be cached, they aren't visible to other requests and
+            # could still be rolled back.
+            return load()
+
+        self._check_version()
+        # Another greenlet can replace the reference data with a new version while load() waits
+        # for the database, the loaded value belongs to the version that has been checked.
+        data = self._data
+
+        try:
+            return data[key]
+        except KeyError:
+            value = data[key] = load()
+
+            return value
+
+    def invalidate(self) -> None:
+        """Discard the reference data of every worker."""
+
+        if connection.in_atomic_block:
+            self._local.changed = True
+
+        bump_version(REFERENCE_DATA_VERSION_KEY)
+
+        # Check the version on the next get(), and again once the transaction commits.
+        self._expire_version_check()
+        transaction.on_commit(self._expire_version_check)
+
+    def clear(self) -> None:
+        """Discard the reference data of this worker."""
+
+        self._data = {}
+        self._version = None
+        self._version_checked_at = 0.0
+        self._local.changed = False
+
+    def _changed_in_transaction(self) -> bool:
+        if not getattr(self._local, "changed", False):
+            return False
+
+        if connection.in_atomic_block:
+            return True
+
+        # The transaction has been committed or rolled back.
+        self._local.changed = False
+
+        return False
+
+    def _check_version(self) -> None:
+        now = time.monotonic()
+
+        if now - self._version_checked_at < settings.REFERENCE_DATA_VERSION_CHECK_INTERVAL:
+            return
+
+        version = get_version(REFERENCE_DATA_VERSION_KEY)
+
+        if version != self._version:
+            self._data = {}
+            self._version = version
+
+        self._version_checked_at = now
+
+    def _expire_version_check(self) -> None:
+        self._version_checked_at = 0.0
+
+
+reference_data = ReferenceDataCache()
+
+
+def invalidate_reference_data() -> None:
+    reference_data.invalidate()
+
+
+def clear_reference_data_cache() -> None:
+    reference_data.clear()
+
+
+def get_site_domain(name: str) -> str:
+    """Return the domain of the Site with the supplied name."""
+
+    def load() -> dict[str, str]:
+        return dict(Site.objects.values_list("name", "domain"))
+
+    try:
+        return reference_data.get("site_domains", load)[name]
+    except KeyError:
+        raise Site.DoesNotExist(f"Site {name} does not exist")
+
+
+def get_email_template_id(name: str) -> UUID:
+    """Return the GOV.UK Notify template id of the EmailTemplate with the supplied name."""
+
+    def load() -> dict[str, UUID]:
+        return dict(EmailTemplate.objects.values_list("name", "gov_notify_template_id"))
+
+    try:
+        return reference_data.get("email_template_ids", load)[name]
+    except KeyError:
+        raise EmailTemplate.DoesNotExist(f"EmailTemplate {name} does not exist")
+
+
+def get_template_title_and_content(
+    template_code: str, template_type: str
+) -> tuple[str | None, str | None]:
+    """Return the title and content of the current version of a Template."""
+
+    def load() -> tuple[str | None, str | None]:
+        template = Template.objects.get(template_code=template_code, template_type=template_type)
+        version = template.current_version
+
+        return (version.title, version.content) if version else (None, None)
+
+    return reference_data.get(f"template:{template_type}:{template_code}", load)
+
+
+def get_export_application_type(type_code: str) -> ExportApplicationType:
+    """Return the ExportApplicationType with the supplied type code.
+
+    A copy of the cached record is returned so the caller can't change the cached record.
+    """
+
+    def load() -> ExportApplicationType:
+        return ExportApplicationType.objects.get(type_code=type_code)
+
+    return copy.deepcopy(reference_data.get(f"export_application_type:{type_code}", load))
+
+
+def get_import_application_type(pk: int) -> ImportApplicationType:
+    """Return the ImportApplicationType with the supplied pk.
+
+    A copy of the cached record is returned so the caller can't change the cached record.
+    """
+
+    def load() -> ImportApplicationType:
+        return ImportApplicationType.objects.get(pk=pk)
+
+    return copy.deepcopy(reference_data.get(f"import_application_type:{pk}", load))
+
+
+def get_country_group_country_pks(name: str) -> frozenset[int]:
+    """Return the pks of the active countries in the CountryGroup with the supplied name."""
+
+    def load() -> frozenset[int]:
+        return frozenset(
+            Country.objects.filter(country_groups__name__iexact=name, is_active=True).values_list(
+                "pk", flat=True
+            )
+        )
+
+    return reference_data.get(f"country_group_country_pks:{name.lower()}", load)
+
+
+def reference_data_saved(sender: Any, **kwargs: Any) -> None:
+    invalidate_reference_data()
+
+
+def reference_data_m2m_changed(sender: Any, action: str, **kwargs: Any) -> None:
+    if action.startswith("post_"):
+        invalidate_reference_data()
+
+
+for model in REFERENCE_DATA_MODELS:
+    post_save.connect(
+        reference_data_saved, sender=model, dispatch_uid=f"reference_data_{model.__name__}_saved"
+    )
+    post_delete.connect(
+        reference_data_saved,
+        sender=model,
+        dispatch_uid=f"reference_data_{model.__name__}_deleted",
+    )
+
+for through in REFERENCE_DATA_M2M_MODELS:
+    m2m_changed.connect(
+        reference_data_m2m_changed,
+        sender=through,
+        dispatch_uid=f"reference_data_{through.__name__}_changed",
+    )
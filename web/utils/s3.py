@@ -1,14 +1,19 @@
 import logging
+import os
+import threading
 from typing import IO, TYPE_CHECKING, Any, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
 
 if TYPE_CHECKING:
     from mypy_boto3_s3 import Client as S3Client
     from mypy_boto3_s3 import ServiceResource as S3Resource
+    from mypy_boto3_s3.type_defs import GetObjectOutputTypeDef
 
+from web.utils import instrumentation
 from web.utils.sentry import capture_exception
 
 logger = logging.getLogger(__name__)
@@ -26,13 +31,65 @@ def _get_s3_extra_kwargs() -> dict[str, Any]:
     return extra_kwargs
 
 
+class S3ClientRegistry:
+    """Process-wide registry of S3 clients.
+
+    Creating a boto3 client resolves credentials and builds a new connection pool, so one
+    client is created per set of S3 settings and shared by every thread in the process
+    (boto3 clients are thread safe, sessions are not). The connection pool size is set by
+    AWS_S3_MAX_POOL_CONNECTIONS.
+
+    Clients are discarded in a forked child process as the pooled connections belong to
+    the parent process.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[tuple[Any, ...], "S3Client"] = {}
+
+    def get_client(self) -> "S3Client":
+        extra_kwargs = _get_s3_extra_kwargs()
+        key = (settings.AWS_REGION, *sorted(extra_kwargs.items()))
+
+        if client := self._clients.get(key):
+            return client
+
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self._create_client(extra_kwargs)
+
+            return self._clients[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients = {}
+
+    def _create_client(self, extra_kwargs: dict[str, Any]) -> "S3Client":
+        config = Config(
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=settings.AWS_S3_TCP_KEEPALIVE,
+        )
+
+        client = boto3.session.Session().client(
+            "s3", region_name=settings.AWS_REGION, config=config, **extra_kwargs
+        )
+        client.meta.events.register("before-call.s3", instrumentation.s3_before_call)
+        client.meta.events.register("after-call.s3", instrumentation.s3_after_call)
+
+        return client
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._clients = {}
+
+
+s3_client_registry = S3ClientRegistry()
+os.register_at_fork(after_in_child=s3_client_registry._after_fork)
+
+
 def get_s3_client() -> "S3Client":
-    """Get an S3 client."""
-    return boto3.client(
-        "s3",
-        region_name=settings.AWS_REGION,
-        **_get_s3_extra_kwargs(),
-    )
+    """Get the shared S3 client for this process."""
+    return s3_client_registry.get_client()
 
 
 def get_s3_resource() -> "S3Resource":
@@ -62,6 +119,39 @@ def get_file_from_s3(path: str, client: Optional["S3Client"] = None) -> bytes:
     return contents
 
 
+def get_file_stream_from_s3(
+    path: str, byte_range: str | None = None, client: Optional["S3Client"] = None
+) -> "GetObjectOutputTypeDef":
+    """Get an object in S3 without reading the body.
+
+    :param path: The object key
+    :param byte_range: Optional HTTP Range header value, e.g. "bytes=0-99"
+    :param client: Optional S3 client
+    :return: The get_object response, the caller must read and close the "Body".
+    """
+
+    if not client:
+        client = get_s3_client()
+
+    if byte_range:
+        return client.get_object(
+            Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=path, Range=byte_range
+        )
+
+    return client.get_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=path)
+
+
+def download_file_obj_from_s3(
+    path: str, file_obj: IO[Any], client: Optional["S3Client"] = None
+) -> None:
+    """Download an object in S3 to a file obj, in parts for large objects."""
+
+    if not client:
+        client = get_s3_client()
+
+    client.download_fileobj(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=path, Fileobj=file_obj)
+
+
 def delete_file_from_s3(path: str, client: Optional["S3Client"] = None) -> None:
     """Delete object in S3."""
 
@@ -78,11 +168,15 @@ def upload_file_obj_to_s3(file_obj: IO[Any], key: str, client: Optional["S3Clien
     if not client:
         client = get_s3_client()
 
+    file_size = _get_file_obj_size(file_obj)
+
     client.upload_fileobj(file_obj, Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
 
-    object_meta = client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+    if file_size is None:
+        object_meta = client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+        file_size = object_meta["ContentLength"]
 
-    return object_meta["ContentLength"]
+    return file_size
 
 
 def put_object_in_s3(file_data: str | bytes, key: str, client: Optional["S3Client"] = None) -> int:
@@ -91,11 +185,25 @@ def put_object_in_s3(file_data: str | bytes, key: str, client: Optional["S3Clien
     if not client:
         client = get_s3_client()
 
+    if isinstance(file_data, str):
+        file_data = file_data.encode()
+
     client.put_object(Body=file_data, Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
 
-    object_meta = client.head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
+    return len(file_data)
+
+
+def _get_file_obj_size(file_obj: IO[Any]) -> int | None:
+    """Return the number of bytes remaining in a seekable file object, otherwise None."""
+
+    if not file_obj.seekable():
+        return None
+
+    position = file_obj.tell()
+    size = file_obj.seek(0, os.SEEK_END) - position
+    file_obj.seek(position)
 
-    return object_meta["ContentLength"]
+    return size
 
 
 def create_presigned_url(key: str, expiration: int = 60 * 60) -> str | None:
@@ -4,6 +4,7 @@ from .api import (
     get_search_results_spreadsheet,
     get_wildcard_filter,
     search_applications,
+    write_search_results_spreadsheet,
 )
 from .types import SearchTerms
 
@@ -14,4 +15,5 @@ __all__ = [
     "get_search_results_spreadsheet",
     "get_wildcard_filter",
     "search_applications",
+    "write_search_results_spreadsheet",
 ]
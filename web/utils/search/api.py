@@ -1,9 +1,11 @@
 import datetime as dt
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Iterator
 from operator import attrgetter
-from typing import Any
+from typing import IO, Any
 
+import xlsxwriter
+from django.conf import settings
 from django.db import models
 from django.db.models import Model, QuerySet
 from django.urls import reverse
@@ -27,20 +29,26 @@ from web.models import (
 )
 from web.models.shared import FirearmCommodity, YesNoChoices
 from web.utils import datetime_format
-from web.utils.spreadsheet import XlsxSheetConfig, generate_xlsx_file
+from web.utils.spreadsheet import XlsxSheetConfig, add_worksheet, generate_xlsx_file
 
-from . import app_data, types, utils
+from . import app_data, cache, types, utils
 from .actions import get_export_record_actions, get_import_record_actions
 
+# Characters with a special meaning in LIKE / ILIKE patterns.
+LIKE_SPECIAL_CHARACTERS = frozenset("%_\\")
+
 
 def search_applications(
     terms: types.SearchTerms, user: User, limit: int = 200
 ) -> types.SearchResults:
     """Main search function used to find applications.
 
-    Return records matching the supplied search terms.
+    Return records matching the supplied search terms, only the first `limit` records are
+    loaded. The ordered search result ids are cached, see web.utils.search.cache.
     """
-    app_pks_and_types = _get_search_ids_and_types(terms, user)
+    app_pks_and_types = cache.get_search_ids_and_types(
+        terms, user, lambda: _get_search_ids_and_types(terms, user)
+    )
 
     get_result_row = _get_result_row if terms.case_type == "import" else _get_export_result_row
 
@@ -61,8 +69,66 @@ def search_applications(
 def get_search_results_spreadsheet(case_type: str, results: types.SearchResults) -> bytes:
     """Return a spreadsheet of the supplied search results"""
 
-    rows: Iterable[types.SpreadsheetRow | types.ExportSpreadsheetRow]
+    config = _get_spreadsheet_config(case_type, _get_spreadsheet_rows(case_type, results.records))
+
+    return generate_xlsx_file([config])
+
+
+def write_search_results_spreadsheet(
+    terms: types.SearchTerms,
+    user: User,
+    file_obj: IO[bytes],
+    on_progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """Write a spreadsheet of every record matching the supplied search terms to file_obj.
+
+    Unlike search_applications the results are not limited. Records are loaded in batches
+    of SEARCH_EXPORT_BATCH_SIZE and written using a constant_memory workbook, so memory use
+    doesn't grow with the number of results.
+
+    :param on_progress: Called with the number of rows written and the total after each batch
+    :return: The number of rows written
+    """
+
+    app_pks_and_types = _get_search_ids_and_types(terms, user)
+    total_rows = len(app_pks_and_types)
+
+    if on_progress:
+        on_progress(0, total_rows)
+
+    def iter_rows() -> Iterator[types.SpreadsheetRow | types.ExportSpreadsheetRow]:
+        get_result_row = _get_result_row if terms.case_type == "import" else _get_export_result_row
+        user_org_perms = utils.UserOrganisationPermissions(user, terms.case_type)
+        batch_size = settings.SEARCH_EXPORT_BATCH_SIZE
+
+        for start in range(0, total_rows, batch_size):
+            batch = app_pks_and_types[start : start + batch_size]
+
+            # _get_search_records groups records by process type, restore the search order.
+            position = {app.pk: i for i, app in enumerate(batch)}
+            records: list[types.ResultRow] = []
+            for queryset in _get_search_records(batch):
+                for rec in queryset:
+                    records.append(get_result_row(rec, user_org_perms))  # type:ignore[arg-type]
+
+            records.sort(key=lambda r: position[r.app_pk])
 
+            yield from _get_spreadsheet_rows(terms.case_type, records)
+
+            if on_progress:
+                on_progress(start + len(batch), total_rows)
+
+    config = _get_spreadsheet_config(terms.case_type, iter_rows())
+
+    with xlsxwriter.Workbook(file_obj, {"constant_memory": True}) as workbook:
+        add_worksheet(workbook, config)
+
+    return total_rows
+
+
+def _get_spreadsheet_config(
+    case_type: str, rows: Iterable[types.SpreadsheetRow | types.ExportSpreadsheetRow]
+) -> XlsxSheetConfig:
     if case_type == "import":
         header_data = [
             "Case Reference",
@@ -85,8 +151,6 @@ def get_search_results_spreadsheet(case_type: str, results: types.SearchResults)
             "Goods Category",
             "Commodity Code(s)",
         ]
-        rows = _get_import_spreadsheet_rows(results.records)  # type:ignore[arg-type]
-
     else:
         header_data = [
             "Case Reference",
@@ -101,16 +165,23 @@ def get_search_results_spreadsheet(case_type: str, results: types.SearchResults)
             "Application Contact",
         ]
 
-        rows = _get_export_spreadsheet_rows(results.records)  # type:ignore[arg-type]
-
     config = XlsxSheetConfig()
     config.header.data = header_data
     config.header.styles = {"bold": True}
-    config.rows = rows  # type: ignore[assignment]
+    config.rows = rows
     config.column_width = 25
     config.sheet_name = "Sheet 1"
 
-    return generate_xlsx_file([config])
+    return config
+
+
+def _get_spreadsheet_rows(
+    case_type: str, records: list[types.ResultRow]
+) -> Iterable[types.SpreadsheetRow | types.ExportSpreadsheetRow]:
+    if case_type == "import":
+        return _get_import_spreadsheet_rows(records)  # type:ignore[arg-type]
+    else:
+        return _get_export_spreadsheet_rows(records)  # type:ignore[arg-type]
 
 
 def get_import_status_choices() -> list[tuple[Any, str]]:
@@ -153,6 +224,10 @@ def get_wildcard_filter(field: str, search_pattern: str) -> models.Q:
 
     Uses the ilike lookup and adds a % to the end of the string if not in the search_pattern.
 
+    Patterns where the only wildcard is the trailing % (e.g. "IMA/2024/%") are filtered using
+    istartswith instead, which can use the UPPER(field) index created by get_search_indexes
+    rather than the trigram index.
+
     :param field: The name of the field to search on
     :param search_pattern: the user supplied search pattern
     """
@@ -163,7 +238,12 @@ def get_wildcard_filter(field: str, search_pattern: str) -> models.Q:
     if not search_pattern.endswith("%"):
         search_pattern += "%"
 
-    search = {f"{field}__ilike": search_pattern}
+    prefix = search_pattern.removesuffix("%")
+
+    if prefix and not LIKE_SPECIAL_CHARACTERS.intersection(prefix):
+        search = {f"{field}__istartswith": prefix}
+    else:
+        search = {f"{field}__ilike": search_pattern}
 
     return models.Q(**search)
 
@@ -0,0 +1,84 @@
+import dataclasses
+import hashlib
+import json
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from web.models import User
+from web.permissions.service import get_permissions_version
+from web.utils.cache import bump_version, get_version
+
+from . import types
+
+# Changing the version makes every cached search result stale.
+SEARCH_RESULTS_VERSION_KEY = "search:results:version"
+
+
+def get_search_ids_and_types(
+    terms: types.SearchTerms,
+    user: User,
+    query: Callable[[], list[types.ProcessTypeAndPK]],
+) -> list[types.ProcessTypeAndPK]:
+    """Return the ordered search result ids for the user and search terms.
+
+    The result of query() is cached for SEARCH_RESULTS_CACHE_TIMEOUT seconds so loading the
+    search page again (e.g. after a search action) doesn't run the search query again.
+
+    The results are cached with the user's permissions version, so they are discarded when the
+    user's access to applications changes (e.g. they are removed from an importer).
+    """
+
+    key = _get_cache_key(terms, user)
+    cached = cache.get(key)
+
+    if cached is not None:
+        return [types.ProcessTypeAndPK(process_type=pt, pk=pk) for pk, pt in cached]
+
+    app_pks_and_types = query()
+    cache.set(
+        key,
+        [(app.pk, app.process_type) for app in app_pks_and_types],
+        timeout=settings.SEARCH_RESULTS_CACHE_TIMEOUT,
+    )
+
+    return app_pks_and_types
+
+
+def invalidate_search_results() -> None:
+    """Invalidate every cached search result."""
+
+    bump_version(SEARCH_RESULTS_VERSION_KEY)
+
+
+def _get_cache_key(terms: types.SearchTerms, user: User) -> str:
+    version = get_version(SEARCH_RESULTS_VERSION_KEY)
+    # The results depend on the applications the user has access to.
+    permissions_version = get_permissions_version(user)
+
+    return f"search:results:{version}:{permissions_version}:{user.pk}:{_get_terms_digest(terms)}"
+
+
+def _get_terms_digest(terms: types.SearchTerms) -> str:
+    """Return a digest of the normalised search terms."""
+
+    values = {}
+
+    for field in dataclasses.fields(terms):
+        value = getattr(terms, field.name)
+
+        if isinstance(value, models.QuerySet):
+            value = sorted(value.values_list("pk", flat=True))
+        elif isinstance(value, models.Model):
+            value = value.pk
+        elif isinstance(value, str):
+            value = value.strip() or None
+
+        values[field.name] = value
+
+    data = json.dumps(values, sort_keys=True, cls=DjangoJSONEncoder)
+
+    return hashlib.sha256(data.encode()).hexdigest()
@@ -0,0 +1,56 @@
+from typing import Any
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from web.domains.case.models import (
+    ApplicationBase,
+    CaseDocumentReference,
+    DocumentPackBase,
+    UpdateRequest,
+)
+from web.models import FurtherInformationRequest
+
+from .cache import invalidate_search_results
+
+# Case records the application search filters on.
+CASE_RECORD_MODELS = (
+    CaseDocumentReference,
+    DocumentPackBase,
+    FurtherInformationRequest,
+    UpdateRequest,
+)
+
+
+def search_record_saved(sender: Any, instance: Any, created: bool, **kwargs: Any) -> None:
+    """Invalidate cached search results when a record the search depends on changes.
+
+    Applications invalidate the results when they are created or their status (or another
+    field in SEARCH_STATE_FIELDS) changes. Editing a draft application doesn't invalidate
+    the results, those changes are visible once the cached results expire.
+    """
+
+    if isinstance(instance, ApplicationBase):
+        search_state = instance.get_search_state()
+
+        if created or search_state != getattr(instance, "_loaded_search_state", search_state):
+            instance._loaded_search_state = search_state
+            invalidate_search_results()
+
+    else:
+        invalidate_search_results()
+
+
+def search_record_deleted(sender: Any, instance: Any, **kwargs: Any) -> None:
+    invalidate_search_results()
+
+
+# Signals are sent with the concrete model as the sender (e.g. DFLApplication).
+for model in apps.get_models():
+    if issubclass(model, (ApplicationBase, *CASE_RECORD_MODELS)):
+        post_save.connect(
+            search_record_saved, sender=model, dispatch_uid=f"search_{model.__name__}_saved"
+        )
+        post_delete.connect(
+            search_record_deleted, sender=model, dispatch_uid=f"search_{model.__name__}_deleted"
+        )
@@ -5,13 +5,12 @@ from typing import Any, Literal
 from django.db import models
 from django.db.models.functions import Coalesce
 
-from web.models import ExportApplication, ImportApplication, User
+from web.models import ExportApplication, Exporter, ImportApplication, Importer, User
 from web.permissions import (
     ExporterObjectPermissions,
     ImporterObjectPermissions,
     Perms,
-    get_user_exporter_permissions,
-    get_user_importer_permissions,
+    get_object_permission_snapshot,
 )
 
 
@@ -102,15 +101,15 @@ class UserOrganisationPermissions:
     def __post_init__(self) -> None:
         self.has_ilb_admin_perm = self.user.has_perm(Perms.sys.ilb_admin)
 
+        # Shares the object permissions loaded for the user in this request.
+        snapshot = get_object_permission_snapshot(self.user)
+
         if self.case_type == "import":
-            user_org_permissions = get_user_importer_permissions(self.user)
+            user_org_permissions = snapshot.get_org_perms(Importer)
         else:
-            user_org_permissions = get_user_exporter_permissions(self.user)
-
-        self._cache = defaultdict(set)
+            user_org_permissions = snapshot.get_org_perms(Exporter)
 
-        for uop in user_org_permissions:
-            self._cache[uop.content_object_id] = set(uop.org_permissions)
+        self._cache = defaultdict(set, user_org_permissions)
 
     def has_permission(
         self,
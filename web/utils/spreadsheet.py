@@ -1,4 +1,5 @@
 import io
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -18,7 +19,9 @@ class XlsxSheetConfig:
     header: XlsxHeaderData = field(repr=False, default_factory=XlsxHeaderData)
     column_width: int | None = field(repr=False, default=None)
     sheet_name: str = field(default_factory=str)
-    rows: list[list[str]] | None = field(repr=False, default=None)
+    # Rows are written as they are iterated, use a generator with a constant_memory workbook
+    # to avoid holding large sheets in memory.
+    rows: Iterable[Iterable[Any]] | None = field(repr=False, default=None)
 
 
 def generate_xlsx_file(
@@ -1,7 +1,9 @@
+from collections.abc import Iterator
 from typing import Any, ClassVar
 
 from django.conf import settings
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import FieldDoesNotExist, PermissionDenied
+from django.db.models import Prefetch, QuerySet
 from django.views.generic.base import View
 from django.views.generic.list import ListView
 
@@ -22,6 +24,15 @@ class PageTitleMixin(View):
         return context
 
 
+def get_display_prefetch_attr(field_name: str) -> str:
+    """Return the attribute the related records of a `show_all` display field are prefetched to.
+
+    See icms/web/templates/tables/tables.html
+    """
+
+    return f"display_{field_name}"
+
+
 class DataDisplayConfigMixin(PageTitleMixin, ListView):
     """Adds display configuration for listed object"""
 
@@ -32,6 +43,60 @@ class DataDisplayConfigMixin(PageTitleMixin, ListView):
             context["display"] = display
         return context
 
+    def add_display_related(self, queryset: QuerySet) -> QuerySet:
+        """Load the related records of the displayed fields with the queryset.
+
+        Forward relations are selected and `show_all` relations are prefetched (filtered by
+        their `query_filter`), so rendering a row doesn't query the database.
+        """
+
+        display = getattr(self, "Display", None)
+
+        if not display:
+            return queryset
+
+        fields_config = getattr(display, "fields_config", {})
+        select_related = []
+        prefetch_related = []
+
+        for field_name in _get_display_field_names(display.fields):
+            try:
+                field = queryset.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                # Properties and methods
+                continue
+
+            if not field.is_relation:
+                continue
+
+            config = fields_config.get(field_name) or {}
+
+            if config.get("show_all"):
+                related = field.related_model._default_manager.filter(
+                    **config.get("query_filter", {})
+                ).select_related(*config.get("select_related", []))
+
+                prefetch_related.append(
+                    Prefetch(
+                        field_name,
+                        queryset=related,
+                        to_attr=get_display_prefetch_attr(field_name),
+                    )
+                )
+
+            elif field.concrete and (field.many_to_one or field.one_to_one):
+                select_related.append(field_name)
+
+        return queryset.select_related(*select_related).prefetch_related(*prefetch_related)
+
+
+def _get_display_field_names(fields: list[str | tuple[str, ...]]) -> Iterator[str]:
+    for field in fields:
+        if isinstance(field, str):
+            yield field
+        else:
+            yield from field
+
 
 class PostActionMixin:
     """Handle post requests with action variable: Calls method with the same
@@ -403,10 +403,12 @@ class ModelFilterView(
         context = super().get_context_data(**kwargs)
         filterset = self.get_filterset()
         context["filter"] = filterset
+        queryset = self.add_display_related(filterset.qs)
+
         if self.paginate:
-            context["page"] = self._paginate(filterset.qs)
+            context["page"] = self._paginate(queryset)
         else:
-            context["results"] = filterset.qs
+            context["results"] = queryset
 
         context["initial_page_load"] = self.is_initial_page_load()
 